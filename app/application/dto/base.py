@@ -1,6 +1,9 @@
 from pydantic import BaseModel, ConfigDict
 from pydantic.alias_generators import to_camel
 
+# 다건 조회(batchGet) 요청 한 번에 허용하는 최대 ID 수
+MAX_BATCH_GET_IDS = 100
+
 
 class CamelCaseBaseModel(BaseModel):
     model_config = ConfigDict(
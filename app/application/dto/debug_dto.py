@@ -0,0 +1,60 @@
+from datetime import datetime
+from typing import Annotated
+
+from pydantic import Field
+
+from app.application.dto.base import CamelCaseBaseModel
+
+
+class ConnectionHoldStatsRead(CamelCaseBaseModel):
+    """라우트별 DB 커넥션 점유 통계 DTO"""
+
+    route: Annotated[str, Field(title="라우트", description="HTTP 메서드와 경로 템플릿")]
+    checkouts: Annotated[int, Field(title="커넥션 획득 횟수")]
+    total_ms: Annotated[float, Field(title="총 점유 시간(ms)")]
+    avg_ms: Annotated[float, Field(title="평균 점유 시간(ms)")]
+    max_ms: Annotated[float, Field(title="최대 점유 시간(ms)")]
+
+
+class RateLimitStatsRead(CamelCaseBaseModel):
+    """요청 제한 규칙별 허용/거부 통계 DTO"""
+
+    rule: Annotated[str, Field(title="제한 규칙", description="예: login:ip, login:email")]
+    allowed: Annotated[int, Field(title="허용 횟수")]
+    rejected: Annotated[int, Field(title="거부 횟수")]
+
+
+class AsyncioTaskRead(CamelCaseBaseModel):
+    """대기 중인 asyncio 태스크 DTO"""
+
+    name: Annotated[str, Field(title="태스크 이름")]
+    route: Annotated[str, Field(title="라우트", description="처리 중인 요청의 라우트 이름, 요청이 아니면 (no request)")]
+    coroutine: Annotated[str, Field(title="코루틴")]
+    awaiting: Annotated[str | None, Field(title="대기 대상", description="가장 안쪽에서 await 중인 Future 등")]
+    stack: Annotated[list[str], Field(title="호출 스택", description="바깥쪽 코루틴부터 await 중인 위치")]
+
+
+class LoopBlockRead(CamelCaseBaseModel):
+    """이벤트 루프를 막은 호출 DTO"""
+
+    route: Annotated[str, Field(title="라우트", description="차단 당시 처리 중이던 요청의 라우트 이름")]
+    duration_ms: Annotated[float, Field(title="차단 시간(ms)")]
+    stack: Annotated[list[str], Field(title="호출 스택", description="임계값을 넘은 시점의 바깥쪽부터의 호출 스택")]
+    occurred_at: Annotated[datetime, Field(title="감지 시각")]
+
+
+class SlowQueryRead(CamelCaseBaseModel):
+    """정규화한 SQL 문별 느린 실행 통계 DTO"""
+
+    statement: Annotated[str, Field(title="SQL 문", description="리터럴과 바인드 파라미터를 ?로 바꾼 문장")]
+    count: Annotated[int, Field(title="느린 실행 횟수")]
+    total_ms: Annotated[float, Field(title="총 실행 시간(ms)")]
+    avg_ms: Annotated[float, Field(title="평균 실행 시간(ms)")]
+    max_ms: Annotated[float, Field(title="최대 실행 시간(ms)")]
+    callers: Annotated[dict[str, int], Field(title="호출 메서드별 횟수", description="예: SQLProductRepository.list")]
+    parameter_shapes: Annotated[
+        dict[str, int], Field(title="바인드 파라미터 형태별 횟수", description="예: (int, int*3)")
+    ]
+    plan: Annotated[
+        list[str] | None, Field(title="실행 계획", description="처음 느리게 실행되었을 때 수집한 EXPLAIN 결과")
+    ]
@@ -1,4 +1,5 @@
 from datetime import datetime
+from enum import StrEnum
 from typing import Annotated
 
 from pydantic import Field
@@ -39,3 +40,40 @@ class OrderRead(CamelCaseBaseModel):
     items: Annotated[list[OrderItemRead], Field(title="주문 항목 목록")]
     created_at: Annotated[datetime, Field(title="생성 일시")]
     updated_at: Annotated[datetime, Field(title="수정 일시")]
+
+
+class OrderSummaryRead(CamelCaseBaseModel):
+    """주문 요약 조회 DTO (주문 목록 summary 뷰)"""
+
+    id: Annotated[int, Field(validation_alias="order_id", title="주문 ID")]
+    status: Annotated[OrderStatus, Field(title="주문 상태")]
+    item_count: Annotated[int, Field(title="주문 항목 수")]
+    total_price: Annotated[float, Field(title="총 주문 금액")]
+    first_product_name: Annotated[str | None, Field(title="첫 번째 상품명")]
+    created_at: Annotated[datetime, Field(title="생성 일시")]
+    updated_at: Annotated[datetime, Field(title="수정 일시")]
+
+
+class OrderListView(StrEnum):
+    """주문 목록 조회 방식"""
+
+    FULL = "full"
+    SUMMARY = "summary"
+
+
+class OrderBatchRead(CamelCaseBaseModel):
+    """주문 다건 조회 DTO"""
+
+    items: Annotated[list[OrderRead], Field(title="주문 목록", description="요청한 ID 순서대로 정렬된 주문 목록")]
+    not_found_ids: Annotated[
+        list[int],
+        Field(title="조회되지 않은 ID 목록", description="존재하지 않거나 본인 주문이 아닌 ID"),
+    ]
+
+
+class ReservationExpiryRead(CamelCaseBaseModel):
+    """재고 선점 만료 처리 결과 DTO (배치 한 번)"""
+
+    expired_order_ids: Annotated[list[int], Field(title="만료된 주문 ID 목록")]
+    released_count: Annotated[int, Field(title="해제한 선점 수")]
+    released_quantity: Annotated[int, Field(title="재고로 되돌린 수량")]
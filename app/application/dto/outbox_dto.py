@@ -0,0 +1,18 @@
+from datetime import datetime
+from typing import Annotated, Any
+
+from pydantic import Field
+
+from app.application.dto.base import CamelCaseBaseModel
+from app.domain.model.outbox import OutboxEventType
+
+
+class OutboxEventRead(CamelCaseBaseModel):
+    """외부로 전달하는 outbox 이벤트 DTO (전달 메시지 형식)"""
+
+    id: Annotated[int, Field(title="이벤트 ID", description="받는 쪽에서 중복 전달을 거르는 키")]
+    event_type: Annotated[OutboxEventType, Field(title="이벤트 종류")]
+    aggregate_id: Annotated[int, Field(title="대상 ID")]
+    payload: Annotated[dict[str, Any], Field(title="이벤트 본문")]
+    created_at: Annotated[datetime, Field(title="생성 일시")]
+    attempts: Annotated[int, Field(title="전달 시도 횟수")]
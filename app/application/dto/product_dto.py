@@ -1,6 +1,6 @@
-from typing import Annotated
+from typing import Annotated, Self
 
-from pydantic import Field
+from pydantic import Field, model_validator
 
 from app.application.dto.base import CamelCaseBaseModel
 
@@ -19,6 +19,17 @@ class ProductCreate(ProductBase):
 class ProductRead(ProductBase):
     id: Annotated[int, Field(title="고유 ID")]
     seller_id: Annotated[int, Field(title="판매자 ID")]
+    version: Annotated[int, Field(title="버전", description="낙관적 락을 위한 버전 정보")] = 1
+    stock_shards: Annotated[
+        int, Field(title="재고 샤드 수", description="재고를 나눠 저장하는 샤드 행 수 (0이면 사용하지 않음)")
+    ] = 0
+
+
+class ProductBatchRead(CamelCaseBaseModel):
+    """상품 다건 조회 DTO"""
+
+    items: Annotated[list[ProductRead], Field(title="상품 목록", description="요청한 ID 순서대로 정렬된 상품 목록")]
+    not_found_ids: Annotated[list[int], Field(title="조회되지 않은 ID 목록")]
 
 
 class ProductUpdate(CamelCaseBaseModel):
@@ -26,3 +37,92 @@ class ProductUpdate(CamelCaseBaseModel):
     description: Annotated[str | None, Field(title="상품 설명")] = None
     price: Annotated[float | None, Field(title="가격", gt=0)] = None
     stock: Annotated[int | None, Field(title="재고 수량", ge=0)] = None
+
+
+class ProductImportRowResult(CamelCaseBaseModel):
+    """상품 대량 등록의 행 단위 처리 결과"""
+
+    row: Annotated[int, Field(title="행 번호", description="입력 데이터 기준 1부터 시작하는 행 번호")]
+    success: Annotated[bool, Field(title="성공 여부")]
+    product_id: Annotated[int | None, Field(title="생성된 상품 ID")] = None
+    error: Annotated[str | None, Field(title="오류 메시지")] = None
+
+
+class ProductImportReport(CamelCaseBaseModel):
+    """상품 대량 등록 결과 리포트"""
+
+    total: Annotated[int, Field(title="전체 행 수")]
+    succeeded: Annotated[int, Field(title="성공한 행 수")]
+    failed: Annotated[int, Field(title="실패한 행 수")]
+    results: Annotated[list[ProductImportRowResult], Field(title="행 단위 결과 목록")]
+
+
+# 재고/가격 일괄 조정 요청 한 번에 허용하는 최대 항목 수
+MAX_INVENTORY_UPDATE_ITEMS = 1000
+
+
+class ProductInventoryUpdateItem(CamelCaseBaseModel):
+    """재고/가격 일괄 조정 항목"""
+
+    id: Annotated[int, Field(title="상품 ID")]
+    stock: Annotated[int | None, Field(title="재고 수량", description="설정할 재고 수량 (절대값)", ge=0)] = None
+    stock_delta: Annotated[int | None, Field(title="재고 증감량", description="현재 재고에 더할 증감량")] = None
+    price: Annotated[float | None, Field(title="가격", gt=0)] = None
+    expected_version: Annotated[
+        int | None,
+        Field(title="기대 버전", description="지정 시 현재 버전이 일치하는 경우에만 적용합니다."),
+    ] = None
+
+    @model_validator(mode="after")
+    def check_adjustment_fields(self) -> Self:
+        if self.stock is not None and self.stock_delta is not None:
+            raise ValueError("stock과 stockDelta는 동시에 지정할 수 없습니다.")
+        if self.stock is None and self.stock_delta is None and self.price is None:
+            raise ValueError("stock, stockDelta, price 중 하나 이상을 지정해야 합니다.")
+        return self
+
+
+class ProductInventoryUpdate(CamelCaseBaseModel):
+    """재고/가격 일괄 조정 요청 DTO"""
+
+    items: Annotated[
+        list[ProductInventoryUpdateItem],
+        Field(min_length=1, max_length=MAX_INVENTORY_UPDATE_ITEMS, title="조정 항목 목록"),
+    ]
+
+
+class ProductInventoryUpdateResult(CamelCaseBaseModel):
+    """재고/가격 일괄 조정의 항목 단위 처리 결과"""
+
+    id: Annotated[int, Field(title="상품 ID")]
+    success: Annotated[bool, Field(title="성공 여부")]
+    code: Annotated[str, Field(title="결과 코드", description="성공 시 OK, 실패 시 오류 코드")] = "OK"
+    message: Annotated[str | None, Field(title="오류 메시지")] = None
+    product: Annotated[ProductRead | None, Field(title="조정된 상품 정보")] = None
+
+
+class ProductInventoryUpdateReport(CamelCaseBaseModel):
+    """재고/가격 일괄 조정 결과 리포트"""
+
+    total: Annotated[int, Field(title="전체 항목 수")]
+    succeeded: Annotated[int, Field(title="성공한 항목 수")]
+    failed: Annotated[int, Field(title="실패한 항목 수")]
+    results: Annotated[list[ProductInventoryUpdateResult], Field(title="항목 단위 결과 목록 (요청 순서)")]
+
+
+# 상품 하나에 설정할 수 있는 최대 재고 샤드 수
+MAX_STOCK_SHARDS = 64
+
+
+class ProductStockShardConfig(CamelCaseBaseModel):
+    """재고 샤드 설정 요청 DTO"""
+
+    shard_count: Annotated[
+        int,
+        Field(
+            ge=0,
+            le=MAX_STOCK_SHARDS,
+            title="재고 샤드 수",
+            description="재고를 나눠 저장할 샤드 행 수 (0이면 샤드 재고를 상품 행으로 합침)",
+        ),
+    ]
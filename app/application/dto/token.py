@@ -3,12 +3,33 @@ from typing import Annotated
 from pydantic import Field
 
 from app.application.dto.base import CamelCaseBaseModel
+from app.domain.model.user import User, UserRole
 
 
 class Token(CamelCaseBaseModel):
     access_token: Annotated[str, Field(title="액세스 토큰", description="인증에 사용되는 JWT 토큰")]
+    refresh_token: Annotated[
+        str, Field(title="리프레시 토큰", description="액세스 토큰 재발급에 사용하는 토큰 (재발급 시마다 교체됨)")
+    ]
     token_type: Annotated[str, Field(title="토큰 타입", description="토큰의 타입 (예: Bearer)")] = "bearer"
 
 
 class TokenPayload(CamelCaseBaseModel):
     sub: Annotated[str, Field(title="주제", description="토큰의 주체 (예: 사용자 이메일)")]
+    uid: Annotated[int | None, Field(title="사용자 ID")] = None
+    role: Annotated[UserRole | None, Field(title="역할")] = None
+    seller_id: Annotated[int | None, Field(title="판매자 ID", description="판매자인 경우에만 포함")] = None
+
+    @classmethod
+    def from_user(cls, user: User) -> "TokenPayload":
+        """DB 조회 없이 권한을 확인할 수 있도록 사용자 ID/역할/판매자 ID를 담은 페이로드를 만듭니다."""
+        return cls(
+            sub=user.email,
+            uid=user.id,
+            role=user.role,
+            seller_id=user.seller.id if user.seller is not None else None,
+        )
+
+
+class TokenRefresh(CamelCaseBaseModel):
+    refresh_token: Annotated[str, Field(title="리프레시 토큰")]
@@ -4,10 +4,12 @@ from app.application.dto.cart_dto import (
     CartItemUpdate,
     CartRead,
 )
+from app.core.decorators import read_only
 from app.core.exceptions import (
     CartItemNotFoundException,
     ProductNotFoundException,
 )
+from app.core.metrics import instrumented
 from app.domain.exceptions import InvalidDomainException
 from app.domain.model.cart import CartItem
 from app.domain.ports.cart_repository import ICartRepository
@@ -15,6 +17,7 @@ from app.domain.ports.product_repository import IProductRepository
 from app.domain.ports.unit_of_work import IUnitOfWork
 
 
+@instrumented("use_case")
 class CartUseCase:
     """장바구니 도메인 유즈케이스"""
 
@@ -28,6 +31,7 @@ class CartUseCase:
         self.product_repository = product_repository
         self.uow = uow
 
+    @read_only
     async def get_cart(self, user_id: int) -> CartRead:
         """사용자의 장바구니를 조회합니다."""
         cart_items = await self.cart_repository.get_all_by_user_id(user_id)
@@ -1,51 +1,157 @@
-from collections.abc import Sequence
+from collections import Counter
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from functools import partial
 from typing import Any
 
-from app.application.dto.order_dto import OrderCreate, OrderRead
-from app.core.decorators import retry_on_conflict
+from app.application.dto.order_dto import (
+    OrderBatchRead,
+    OrderCreate,
+    OrderRead,
+    OrderSummaryRead,
+    ReservationExpiryRead,
+)
+from app.application.use_cases.outbox_use_case import OUTBOX_DISPATCH_JOB
+from app.core.config import get_settings
+from app.core.decorators import read_only, retry_on_conflict
 from app.core.exceptions import (
+    CustomException,
     EmptyCartException,
+    IdempotencyKeyMismatchException,
     OrderNotFoundException,
     ProductNotFoundException,
 )
-from app.domain.model.order import Order, OrderItem
+from app.core.group_commit import GroupCommitter
+from app.core.idempotency import idempotency_locks, request_fingerprint
+from app.core.job_queue import job_queue
+from app.core.metrics import instrumented
+from app.domain.exceptions import ConcurrentModificationException, DomainException
+from app.domain.model.idempotency import IdempotencyRecord
+from app.domain.model.order import Order, OrderItem, OrderStatus, OrderSummary
+from app.domain.model.outbox import OutboxEvent, OutboxEventType
+from app.domain.model.product import Product
+from app.domain.model.reservation import StockReservation
 from app.domain.ports.cart_repository import ICartRepository
+from app.domain.ports.idempotency_repository import IIdempotencyRepository
 from app.domain.ports.order_repository import IOrderRepository
+from app.domain.ports.order_summary_repository import IOrderSummaryRepository
+from app.domain.ports.outbox_repository import IOutboxRepository
 from app.domain.ports.product_repository import IProductRepository
+from app.domain.ports.stock_reservation_repository import IStockReservationRepository
 from app.domain.ports.unit_of_work import IUnitOfWork
 
+# 멱등성 키 기록의 작업 이름
+CREATE_ORDER_OPERATION = "create_order"
+CHECKOUT_OPERATION = "create_order_from_cart"
+
+
+@dataclass(frozen=True)
+class _AllocationRequest:
+    """재고 할당기에 제출하는 단건 주문"""
+
+    user_id: int
+    quantity: int
+    idempotency_key: str | None
+    fingerprint: str
+
 
+# 재고 할당기: 설정된 상품의 단건 주문을 상품별로 모아 한 트랜잭션에서 재고를 할당하고 저장
+inventory_allocator: GroupCommitter[int, _AllocationRequest, OrderRead] = GroupCommitter("inventory_allocator")
+
+
+@instrumented("use_case")
 class OrderUseCase:
     """주문 도메인 유즈케이스"""
 
-    def __init__(
+    def __init__(  # noqa: PLR0913
         self,
         order_repository: IOrderRepository,
         product_repository: IProductRepository,
         cart_repository: ICartRepository,
+        order_summary_repository: IOrderSummaryRepository,
+        idempotency_repository: IIdempotencyRepository,
+        reservation_repository: IStockReservationRepository,
+        outbox_repository: IOutboxRepository,
         uow: IUnitOfWork,
     ):
         self.order_repository = order_repository
         self.product_repository = product_repository
         self.cart_repository = cart_repository
+        self.order_summary_repository = order_summary_repository
+        self.idempotency_repository = idempotency_repository
+        self.reservation_repository = reservation_repository
+        self.outbox_repository = outbox_repository
         self.uow = uow
 
+    async def _find_idempotent_replay(
+        self, user_id: int, idempotency_key: str | None, operation: str, fingerprint: str
+    ) -> OrderRead | None:
+        """같은 멱등성 키로 이미 처리된 요청의 응답을 반환합니다. 본문이 다르면 예외를 발생시킵니다."""
+        if idempotency_key is None:
+            return None
+
+        record = await self.idempotency_repository.get(user_id, idempotency_key)
+        if record is None:
+            return None
+        if not record.matches(operation, fingerprint):
+            raise IdempotencyKeyMismatchException()
+        if record.response_body is None:
+            # 커밋되지 않은 선점 기록은 보이지 않아야 하지만, 보인다면 처리가 끝날 때까지 재시도
+            raise ConcurrentModificationException(
+                f"같은 멱등성 키로 처리 중인 요청이 있습니다. (key: {idempotency_key})"
+            )
+        return OrderRead.model_validate_json(record.response_body)
+
+    async def _claim_idempotency_key(
+        self, user_id: int, idempotency_key: str | None, operation: str, fingerprint: str
+    ) -> OrderRead | None:
+        """
+        현재 트랜잭션에서 멱등성 키를 선점합니다.
+        같은 키로 이미 처리된 요청이 있으면 저장된 응답을 반환하고, 본문이 다르면 예외를 발생시킵니다.
+        """
+        replay = await self._find_idempotent_replay(user_id, idempotency_key, operation, fingerprint)
+        if replay is not None or idempotency_key is None:
+            return replay
+
+        await self.idempotency_repository.claim(
+            IdempotencyRecord(
+                user_id=user_id,
+                key=idempotency_key,
+                operation=operation,
+                request_fingerprint=fingerprint,
+                created_at=datetime.now(),
+            )
+        )
+        return None
+
+    async def _save_idempotent_response(self, user_id: int, idempotency_key: str | None, response: OrderRead) -> None:
+        if idempotency_key is not None:
+            await self.idempotency_repository.save_response(user_id, idempotency_key, response.model_dump_json())
+
     async def _create_order_core(self, user_id: int, items: Sequence[Any]) -> Order:
         """
         주문 생성 핵심 로직 (재고 확인, 차감, 주문 객체 생성 및 저장)
         items의 각 요소는 product_id와 quantity 속성을 가져야 합니다.
+        주문 요약(order_summary)과 차감한 재고의 선점(만료 시각 포함)도 같은 트랜잭션에서 함께 저장합니다.
         """
+        products = await self._load_products(item.product_id for item in items)
         total_price = 0.0
         order_items = []
+        first_product_name: str | None = None
 
+        # 주문 항목은 요청 순서대로 만들고, 재고 갱신은 상품 ID 순으로 실행
         for item in items:
-            product = await self.product_repository.get_by_id(item.product_id)
+            product = products.get(item.product_id)
             if not product:
                 raise ProductNotFoundException(message=f"상품을 찾을 수 없습니다. (ID: {item.product_id})")
 
             # 도메인 메서드 호출로 변경
             product.decrease_stock(item.quantity)
 
+            if first_product_name is None:
+                first_product_name = product.name
+
             # 가격 계산 및 아이템 생성
             item_price = product.price * item.quantity
             total_price += item_price
@@ -58,7 +164,8 @@ class OrderUseCase:
                 )
             )
 
-            # 재고 업데이트
+        # 재고 업데이트
+        for product in products.values():
             await self.product_repository.update(product)
 
         # 주문 생성
@@ -68,31 +175,190 @@ class OrderUseCase:
             items=order_items,
         )
 
-        return await self.order_repository.save(order)
+        saved_order = await self.order_repository.save(order)
+        await self.order_summary_repository.save(OrderSummary.from_order(saved_order, first_product_name))
+        await self._save_reservations([saved_order])
+        await self._record_order_events(OutboxEventType.ORDER_CREATED, [saved_order])
+
+        return saved_order
+
+    async def _record_order_events(self, event_type: OutboxEventType, orders: Sequence[Order]) -> None:
+        """
+        주문 이벤트를 같은 트랜잭션에서 outbox에 기록합니다. 외부 전달은 커밋 후 백그라운드 전달기가 맡으며,
+        커밋되면 전달기를 깨워 다음 확인 주기를 기다리지 않고 전달합니다. (동시 주문의 깨우기는 한 번으로 합침)
+        """
+        if not get_settings().outbox_enabled:
+            return
+        await self.outbox_repository.save_many(
+            [
+                OutboxEvent(
+                    event_type=event_type,
+                    aggregate_id=order.id,  # type: ignore[arg-type]
+                    payload=OrderRead.model_validate(order).model_dump(mode="json", by_alias=True),
+                )
+                for order in orders
+            ]
+        )
+        self.uow.on_commit(partial(job_queue.enqueue, OUTBOX_DISPATCH_JOB, key=OUTBOX_DISPATCH_JOB))
+
+    async def _load_products(self, product_ids: Iterable[int]) -> dict[int, Product]:
+        """
+        상품을 ID 순으로 조회합니다. (반환 dict도 ID 순)
+        재고를 바꾸는 트랜잭션이 항상 같은 순서로 상품 행을 잠그므로 상품이 겹치는 주문끼리 교착 상태에 빠지지 않습니다.
+        비관적 락 모드(`lock_strategy=pessimistic`)에서는 조회 시점에 행을 잠가
+        겹치는 주문이 버전 충돌 없이 차례로 처리됩니다.
+        """
+        ids = sorted(set(product_ids))
+        if get_settings().lock_strategy == "pessimistic":
+            products = await self.product_repository.lock_many_by_ids(ids)
+        else:
+            products = await self.product_repository.get_many_by_ids(ids)
+        products_by_id = {product.id: product for product in products if product.id is not None}
+        return {product_id: products_by_id[product_id] for product_id in ids if product_id in products_by_id}
+
+    async def _save_reservations(self, orders: Sequence[Order]) -> None:
+        """저장된 주문의 항목마다 주문 시각부터 선점 시간 동안 유효한 재고 선점을 저장합니다."""
+        ttl = timedelta(minutes=get_settings().reservation_ttl_minutes)
+        await self.reservation_repository.save_many(
+            [
+                StockReservation(
+                    order_id=order.id,  # type: ignore[arg-type]
+                    product_id=item.product_id,
+                    quantity=item.quantity,
+                    expires_at=order.created_at + ttl,
+                )
+                for order in orders
+                for item in order.items
+            ]
+        )
+
+    async def _allocate_orders(
+        self, product_id: int, requests: list[_AllocationRequest]
+    ) -> list[OrderRead | Exception]:
+        """
+        재고 할당기가 모은 같은 상품의 단건 주문들을 한 트랜잭션에서 처리합니다.
+        재고는 메모리에서 도착 순서대로 할당하며(재고가 모자라거나 멱등성 키 본문이 다른 주문만 실패),
+        상품 재고 UPDATE 1회와 주문/주문 항목/주문 요약/재고 선점의 다중 행 INSERT로 저장합니다.
+        트랜잭션이 실패하면(다른 경로의 재고 변경과 충돌 등) 배치의 모든 주문이 같은 예외로 실패하고 각자 재시도합니다.
+        """
+        results: dict[int, OrderRead | Exception] = {}
+        accepted: list[int] = []
+        async with self.uow:
+            product = (await self._load_products([product_id])).get(product_id)
+            for index, request in enumerate(requests):
+                try:
+                    if product is None:
+                        raise ProductNotFoundException(message=f"상품을 찾을 수 없습니다. (ID: {product_id})")
+                    replay = await self._find_idempotent_replay(
+                        request.user_id, request.idempotency_key, CREATE_ORDER_OPERATION, request.fingerprint
+                    )
+                    if replay is not None:
+                        results[index] = replay
+                        continue
+                    product.decrease_stock(request.quantity)
+                except (CustomException, DomainException) as e:
+                    results[index] = e
+                    continue
+                accepted.append(index)
+
+            if product is not None and accepted:
+                for index in accepted:
+                    await self._claim_idempotency_key(
+                        requests[index].user_id,
+                        requests[index].idempotency_key,
+                        CREATE_ORDER_OPERATION,
+                        requests[index].fingerprint,
+                    )
+                await self.product_repository.update(product)
+
+                created_at = datetime.now()
+                saved_orders = await self.order_repository.save_many(
+                    [
+                        Order(
+                            user_id=requests[index].user_id,
+                            total_price=product.price * requests[index].quantity,
+                            items=[
+                                OrderItem(product_id=product_id, price=product.price, quantity=requests[index].quantity)
+                            ],
+                            created_at=created_at,
+                            updated_at=created_at,
+                        )
+                        for index in accepted
+                    ]
+                )
+                await self.order_summary_repository.save_many(
+                    [OrderSummary.from_order(order, product.name) for order in saved_orders]
+                )
+                await self._save_reservations(saved_orders)
+                await self._record_order_events(OutboxEventType.ORDER_CREATED, saved_orders)
+                await self.cart_repository.delete_product_for_users(
+                    product_id, [requests[index].user_id for index in accepted]
+                )
+
+                for index, order in zip(accepted, saved_orders, strict=True):
+                    response = results[index] = OrderRead.model_validate(order)
+                    await self._save_idempotent_response(
+                        requests[index].user_id, requests[index].idempotency_key, response
+                    )
+
+        return [results[index] for index in range(len(requests))]
 
     @retry_on_conflict()
-    async def create_order(self, user_id: int, order_create: OrderCreate) -> OrderRead:
+    async def create_order(
+        self, user_id: int, order_create: OrderCreate, idempotency_key: str | None = None
+    ) -> OrderRead:
         """
         주문을 생성합니다.
         1. 상품 존재 여부 및 재고 확인
         2. 총 주문 금액 계산
         3. 재고 차감 (트랜잭션 처리)
         4. 주문 저장
+
+        멱등성 키가 있으면 같은 키로 처리된 주문을 상품 조회 없이 그대로 반환합니다.
+        재고 할당기를 사용하는 상품(`INVENTORY_ALLOCATOR_PRODUCT_IDS`)의 단건 주문은
+        같은 상품의 동시 주문과 함께 한 트랜잭션으로 처리됩니다. (`_allocate_orders`)
         """
-        async with self.uow:
+        fingerprint = request_fingerprint(CREATE_ORDER_OPERATION, order_create.model_dump(mode="json"))
+        allocated_product_id = _allocated_product_id(order_create)
+        if allocated_product_id is not None:
+            settings = get_settings()
+            request = _AllocationRequest(user_id, order_create.items[0].quantity, idempotency_key, fingerprint)
+            async with idempotency_locks.hold(_lock_key(user_id, idempotency_key)):
+                return await inventory_allocator.submit(
+                    allocated_product_id,
+                    request,
+                    partial(self._allocate_orders, allocated_product_id),
+                    window=settings.inventory_allocator_window_ms / 1000,
+                    max_batch=settings.inventory_allocator_max_batch,
+                )
+
+        async with idempotency_locks.hold(_lock_key(user_id, idempotency_key)), self.uow:
+            replay = await self._claim_idempotency_key(user_id, idempotency_key, CREATE_ORDER_OPERATION, fingerprint)
+            if replay is not None:
+                return replay
+
             saved_order = await self._create_order_core(user_id, order_create.items)
 
             # 주문한 상품이 장바구니에 있다면 제거
             product_ids = [item.product_id for item in order_create.items]
             await self.cart_repository.delete_items_by_user_id(user_id, product_ids)
 
-            return OrderRead.model_validate(saved_order)
+            response = OrderRead.model_validate(saved_order)
+            await self._save_idempotent_response(user_id, idempotency_key, response)
+            return response
 
+    @read_only
     async def list_orders(self, user_id: int, offset: int, limit: int) -> list[OrderRead]:
         """사용자의 주문 목록을 조회합니다."""
         orders = await self.order_repository.find_by_user_id(user_id, offset, limit)
         return [OrderRead.model_validate(order) for order in orders]
 
+    @read_only
+    async def list_order_summaries(self, user_id: int, offset: int, limit: int) -> list[OrderSummaryRead]:
+        """사용자의 주문 목록을 주문 요약 프로젝션만 읽어 최신순으로 조회합니다. (주문 항목 미포함)"""
+        summaries = await self.order_summary_repository.find_by_user_id(user_id, offset, limit)
+        return [OrderSummaryRead.model_validate(summary) for summary in summaries]
+
     async def get_order(self, user_id: int, order_id: int) -> OrderRead:
         """주문 상세 정보를 조회합니다."""
         order = await self.order_repository.find_by_id(order_id)
@@ -103,6 +369,24 @@ class OrderUseCase:
 
         return OrderRead.model_validate(order)
 
+    async def batch_get_orders(self, user_id: int, order_ids: Sequence[int]) -> OrderBatchRead:
+        """
+        여러 주문을 한 번의 쿼리로 조회합니다.
+        소유권은 쿼리 조건으로 검증되며, 결과는 요청한 ID 순서(중복 제거)를 따릅니다.
+        """
+        requested_ids = list(dict.fromkeys(order_ids))
+        orders = await self.order_repository.find_many_by_ids_for_user(user_id, requested_ids)
+        orders_by_id = {order.id: order for order in orders}
+
+        return OrderBatchRead(
+            items=[
+                OrderRead.model_validate(orders_by_id[order_id])
+                for order_id in requested_ids
+                if order_id in orders_by_id
+            ],
+            not_found_ids=[order_id for order_id in requested_ids if order_id not in orders_by_id],
+        )
+
     @retry_on_conflict()
     async def cancel_order(self, user_id: int, order_id: int) -> OrderRead:
         """
@@ -110,7 +394,9 @@ class OrderUseCase:
         1. 주문 조회 및 권한 확인
         2. 주문 상태 확인 (PENDING, PAID만 취소 가능)
         3. 재고 복구
-        4. 주문 상태 변경 및 저장
+        4. 주문 상태 변경 및 저장 (주문 요약 포함)
+        5. 재고 선점 해제
+        6. 주문 취소 이벤트 기록 (outbox)
         """
         async with self.uow:
             order = await self.order_repository.find_by_id(order_id)
@@ -121,27 +407,72 @@ class OrderUseCase:
 
             order.cancel()
 
-            # 재고 복구
+            # 재고 복구 (주문 생성과 같은 상품 ID 순)
+            products = await self._load_products(item.product_id for item in order.items)
             for item in order.items:
-                product = await self.product_repository.get_by_id(item.product_id)
-                if product:
-                    product.add_stock(item.quantity)
-                    await self.product_repository.update(product)
+                if item.product_id in products:
+                    products[item.product_id].add_stock(item.quantity)
+            for product in products.values():
+                await self.product_repository.update(product)
 
             updated_order = await self.order_repository.save(order)
+            await self.order_summary_repository.update_status(order_id, updated_order.status, updated_order.updated_at)
+            await self.reservation_repository.release_by_order_ids([order_id], updated_order.updated_at)
+            await self._record_order_events(OutboxEventType.ORDER_CANCELLED, [updated_order])
 
             return OrderRead.model_validate(updated_order)
 
+    async def expire_reservations(self, now: datetime, limit: int) -> ReservationExpiryRead:
+        """
+        재고 선점 만료 시각이 지난 주문을 최대 `limit`건 만료 처리합니다.
+        1. 만료된 활성 선점이 있는 주문 조회
+        2. 그중 PENDING 주문만 EXPIRED로 변경 (주문 요약 포함)
+        3. 선점 해제 후 만료된 주문의 선점 수량만 상품별로 모아 재고 복구
+
+        모든 변경은 주문/상품 행 단위가 아닌 집합 단위 UPDATE로 처리합니다.
+        PENDING이 아닌 주문(그 사이 취소됨 등)의 남은 선점은 재고를 되돌리지 않고 해제만 합니다.
+        """
+        async with self.uow:
+            skip_locked = get_settings().lock_strategy == "pessimistic"
+            order_ids = await self.reservation_repository.find_expired_order_ids(now, limit, skip_locked=skip_locked)
+            expired_order_ids = await self.order_repository.expire_pending(order_ids, now)
+            await self.order_summary_repository.update_status_many(expired_order_ids, OrderStatus.EXPIRED, now)
+
+            released = await self.reservation_repository.release_by_order_ids(order_ids, now)
+            expired = set(expired_order_ids)
+            quantities: Counter[int] = Counter()
+            for reservation in released:
+                if reservation.order_id in expired:
+                    quantities[reservation.product_id] += reservation.quantity
+            await self.product_repository.restore_stock(quantities)
+
+            return ReservationExpiryRead(
+                expired_order_ids=expired_order_ids,
+                released_count=len(released),
+                released_quantity=quantities.total(),
+            )
+
+    async def oldest_expired_reservation_at(self, now: datetime) -> datetime | None:
+        """아직 처리되지 않은 만료 선점 중 가장 이른 만료 시각 (만료 처리 지연 측정용)"""
+        return await self.reservation_repository.oldest_expired_at(now)
+
     @retry_on_conflict()
-    async def create_order_from_cart(self, user_id: int) -> OrderRead:
+    async def create_order_from_cart(self, user_id: int, idempotency_key: str | None = None) -> OrderRead:
         """
         장바구니에 있는 모든 상품을 주문합니다.
         1. 장바구니 조회
         2. 재고 확인 및 차감
         3. 주문 생성
         4. 장바구니 비우기
+
+        멱등성 키가 있으면 같은 키로 처리된 주문을 장바구니 조회 없이 그대로 반환합니다.
         """
-        async with self.uow:
+        fingerprint = request_fingerprint(CHECKOUT_OPERATION)
+        async with idempotency_locks.hold(_lock_key(user_id, idempotency_key)), self.uow:
+            replay = await self._claim_idempotency_key(user_id, idempotency_key, CHECKOUT_OPERATION, fingerprint)
+            if replay is not None:
+                return replay
+
             cart_items = await self.cart_repository.get_all_by_user_id(user_id)
             if not cart_items:
                 raise EmptyCartException()
@@ -151,4 +482,18 @@ class OrderUseCase:
             # 장바구니 비우기
             await self.cart_repository.delete_all_by_user_id(user_id)
 
-            return OrderRead.model_validate(saved_order)
+            response = OrderRead.model_validate(saved_order)
+            await self._save_idempotent_response(user_id, idempotency_key, response)
+            return response
+
+
+def _lock_key(user_id: int, idempotency_key: str | None) -> str | None:
+    return None if idempotency_key is None else f"{user_id}:{idempotency_key}"
+
+
+def _allocated_product_id(order_create: OrderCreate) -> int | None:
+    """재고 할당기로 처리할 주문이면 상품 ID를 반환합니다. (할당기를 사용하는 상품 하나만 담은 주문)"""
+    if len(order_create.items) != 1:
+        return None
+    product_id = order_create.items[0].product_id
+    return product_id if product_id in get_settings().inventory_allocator_product_ids else None
@@ -0,0 +1,51 @@
+from collections.abc import Sequence
+from datetime import datetime, timedelta
+
+from app.application.dto.outbox_dto import OutboxEventRead
+from app.core.config import get_settings
+from app.core.metrics import instrumented
+from app.domain.model.outbox import next_retry_at
+from app.domain.ports.outbox_repository import IOutboxRepository
+from app.domain.ports.unit_of_work import IUnitOfWork
+
+# 이벤트를 기록한 트랜잭션이 커밋되면 전달기를 바로 깨우는 작업 (핸들러는 전달기가 등록)
+OUTBOX_DISPATCH_JOB = "outbox.dispatch"
+
+
+@instrumented("use_case")
+class OutboxUseCase:
+    """outbox 이벤트 전달 유즈케이스 (백그라운드 전달기용)"""
+
+    def __init__(self, outbox_repository: IOutboxRepository, uow: IUnitOfWork):
+        self.outbox_repository = outbox_repository
+        self.uow = uow
+
+    async def claim_due_events(self, now: datetime, limit: int) -> list[OutboxEventRead]:
+        """
+        전달할 차례가 된 이벤트를 최대 `limit`건 가져옵니다.
+        가져온 이벤트는 전달 결과를 기록할 때까지(최대 `OUTBOX_LEASE_SECONDS`) 다른 전달기가 가져가지 않습니다.
+        """
+        lease_until = now + timedelta(seconds=get_settings().outbox_lease_seconds)
+        async with self.uow:
+            events = await self.outbox_repository.claim_due(now, limit, lease_until)
+            return [OutboxEventRead.model_validate(event) for event in events]
+
+    async def mark_dispatched(self, event_ids: Sequence[int], now: datetime) -> None:
+        async with self.uow:
+            await self.outbox_repository.mark_dispatched(event_ids, now)
+
+    async def reschedule_failed(self, events: Sequence[OutboxEventRead], now: datetime, error: str) -> None:
+        """전달에 실패한 이벤트를 시도 횟수에 따라 늘어나는 간격 뒤에 다시 시도하도록 기록합니다."""
+        settings = get_settings()
+        next_attempts = {
+            event.id: next_retry_at(
+                event.attempts, now, settings.outbox_retry_base_seconds, settings.outbox_retry_max_seconds
+            )
+            for event in events
+        }
+        async with self.uow:
+            await self.outbox_repository.reschedule_many(next_attempts, error)
+
+    async def oldest_pending_created_at(self) -> datetime | None:
+        """전달되지 않은 이벤트 중 가장 이른 생성 시각 (전달 지연 측정용)"""
+        return await self.outbox_repository.oldest_pending_created_at()
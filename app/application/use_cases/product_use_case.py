@@ -1,15 +1,39 @@
-from collections.abc import Sequence
+from collections.abc import AsyncIterable, Sequence
+from typing import Any
 
-from app.application.dto.product_dto import ProductCreate, ProductRead, ProductUpdate
-from app.core.decorators import retry_on_conflict
+from pydantic import ValidationError
+
+from app.application.dto.product_dto import (
+    ProductBatchRead,
+    ProductCreate,
+    ProductImportReport,
+    ProductImportRowResult,
+    ProductInventoryUpdate,
+    ProductInventoryUpdateReport,
+    ProductInventoryUpdateResult,
+    ProductRead,
+    ProductStockShardConfig,
+    ProductUpdate,
+)
+from app.core.config import get_settings
+from app.core.decorators import read_only, retry_on_conflict
 from app.core.exceptions import (
+    ExceptionCode,
     ProductNotFoundException,
 )
-from app.domain.model.product import Product
+from app.core.metrics import instrumented
+from app.domain.exceptions import (
+    ConcurrentModificationException,
+    DomainException,
+    InsufficientStockException,
+    PermissionDeniedException,
+)
+from app.domain.model.product import InventoryAdjustment, Product
 from app.domain.ports.product_repository import IProductRepository
 from app.domain.ports.unit_of_work import IUnitOfWork
 
 
+@instrumented("use_case")
 class ProductUseCase:
     def __init__(self, product_repository: IProductRepository, uow: IUnitOfWork):
         self.product_repository = product_repository
@@ -22,12 +46,152 @@ class ProductUseCase:
             created_product = await self.product_repository.create(product=product_to_create)
             return ProductRead.model_validate(created_product)
 
+    async def import_products(self, seller_id: int, rows: AsyncIterable[Any]) -> ProductImportReport:
+        """
+        상품을 대량으로 등록합니다.
+        1. 각 행을 ProductCreate로 검증 (실패한 행은 결과에 오류로 기록)
+        2. 유효한 행을 청크 단위로 모아 다중 행 INSERT로 저장
+        3. 행 번호 순으로 정렬된 결과 리포트 반환
+
+        rows의 각 요소는 상품 필드를 담은 dict이며, 파싱 단계에서 실패한 행은 ValueError 인스턴스로 전달됩니다.
+        청크마다 별도의 트랜잭션으로 커밋되므로 먼저 저장된 청크는 이후 청크의 결과와 무관하게 유지됩니다.
+        """
+        chunk_size = get_settings().bulk_import_chunk_size
+        results: list[ProductImportRowResult] = []
+        chunk: list[tuple[int, Product]] = []
+
+        row_number = 0
+        async for raw in rows:
+            row_number += 1
+            if isinstance(raw, ValueError):
+                results.append(ProductImportRowResult(row=row_number, success=False, error=str(raw)))
+                continue
+
+            try:
+                product_create = ProductCreate.model_validate(raw)
+            except ValidationError as e:
+                results.append(ProductImportRowResult(row=row_number, success=False, error=_format_errors(e)))
+                continue
+
+            chunk.append((row_number, Product(**product_create.model_dump(), seller_id=seller_id)))
+            if len(chunk) >= chunk_size:
+                results.extend(await self._import_chunk(chunk))
+                chunk = []
+
+        if chunk:
+            results.extend(await self._import_chunk(chunk))
+
+        results.sort(key=lambda result: result.row)
+        succeeded = sum(1 for result in results if result.success)
+        return ProductImportReport(
+            total=len(results),
+            succeeded=succeeded,
+            failed=len(results) - succeeded,
+            results=results,
+        )
+
+    async def _import_chunk(self, chunk: list[tuple[int, Product]]) -> list[ProductImportRowResult]:
+        """검증을 통과한 행들을 한 트랜잭션에서 저장합니다."""
+        async with self.uow:
+            created_products = await self.product_repository.create_many([product for _, product in chunk])
+
+        return [
+            ProductImportRowResult(row=row, success=True, product_id=product.id)
+            for (row, _), product in zip(chunk, created_products, strict=True)
+        ]
+
+    async def bulk_update_inventory(
+        self, seller_id: int, inventory_update: ProductInventoryUpdate
+    ) -> ProductInventoryUpdateReport:
+        """
+        여러 상품의 재고/가격을 한 트랜잭션에서 일괄 조정합니다.
+        1. 요청 내 중복 ID 제외
+        2. 집합 단위 UPDATE로 조건(소유자, 기대 버전, 재고 하한)을 만족하는 항목만 적용
+        3. 적용되지 않은 항목은 현재 상태를 조회하여 실패 사유를 항목별로 보고
+
+        일부 항목이 실패해도 나머지 항목의 적용은 취소되지 않습니다.
+        """
+        items = inventory_update.items
+        seen_ids: set[int] = set()
+        duplicated_indexes: set[int] = set()
+        adjustments: list[InventoryAdjustment] = []
+        for index, item in enumerate(items):
+            if item.id in seen_ids:
+                duplicated_indexes.add(index)
+                continue
+            seen_ids.add(item.id)
+            adjustments.append(
+                InventoryAdjustment(
+                    product_id=item.id,
+                    stock=item.stock,
+                    stock_delta=item.stock_delta,
+                    price=item.price,
+                    expected_version=item.expected_version,
+                )
+            )
+
+        async with self.uow:
+            applied = {
+                product.id: product
+                for product in await self.product_repository.apply_inventory_adjustments(seller_id, adjustments)
+            }
+            rejected_ids = [adjustment.product_id for adjustment in adjustments if adjustment.product_id not in applied]
+            current = {product.id: product for product in await self.product_repository.get_many_by_ids(rejected_ids)}
+
+        adjustments_by_id = {adjustment.product_id: adjustment for adjustment in adjustments}
+        results: list[ProductInventoryUpdateResult] = []
+        for index, item in enumerate(items):
+            if index in duplicated_indexes:
+                results.append(
+                    ProductInventoryUpdateResult(
+                        id=item.id,
+                        success=False,
+                        code=ExceptionCode.BAD_REQUEST,
+                        message="요청에 중복된 상품 ID입니다. 첫 번째 항목만 적용됩니다.",
+                    )
+                )
+            elif item.id in applied:
+                results.append(
+                    ProductInventoryUpdateResult(
+                        id=item.id, success=True, product=ProductRead.model_validate(applied[item.id])
+                    )
+                )
+            else:
+                code, message = _explain_rejection(seller_id, adjustments_by_id[item.id], current.get(item.id))
+                results.append(ProductInventoryUpdateResult(id=item.id, success=False, code=code, message=message))
+
+        succeeded = len(applied)
+        return ProductInventoryUpdateReport(
+            total=len(results),
+            succeeded=succeeded,
+            failed=len(results) - succeeded,
+            results=results,
+        )
+
+    @read_only
     async def get_product_by_id(self, product_id: int) -> ProductRead:
         product = await self.product_repository.get_by_id(product_id=product_id)
         if not product:
             raise ProductNotFoundException()
         return ProductRead.model_validate(product)
 
+    @read_only
+    async def batch_get_products(self, product_ids: Sequence[int]) -> ProductBatchRead:
+        """여러 상품을 한 번의 쿼리로 조회합니다. 결과는 요청한 ID 순서(중복 제거)를 따릅니다."""
+        requested_ids = list(dict.fromkeys(product_ids))
+        products = await self.product_repository.get_many_by_ids(requested_ids)
+        products_by_id = {product.id: product for product in products}
+
+        return ProductBatchRead(
+            items=[
+                ProductRead.model_validate(products_by_id[product_id])
+                for product_id in requested_ids
+                if product_id in products_by_id
+            ],
+            not_found_ids=[product_id for product_id in requested_ids if product_id not in products_by_id],
+        )
+
+    @read_only
     async def list_products(self, offset: int, limit: int, seller_id: int | None = None) -> Sequence[ProductRead]:
         products = await self.product_repository.list(offset=offset, limit=limit, seller_id=seller_id)
         return [ProductRead.model_validate(p) for p in products]
@@ -50,3 +214,77 @@ class ProductUseCase:
 
             updated_product = await self.product_repository.update(product=product)
             return ProductRead.model_validate(updated_product)
+
+    @retry_on_conflict()
+    async def configure_stock_shards(self, product_id: int, shard_config: ProductStockShardConfig) -> ProductRead:
+        """상품 재고를 지정한 수의 샤드 행에 고르게 나눠 저장하도록 바꿉니다. (0이면 샤드 재고를 상품 행으로 합침)"""
+        async with self.uow:
+            product = await self.product_repository.configure_stock_shards(product_id, shard_config.shard_count)
+            if not product:
+                raise ProductNotFoundException()
+            return ProductRead.model_validate(product)
+
+    async def rebalance_stock_shards(self, product_ids: Sequence[int] | None = None) -> list[ProductRead]:
+        """
+        주문이 임의의 샤드에서 차감되며 생긴 샤드 간 재고 편차를 합계를 유지한 채 고르게 다시 나눕니다.
+        product_ids를 지정하지 않으면 재고 샤드를 사용하는 모든 상품이 대상이며,
+        상품마다 별도의 트랜잭션으로 처리하여 샤드 행을 잠그는 시간을 짧게 유지합니다.
+        재고 샤드를 사용하지 않거나 존재하지 않는 상품은 결과에서 제외됩니다.
+        """
+        if product_ids is None:
+            async with self.uow:
+                product_ids = await self.product_repository.list_stock_sharded_ids()
+
+        rebalanced: list[ProductRead] = []
+        for product_id in sorted(set(product_ids)):
+            async with self.uow:
+                product = await self.product_repository.rebalance_stock_shards(product_id)
+            if product:
+                rebalanced.append(ProductRead.model_validate(product))
+        return rebalanced
+
+
+def _format_errors(error: ValidationError) -> str:
+    """Pydantic 검증 오류를 한 줄 메시지로 변환합니다."""
+    return "; ".join(
+        f"{'.'.join(str(loc) for loc in detail['loc'])}: {detail['msg']}" if detail["loc"] else detail["msg"]
+        for detail in error.errors()
+    )
+
+
+def _explain_rejection(seller_id: int, adjustment: InventoryAdjustment, product: Product | None) -> tuple[str, str]:
+    """
+    적용되지 않은 재고 조정 항목의 실패 사유를 (오류 코드, 메시지)로 반환합니다.
+    현재 상태 기준으로 도메인 규칙을 다시 검사하며, 모든 규칙을 통과한다면
+    UPDATE 이후 다른 트랜잭션이 상태를 바꾼 경우이므로 동시 수정 충돌로 보고합니다.
+    """
+    if product is None:
+        not_found = ProductNotFoundException()
+        return not_found.code, not_found.message
+
+    try:
+        product.verify_owner(seller_id)
+        if adjustment.expected_version is not None and product.version != adjustment.expected_version:
+            raise ConcurrentModificationException(
+                f"상품 정보가 변경되었습니다. (기대 버전: {adjustment.expected_version}, 현재 버전: {product.version})"
+            )
+        product.model_copy().adjust_inventory(
+            stock=adjustment.stock,
+            stock_delta=adjustment.stock_delta,
+            price=adjustment.price,
+        )
+    except DomainException as e:
+        return _domain_error_code(e), str(e)
+
+    return ExceptionCode.CONCURRENT_MODIFICATION, "다른 요청과 충돌하여 적용되지 않았습니다. 다시 시도해주세요."
+
+
+def _domain_error_code(error: DomainException) -> str:
+    """도메인 예외를 API 오류 코드로 변환합니다. (exception_handlers의 매핑과 동일)"""
+    if isinstance(error, InsufficientStockException):
+        return ExceptionCode.INSUFFICIENT_STOCK
+    if isinstance(error, PermissionDeniedException):
+        return ExceptionCode.FORBIDDEN
+    if isinstance(error, ConcurrentModificationException):
+        return ExceptionCode.CONCURRENT_MODIFICATION
+    return ExceptionCode.BAD_REQUEST
@@ -1,10 +1,12 @@
 from app.application.dto.seller_dto import SellerCreate, SellerRead
 from app.core.exceptions import SellerAlreadyExistsException, UserNotFoundException
+from app.core.metrics import instrumented
 from app.domain.ports.seller_repository import ISellerRepository
 from app.domain.ports.unit_of_work import IUnitOfWork
 from app.domain.ports.user_repository import IUserRepository
 
 
+@instrumented("use_case")
 class SellerUseCase:
     def __init__(
         self,
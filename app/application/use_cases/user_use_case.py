@@ -1,21 +1,36 @@
-from app.application.dto.token import TokenPayload
+import uuid
+from datetime import datetime, timedelta
+
+from app.application.dto.token import Token, TokenPayload
 from app.application.dto.user_dto import UserCreate, UserRead, UserUpdate
 from app.core import security
+from app.core.config import get_settings
 from app.core.exceptions import (
     EmailAlreadyExistsException,
     InvalidCredentialsException,
+    InvalidRefreshTokenException,
     SellerAlreadyExistsException,
     UserInactiveException,
     UserNotFoundException,
 )
+from app.core.metrics import instrumented
+from app.domain.model.refresh_token import RefreshToken
 from app.domain.model.user import User
+from app.domain.ports.refresh_token_repository import IRefreshTokenRepository
 from app.domain.ports.unit_of_work import IUnitOfWork
 from app.domain.ports.user_repository import IUserRepository
 
 
+@instrumented("use_case")
 class UserUseCase:
-    def __init__(self, user_repository: IUserRepository, uow: IUnitOfWork):
+    def __init__(
+        self,
+        user_repository: IUserRepository,
+        refresh_token_repository: IRefreshTokenRepository,
+        uow: IUnitOfWork,
+    ):
         self.user_repository = user_repository
+        self.refresh_token_repository = refresh_token_repository
         self.uow = uow
 
     async def create_user(self, user_create: UserCreate) -> UserRead:
@@ -38,7 +53,8 @@ class UserUseCase:
 
             return UserRead.model_validate(created_user)
 
-    async def login_user(self, email: str, password: str) -> str:
+    async def login_user(self, email: str, password: str) -> Token:
+        # 조회와 비밀번호 검증은 작업 단위 밖에서 하여, 실패한 로그인과 bcrypt 검증 동안 커넥션을 점유하지 않음
         user = await self.user_repository.get_by_email(email=email)
 
         # 도메인 메서드 사용
@@ -48,8 +64,56 @@ class UserUseCase:
         if not user.is_active:
             raise UserInactiveException()
 
-        access_token = security.create_access_token(data=TokenPayload(sub=user.email))
-        return access_token
+        async with self.uow:
+            return await self._issue_tokens(user, family_id=uuid.uuid4().hex)
+
+    async def refresh_access_token(self, refresh_token: str) -> Token:
+        """
+        리프레시 토큰으로 액세스 토큰을 재발급합니다. (비밀번호 검증 없음)
+
+        사용한 리프레시 토큰은 폐기하고 같은 묶음의 새 리프레시 토큰을 발급합니다(회전).
+        이미 폐기된 토큰이 다시 사용되면 탈취된 것으로 보고 묶음 전체를 폐기합니다.
+        """
+        async with self.uow:
+            now = datetime.now()
+            stored = await self.refresh_token_repository.get_by_hash(security.hash_refresh_token(refresh_token))
+            if stored is None or stored.is_expired(now):
+                raise InvalidRefreshTokenException()
+
+            if stored.is_revoked or not await self.refresh_token_repository.revoke(stored.token_hash, now):
+                await self.refresh_token_repository.revoke_family(stored.family_id, now)
+                await self.uow.commit()
+                raise InvalidRefreshTokenException(message="이미 사용된 리프레시 토큰입니다. 다시 로그인해주세요.")
+
+            user = await self.user_repository.get_by_id(user_id=stored.user_id)
+            if not user or not user.is_active:
+                raise InvalidRefreshTokenException()
+
+            return await self._issue_tokens(user, family_id=stored.family_id)
+
+    async def revoke_refresh_token(self, refresh_token: str) -> None:
+        """리프레시 토큰과 같은 묶음의 토큰을 모두 폐기합니다. (로그아웃)"""
+        async with self.uow:
+            stored = await self.refresh_token_repository.get_by_hash(security.hash_refresh_token(refresh_token))
+            if stored is not None:
+                await self.refresh_token_repository.revoke_family(stored.family_id, datetime.now())
+
+    async def _issue_tokens(self, user: User, family_id: str) -> Token:
+        """사용자 클레임을 담은 액세스 토큰과 새 리프레시 토큰을 발급합니다."""
+        if user.id is None:
+            raise ValueError("토큰 발급을 위해서는 사용자의 ID가 필요합니다.")
+
+        refresh_token = security.generate_refresh_token()
+        await self.refresh_token_repository.save(
+            RefreshToken(
+                token_hash=security.hash_refresh_token(refresh_token),
+                user_id=user.id,
+                family_id=family_id,
+                expires_at=datetime.now() + timedelta(days=get_settings().jwt_refresh_token_expire_days),
+            )
+        )
+        access_token = security.create_access_token(data=TokenPayload.from_user(user))
+        return Token(access_token=access_token, refresh_token=refresh_token)
 
     async def get_user_by_id(self, user_id: int) -> UserRead | None:
         user = await self.user_repository.get_by_id(user_id=user_id)
@@ -2,15 +2,22 @@ from dependency_injector import containers, providers
 
 from app.application.use_cases.cart_use_case import CartUseCase
 from app.application.use_cases.order_use_case import OrderUseCase
+from app.application.use_cases.outbox_use_case import OutboxUseCase
 from app.application.use_cases.product_use_case import ProductUseCase
 from app.application.use_cases.seller_use_case import SellerUseCase
 from app.application.use_cases.user_use_case import UserUseCase
 from app.core.config import get_settings
-from app.core.db import get_session
+from app.core.db import get_request_session
+from app.core.di import RequestScoped
 from app.infrastructure.persistence.cart_repository import SQLCartRepository
+from app.infrastructure.persistence.idempotency_repository import SQLIdempotencyRepository
 from app.infrastructure.persistence.order_repository import SQLOrderRepository
+from app.infrastructure.persistence.order_summary_repository import SQLOrderSummaryRepository
+from app.infrastructure.persistence.outbox_repository import SQLOutboxRepository
 from app.infrastructure.persistence.product_repository import SQLProductRepository
+from app.infrastructure.persistence.refresh_token_repository import SQLRefreshTokenRepository
 from app.infrastructure.persistence.seller_repository import SQLSellerRepository
+from app.infrastructure.persistence.stock_reservation_repository import SQLStockReservationRepository
 from app.infrastructure.persistence.unit_of_work import SQLAlchemyUnitOfWork
 from app.infrastructure.persistence.user_repository import SQLUserRepository
 
@@ -29,63 +36,127 @@ class Container(containers.DeclarativeContainer):
 
     # Core
     settings = providers.Singleton(get_settings)
-    db_session = providers.Resource(get_session)
+    # 요청 스코프 세션: 요청마다 request_scope 의존성이 만든 세션을 반환하며, 생성/종료는 요청 스코프가 담당
+    db_session = RequestScoped(providers.Callable(get_request_session))
 
-    # Repositories
-    user_repository = providers.Factory(
-        SQLUserRepository,
-        session=db_session,
+    # Repositories / Unit of Work / Use Cases
+    # 모두 상태가 없는 객체이므로 요청 스코프 안에서는 요청당 한 번만 생성 (RequestScoped)
+    user_repository = RequestScoped(
+        providers.Factory(
+            SQLUserRepository,
+            session=db_session,
+        )
     )
-    product_repository = providers.Factory(
-        SQLProductRepository,
-        session=db_session,
+    product_repository = RequestScoped(
+        providers.Factory(
+            SQLProductRepository,
+            session=db_session,
+        )
     )
-    order_repository = providers.Factory(
-        SQLOrderRepository,
-        session=db_session,
+    order_repository = RequestScoped(
+        providers.Factory(
+            SQLOrderRepository,
+            session=db_session,
+        )
     )
-    cart_repository = providers.Factory(
-        SQLCartRepository,
-        session=db_session,
+    order_summary_repository = RequestScoped(
+        providers.Factory(
+            SQLOrderSummaryRepository,
+            session=db_session,
+        )
     )
-    seller_repository = providers.Factory(
-        SQLSellerRepository,
-        session=db_session,
+    cart_repository = RequestScoped(
+        providers.Factory(
+            SQLCartRepository,
+            session=db_session,
+        )
+    )
+    seller_repository = RequestScoped(
+        providers.Factory(
+            SQLSellerRepository,
+            session=db_session,
+        )
+    )
+    refresh_token_repository = RequestScoped(
+        providers.Factory(
+            SQLRefreshTokenRepository,
+            session=db_session,
+        )
+    )
+    idempotency_repository = RequestScoped(
+        providers.Factory(
+            SQLIdempotencyRepository,
+            session=db_session,
+        )
+    )
+    reservation_repository = RequestScoped(
+        providers.Factory(
+            SQLStockReservationRepository,
+            session=db_session,
+        )
+    )
+    outbox_repository = RequestScoped(
+        providers.Factory(
+            SQLOutboxRepository,
+            session=db_session,
+        )
     )
 
-    # Unit of Work
-    uow = providers.Factory(
-        SQLAlchemyUnitOfWork,
-        session=db_session,
+    uow = RequestScoped(
+        providers.Factory(
+            SQLAlchemyUnitOfWork,
+            session=db_session,
+        )
     )
 
-    # Use Cases
-    user_use_case = providers.Factory(
-        UserUseCase,
-        user_repository=user_repository,
-        uow=uow,
-    )
-    product_use_case = providers.Factory(
-        ProductUseCase,
-        product_repository=product_repository,
-        uow=uow,
-    )
-    order_use_case = providers.Factory(
-        OrderUseCase,
-        order_repository=order_repository,
-        product_repository=product_repository,
-        cart_repository=cart_repository,
-        uow=uow,
-    )
-    cart_use_case = providers.Factory(
-        CartUseCase,
-        cart_repository=cart_repository,
-        product_repository=product_repository,
-        uow=uow,
-    )
-    seller_use_case = providers.Factory(
-        SellerUseCase,
-        seller_repository=seller_repository,
-        user_repository=user_repository,
-        uow=uow,
+    user_use_case = RequestScoped(
+        providers.Factory(
+            UserUseCase,
+            user_repository=user_repository,
+            refresh_token_repository=refresh_token_repository,
+            uow=uow,
+        )
+    )
+    product_use_case = RequestScoped(
+        providers.Factory(
+            ProductUseCase,
+            product_repository=product_repository,
+            uow=uow,
+        )
+    )
+    order_use_case = RequestScoped(
+        providers.Factory(
+            OrderUseCase,
+            order_repository=order_repository,
+            product_repository=product_repository,
+            cart_repository=cart_repository,
+            order_summary_repository=order_summary_repository,
+            idempotency_repository=idempotency_repository,
+            reservation_repository=reservation_repository,
+            outbox_repository=outbox_repository,
+            uow=uow,
+        )
+    )
+    outbox_use_case = RequestScoped(
+        providers.Factory(
+            OutboxUseCase,
+            outbox_repository=outbox_repository,
+            uow=uow,
+        )
+    )
+    cart_use_case = RequestScoped(
+        providers.Factory(
+            CartUseCase,
+            cart_repository=cart_repository,
+            product_repository=product_repository,
+            uow=uow,
+        )
+    )
+    seller_use_case = RequestScoped(
+        providers.Factory(
+            SellerUseCase,
+            seller_repository=seller_repository,
+            user_repository=user_repository,
+            uow=uow,
+        )
     )
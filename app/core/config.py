@@ -1,4 +1,5 @@
 from functools import lru_cache
+from typing import Literal
 
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -13,12 +14,121 @@ class Settings(BaseSettings):
     auto_create_tables: bool = True
 
     database_url: str = "sqlite+aiosqlite:///:memory:"
+    # 실행되는 모든 SQL을 출력 (디버깅용, 요청마다 동기 출력이 발생하므로 운영 환경에서는 사용하지 않음)
+    database_echo: bool = False
+    # 읽기 복제본 URL 목록 (JSON 배열). 조회 전용으로 표시된 유즈케이스의 SELECT가 라운드 로빈으로 라우팅됨
+    database_read_urls: list[str] = []
+    # 쓰기 커밋 후 같은 사용자의 읽기를 쓰기 DB로 고정하는 시간(초). 복제 지연보다 길게 설정
+    read_your_writes_window_seconds: float = 5.0
     jwt_secret_key: str = "super-secret"
     jwt_algorithm: str = "HS256"
-    jwt_access_token_expire_minutes: int = 30
+    # 액세스 토큰 만료 시간(분). 판매자 권한은 토큰 클레임으로 확인하므로 비활성화/권한 변경이 반영되기까지의
+    # 최대 지연이기도 함 (리프레시 토큰으로 재발급되므로 짧게 유지)
+    jwt_access_token_expire_minutes: int = 15
+    # 리프레시 토큰 만료 기간(일). 재발급할 때마다 새 토큰으로 회전됨
+    jwt_refresh_token_expire_days: int = 14
+    # 비대칭 알고리즘(ES256, EdDSA) 사용 시 PEM 형식의 서명/검증 키 (HS* 알고리즘은 jwt_secret_key 사용)
+    jwt_private_key: str | None = None
+    jwt_public_key: str | None = None
+    # 검증된 토큰 페이로드 캐시 크기 (0이면 캐시하지 않음)
+    jwt_token_cache_size: int = 10_000
+
+    # Rate Limiting
+    # 토큰 버킷 기반 요청 제한 (분당 허용 건수, 순간 최대 허용 건수도 같음)
+    rate_limit_enabled: bool = True
+    rate_limit_login_per_ip_per_minute: int = 30
+    rate_limit_login_per_email_per_minute: int = 10
+    rate_limit_signup_per_ip_per_minute: int = 10
+    rate_limit_token_per_ip_per_minute: int = 30
+    rate_limit_order_per_user_per_minute: int = 30
+
+    # Logging
+    log_level: str = "INFO"
+    # JSON 한 줄 형식으로 출력 (False면 사람이 읽기 쉬운 텍스트 형식)
+    log_json: bool = True
+    # 백그라운드 출력 대기 큐 크기 (가득 차면 이후 로그는 버림)
+    log_queue_size: int = 10_000
+    # 예상된 4xx 오류(검증 실패, 리소스 없음 등) 로그를 남기는 비율 (0~1)
+    log_client_error_sample_rate: float = 0.1
+
+    # Tracing
+    # 스팬 exporter (none/console/otlp_file/memory). none이면 추적하지 않음
+    tracing_exporter: str = "none"
+    # 상위 서비스의 결정이 없는 요청을 추적하는 비율 (0~1)
+    tracing_sample_ratio: float = 1.0
+    # otlp_file exporter가 OTLP/JSON을 추가하는 파일 경로
+    tracing_file_path: str = "traces.jsonl"
+
+    # Slow Query Log
+    # 이 시간(ms) 이상 걸린 SQL 문을 정규화한 문장별로 집계하고 경고 로그로 남김
+    slow_query_log_enabled: bool = True
+    slow_query_threshold_ms: float = 200
+    # 문장마다 처음 느리게 실행되었을 때 EXPLAIN 실행 계획 수집 (SQLite, PostgreSQL)
+    slow_query_explain: bool = True
+
+    # Event Loop Monitor
+    # 이벤트 루프 지연 감시 (감시 스레드가 간격마다 루프에 콜백을 보내 실행되기까지의 지연을 측정)
+    loop_monitor_enabled: bool = True
+    loop_monitor_interval_seconds: float = 0.1
+    # 콜백 하나가 이 시간(ms) 이상 이벤트 루프를 막으면 호출 스택과 라우트를 기록
+    loop_block_threshold_ms: float = 100
 
     # Concurrency Control
     max_retry_count: int = 3
+    # 주문/취소 시 상품 재고 동시성 제어 방식
+    # optimistic: 버전 비교로 충돌을 감지하고 재시도
+    # pessimistic: 상품 행을 ID 순으로 잠근 뒤 차감 (SELECT ... FOR UPDATE)
+    # pessimistic에서는 재고 선점 만료 처리도 잠긴 행을 건너뛰므로(SKIP LOCKED) 여러 워커가 나눠 처리할 수 있음
+    # pessimistic은 FOR UPDATE를 지원하는 DB(PostgreSQL 등) 전용. SQLite 방언은 잠금 절을 생략하므로 시작 시 경고함
+    lock_strategy: Literal["optimistic", "pessimistic"] = "optimistic"
+
+    # Stock Reservation
+    # 주문 생성 시 차감한 재고를 결제 대기(PENDING) 상태로 선점하는 시간(분)
+    reservation_ttl_minutes: int = 30
+    # 만료된 선점을 해제하는 백그라운드 작업의 실행 간격(초)과 트랜잭션 한 번에 만료 처리하는 주문 수
+    reservation_sweeper_enabled: bool = True
+    reservation_sweep_interval_seconds: float = 30
+    reservation_sweep_batch_size: int = 500
+
+    # Inventory Allocator
+    # 단건 주문을 상품별로 모아 한 트랜잭션으로 처리(그룹 커밋)할 상품 ID 목록 (JSON 배열, 플래시 세일 상품 등)
+    inventory_allocator_product_ids: list[int] = []
+    # 첫 주문이 도착한 뒤 같은 상품의 주문을 모으는 시간(ms)과 트랜잭션 한 번에 처리하는 최대 주문 수
+    inventory_allocator_window_ms: float = 5
+    inventory_allocator_max_batch: int = 100
+
+    # Outbox
+    # 주문 생성/취소 이벤트를 주문과 같은 트랜잭션에서 outbox 테이블에 기록하고 백그라운드 전달기가 외부로 전달
+    outbox_enabled: bool = False
+    # 전달 대상 (memory/file/http)
+    outbox_sink: str = "file"
+    # file sink가 이벤트를 JSON 한 줄씩 추가하는 파일 경로
+    outbox_file_path: str = "outbox_events.jsonl"
+    # http sink가 이벤트 배치를 JSON 배열로 POST하는 URL과 요청 제한 시간(초)
+    outbox_http_url: str = "http://localhost:8080/events"
+    outbox_http_timeout_seconds: float = 5
+    # 전달할 이벤트를 확인하는 간격(초)과 한 번에 전달하는 이벤트 수
+    outbox_poll_interval_seconds: float = 1
+    outbox_batch_size: int = 100
+    # 전달 실패 시 재시도 간격(초): 시도마다 두 배로 늘리되 최대 간격을 넘지 않음
+    outbox_retry_base_seconds: float = 1
+    outbox_retry_max_seconds: float = 300
+    # 가져간 이벤트를 전달 결과 기록 전까지 다른 전달기가 가져가지 않도록 미루는 시간(초). 전달 제한 시간보다 길게 설정
+    outbox_lease_seconds: float = 60
+
+    # Job Queue
+    # 커밋 후 실행하는 후속 작업(uow.on_commit) 큐의 워커 수 (동시에 실행하는 작업 수)
+    job_queue_concurrency: int = 4
+    # 실패한 작업의 최대 시도 횟수(모두 실패하면 dead letter로 보관)와 재시도 간격(초, 시도마다 두 배로 늘림)
+    job_queue_max_attempts: int = 5
+    job_queue_retry_base_seconds: float = 1
+    job_queue_retry_max_seconds: float = 60
+    # 지정하면 대기/재시도 중인 작업을 이 SQLite 파일에 저장하여 재시작 후에도 이어서 실행 (비우면 메모리에만 보관)
+    job_queue_sqlite_path: str | None = None
+
+    # Bulk Operations
+    # 대량 등록 시 한 번에 검증/저장하는 행 수 (SQLite 바인드 파라미터 한도를 고려해 설정)
+    bulk_import_chunk_size: int = 1000
 
     model_config = SettingsConfigDict(env_file=".env")
 
@@ -1,14 +1,455 @@
-from collections.abc import AsyncIterator
+import itertools
+import logging
+import re
+import threading
+import time
+from collections import Counter
+from collections.abc import AsyncIterator, Iterator, Mapping, Sequence
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any
 
+from sqlalchemy import Engine, event
 from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
-from sqlmodel import SQLModel
+from sqlalchemy.pool import ConnectionPoolEntry
+from sqlalchemy.sql.dml import UpdateBase
+from sqlmodel import Session, SQLModel
 from sqlmodel.ext.asyncio.session import AsyncSession
 
 from app.core.config import get_settings
+from app.core.metrics import current_operation
+from app.core.tracing import instrument_engine
 
 settings = get_settings()
 
-engine: AsyncEngine = create_async_engine(settings.database_url, echo=True)
+engine: AsyncEngine = create_async_engine(settings.database_url, echo=settings.database_echo)
+# 읽기 전용 복제본 엔진 (설정이 없으면 모든 쿼리가 쓰기 엔진으로 라우팅됨)
+reader_engines: list[AsyncEngine] = [create_async_engine(url) for url in settings.database_read_urls]
+
+# 현재 실행 흐름이 읽기 전용(복제본 라우팅 대상)인지 여부
+_read_only: ContextVar[bool] = ContextVar("db_read_only", default=False)
+# read-your-writes 판단 기준 키 (예: 인증된 사용자 ID)
+_read_affinity_key: ContextVar[str | None] = ContextVar("db_read_affinity_key", default=None)
+
+# 현재 요청에 바인딩된 세션 (요청마다 새로 만들고 요청이 끝나면 닫음)
+_request_session: ContextVar[AsyncSession | None] = ContextVar("db_request_session", default=None)
+
+# 커넥션 점유 시간을 집계할 라우트 이름 (예: `GET /api/v1/products/{product_id}`)
+_route_label: ContextVar[str | None] = ContextVar("db_route_label", default=None)
+
+_WROTE_KEY = "routing_session_wrote"
+# 세션 info에 기록하는 진행 중인 작업 단위(UoW) 중첩 수
+UOW_DEPTH_KEY = "unit_of_work_depth"
+UNKNOWN_ROUTE = "(unknown)"
+
+
+@dataclass
+class ConnectionHoldStats:
+    """라우트별 커넥션 점유 통계"""
+
+    checkouts: int = 0
+    total_seconds: float = 0.0
+    max_seconds: float = 0.0
+
+
+class ConnectionHoldMetrics:
+    """
+    커넥션 풀의 checkout/checkin 이벤트로 커넥션 점유 시간을 라우트별로 집계합니다.
+    세션 생성이 아니라 실제 커넥션을 잡고 있던 시간만 측정하므로 풀 압박을 그대로 보여줍니다.
+    """
+
+    def __init__(self) -> None:
+        self._stats: dict[str, ConnectionHoldStats] = {}
+        # checkin은 스레드 풀이나 GC 시점에도 호출될 수 있으므로 잠금으로 보호
+        self._lock = threading.Lock()
+
+    def attach(self, engine: AsyncEngine) -> None:
+        event.listen(engine.sync_engine, "checkout", self._on_checkout)
+        event.listen(engine.sync_engine, "checkin", self._on_checkin)
+
+    def snapshot(self) -> dict[str, ConnectionHoldStats]:
+        with self._lock:
+            return {route: ConnectionHoldStats(**vars(stats)) for route, stats in self._stats.items()}
+
+    def reset(self) -> None:
+        with self._lock:
+            self._stats.clear()
+
+    def _on_checkout(self, dbapi_connection: Any, record: ConnectionPoolEntry, proxy: Any) -> None:
+        record.info["hold_started_at"] = time.perf_counter()
+        record.info["hold_route"] = _route_label.get() or UNKNOWN_ROUTE
+
+    def _on_checkin(self, dbapi_connection: Any, record: ConnectionPoolEntry) -> None:
+        started_at = record.info.pop("hold_started_at", None)
+        route = record.info.pop("hold_route", UNKNOWN_ROUTE)
+        if started_at is None:
+            return
+
+        held = time.perf_counter() - started_at
+        with self._lock:
+            stats = self._stats.setdefault(route, ConnectionHoldStats())
+            stats.checkouts += 1
+            stats.total_seconds += held
+            stats.max_seconds = max(stats.max_seconds, held)
+
+
+slow_query_logger = logging.getLogger("app.slow_query")
+logger = logging.getLogger(__name__)
+
+_WHITESPACE_PATTERN = re.compile(r"\s+")
+# 드라이버별 바인드 파라미터 표기 (`%(name)s`, `$1`)
+_PLACEHOLDER_PATTERN = re.compile(r"%\(\w+\)s|\$\d+")
+_LITERAL_PATTERN = re.compile(r"'(?:[^']|'')*'|\b\d+(?:\.\d+)?\b")
+# 개수가 달라지는 IN 목록 (`IN (?, ?, ?)`)
+_PLACEHOLDER_LIST_PATTERN = re.compile(r"\(\?(?:, \?)+\)")
+_EXPLAINED_STATEMENTS = ("SELECT", "WITH", "UPDATE", "DELETE")
+_EXPLAIN_PREFIXES = {"sqlite": "EXPLAIN QUERY PLAN", "postgresql": "EXPLAIN"}
+
+
+def normalize_statement(statement: str) -> str:
+    """리터럴과 바인드 파라미터를 `?`로 바꾸고 IN 목록 길이를 지워, 같은 형태의 SQL 문이 하나로 집계되도록 합니다."""
+    normalized = _WHITESPACE_PATTERN.sub(" ", statement).strip()
+    normalized = _PLACEHOLDER_PATTERN.sub("?", normalized)
+    normalized = _LITERAL_PATTERN.sub("?", normalized)
+    return _PLACEHOLDER_LIST_PATTERN.sub("(?...)", normalized)
+
+
+def _value_shapes(values: Sequence[Any]) -> str:
+    # 같은 타입이 연속되면 개수로 줄임 (예: IN 목록 `int*100`)
+    shapes = []
+    for type_name, group in itertools.groupby(type(value).__name__ for value in values):
+        count = len(list(group))
+        shapes.append(type_name if count == 1 else f"{type_name}*{count}")
+    return "(" + ", ".join(shapes) + ")"
+
+
+def parameter_shape(parameters: Any, executemany: bool = False) -> str:
+    """바인드 파라미터의 값 대신 이름과 타입만 나타냅니다. (예: `(int, int*3)`, `{seller_id: int}`, `10 x (str)`)"""
+    if executemany:
+        rows = list(parameters)
+        return f"{len(rows)} x {parameter_shape(rows[0])}" if rows else "[]"
+    if isinstance(parameters, Mapping):
+        return "{" + ", ".join(f"{name}: {type(value).__name__}" for name, value in parameters.items()) + "}"
+    if isinstance(parameters, Sequence) and not isinstance(parameters, str):
+        return _value_shapes(parameters)
+    return type(parameters).__name__
+
+
+@dataclass
+class SlowQueryStats:
+    """정규화한 SQL 문별 느린 실행 통계"""
+
+    statement: str
+    count: int = 0
+    total_seconds: float = 0.0
+    max_seconds: float = 0.0
+    # 실행한 리포지토리(또는 유즈케이스) 메서드별 횟수
+    callers: Counter[str] = field(default_factory=Counter)
+    parameter_shapes: Counter[str] = field(default_factory=Counter)
+    # 처음 느리게 실행되었을 때 수집한 실행 계획 (지원하지 않는 DB나 문장이면 None)
+    plan: list[str] | None = None
+
+
+class SlowQueryLog:
+    """
+    실행 시간이 임계값을 넘은 SQL 문을 정규화한 문장별로 집계하고 경고 로그로 남깁니다.
+
+    문장마다 처음 느리게 실행되었을 때 같은 커넥션에서 실행 계획을 수집합니다. (SQLite, PostgreSQL)
+    `EXPLAIN`은 문장을 실행하지 않으므로 부작용이 없고, 같은 문장에 대해 한 번만 실행합니다.
+    """
+
+    # 집계하는 정규화 문장 최대 개수 (넘으면 새 문장은 로그만 남김)
+    MAX_STATEMENTS = 1000
+
+    def __init__(self, threshold: float, enabled: bool = True, explain: bool = True):
+        self.threshold = threshold
+        self.enabled = enabled
+        self.explain = explain
+        self._stats: dict[str, SlowQueryStats] = {}
+        self._lock = threading.Lock()
+
+    def attach(self, engine: AsyncEngine) -> None:
+        event.listen(engine.sync_engine, "before_cursor_execute", self._on_before_execute, named=True)
+        event.listen(engine.sync_engine, "after_cursor_execute", self._on_after_execute, named=True)
+
+    def snapshot(self) -> list[SlowQueryStats]:
+        with self._lock:
+            return [
+                SlowQueryStats(
+                    statement=stats.statement,
+                    count=stats.count,
+                    total_seconds=stats.total_seconds,
+                    max_seconds=stats.max_seconds,
+                    callers=Counter(stats.callers),
+                    parameter_shapes=Counter(stats.parameter_shapes),
+                    plan=stats.plan,
+                )
+                for stats in self._stats.values()
+            ]
+
+    def top(self, limit: int) -> list[SlowQueryStats]:
+        """총 실행 시간이 긴 순서로 상위 `limit`개 문장을 반환합니다."""
+        return sorted(self.snapshot(), key=lambda stats: stats.total_seconds, reverse=True)[:limit]
+
+    def reset(self) -> None:
+        with self._lock:
+            self._stats.clear()
+
+    def _on_before_execute(self, **kwargs: Any) -> None:
+        context = kwargs["context"]
+        if self.enabled and context is not None:
+            context._slow_query_started_at = time.perf_counter()
+
+    def _on_after_execute(self, **kwargs: Any) -> None:
+        started_at = getattr(kwargs["context"], "_slow_query_started_at", None)
+        if started_at is None:
+            return
+        elapsed = time.perf_counter() - started_at
+        if elapsed < self.threshold:
+            return
+
+        statement: str = kwargs["statement"]
+        normalized = normalize_statement(statement)
+        caller = current_operation() or UNKNOWN_ROUTE
+        shape = parameter_shape(kwargs["parameters"], kwargs["executemany"])
+        with self._lock:
+            stats = self._stats.get(normalized)
+            if stats is None and len(self._stats) < self.MAX_STATEMENTS:
+                stats = self._stats[normalized] = SlowQueryStats(normalized)
+            needs_plan = stats is not None and stats.plan is None
+            if stats is not None:
+                stats.count += 1
+                stats.total_seconds += elapsed
+                stats.max_seconds = max(stats.max_seconds, elapsed)
+                stats.callers[caller] += 1
+                stats.parameter_shapes[shape] += 1
+
+        if stats is not None and needs_plan and self.explain:
+            stats.plan = self._explain(kwargs["conn"], statement, kwargs["parameters"], kwargs["executemany"])
+        slow_query_logger.warning(
+            "느린 SQL 문 %.1fms: %s",
+            elapsed * 1000,
+            normalized,
+            extra={
+                "statement": normalized,
+                "duration_ms": round(elapsed * 1000, 3),
+                "parameters": shape,
+                "caller": caller,
+                "plan": stats.plan if stats is not None else None,
+            },
+        )
+
+    def _explain(self, conn: Any, statement: str, parameters: Any, executemany: bool) -> list[str] | None:
+        prefix = _EXPLAIN_PREFIXES.get(conn.dialect.name)
+        if prefix is None or not statement.lstrip().upper().startswith(_EXPLAINED_STATEMENTS):
+            return None
+        if executemany:
+            parameters = next(iter(parameters), ())
+        # 이벤트가 다시 발생하지 않도록 DBAPI 커서로 직접 실행
+        cursor = conn.connection.dbapi_connection.cursor()
+        try:
+            cursor.execute(f"{prefix} {statement}", parameters)
+            rows = cursor.fetchall()
+        except Exception as e:
+            slow_query_logger.debug("실행 계획을 수집하지 못했습니다: %s", e)
+            return None
+        finally:
+            cursor.close()
+        # SQLite는 (id, parent, notused, detail), PostgreSQL은 (QUERY PLAN,) 행을 반환
+        return [str(row[-1]) for row in rows]
+
+
+connection_hold_metrics = ConnectionHoldMetrics()
+slow_query_log = SlowQueryLog(
+    settings.slow_query_threshold_ms / 1000, settings.slow_query_log_enabled, settings.slow_query_explain
+)
+for _engine in (engine, *reader_engines):
+    connection_hold_metrics.attach(_engine)
+    slow_query_log.attach(_engine)
+    instrument_engine(_engine)
+
+
+class ReadYourWritesTracker:
+    """
+    쓰기를 커밋한 키(사용자)를 일정 시간 동안 기록하여,
+    복제 지연 동안에는 해당 키의 읽기를 쓰기 엔진으로 보내도록 합니다.
+    """
+
+    # 만료 항목 정리를 시작하는 기록 수
+    PRUNE_THRESHOLD = 10_000
+
+    def __init__(self, window_seconds: float):
+        self.window_seconds = window_seconds
+        self._sticky_until: dict[str, float] = {}
+
+    def mark_write(self, key: str) -> None:
+        now = time.monotonic()
+        if len(self._sticky_until) >= self.PRUNE_THRESHOLD:
+            self._sticky_until = {k: until for k, until in self._sticky_until.items() if until > now}
+        self._sticky_until[key] = now + self.window_seconds
+
+    def is_sticky(self, key: str) -> bool:
+        until = self._sticky_until.get(key)
+        return until is not None and until > time.monotonic()
+
+
+read_your_writes = ReadYourWritesTracker(settings.read_your_writes_window_seconds)
+
+
+class RoutingSession(Session):
+    """
+    쿼리마다 바인드할 엔진을 고르는 세션
+
+    - 쓰기(flush, INSERT/UPDATE/DELETE)는 항상 쓰기 엔진
+    - 읽기 전용으로 표시된 흐름의 SELECT는 복제본 엔진 (라운드 로빈)
+    - 단, 현재 키가 최근에 쓰기를 커밋했다면 복제 지연을 피하기 위해 쓰기 엔진
+    """
+
+    def __init__(
+        self,
+        *,
+        writer: AsyncEngine,
+        readers: Sequence[AsyncEngine] = (),
+        tracker: ReadYourWritesTracker | None = None,
+        **kwargs: Any,
+    ):
+        super().__init__(**kwargs)
+        self._writer = writer.sync_engine
+        self._readers = [reader.sync_engine for reader in readers]
+        self._reader_cycle = itertools.cycle(self._readers)
+        self._tracker = tracker
+
+    def get_bind(self, mapper: Any = None, clause: Any = None, **kwargs: Any) -> Engine:
+        if self._flushing or isinstance(clause, UpdateBase):
+            self.info[_WROTE_KEY] = True
+            return self._writer
+
+        if self._readers and _read_only.get() and not self._is_sticky():
+            return next(self._reader_cycle)
+        return self._writer
+
+    def commit(self) -> None:
+        # 커밋 중 flush에서도 쓰기가 발생할 수 있으므로 커밋 이후에 쓰기 여부를 확인
+        super().commit()
+        wrote = self.info.pop(_WROTE_KEY, False)
+        key = _read_affinity_key.get()
+        if wrote and key is not None and self._tracker is not None:
+            self._tracker.mark_write(key)
+
+    def rollback(self) -> None:
+        self.info.pop(_WROTE_KEY, None)
+        super().rollback()
+
+    def _is_sticky(self) -> bool:
+        key = _read_affinity_key.get()
+        return key is not None and self._tracker is not None and self._tracker.is_sticky(key)
+
+
+class LazySession(AsyncSession):
+    """
+    실제 쿼리를 실행하는 동안에만 커넥션을 점유하는 세션
+
+    세션을 만들어도 커넥션은 첫 쿼리에서야 풀에서 가져오며(인증 실패 등 쿼리 없는 요청은 커넥션을 쓰지 않음),
+    작업 단위(UoW) 밖에서 실행된 조회는 결과를 버퍼링한 직후 커넥션을 풀에 반환합니다.
+    UoW 안에서는 커밋/롤백 시점에 반환됩니다.
+    """
+
+    async def exec(self, *args: Any, **kwargs: Any) -> Any:
+        result = await super().exec(*args, **kwargs)
+        await self._release_if_idle()
+        return result
+
+    async def get(self, *args: Any, **kwargs: Any) -> Any:
+        instance = await super().get(*args, **kwargs)
+        await self._release_if_idle()
+        return instance
+
+    async def _release_if_idle(self) -> None:
+        # 변경 사항이 없고 UoW 밖이라면 읽기 트랜잭션을 끝내고 커넥션을 반환
+        # (close는 로드된 속성을 만료시키지 않으므로 방금 읽은 엔티티는 그대로 사용 가능)
+        if (
+            self.info.get(UOW_DEPTH_KEY, 0) == 0
+            and self.in_transaction()
+            and not (self.new or self.dirty or self.deleted)
+            and not self.info.get(_WROTE_KEY)
+        ):
+            await self.close()
+
+
+def create_routing_session(
+    writer: AsyncEngine,
+    readers: Sequence[AsyncEngine] = (),
+    tracker: ReadYourWritesTracker | None = None,
+) -> LazySession:
+    """쓰기/읽기 엔진 사이에서 쿼리를 라우팅하는 세션을 생성합니다."""
+    return LazySession(sync_session_class=RoutingSession, writer=writer, readers=readers, tracker=tracker)
+
+
+@contextmanager
+def read_only_scope() -> Iterator[None]:
+    """블록 안에서 실행되는 SELECT를 복제본 엔진으로 라우팅합니다."""
+    token = _read_only.set(True)
+    try:
+        yield
+    finally:
+        _read_only.reset(token)
+
+
+@contextmanager
+def route_scope(label: str) -> Iterator[None]:
+    """블록 안에서 점유한 커넥션 시간을 지정한 라우트로 집계합니다."""
+    token = _route_label.set(label)
+    try:
+        yield
+    finally:
+        _route_label.reset(token)
+
+
+@contextmanager
+def bind_request_session(session: AsyncSession) -> Iterator[None]:
+    """블록 안에서 `get_request_session()`이 지정한 세션을 반환하도록 현재 컨텍스트에 바인딩합니다."""
+    token = _request_session.set(session)
+    try:
+        yield
+    finally:
+        _request_session.reset(token)
+
+
+def get_request_session() -> AsyncSession:
+    """
+    현재 요청에 바인딩된 세션을 반환합니다.
+
+    Raises:
+        RuntimeError: 요청 스코프(`bind_request_session`) 밖에서 호출한 경우
+    """
+    session = _request_session.get()
+    if session is None:
+        raise RuntimeError("요청 스코프 밖에서 DB 세션을 요청했습니다. bind_request_session() 안에서 사용해야 합니다.")
+    return session
+
+
+def set_read_affinity(key: str | None) -> None:
+    """현재 요청의 read-your-writes 기준 키를 설정합니다. (예: `user:1`)"""
+    _read_affinity_key.set(key)
+
+
+def warn_if_lock_strategy_unsupported(target: AsyncEngine | None = None) -> bool:
+    """
+    비관적 락 모드(`LOCK_STRATEGY=pessimistic`)가 DB에서 행을 잠그지 못하면 경고를 남기고 True를 반환합니다.
+
+    SQLite 방언은 `with_for_update()`를 무시하고 평범한 SELECT로 컴파일하므로 행 락과 SKIP LOCKED가 적용되지 않습니다.
+    (SQLite는 데이터베이스 단위 쓰기 락으로 직렬화되며, 버전 충돌은 낙관적 락과 같은 방식으로 감지됨)
+    """
+    dialect = (target or engine).dialect.name
+    if get_settings().lock_strategy != "pessimistic" or dialect != "sqlite":
+        return False
+    logger.warning(
+        "LOCK_STRATEGY=pessimistic은 SELECT ... FOR UPDATE를 지원하는 DB(PostgreSQL 등)에서만 행을 잠급니다. "
+        "%s에서는 잠금 없이 실행됩니다.",
+        dialect,
+    )
+    return True
 
 
 async def create_db_and_tables() -> None:
@@ -25,5 +466,5 @@ async def create_db_and_tables() -> None:
 
 
 async def get_session() -> AsyncIterator[AsyncSession]:
-    async with AsyncSession(engine) as session:
+    async with create_routing_session(engine, reader_engines, read_your_writes) as session:
         yield session
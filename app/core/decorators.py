@@ -1,9 +1,11 @@
 import functools
 import logging
-from collections.abc import Callable
+from collections.abc import Awaitable, Callable
 from typing import Any, TypeVar
 
 from app.core.config import get_settings
+from app.core.db import read_only_scope
+from app.core.metrics import optimistic_lock_conflicts_total, optimistic_lock_exhausted_total
 from app.domain.exceptions import ConcurrentModificationException
 
 logger = logging.getLogger(__name__)
@@ -18,6 +20,9 @@ def retry_on_conflict(max_retries: int | None = None) -> Callable[[Callable[...,
     """
 
     def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
+        conflicts = optimistic_lock_conflicts_total.labels(func.__qualname__)
+        exhausted = optimistic_lock_exhausted_total.labels(func.__qualname__)
+
         @functools.wraps(func)
         async def wrapper(*args: Any, **kwargs: Any) -> Any:
             nonlocal max_retries
@@ -29,6 +34,7 @@ def retry_on_conflict(max_retries: int | None = None) -> Callable[[Callable[...,
                     return await func(*args, **kwargs)
                 except ConcurrentModificationException as e:
                     last_exception = e
+                    conflicts.inc()
                     logger.warning(
                         f"Concurrent modification detected in {func.__name__}. "
                         f"Retrying... (Attempt {attempt + 1}/{effective_max_retries})"
@@ -36,6 +42,7 @@ def retry_on_conflict(max_retries: int | None = None) -> Callable[[Callable[...,
 
             # 모든 재시도 실패 시 마지막 예외 전파
             if last_exception:
+                exhausted.inc()
                 logger.error(
                     f"Max retries ({effective_max_retries}) reached for {func.__name__}. "
                     "Raising ConcurrentModificationException."
@@ -46,3 +53,17 @@ def retry_on_conflict(max_retries: int | None = None) -> Callable[[Callable[...,
         return wrapper
 
     return decorator
+
+
+def read_only[**P, R](func: Callable[P, Awaitable[R]]) -> Callable[P, Awaitable[R]]:
+    """
+    조회 전용 유즈케이스/리포지토리 메서드를 표시하는 데코레이터입니다.
+    읽기 복제본이 설정되어 있으면 메서드 안의 SELECT가 복제본으로 라우팅됩니다.
+    """
+
+    @functools.wraps(func)
+    async def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+        with read_only_scope():
+            return await func(*args, **kwargs)
+
+    return wrapper
@@ -0,0 +1,109 @@
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any
+
+from dependency_injector import providers
+
+_MISSING = object()
+
+# 현재 요청에서 이미 생성한 인스턴스 (provider별)
+_request_instances: ContextVar[dict["RequestScoped", Any] | None] = ContextVar("di_request_instances", default=None)
+
+
+@contextmanager
+def request_instance_scope() -> Iterator[None]:
+    """블록 안에서 `RequestScoped` provider가 만든 인스턴스를 재사용하도록 요청 스코프를 엽니다."""
+    token = _request_instances.set({})
+    try:
+        yield
+    finally:
+        _request_instances.reset(token)
+
+
+class RequestScoped(providers.Provider):  # type: ignore[type-arg]
+    """
+    요청 스코프 안에서는 요청당 한 번만 생성하여 재사용하는 provider 래퍼
+
+    감싼 Factory의 의존성 그래프는 처음 사용할 때 일반 함수 호출로 펼쳐두고(precompile),
+    이후에는 provider의 인자 해석 없이 바로 생성합니다.
+    요청 스코프 밖(스크립트, 단위 테스트 등)에서는 감싼 provider를 그대로 호출합니다.
+    """
+
+    # 오버라이드가 바뀔 때마다 증가 (미리 펼친 생성 함수를 다시 만들기 위함)
+    _override_generation = 0
+
+    def __init__(self, provider: providers.Provider) -> None:  # type: ignore[type-arg]
+        self._provider = provider
+        self._build: Callable[[dict[RequestScoped, Any]], Any] | None = None
+        self._build_generation = -1
+        super().__init__()
+
+    @property
+    def related(self) -> Iterator[providers.Provider]:  # type: ignore[type-arg]
+        yield self._provider
+        yield from super().related
+
+    def override(self, provider: Any) -> Any:
+        RequestScoped._override_generation += 1
+        return super().override(provider)
+
+    def reset_last_overriding(self) -> None:
+        RequestScoped._override_generation += 1
+        super().reset_last_overriding()
+
+    def reset_override(self) -> None:
+        RequestScoped._override_generation += 1
+        super().reset_override()
+
+    def __deepcopy__(self, memo: dict[Any, Any] | None) -> "RequestScoped":
+        memo = {} if memo is None else memo
+        copied = memo.get(id(self))
+        if copied is not None:
+            return copied  # type: ignore[no-any-return]
+
+        copied = self.__class__(providers.deepcopy(self._provider, memo))
+        self._copy_overridings(copied, memo)
+        return copied
+
+    def _provide(self, args: tuple[Any, ...], kwargs: dict[str, Any]) -> Any:
+        instances = _request_instances.get()
+        if instances is None or args or kwargs:
+            return self._provider(*args, **kwargs)
+        return self._resolve(instances)
+
+    def _resolve(self, instances: dict["RequestScoped", Any]) -> Any:
+        instance = instances.get(self, _MISSING)
+        if instance is _MISSING:
+            if self._build is None or self._build_generation != RequestScoped._override_generation:
+                self._build = _compile(self._provider)
+                self._build_generation = RequestScoped._override_generation
+            instance = instances[self] = self._build(instances)
+        return instance
+
+
+def _compile(provider: Any) -> Callable[[dict[RequestScoped, Any]], Any]:
+    """
+    Factory provider를 인자를 미리 해석해 둔 생성 함수로 펼칩니다.
+
+    하위 의존성이 `RequestScoped`이면 provider 호출을 거치지 않고 요청 내 인스턴스를 바로 찾아 공유하고,
+    그 밖의 provider는 호출 결과를, provider가 아닌 값은 그대로 주입합니다.
+    """
+    if not isinstance(provider, providers.Factory) or provider.args:
+        return lambda instances: provider()
+
+    provides = provider.provides
+    dependencies = [(name, _compile_dependency(value)) for name, value in provider.kwargs.items()]
+
+    def build(instances: dict[RequestScoped, Any]) -> Any:
+        return provides(**{name: dependency(instances) for name, dependency in dependencies})
+
+    return build
+
+
+def _compile_dependency(value: Any) -> Callable[[dict[RequestScoped, Any]], Any]:
+    if isinstance(value, RequestScoped) and not value.overridden:
+        return value._resolve
+    if isinstance(value, providers.Provider):
+        return lambda instances: value()
+    return lambda instances: value
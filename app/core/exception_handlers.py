@@ -2,12 +2,15 @@ import logging
 from typing import Any
 
 from fastapi import FastAPI, Request, status
+from fastapi.encoders import jsonable_encoder
 from fastapi.exceptions import RequestValidationError
 from fastapi.responses import JSONResponse
 from starlette.exceptions import HTTPException as StarletteHTTPException
 
 from app.application.dto.response import BaseResponse
+from app.core.config import get_settings
 from app.core.exceptions import CustomException, ExceptionCode
+from app.core.log import LogSampler
 from app.domain.exceptions import (
     ConcurrentModificationException,
     DomainException,
@@ -17,11 +20,34 @@ from app.domain.exceptions import (
 
 logger = logging.getLogger(__name__)
 
+# 검증 실패, 리소스 없음 등 예상된 4xx 오류는 대량으로 발생할 수 있으므로 일부만 기록
+client_error_sampler = LogSampler(get_settings().log_client_error_sample_rate)
+
+
+def log_exception(request: Request, status_code: int, code: str, message: str, exc: Exception) -> None:
+    """
+    처리한 예외를 기록합니다.
+
+    5xx는 트레이스백과 함께 ERROR로 모두 기록하고,
+    4xx는 예상된 오류이므로 트레이스백 없이 INFO로 샘플링하여 기록합니다.
+    """
+    fields = {
+        "method": request.method,
+        "path": request.url.path,
+        "status_code": status_code,
+        "code": code,
+        "exception_type": type(exc).__name__,
+    }
+    if status_code >= status.HTTP_500_INTERNAL_SERVER_ERROR:
+        logger.error(message, exc_info=exc, extra=fields)
+    elif client_error_sampler.should_log():
+        logger.info(message, extra=fields)
+
 
 def configure_exception_handlers(app: FastAPI) -> None:
     @app.exception_handler(CustomException)
     async def custom_exception_handler(request: Request, exc: CustomException) -> JSONResponse:
-        logger.error(f"CustomException: {exc.code} - {exc.message}", exc_info=True)
+        log_exception(request, exc.status_code, exc.code, exc.message, exc)
         return JSONResponse(
             status_code=exc.status_code,
             content=BaseResponse[Any](
@@ -29,12 +55,11 @@ def configure_exception_handlers(app: FastAPI) -> None:
                 message=exc.message,
                 result=exc.data,
             ).model_dump(by_alias=True),
+            headers=exc.headers,
         )
 
     @app.exception_handler(DomainException)
     async def domain_exception_handler(request: Request, exc: DomainException) -> JSONResponse:
-        logger.error(f"DomainException: {str(exc)}", exc_info=True)
-
         status_code = status.HTTP_400_BAD_REQUEST
         code = ExceptionCode.BAD_REQUEST
 
@@ -49,6 +74,7 @@ def configure_exception_handlers(app: FastAPI) -> None:
             status_code = status.HTTP_409_CONFLICT
             code = ExceptionCode.CONCURRENT_MODIFICATION
 
+        log_exception(request, status_code, code, str(exc), exc)
         return JSONResponse(
             status_code=status_code,
             content=BaseResponse[Any](
@@ -60,7 +86,7 @@ def configure_exception_handlers(app: FastAPI) -> None:
 
     @app.exception_handler(StarletteHTTPException)
     async def http_exception_handler(request: Request, exc: StarletteHTTPException) -> JSONResponse:
-        logger.error(f"StarletteHTTPException: {exc.status_code} - {exc.detail}", exc_info=True)
+        log_exception(request, exc.status_code, ExceptionCode.BAD_REQUEST, str(exc.detail), exc)
         return JSONResponse(
             status_code=exc.status_code,
             content=BaseResponse[Any](
@@ -72,19 +98,24 @@ def configure_exception_handlers(app: FastAPI) -> None:
 
     @app.exception_handler(RequestValidationError)
     async def validation_exception_handler(request: Request, exc: RequestValidationError) -> JSONResponse:
-        logger.error(f"RequestValidationError: 422 - {exc.errors()}", exc_info=True)
+        log_exception(
+            request, status.HTTP_422_UNPROCESSABLE_ENTITY, ExceptionCode.VALIDATION_ERROR, "Validation Error", exc
+        )
         return JSONResponse(
             status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
             content=BaseResponse[Any](
                 code=ExceptionCode.VALIDATION_ERROR,
                 message="Validation Error",
-                result=exc.errors(),
+                # model_validator에서 발생한 ValueError 등은 ctx에 예외 객체로 담기므로 문자열로 변환
+                result=jsonable_encoder(exc.errors(), custom_encoder={Exception: str}),
             ).model_dump(by_alias=True),
         )
 
     @app.exception_handler(Exception)
     async def generic_exception_handler(request: Request, exc: Exception) -> JSONResponse:
-        logger.error(f"Unhandled Exception: {exc}", exc_info=True)
+        log_exception(
+            request, status.HTTP_500_INTERNAL_SERVER_ERROR, ExceptionCode.INTERNAL_SERVER_ERROR, str(exc), exc
+        )
         return JSONResponse(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             content=BaseResponse[Any](
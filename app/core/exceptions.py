@@ -1,3 +1,4 @@
+import math
 from typing import Any
 
 from starlette import status
@@ -10,12 +11,16 @@ class ExceptionCode:
     NOT_FOUND: str = "NOT_FOUND"
     UNAUTHORIZED: str = "UNAUTHORIZED"
     FORBIDDEN: str = "FORBIDDEN"
+    UNSUPPORTED_MEDIA_TYPE: str = "UNSUPPORTED_MEDIA_TYPE"
+    TOO_MANY_REQUESTS: str = "TOO_MANY_REQUESTS"
+    CONFLICT: str = "CONFLICT"
 
     # User
     USER_NOT_FOUND: str = "USER_NOT_FOUND"
     EMAIL_ALREADY_EXISTS: str = "EMAIL_ALREADY_EXISTS"
     INVALID_PASSWORD: str = "INVALID_PASSWORD"
     USER_INACTIVE: str = "USER_INACTIVE"
+    INVALID_REFRESH_TOKEN: str = "INVALID_REFRESH_TOKEN"
 
     # Product
     PRODUCT_NOT_FOUND: str = "PRODUCT_NOT_FOUND"
@@ -28,10 +33,14 @@ class ExceptionCode:
     # Order
     ORDER_NOT_FOUND: str = "ORDER_NOT_FOUND"
     EMPTY_CART: str = "EMPTY_CART"
+    IDEMPOTENCY_KEY_MISMATCH: str = "IDEMPOTENCY_KEY_MISMATCH"
 
     # Seller
     SELLER_ALREADY_EXISTS: str = "SELLER_ALREADY_EXISTS"
 
+    # Debug
+    PROFILER_BUSY: str = "PROFILER_BUSY"
+
 
 class CustomException(Exception):
     def __init__(
@@ -40,11 +49,13 @@ class CustomException(Exception):
         code: str,
         message: str,
         data: Any | None = None,
+        headers: dict[str, str] | None = None,
     ) -> None:
         self.status_code = status_code
         self.code = code
         self.message = message
         self.data = data
+        self.headers = headers
         super().__init__(self.message)
 
 
@@ -68,11 +79,38 @@ class InvalidCredentialsException(UnauthorizedException):
         super().__init__(message="이메일 또는 비밀번호가 올바르지 않습니다.")
 
 
+class InvalidRefreshTokenException(UnauthorizedException):
+    def __init__(self, message: str = "유효하지 않거나 만료된 리프레시 토큰입니다.") -> None:
+        super().__init__(code=ExceptionCode.INVALID_REFRESH_TOKEN, message=message)
+
+
 class ForbiddenException(CustomException):
     def __init__(self, code: str = ExceptionCode.FORBIDDEN, message: str = "Forbidden") -> None:
         super().__init__(status_code=status.HTTP_403_FORBIDDEN, code=code, message=message)
 
 
+class ConflictException(CustomException):
+    def __init__(self, code: str = ExceptionCode.CONFLICT, message: str = "Conflict") -> None:
+        super().__init__(status_code=status.HTTP_409_CONFLICT, code=code, message=message)
+
+
+class UnsupportedMediaTypeException(CustomException):
+    def __init__(
+        self, code: str = ExceptionCode.UNSUPPORTED_MEDIA_TYPE, message: str = "Unsupported Media Type"
+    ) -> None:
+        super().__init__(status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE, code=code, message=message)
+
+
+class TooManyRequestsException(CustomException):
+    def __init__(self, retry_after: float, message: str = "요청이 너무 많습니다. 잠시 후 다시 시도해주세요.") -> None:
+        super().__init__(
+            status.HTTP_429_TOO_MANY_REQUESTS,
+            ExceptionCode.TOO_MANY_REQUESTS,
+            message,
+            headers={"Retry-After": str(math.ceil(retry_after))},
+        )
+
+
 # Domain Exceptions
 
 
@@ -125,6 +163,20 @@ class EmptyCartException(BadRequestException):
         super().__init__(code=ExceptionCode.EMPTY_CART, message=message)
 
 
+class IdempotencyKeyMismatchException(CustomException):
+    def __init__(self, message: str = "같은 멱등성 키로 다른 요청을 보낼 수 없습니다.") -> None:
+        super().__init__(
+            status_code=status.HTTP_422_UNPROCESSABLE_CONTENT,
+            code=ExceptionCode.IDEMPOTENCY_KEY_MISMATCH,
+            message=message,
+        )
+
+
 class SellerAlreadyExistsException(BadRequestException):
     def __init__(self, message: str = "이미 판매자로 등록된 사용자입니다.") -> None:
         super().__init__(code=ExceptionCode.SELLER_ALREADY_EXISTS, message=message)
+
+
+class ProfilerBusyException(ConflictException):
+    def __init__(self, message: str = "이미 프로파일링이 진행 중입니다.") -> None:
+        super().__init__(code=ExceptionCode.PROFILER_BUSY, message=message)
@@ -0,0 +1,150 @@
+"""
+키별 그룹 커밋 도구
+
+같은 키(상품 ID 등)로 동시에 들어온 요청을 짧은 시간(window) 동안 모아 한 번의 처리(트랜잭션)로 결정하고,
+대기 중인 요청마다 결과를 돌려줍니다. 키마다 처리 중인 배치는 하나뿐이므로 키 단위로 직렬화된 actor처럼 동작합니다.
+
+배치는 별도의 백그라운드 태스크가 아니라 먼저 도착한 요청(리더)이 자신의 세션/DI 스코프로 처리합니다.
+리더는 배치를 처리한 뒤 그동안 도착한 요청 중 가장 먼저 온 요청에게 리더를 넘기므로,
+한 요청이 다른 요청의 배치를 계속 처리하며 오래 붙잡히지 않습니다.
+"""
+
+import asyncio
+import contextlib
+from collections.abc import Awaitable, Callable, Hashable, Sequence
+from dataclasses import dataclass, field
+from typing import Any, cast
+
+from app.core.metrics import registry
+
+# 대기 중인 요청에게 리더를 넘길 때 전달하는 값
+_PROMOTED = object()
+
+group_commit_batch_size = registry.histogram(
+    "group_commit_batch_size",
+    "그룹 커밋 배치 한 번에 처리한 요청 수",
+    ("name",),
+    buckets=(1, 2, 5, 10, 20, 50, 100, 200, 500),
+)
+
+
+@dataclass(eq=False)
+class _Entry:
+    request: Any
+    future: asyncio.Future[Any]
+
+
+@dataclass(eq=False)
+class _Group:
+    pending: list[_Entry] = field(default_factory=list)
+    # 대기 중인 요청이 배치 최대 크기에 도달하면 리더가 window를 다 기다리지 않고 처리
+    full: asyncio.Event = field(default_factory=asyncio.Event)
+    leader: _Entry | None = None
+
+
+class GroupCommitter[K: Hashable, T, R]:
+    """
+    키별로 동시 요청을 모아 `commit(requests)`로 한 번에 처리합니다.
+
+    `commit`은 요청 순서대로 요청별 결과(또는 그 요청만 실패시킬 예외 객체)를 반환해야 하며,
+    `commit`이 예외를 발생시키면 배치의 모든 요청이 같은 예외로 실패합니다.
+    리더 요청이 취소되면 커밋되지 않은 나머지 요청은 다음 배치로 넘어갑니다.
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self._groups: dict[K, _Group] = {}
+        self._batch_size = group_commit_batch_size.labels(name)
+
+    def __len__(self) -> int:
+        return len(self._groups)
+
+    async def submit(  # noqa: PLR0913
+        self,
+        key: K,
+        request: T,
+        commit: Callable[[list[T]], Awaitable[Sequence[R | Exception]]],
+        window: float,
+        max_batch: int,
+    ) -> R:
+        group = self._groups.get(key)
+        if group is None:
+            group = self._groups[key] = _Group()
+        entry = _Entry(request, asyncio.get_running_loop().create_future())
+        group.pending.append(entry)
+        if len(group.pending) >= max_batch:
+            group.full.set()
+
+        if group.leader is None:
+            group.leader = entry
+        else:
+            try:
+                outcome = await entry.future
+            except asyncio.CancelledError:
+                # 리더를 넘겨받은 직후 취소되었다면 다음 요청에게 다시 넘김
+                if entry.future.done() and not entry.future.cancelled():
+                    self._hand_off(key, group, entry)
+                raise
+            if outcome is not _PROMOTED:
+                return cast(R, outcome)
+        return await self._lead(key, group, entry, commit, window, max_batch)
+
+    async def _lead(  # noqa: PLR0913
+        self,
+        key: K,
+        group: _Group,
+        leader: _Entry,
+        commit: Callable[[list[T]], Awaitable[Sequence[R | Exception]]],
+        window: float,
+        max_batch: int,
+    ) -> R:
+        try:
+            batch = await self._take_batch(group, leader, window, max_batch)
+            try:
+                results = await commit([entry.request for entry in batch])
+            except asyncio.CancelledError:
+                group.pending[:0] = [entry for entry in batch if entry is not leader]
+                raise
+            except Exception as error:
+                for entry in batch:
+                    if entry is not leader and not entry.future.done():
+                        entry.future.set_exception(error)
+                raise
+        finally:
+            self._hand_off(key, group, leader)
+
+        own: R | Exception | None = None
+        for entry, result in zip(batch, results, strict=True):
+            if entry is leader:
+                own = result
+            elif not entry.future.done():
+                if isinstance(result, Exception):
+                    entry.future.set_exception(result)
+                else:
+                    entry.future.set_result(result)
+        if isinstance(own, Exception):
+            raise own
+        return cast(R, own)
+
+    async def _take_batch(self, group: _Group, leader: _Entry, window: float, max_batch: int) -> list[_Entry]:
+        """window 동안(배치가 차면 즉시) 기다린 뒤 먼저 도착한 순서로 최대 max_batch개의 요청을 꺼냅니다."""
+        if len(group.pending) < max_batch:
+            with contextlib.suppress(TimeoutError):
+                await asyncio.wait_for(group.full.wait(), window)
+
+        batch = [entry for entry in group.pending[:max_batch] if entry is leader or not entry.future.done()]
+        del group.pending[:max_batch]
+        if len(group.pending) < max_batch:
+            group.full.clear()
+        self._batch_size.observe(len(batch))
+        return batch
+
+    def _hand_off(self, key: K, group: _Group, leader: _Entry) -> None:
+        """취소된 요청을 정리하고 가장 먼저 도착한 대기 요청을 다음 리더로 지정합니다."""
+        group.pending = [entry for entry in group.pending if entry is not leader and not entry.future.done()]
+        if group.pending:
+            group.leader = group.pending[0]
+            group.leader.future.set_result(_PROMOTED)
+        else:
+            group.leader = None
+            del self._groups[key]
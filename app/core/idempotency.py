@@ -0,0 +1,55 @@
+"""
+멱등성 키(`Idempotency-Key` 헤더) 처리 도구
+
+같은 키로 동시에 들어온 요청은 `idempotency_locks`로 프로세스 안에서 직렬화하여, 먼저 들어온 요청이 끝난 뒤
+나머지 요청이 저장된 응답을 재사용하도록 합니다.
+다른 워커/인스턴스의 중복 요청은 DB의 멱등성 키 PK 제약이 먼저 선점한 트랜잭션이 끝날 때까지 대기시킵니다.
+"""
+
+import asyncio
+import hashlib
+import json
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from typing import Any
+
+IDEMPOTENCY_KEY_HEADER = "Idempotency-Key"
+MAX_IDEMPOTENCY_KEY_LENGTH = 255
+
+
+def request_fingerprint(operation: str, payload: Any = None) -> str:
+    """작업 이름과 요청 본문의 SHA-256 해시 (키 순서와 공백에 영향받지 않음)"""
+    canonical = json.dumps([operation, payload], sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    return hashlib.sha256(canonical.encode()).hexdigest()
+
+
+class KeyedLock:
+    """키마다 하나의 asyncio.Lock을 제공하고, 대기자가 없어진 락은 제거합니다."""
+
+    def __init__(self) -> None:
+        self._locks: dict[str, tuple[asyncio.Lock, int]] = {}
+
+    def __len__(self) -> int:
+        return len(self._locks)
+
+    @asynccontextmanager
+    async def hold(self, key: str | None) -> AsyncIterator[None]:
+        """키의 락을 잡습니다. 키가 None이면 아무것도 하지 않습니다."""
+        if key is None:
+            yield
+            return
+
+        lock, waiters = self._locks.get(key, (asyncio.Lock(), 0))
+        self._locks[key] = (lock, waiters + 1)
+        try:
+            async with lock:
+                yield
+        finally:
+            lock, waiters = self._locks[key]
+            if waiters == 1:
+                del self._locks[key]
+            else:
+                self._locks[key] = (lock, waiters - 1)
+
+
+idempotency_locks = KeyedLock()
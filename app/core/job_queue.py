@@ -0,0 +1,444 @@
+"""
+프로세스 내 비동기 작업 큐
+
+트랜잭션 커밋 뒤에 할 후속 작업(알림, 캐시 무효화, 외부 전달기 깨우기 등)을 요청 처리와 분리하여
+이벤트 루프의 워커 태스크에서 실행합니다. 유즈케이스는 `uow.on_commit`으로 커밋이 성공한 경우에만 작업을 넣습니다.
+
+- 작업은 이름으로 등록한 핸들러(`register`)가 JSON으로 직렬화할 수 있는 payload를 받아 실행합니다.
+- 워커 수(`concurrency`)만큼만 동시에 실행하며, 우선순위 값이 작은 작업부터(같으면 넣은 순서대로) 실행합니다.
+- 같은 `key`로 넣은 작업이 아직 실행 전이면 새로 넣지 않고 기존 작업을 사용합니다. (주문마다 같은 작업을 넣는 경우 등)
+- 실패한 작업은 시도마다 두 배로 늘어나는 간격 뒤에 다시 실행하고, `max_attempts`번 실패하면 dead letter로 보관합니다.
+
+기본 저장소는 메모리이므로 프로세스가 종료되면 남은 작업은 사라집니다. `SQLiteJobStore`를 사용하면 대기/재시도 중인
+작업을 파일에 저장했다가 다음 시작 시 다시 실행합니다. 실행 중에 종료된 작업도 다시 실행되므로(at-least-once)
+핸들러는 여러 번 실행되어도 안전하게 작성합니다. 커밋과 작업 저장 사이에 프로세스가 종료되면 작업이 유실될 수 있으므로,
+반드시 외부에 전달되어야 하는 이벤트는 outbox(`OUTBOX_ENABLED`)를 사용합니다.
+"""
+
+import asyncio
+import contextlib
+import itertools
+import json
+import logging
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import deque
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from app.core.config import Settings
+from app.core.metrics import registry
+
+logger = logging.getLogger(__name__)
+
+JobHandler = Callable[[dict[str, Any]], Awaitable[None]]
+
+# 작업 실패 오류 메시지 저장 최대 길이
+MAX_ERROR_LENGTH = 1000
+# 메모리 저장소가 보관하는 dead letter 최대 개수 (오래된 것부터 버림)
+MAX_DEAD_LETTERS = 1000
+
+job_queue_jobs_total = registry.counter(
+    "job_queue_jobs_total", "실행한 작업 수 (결과별: succeeded/retried/dead)", ("name", "result")
+)
+job_queue_wait_seconds = registry.histogram(
+    "job_queue_wait_seconds", "작업이 실행 가능해진 뒤 워커가 실행을 시작하기까지 걸린 시간(초)", ("name",)
+)
+job_queue_duration_seconds = registry.histogram("job_queue_duration_seconds", "작업 핸들러 실행 시간(초)", ("name",))
+
+
+@dataclass(eq=False)
+class Job:
+    """큐에 넣은 작업 한 건"""
+
+    name: str
+    payload: dict[str, Any] = field(default_factory=dict)
+    priority: int = 0
+    # 실행 전인 작업끼리 중복을 합치는 키
+    key: str | None = None
+    attempts: int = 0
+    # 실행할 수 있게 되는 시각(epoch 초)
+    run_at: float = field(default_factory=time.time)
+    last_error: str | None = None
+    # 저장소가 부여한 ID
+    id: int | None = None
+
+
+class JobStore(ABC):
+    """대기/재시도 중인 작업과 dead letter 저장소"""
+
+    @abstractmethod
+    async def add(self, job: Job) -> None:
+        """작업을 저장하고 `job.id`를 채웁니다."""
+
+    @abstractmethod
+    async def update(self, job: Job) -> None:
+        """재시도할 작업의 시도 횟수, 다음 실행 시각, 오류를 저장합니다."""
+
+    @abstractmethod
+    async def remove(self, job: Job) -> None:
+        """완료한 작업을 삭제합니다."""
+
+    @abstractmethod
+    async def bury(self, job: Job) -> None:
+        """더 이상 재시도하지 않을 작업을 dead letter로 옮깁니다."""
+
+    @abstractmethod
+    async def load_pending(self) -> list[Job]:
+        """대기/재시도 중인 작업 목록 (큐를 시작할 때 불러옴)"""
+
+    @abstractmethod
+    async def dead_letters(self) -> list[Job]:
+        pass
+
+    async def close(self) -> None:  # noqa: B027
+        """사용한 연결 등을 정리합니다."""
+
+
+class InMemoryJobStore(JobStore):
+    """프로세스 메모리에 작업을 보관합니다. (큐를 다시 시작해도 남은 작업은 유지되지만 프로세스가 종료되면 사라짐)"""
+
+    def __init__(self) -> None:
+        self._ids = itertools.count(1)
+        self._pending: dict[int, Job] = {}
+        self._dead: deque[Job] = deque(maxlen=MAX_DEAD_LETTERS)
+
+    async def add(self, job: Job) -> None:
+        job.id = next(self._ids)
+        self._pending[job.id] = job
+
+    async def update(self, job: Job) -> None:
+        pass
+
+    async def remove(self, job: Job) -> None:
+        if job.id is not None:
+            self._pending.pop(job.id, None)
+
+    async def bury(self, job: Job) -> None:
+        await self.remove(job)
+        self._dead.append(job)
+
+    async def load_pending(self) -> list[Job]:
+        return list(self._pending.values())
+
+    async def dead_letters(self) -> list[Job]:
+        return list(self._dead)
+
+
+class SQLiteJobStore(JobStore):
+    """
+    작업을 SQLite 파일에 저장합니다. (파일 I/O는 이벤트 루프를 막지 않도록 스레드 풀에서 실행)
+
+    주문 DB와 별도의 파일을 사용하므로 작업 저장이 주문 트랜잭션의 커넥션/락을 점유하지 않습니다.
+    """
+
+    _SCHEMA = """
+        CREATE TABLE IF NOT EXISTS job (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            name TEXT NOT NULL,
+            payload TEXT NOT NULL,
+            priority INTEGER NOT NULL,
+            key TEXT,
+            attempts INTEGER NOT NULL,
+            run_at REAL NOT NULL,
+            last_error TEXT,
+            dead INTEGER NOT NULL DEFAULT 0
+        )
+    """
+    _COLUMNS = "id, name, payload, priority, key, attempts, run_at, last_error"
+
+    def __init__(self, path: str | Path):
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self._connection: sqlite3.Connection | None = None
+
+    async def add(self, job: Job) -> None:
+        job.id = await self._execute(
+            "INSERT INTO job (name, payload, priority, key, attempts, run_at, last_error) VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (
+                job.name,
+                json.dumps(job.payload),
+                job.priority,
+                job.key,
+                job.attempts,
+                job.run_at,
+                job.last_error,
+            ),
+        )
+
+    async def update(self, job: Job) -> None:
+        await self._execute(
+            "UPDATE job SET attempts = ?, run_at = ?, last_error = ? WHERE id = ?",
+            (job.attempts, job.run_at, job.last_error, job.id),
+        )
+
+    async def remove(self, job: Job) -> None:
+        await self._execute("DELETE FROM job WHERE id = ?", (job.id,))
+
+    async def bury(self, job: Job) -> None:
+        await self._execute(
+            "UPDATE job SET dead = 1, attempts = ?, last_error = ? WHERE id = ?", (job.attempts, job.last_error, job.id)
+        )
+
+    async def load_pending(self) -> list[Job]:
+        return await self._select(f"SELECT {self._COLUMNS} FROM job WHERE dead = 0 ORDER BY id")
+
+    async def dead_letters(self) -> list[Job]:
+        return await self._select(f"SELECT {self._COLUMNS} FROM job WHERE dead = 1 ORDER BY id")
+
+    async def close(self) -> None:
+        await asyncio.to_thread(self._close)
+
+    async def _execute(self, statement: str, parameters: tuple[Any, ...]) -> int | None:
+        return await asyncio.to_thread(self._write, statement, parameters)
+
+    async def _select(self, statement: str) -> list[Job]:
+        rows = await asyncio.to_thread(self._read, statement)
+        return [
+            Job(
+                id=row[0],
+                name=row[1],
+                payload=json.loads(row[2]),
+                priority=row[3],
+                key=row[4],
+                attempts=row[5],
+                run_at=row[6],
+                last_error=row[7],
+            )
+            for row in rows
+        ]
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._connection is None:
+            # 문장마다 자동 커밋하여 작업 저장이 끝나면 바로 디스크에 반영
+            connection = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute(self._SCHEMA)
+            self._connection = connection
+        return self._connection
+
+    def _write(self, statement: str, parameters: tuple[Any, ...]) -> int | None:
+        with self._lock:
+            return self._connect().execute(statement, parameters).lastrowid
+
+    def _read(self, statement: str) -> list[tuple[Any, ...]]:
+        with self._lock:
+            return self._connect().execute(statement).fetchall()
+
+    def _close(self) -> None:
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+
+class JobQueue:
+    """등록한 핸들러로 작업을 실행하는 우선순위 작업 큐"""
+
+    def __init__(  # noqa: PLR0913
+        self,
+        store: JobStore | None = None,
+        concurrency: int = 4,
+        max_attempts: int = 5,
+        retry_base_seconds: float = 1,
+        retry_max_seconds: float = 60,
+    ):
+        self.store = store or InMemoryJobStore()
+        self.concurrency = concurrency
+        self.max_attempts = max_attempts
+        self.retry_base_seconds = retry_base_seconds
+        self.retry_max_seconds = retry_max_seconds
+        self._handlers: dict[str, JobHandler] = {}
+        self._sequence = itertools.count()
+        # 실행 전인 작업 (중복 합치기용, 키 -> 작업)
+        self._keyed: dict[str, Job] = {}
+        # 큐에 있거나 재시도를 기다리는 작업 수와, 그 수가 0이 되면 설정되는 이벤트
+        self._pending = 0
+        self._idle: asyncio.Event | None = None
+        self._queue: asyncio.PriorityQueue[tuple[int, int, Job]] | None = None
+        self._timers: dict[Job, asyncio.TimerHandle] = {}
+        self._workers: list[asyncio.Task[None]] = []
+
+    @property
+    def pending(self) -> int:
+        return self._pending
+
+    def register(self, name: str, handler: JobHandler) -> None:
+        """`name` 작업을 실행할 핸들러를 등록합니다."""
+        self._handlers[name] = handler
+
+    async def enqueue(
+        self, name: str, payload: dict[str, Any] | None = None, priority: int = 0, key: str | None = None
+    ) -> Job:
+        """
+        작업을 저장하고 큐에 넣습니다. 큐를 시작하기 전에 넣은 작업은 시작할 때 실행합니다.
+        같은 `key`의 작업이 아직 실행 전이면 새로 넣지 않고 그 작업을 반환합니다.
+        """
+        if name not in self._handlers:
+            raise ValueError(f"등록되지 않은 작업입니다: {name}")
+        if key is not None and (queued := self._keyed.get(key)) is not None:
+            return queued
+
+        job = Job(name, payload or {}, priority, key)
+        await self.store.add(job)
+        if key is not None:
+            self._keyed[key] = job
+        self._schedule(job)
+        return job
+
+    async def start(self) -> None:
+        """현재 이벤트 루프에서 워커를 시작하고 저장소에 남아 있던 작업을 다시 큐에 넣습니다."""
+        if self._queue is not None:
+            return
+        self._queue = asyncio.PriorityQueue()
+        self._idle = asyncio.Event()
+        self._idle.set()
+        self._pending = 0
+        self._keyed.clear()
+        for job in await self.store.load_pending():
+            if job.key is not None:
+                if job.key in self._keyed:
+                    await self.store.remove(job)
+                    continue
+                self._keyed[job.key] = job
+            self._schedule(job)
+        self._workers = [
+            asyncio.create_task(self._work(self._queue), name=f"job-queue-worker-{index}")
+            for index in range(self.concurrency)
+        ]
+
+    async def stop(self, timeout: float = 5) -> None:
+        """남은 작업을 `timeout`초까지 기다린 뒤 워커를 종료합니다. (끝내지 못한 작업은 저장소에 남음)"""
+        if self._queue is None:
+            return
+        with contextlib.suppress(TimeoutError):
+            await asyncio.wait_for(self.join(), timeout)
+
+        for timer in self._timers.values():
+            timer.cancel()
+        self._timers.clear()
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+        self._queue = None
+        self._idle = None
+        await self.store.close()
+
+    async def join(self) -> None:
+        """큐에 있거나 재시도를 기다리는 작업이 모두 끝날 때까지 대기합니다."""
+        if self._idle is not None:
+            await self._idle.wait()
+
+    async def dead_letters(self) -> list[Job]:
+        return await self.store.dead_letters()
+
+    def _schedule(self, job: Job) -> None:
+        if self._queue is None or self._idle is None:
+            # 시작 전에는 저장소에만 보관하고 시작할 때 불러옴
+            return
+        self._pending += 1
+        self._idle.clear()
+
+        delay = job.run_at - time.time()
+        if delay > 0:
+            self._timers[job] = asyncio.get_running_loop().call_later(delay, self._release, job)
+        else:
+            self._queue.put_nowait((job.priority, next(self._sequence), job))
+
+    def _release(self, job: Job) -> None:
+        """재시도 간격이 지난 작업을 큐에 넣습니다."""
+        self._timers.pop(job, None)
+        if self._queue is not None:
+            self._queue.put_nowait((job.priority, next(self._sequence), job))
+
+    def _finish(self) -> None:
+        self._pending -= 1
+        if self._pending == 0 and self._idle is not None:
+            self._idle.set()
+
+    async def _work(self, queue: asyncio.PriorityQueue[tuple[int, int, Job]]) -> None:
+        while True:
+            _, _, job = await queue.get()
+            # 실행을 시작한 뒤 같은 키로 들어온 작업은 이번 실행에 반영되지 않았을 수 있으므로 새로 넣음
+            if job.key is not None and self._keyed.get(job.key) is job:
+                del self._keyed[job.key]
+            try:
+                await self._execute(job)
+            except Exception:
+                logger.exception("작업 실행 결과를 저장하지 못했습니다.", extra={"job": job.name, "job_id": job.id})
+            finally:
+                self._finish()
+
+    async def _execute(self, job: Job) -> None:
+        job_queue_wait_seconds.labels(job.name).observe(max(time.time() - job.run_at, 0.0))
+        job.attempts += 1
+        handler = self._handlers.get(job.name)
+        started = time.perf_counter()
+        try:
+            if handler is None:
+                raise LookupError(f"등록되지 않은 작업입니다: {job.name}")
+            await handler(job.payload)
+        except Exception as e:
+            job.last_error = repr(e)[:MAX_ERROR_LENGTH]
+            if handler is None or job.attempts >= self.max_attempts:
+                await self._bury(job)
+                return
+            await self._retry(job)
+            return
+        finally:
+            job_queue_duration_seconds.labels(job.name).observe(time.perf_counter() - started)
+
+        await self.store.remove(job)
+        job_queue_jobs_total.labels(job.name, "succeeded").inc()
+
+    async def _retry(self, job: Job) -> None:
+        delay = min(self.retry_max_seconds, self.retry_base_seconds * 2 ** (job.attempts - 1))
+        job.run_at = time.time() + delay
+        await self.store.update(job)
+        job_queue_jobs_total.labels(job.name, "retried").inc()
+        logger.warning(
+            "작업 %s(%s)이 실패하여 %.1f초 뒤에 다시 실행합니다. (%s)",
+            job.name,
+            job.id,
+            delay,
+            job.last_error,
+            extra={"job": job.name, "job_id": job.id, "attempts": job.attempts},
+        )
+        self._schedule(job)
+
+    async def _bury(self, job: Job) -> None:
+        await self.store.bury(job)
+        job_queue_jobs_total.labels(job.name, "dead").inc()
+        logger.error(
+            "작업 %s(%s)이 %d번 실패하여 dead letter로 옮겼습니다. (%s)",
+            job.name,
+            job.id,
+            job.attempts,
+            job.last_error,
+            extra={"job": job.name, "job_id": job.id, "attempts": job.attempts},
+        )
+
+
+job_queue = JobQueue()
+
+registry.callback(
+    "job_queue_pending_jobs",
+    "큐에서 실행을 기다리거나 재시도를 기다리는 작업 수",
+    (),
+    lambda: [((), job_queue.pending)],
+)
+
+
+def configure_job_queue(settings: Settings) -> None:
+    job_queue.concurrency = settings.job_queue_concurrency
+    job_queue.max_attempts = settings.job_queue_max_attempts
+    job_queue.retry_base_seconds = settings.job_queue_retry_base_seconds
+    job_queue.retry_max_seconds = settings.job_queue_retry_max_seconds
+    job_queue.store = (
+        SQLiteJobStore(settings.job_queue_sqlite_path) if settings.job_queue_sqlite_path else InMemoryJobStore()
+    )
@@ -0,0 +1,185 @@
+import copy
+import json
+import logging
+import queue
+import random
+import re
+import sys
+import time
+import traceback
+import uuid
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import UTC, datetime
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any
+
+from starlette.routing import Route
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.config import Settings
+from app.core.tracing import current_trace_id
+
+REQUEST_ID_HEADER = b"x-request-id"
+# 클라이언트가 보낸 요청 ID는 이 형식일 때만 그대로 사용 (로그 주입 방지)
+_REQUEST_ID_PATTERN = re.compile(r"^[A-Za-z0-9._-]{1,128}$")
+
+# 현재 요청의 ID (로그 레코드에 자동으로 포함됨)
+_request_id: ContextVar[str | None] = ContextVar("log_request_id", default=None)
+
+access_logger = logging.getLogger("app.access")
+
+# LogRecord 기본 속성 (이 밖의 속성은 `extra`로 전달된 구조화 필드로 출력)
+_RECORD_ATTRIBUTES = frozenset(vars(logging.LogRecord("", 0, "", 0, "", None, None))) | {"message", "asctime"}
+
+
+def get_request_id() -> str | None:
+    return _request_id.get()
+
+
+@contextmanager
+def request_id_scope(request_id: str) -> Iterator[None]:
+    """블록 안에서 기록되는 로그에 요청 ID를 포함합니다."""
+    token = _request_id.set(request_id)
+    try:
+        yield
+    finally:
+        _request_id.reset(token)
+
+
+class JsonFormatter(logging.Formatter):
+    """로그 레코드를 한 줄의 JSON으로 출력합니다. `extra`로 전달한 필드도 함께 출력합니다."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry: dict[str, Any] = {
+            "timestamp": datetime.fromtimestamp(record.created, UTC).isoformat(),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        entry.update({key: value for key, value in vars(record).items() if key not in _RECORD_ATTRIBUTES})
+        if record.exc_info:
+            entry["exception"] = "".join(traceback.format_exception(*record.exc_info))
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+
+class BackgroundQueueHandler(QueueHandler):
+    """
+    로그 레코드를 큐에 넣기만 하는 핸들러
+
+    메시지 포맷팅, 트레이스백 문자열 변환, 출력은 모두 백그라운드 `QueueListener` 스레드에서 처리하므로
+    이벤트 루프에서는 레코드를 복사해 큐에 넣는 비용만 듭니다.
+    큐가 가득 차면 이벤트 루프를 막지 않도록 레코드를 버리고 버린 수를 집계합니다.
+    """
+
+    def __init__(self, log_queue: "queue.Queue[logging.LogRecord]"):
+        super().__init__(log_queue)
+        self.dropped = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # 기본 구현은 여기서 트레이스백까지 포맷팅하므로, 인자만 메시지에 합치고 나머지는 리스너에 맡김
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        record.request_id = _request_id.get()
+        record.trace_id = current_trace_id()
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+class LogSampler:
+    """대량으로 발생하는 로그를 지정한 비율만큼만 남깁니다. (1이면 모두, 0이면 남기지 않음)"""
+
+    def __init__(self, rate: float, random_func: Callable[[], float] = random.random):
+        self.rate = rate
+        self._random = random_func
+
+    def should_log(self) -> bool:
+        return self.rate >= 1 or (self.rate > 0 and self._random() < self.rate)
+
+
+class RequestLoggingMiddleware:
+    """
+    요청마다 요청 ID를 부여하고 처리 결과를 구조화된 접근 로그로 남기는 ASGI 미들웨어
+
+    요청 ID는 클라이언트가 보낸 `X-Request-ID`를 사용하거나 새로 만들며, 응답 헤더에도 포함합니다.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request_id = _resolve_request_id(scope)
+        # 처리되지 않은 예외는 이 미들웨어 바깥의 500 핸들러에서 기록되므로 요청 ID를 되돌리지 않음
+        # (요청마다 별도의 태스크 컨텍스트에서 실행되어 다른 요청에 영향을 주지 않음)
+        _request_id.set(request_id)
+        started_at = time.perf_counter()
+        status_code = 500
+
+        async def send_with_request_id(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                message.setdefault("headers", [])
+                message["headers"] = [*message["headers"], (REQUEST_ID_HEADER, request_id.encode("latin-1"))]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_request_id)
+        finally:
+            route = scope.get("route")
+            access_logger.info(
+                "%s %s %s",
+                scope["method"],
+                scope["path"],
+                status_code,
+                extra={
+                    "method": scope["method"],
+                    "path": scope["path"],
+                    "route": route.path if isinstance(route, Route) else None,
+                    "status_code": status_code,
+                    "duration_ms": round((time.perf_counter() - started_at) * 1000, 3),
+                },
+            )
+
+
+def _resolve_request_id(scope: Scope) -> str:
+    for name, value in scope["headers"]:
+        if name == REQUEST_ID_HEADER:
+            request_id: str = value.decode("latin-1")
+            if _REQUEST_ID_PATTERN.match(request_id):
+                return request_id
+            break
+    return uuid.uuid4().hex
+
+
+def configure_logging(settings: Settings) -> QueueListener:
+    """
+    루트 로거가 백그라운드 큐를 거쳐 출력하도록 설정하고, 큐를 비우는 리스너를 반환합니다.
+
+    리스너는 앱 수명 주기에 맞춰 `start()`/`stop()`해야 하며, `stop()`은 큐에 남은 로그를 모두 출력합니다.
+    여러 번 호출해도 이전에 설정한 큐 핸들러를 교체합니다.
+    """
+    output = logging.StreamHandler(sys.stdout)
+    output.setFormatter(
+        JsonFormatter() if settings.log_json else logging.Formatter("%(asctime)s %(levelname)s %(name)s %(message)s")
+    )
+
+    root = logging.getLogger()
+    for handler in [handler for handler in root.handlers if isinstance(handler, BackgroundQueueHandler)]:
+        root.removeHandler(handler)
+
+    log_queue: queue.Queue[logging.LogRecord] = queue.Queue(settings.log_queue_size)
+    root.addHandler(BackgroundQueueHandler(log_queue))
+    root.setLevel(settings.log_level)
+    return QueueListener(log_queue, output, respect_handler_level=True)
@@ -0,0 +1,152 @@
+"""
+이벤트 루프 지연 감시
+
+감시 스레드가 일정 간격으로 이벤트 루프에 콜백을 보내(`call_soon_threadsafe`) 실행되기까지 걸린 시간을
+루프 지연으로 기록합니다. 콜백이 임계값 안에 실행되지 않으면 다른 콜백이 루프를 막고 있다는 뜻이므로,
+그 순간 이벤트 루프 스레드의 호출 스택을 읽어 처리 중인 요청의 라우트와 함께 기록합니다.
+(bcrypt 해시 검증, 동기 I/O처럼 `await` 없이 오래 실행되는 호출을 찾는 데 사용)
+
+감시 간격보다 짧은 차단은 지연 히스토그램에만 반영되며, `interval + threshold` 이상 막는 호출은 항상 기록됩니다.
+"""
+
+import asyncio
+import logging
+import sys
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from datetime import UTC, datetime
+
+from app.core.config import Settings
+from app.core.metrics import registry
+from app.core.profiler import collect_stack, format_frame, route_name
+
+# 최근 차단 기록 보관 개수
+MAX_RECENT_BLOCKS = 100
+
+logger = logging.getLogger(__name__)
+
+event_loop_lag_seconds = registry.histogram(
+    "event_loop_lag_seconds", "이벤트 루프에 보낸 콜백이 실행되기까지의 지연(초)"
+)
+event_loop_blocks_total = registry.counter(
+    "event_loop_blocks_total", "임계값 이상 이벤트 루프를 막은 호출 수 (라우트별)", ("route",)
+)
+
+
+@dataclass(frozen=True)
+class LoopBlock:
+    """임계값 이상 이벤트 루프를 막은 호출"""
+
+    route: str
+    duration: float
+    stack: list[str]
+    occurred_at: datetime
+
+
+class LoopMonitor:
+    """
+    이벤트 루프 지연을 측정하고 루프를 막는 호출의 스택을 기록하는 감시 스레드
+
+    측정값(메트릭, 차단 기록)은 감시 스레드 하나에서만 갱신합니다.
+    """
+
+    def __init__(self, interval: float = 0.1, threshold: float = 0.1, enabled: bool = True):
+        self.interval = interval
+        self.threshold = threshold
+        self.enabled = enabled
+        self.blocks: deque[LoopBlock] = deque(maxlen=MAX_RECENT_BLOCKS)
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._loop_thread_id = 0
+        self._stopped = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def start(self) -> None:
+        """현재 실행 중인 이벤트 루프 감시를 시작합니다. (이벤트 루프에서 호출)"""
+        self.stop()
+        if not self.enabled:
+            return
+        self._loop = asyncio.get_running_loop()
+        self._loop_thread_id = threading.get_ident()
+        self._stopped = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="loop-monitor", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        if self._thread is None:
+            return
+        self._stopped.set()
+        self._thread.join()
+        self._thread = None
+
+    def reset(self) -> None:
+        self.blocks.clear()
+
+    def _run(self) -> None:
+        while not self._stopped.wait(self.interval):
+            if not self.check():
+                return
+
+    def check(self) -> bool:
+        """
+        루프에 콜백 하나를 보내 지연을 측정합니다.
+        임계값 안에 실행되지 않으면 루프 스레드의 스택을 기록하고, 루프가 닫혔거나 감시가 중지되면 False를 반환합니다.
+        """
+        if self._loop is None:
+            return False
+        processed = threading.Event()
+        sent_at = time.perf_counter()
+        processed_at = sent_at
+
+        def heartbeat() -> None:
+            nonlocal processed_at
+            processed_at = time.perf_counter()
+            processed.set()
+
+        try:
+            self._loop.call_soon_threadsafe(heartbeat)
+        except RuntimeError:
+            # 이벤트 루프가 닫힘
+            return False
+
+        suspect: tuple[str, list[str]] | None = None
+        if not processed.wait(self.threshold):
+            if self._stopped.is_set():
+                return False
+            suspect = self._capture()
+            while not processed.wait(self.interval):
+                if self._stopped.is_set():
+                    return False
+
+        lag = processed_at - sent_at
+        event_loop_lag_seconds.observe(lag)
+        if suspect is not None:
+            self._record(*suspect, lag)
+        return True
+
+    def _capture(self) -> tuple[str, list[str]] | None:
+        frame = sys._current_frames().get(self._loop_thread_id)
+        if frame is None:
+            return None
+        scope, stack = collect_stack(frame)
+        return route_name(scope), [format_frame(item) for item in stack]
+
+    def _record(self, route: str, stack: list[str], duration: float) -> None:
+        self.blocks.append(LoopBlock(route, duration, stack, datetime.now(UTC)))
+        event_loop_blocks_total.labels(route).inc()
+        logger.warning(
+            "이벤트 루프가 %.1fms 동안 차단되었습니다. (%s)",
+            duration * 1000,
+            route,
+            extra={"route": route, "duration_ms": round(duration * 1000, 3), "stack": stack},
+        )
+
+
+loop_monitor = LoopMonitor()
+
+
+def configure_loop_monitor(settings: Settings) -> None:
+    loop_monitor.enabled = settings.loop_monitor_enabled
+    loop_monitor.interval = settings.loop_monitor_interval_seconds
+    loop_monitor.threshold = settings.loop_block_threshold_ms / 1000
@@ -0,0 +1,368 @@
+import bisect
+import functools
+import inspect
+import math
+import time
+from abc import ABC, abstractmethod
+from collections.abc import Awaitable, Callable, Iterable, Sequence
+from contextvars import ContextVar
+from typing import TypeVar
+
+from starlette.routing import Route
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.tracing import tracer
+
+T = TypeVar("T")
+
+# 요청/유즈케이스/리포지토리 처리 시간(초) 히스토그램 기본 구간
+DEFAULT_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+# 라우트에 매칭되지 않은 요청의 라벨 (경로를 그대로 쓰면 라벨 수가 무한히 늘어남)
+UNMATCHED_ROUTE = "unmatched"
+
+LabelValues = tuple[str, ...]
+
+# 실행 중인 가장 안쪽의 계측 대상 메서드 (`클래스.메서드`, SQL 문을 실행한 리포지토리 메서드 확인용)
+_current_operation: ContextVar[str | None] = ContextVar("metrics_current_operation", default=None)
+
+
+def current_operation() -> str | None:
+    return _current_operation.get()
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str]) -> str:
+    if not names:
+        return ""
+    escaped = (value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n") for value in values)
+    return "{" + ",".join(f'{name}="{value}"' for name, value in zip(names, escaped, strict=True)) + "}"
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
+
+
+class Metric(ABC):
+    """메트릭 공통 속성 (이름, 설명, 라벨 이름)"""
+
+    type_name = "untyped"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+
+    def render(self) -> list[str]:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.type_name}"]
+        lines.extend(self.samples())
+        return lines
+
+    @abstractmethod
+    def samples(self) -> Iterable[str]:
+        """노출 형식의 샘플 줄을 반환합니다."""
+        pass
+
+    def reset(self) -> None:  # noqa: B027  # 누적 값이 없는 메트릭(콜백 메트릭)은 초기화할 것이 없음
+        pass
+
+
+class CounterChild:
+    __slots__ = ("value",)
+
+    def __init__(self) -> None:
+        self.value = 0.0
+
+    def inc(self, amount: float = 1.0) -> None:
+        self.value += amount
+
+    def reset(self) -> None:
+        self.value = 0.0
+
+
+class Counter(Metric):
+    """
+    단조 증가 카운터
+
+    값은 이벤트 루프 스레드에서만 갱신하므로 잠금 없이 덧셈만 수행합니다.
+    라벨 조합별 하위 카운터는 처음 사용할 때 만들어 캐시합니다.
+    """
+
+    type_name = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._children: dict[LabelValues, CounterChild] = {}
+
+    def labels(self, *values: str) -> CounterChild:
+        child = self._children.get(values)
+        if child is None:
+            child = self._children[values] = CounterChild()
+        return child
+
+    def inc(self, amount: float = 1.0) -> None:
+        self.labels().inc(amount)
+
+    def value(self, *values: str) -> float:
+        child = self._children.get(values)
+        return child.value if child is not None else 0.0
+
+    def samples(self) -> Iterable[str]:
+        for values, child in list(self._children.items()):
+            yield f"{self.name}{_format_labels(self.labelnames, values)} {_format_value(child.value)}"
+
+    def reset(self) -> None:
+        # 미리 찾아둔 하위 카운터를 계속 사용할 수 있도록 삭제하지 않고 값만 초기화
+        for child in self._children.values():
+            child.reset()
+
+
+class HistogramChild:
+    __slots__ = ("_upper_bounds", "bucket_counts", "count", "sum")
+
+    def __init__(self, upper_bounds: Sequence[float]) -> None:
+        self._upper_bounds = upper_bounds
+        # 구간별(누적 아님) 관측 수, 마지막 칸은 +Inf
+        self.bucket_counts = [0] * (len(upper_bounds) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        self.bucket_counts[bisect.bisect_left(self._upper_bounds, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def reset(self) -> None:
+        self.bucket_counts = [0] * len(self.bucket_counts)
+        self.count = 0
+        self.sum = 0.0
+
+
+class Histogram(Metric):
+    """
+    관측값 분포 히스토그램
+
+    관측 시에는 해당 구간 하나만 증가시키고, 누적 값은 노출할 때 계산합니다.
+    """
+
+    type_name = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        self._children: dict[LabelValues, HistogramChild] = {}
+
+    def labels(self, *values: str) -> HistogramChild:
+        child = self._children.get(values)
+        if child is None:
+            child = self._children[values] = HistogramChild(self.buckets)
+        return child
+
+    def observe(self, value: float) -> None:
+        self.labels().observe(value)
+
+    def get(self, *values: str) -> HistogramChild | None:
+        return self._children.get(values)
+
+    def samples(self) -> Iterable[str]:
+        bucket_labelnames = (*self.labelnames, "le")
+        for values, child in list(self._children.items()):
+            # 미리 만들어 두었지만 아직 관측값이 없는 라벨 조합은 노출하지 않음
+            if not child.count:
+                continue
+            cumulative = 0
+            for upper_bound, count in zip((*self.buckets, math.inf), child.bucket_counts, strict=True):
+                cumulative += count
+                labels = _format_labels(bucket_labelnames, (*values, _format_value(upper_bound)))
+                yield f"{self.name}_bucket{labels} {cumulative}"
+            labels = _format_labels(self.labelnames, values)
+            yield f"{self.name}_sum{labels} {_format_value(child.sum)}"
+            yield f"{self.name}_count{labels} {child.count}"
+
+    def reset(self) -> None:
+        for child in self._children.values():
+            child.reset()
+
+
+class CallbackMetric(Metric):
+    """
+    노출할 때 콜백으로 값을 읽어오는 메트릭
+
+    커넥션 풀 상태나 캐시 적중 수처럼 이미 다른 곳에서 집계하는 값을 핫 패스 추가 비용 없이 노출합니다.
+    콜백은 (라벨 값, 값) 목록을 반환합니다.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str],
+        collect: Callable[[], Iterable[tuple[LabelValues, float]]],
+        type_name: str = "gauge",
+    ):
+        super().__init__(name, documentation, labelnames)
+        self.type_name = type_name
+        self._collect = collect
+
+    def samples(self) -> Iterable[str]:
+        for values, value in self._collect():
+            yield f"{self.name}{_format_labels(self.labelnames, values)} {_format_value(value)}"
+
+
+class MetricsRegistry:
+    """메트릭을 등록하고 Prometheus 텍스트 형식(0.0.4)으로 노출합니다."""
+
+    CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+    def __init__(self) -> None:
+        self._metrics: dict[str, Metric] = {}
+
+    def register(self, metric: Metric) -> None:
+        if metric.name in self._metrics:
+            raise ValueError(f"이미 등록된 메트릭입니다: {metric.name}")
+        self._metrics[metric.name] = metric
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        counter = Counter(name, documentation, labelnames)
+        self.register(counter)
+        return counter
+
+    def histogram(
+        self, name: str, documentation: str, labelnames: Sequence[str] = (), buckets: Sequence[float] = DEFAULT_BUCKETS
+    ) -> Histogram:
+        histogram = Histogram(name, documentation, labelnames, buckets)
+        self.register(histogram)
+        return histogram
+
+    def callback(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str],
+        collect: Callable[[], Iterable[tuple[LabelValues, float]]],
+        type_name: str = "gauge",
+    ) -> CallbackMetric:
+        metric = CallbackMetric(name, documentation, labelnames, collect, type_name)
+        self.register(metric)
+        return metric
+
+    def render(self) -> str:
+        lines: list[str] = []
+        for metric in self._metrics.values():
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+    def reset(self) -> None:
+        """직접 집계한 카운터/히스토그램 값을 초기화합니다. (테스트용)"""
+        for metric in self._metrics.values():
+            metric.reset()
+
+
+registry = MetricsRegistry()
+
+http_requests_total = registry.counter("http_requests_total", "라우트별 HTTP 요청 수", ("route", "method", "status"))
+http_request_duration_seconds = registry.histogram(
+    "http_request_duration_seconds", "라우트별 HTTP 요청 처리 시간(초)", ("route", "method")
+)
+use_case_duration_seconds = registry.histogram(
+    "use_case_duration_seconds", "유즈케이스 메서드 실행 시간(초)", ("use_case", "method", "outcome")
+)
+repository_duration_seconds = registry.histogram(
+    "repository_duration_seconds", "리포지토리 메서드 실행 시간(초)", ("repository", "method", "outcome")
+)
+optimistic_lock_conflicts_total = registry.counter(
+    "optimistic_lock_conflicts_total", "낙관적 락 충돌로 재시도한 횟수", ("function",)
+)
+optimistic_lock_exhausted_total = registry.counter(
+    "optimistic_lock_exhausted_total", "낙관적 락 충돌 재시도를 모두 소진한 횟수", ("function",)
+)
+
+_INSTRUMENTED_HISTOGRAMS = {"use_case": use_case_duration_seconds, "repository": repository_duration_seconds}
+
+
+def _timed[**P, R](
+    histogram: Histogram, owner: str, method: str, func: Callable[P, Awaitable[R]]
+) -> Callable[P, Awaitable[R]]:
+    # 라벨 조합별 하위 히스토그램을 미리 찾아두어 호출마다 딕셔너리 조회를 하지 않음
+    succeeded = histogram.labels(owner, method, "success")
+    failed = histogram.labels(owner, method, "error")
+    span_name = f"{owner}.{method}"
+
+    async def observe(*args: P.args, **kwargs: P.kwargs) -> R:
+        token = _current_operation.set(span_name)
+        started_at = time.perf_counter()
+        try:
+            result = await func(*args, **kwargs)
+        except BaseException:
+            failed.observe(time.perf_counter() - started_at)
+            raise
+        finally:
+            _current_operation.reset(token)
+        succeeded.observe(time.perf_counter() - started_at)
+        return result
+
+    @functools.wraps(func)
+    async def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+        # 샘플링된 요청 안에서만 스팬을 만듦
+        if tracer.is_recording():
+            with tracer.start_span(span_name):
+                return await observe(*args, **kwargs)
+        return await observe(*args, **kwargs)
+
+    return wrapper
+
+
+def instrumented(kind: str) -> Callable[[type[T]], type[T]]:
+    """
+    클래스의 공개 async 메서드마다 실행 시간을 기록하고, 추적 중인 요청에서는 스팬을 만드는 클래스 데코레이터입니다.
+
+        @instrumented("use_case")
+        class OrderUseCase: ...
+
+    `kind`는 "use_case" 또는 "repository"이며, 클래스 이름과 메서드 이름이 라벨이 됩니다.
+    """
+    histogram = _INSTRUMENTED_HISTOGRAMS[kind]
+
+    def decorator(cls: type[T]) -> type[T]:
+        for name, attribute in list(vars(cls).items()):
+            if not name.startswith("_") and inspect.iscoroutinefunction(attribute):
+                setattr(cls, name, _timed(histogram, cls.__name__, name, attribute))
+        return cls
+
+    return decorator
+
+
+class MetricsMiddleware:
+    """라우트 이름(`RouteName`)별 요청 수와 처리 시간을 기록하는 ASGI 미들웨어"""
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        started_at = time.perf_counter()
+        status_code = 500
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            route = scope.get("route")
+            route_name = route.name if isinstance(route, Route) else UNMATCHED_ROUTE
+            method = scope["method"]
+            http_request_duration_seconds.labels(route_name, method).observe(time.perf_counter() - started_at)
+            http_requests_total.labels(route_name, method, str(status_code)).inc()
@@ -0,0 +1,207 @@
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+
+from fastapi import HTTPException, Request
+
+from app.core.config import get_settings
+from app.core.exceptions import TooManyRequestsException
+from app.core.security import decode_access_token
+
+settings = get_settings()
+
+# 요청에서 제한 키(IP, 이메일, 사용자 등)를 추출하는 함수. None이면 해당 제한을 적용하지 않음
+KeyFunc = Callable[[Request], Awaitable[str | None]]
+
+
+@dataclass(frozen=True)
+class RateLimitRule:
+    """
+    토큰 버킷 제한 규칙
+
+    버킷은 최대 `capacity`개의 토큰을 가지며 초당 `refill_per_second`개씩 다시 채워집니다.
+    요청마다 토큰 하나를 소비하므로, 순간적으로 `capacity`건까지 허용하고 이후에는 채워지는 속도로 제한합니다.
+    """
+
+    name: str
+    capacity: int
+    refill_per_second: float
+
+    @classmethod
+    def per_minute(cls, name: str, limit: int) -> "RateLimitRule":
+        """분당 `limit`건 (순간 최대 `limit`건) 규칙을 만듭니다."""
+        return cls(name=name, capacity=limit, refill_per_second=limit / 60)
+
+
+@dataclass(frozen=True)
+class RateLimitDecision:
+    allowed: bool
+    # 거부된 경우 다음 토큰이 채워질 때까지 남은 시간(초)
+    retry_after: float = 0.0
+
+
+class RateLimitBackend(ABC):
+    """
+    토큰 버킷 상태 저장소 인터페이스
+
+    기본은 프로세스 메모리(InMemoryRateLimitBackend)이며, 여러 워커/인스턴스가 제한을 공유해야 하면
+    같은 인터페이스로 공유 저장소(예: Redis) 구현을 만들어 `rate_limiter.backend`에 설정합니다.
+    """
+
+    @abstractmethod
+    async def consume(self, key: str, rule: RateLimitRule) -> RateLimitDecision:
+        """키의 버킷에서 토큰 하나를 소비합니다."""
+        pass
+
+    @abstractmethod
+    async def reset(self) -> None:
+        """모든 버킷을 초기화합니다."""
+        pass
+
+
+class InMemoryRateLimitBackend(RateLimitBackend):
+    """
+    프로세스 메모리 토큰 버킷 저장소
+
+    무작위 이메일로 시도하는 공격에도 메모리가 무한히 늘지 않도록 최근에 사용된 `max_keys`개의 버킷만 유지합니다.
+    """
+
+    def __init__(self, max_keys: int = 100_000, clock: Callable[[], float] = time.monotonic):
+        self.max_keys = max_keys
+        self._clock = clock
+        # 키 -> (남은 토큰, 마지막 갱신 시각)
+        self._buckets: OrderedDict[str, tuple[float, float]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    async def consume(self, key: str, rule: RateLimitRule) -> RateLimitDecision:
+        now = self._clock()
+        with self._lock:
+            tokens, updated_at = self._buckets.get(key, (float(rule.capacity), now))
+            tokens = min(float(rule.capacity), tokens + (now - updated_at) * rule.refill_per_second)
+
+            allowed = tokens >= 1
+            if allowed:
+                tokens -= 1
+            self._buckets[key] = (tokens, now)
+            self._buckets.move_to_end(key)
+            while len(self._buckets) > self.max_keys:
+                self._buckets.popitem(last=False)
+
+        if allowed:
+            return RateLimitDecision(allowed=True)
+        return RateLimitDecision(allowed=False, retry_after=(1 - tokens) / rule.refill_per_second)
+
+    async def reset(self) -> None:
+        with self._lock:
+            self._buckets.clear()
+
+
+@dataclass
+class RateLimitStats:
+    """규칙별 허용/거부 횟수"""
+
+    allowed: int = 0
+    rejected: int = 0
+
+
+class RateLimiter:
+    """규칙별로 버킷을 검사하고 허용/거부 횟수를 집계합니다."""
+
+    def __init__(self, backend: RateLimitBackend, enabled: bool = True):
+        self.backend = backend
+        self.enabled = enabled
+        self._stats: dict[str, RateLimitStats] = {}
+
+    async def check(self, rule: RateLimitRule, key: str) -> None:
+        """
+        Raises:
+            TooManyRequestsException: 버킷에 남은 토큰이 없는 경우
+        """
+        if not self.enabled:
+            return
+
+        decision = await self.backend.consume(f"{rule.name}:{key}", rule)
+        stats = self._stats.setdefault(rule.name, RateLimitStats())
+        if decision.allowed:
+            stats.allowed += 1
+            return
+
+        stats.rejected += 1
+        raise TooManyRequestsException(retry_after=decision.retry_after)
+
+    def snapshot(self) -> dict[str, RateLimitStats]:
+        return {name: RateLimitStats(stats.allowed, stats.rejected) for name, stats in self._stats.items()}
+
+    async def reset(self) -> None:
+        self._stats.clear()
+        await self.backend.reset()
+
+
+rate_limiter = RateLimiter(InMemoryRateLimitBackend(), enabled=settings.rate_limit_enabled)
+
+
+async def client_ip(request: Request) -> str | None:
+    """요청을 보낸 클라이언트 IP (프록시 뒤라면 uvicorn `--proxy-headers`로 실제 IP가 설정되어야 함)"""
+    return request.client.host if request.client else None
+
+
+def json_field(field: str) -> KeyFunc:
+    """
+    JSON 본문의 필드 값을 키로 사용합니다. (예: 로그인 이메일)
+    대소문자/공백 차이로 우회하지 못하도록 정규화합니다.
+    """
+
+    async def key(request: Request) -> str | None:
+        try:
+            body = await request.json()
+        except ValueError:
+            return None
+        value = body.get(field) if isinstance(body, dict) else None
+        return value.strip().lower() if isinstance(value, str) else None
+
+    return key
+
+
+async def token_subject(request: Request) -> str | None:
+    """
+    액세스 토큰의 사용자(sub)를 키로 사용합니다. 토큰이 없거나 유효하지 않으면 IP를 사용합니다.
+    (검증된 토큰은 캐시되므로 이후 인증 의존성에서 다시 검증하지 않음)
+    """
+    scheme, _, token = request.headers.get("Authorization", "").partition(" ")
+    if scheme.lower() == "bearer" and token:
+        try:
+            return f"user:{decode_access_token(token).sub}"
+        except HTTPException:
+            # 인증 실패는 이후 인증 의존성이 처리
+            pass
+    return await client_ip(request)
+
+
+def rate_limit(rule: RateLimitRule, key_func: KeyFunc = client_ip) -> Callable[[Request], Awaitable[None]]:
+    """
+    라우트에 적용할 요청 제한 의존성을 만듭니다.
+
+    라우트 데코레이터의 `dependencies`에 지정하면 라우트 의존성으로 실행되며, 본문 파싱/검증과 같은 의존성 해석
+    단계에서 엔드포인트 매개변수의 의존성보다 먼저 해석됩니다. 따라서 엔드포인트의 DB 조회/비밀번호 검증보다는
+    항상 먼저 실행되지만, 본문 스키마 검증에 실패하는 요청도 토큰을 소비합니다.
+
+        @router.post("/login", dependencies=[Depends(rate_limit(LOGIN_PER_IP))])
+    """
+
+    async def dependency(request: Request) -> None:
+        key = await key_func(request)
+        if key is not None:
+            await rate_limiter.check(rule, key)
+
+    return dependency
+
+
+# 라우트별 제한 규칙
+LOGIN_PER_IP = RateLimitRule.per_minute("login:ip", settings.rate_limit_login_per_ip_per_minute)
+LOGIN_PER_EMAIL = RateLimitRule.per_minute("login:email", settings.rate_limit_login_per_email_per_minute)
+SIGNUP_PER_IP = RateLimitRule.per_minute("signup:ip", settings.rate_limit_signup_per_ip_per_minute)
+TOKEN_PER_IP = RateLimitRule.per_minute("token:ip", settings.rate_limit_token_per_ip_per_minute)
+ORDER_PER_USER = RateLimitRule.per_minute("order:user", settings.rate_limit_order_per_user_per_minute)
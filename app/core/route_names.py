@@ -9,6 +9,8 @@ class RouteName(StrEnum):
     # Users
     USERS_CREATE_USER = "users:create-user"
     USERS_LOGIN = "users:login"
+    USERS_REFRESH_TOKEN = "users:refresh-token"
+    USERS_REVOKE_TOKEN = "users:revoke-token"
     USERS_GET_CURRENT_USER = "users:get-current-user"
     USERS_UPDATE_CURRENT_USER = "users:update-current-user"
     USERS_REGISTER_SELLER = "users:register-seller"
@@ -18,6 +20,11 @@ class RouteName(StrEnum):
     PRODUCTS_LIST = "products:list-products"
     PRODUCTS_GET = "products:get-product"
     PRODUCTS_UPDATE = "products:update-product"
+    PRODUCTS_BULK_IMPORT = "products:bulk-import"
+    PRODUCTS_BULK_UPDATE_INVENTORY = "products:bulk-update-inventory"
+    PRODUCTS_BATCH_GET = "products:batch-get-products"
+    PRODUCTS_CONFIGURE_STOCK_SHARDS = "products:configure-stock-shards"
+    PRODUCTS_REBALANCE_STOCK_SHARDS = "products:rebalance-stock-shards"
 
     # Carts
     CARTS_GET_MY_CART = "carts:get-my-cart"
@@ -29,5 +36,17 @@ class RouteName(StrEnum):
     ORDERS_CREATE = "orders:create-order"
     ORDERS_LIST = "orders:list-orders"
     ORDERS_GET = "orders:get-order"
+    ORDERS_BATCH_GET = "orders:batch-get-orders"
     ORDERS_CANCEL = "orders:cancel-order"
     ORDERS_CHECKOUT = "orders:checkout"
+
+    # Metrics
+    METRICS = "metrics"
+
+    # Debug
+    DEBUG_DB_CONNECTIONS = "debug:db-connections"
+    DEBUG_RATE_LIMITS = "debug:rate-limits"
+    DEBUG_PROFILE = "debug:profile"
+    DEBUG_ASYNCIO = "debug:asyncio"
+    DEBUG_EVENT_LOOP_BLOCKS = "debug:event-loop-blocks"
+    DEBUG_SLOW_QUERIES = "debug:slow-queries"
@@ -1,5 +1,8 @@
+import hashlib
+import secrets
+from dataclasses import dataclass
 from datetime import UTC, datetime, timedelta
-from typing import Annotated
+from typing import Annotated, Any
 
 import bcrypt
 import jwt
@@ -8,35 +11,93 @@ from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 
 from app.application.dto.token import TokenPayload
-from app.core.config import get_settings
+from app.core.config import Settings, get_settings
+from app.core.db import set_read_affinity
 from app.core.exceptions import ForbiddenException
-from app.domain.model.seller import Seller
-from app.domain.model.user import User
+from app.core.token_cache import VerifiedTokenCache
+from app.core.tracing import tracer
+from app.domain.model.user import User, UserRole
 from app.domain.ports.user_repository import IUserRepository
 
 settings = get_settings()
 security_scheme = HTTPBearer()
 
+# 서명/검증에 개인키-공개키 쌍을 사용하는 알고리즘
+ASYMMETRIC_JWT_ALGORITHMS = frozenset({"ES256", "EdDSA"})
+
+
+@dataclass(frozen=True)
+class JWTKeys:
+    """토큰 서명/검증 키 (HS* 알고리즘은 두 키가 같은 비밀키)"""
+
+    algorithm: str
+    signing_key: Any
+    verification_key: Any
+
+
+def load_jwt_keys(settings: Settings) -> JWTKeys:
+    """
+    설정에서 JWT 키를 읽어 알고리즘에 맞는 키 객체로 한 번만 변환합니다.
+
+    비대칭 알고리즘은 PEM 파싱 비용이 크므로 요청마다 하지 않도록 앱 시작 시 미리 준비합니다.
+
+    Raises:
+        ValueError: 비대칭 알고리즘인데 키가 설정되지 않았거나, 알고리즘을 사용할 수 없는 경우
+            (ES256/EdDSA는 `PyJWT[crypto]`가 필요)
+    """
+    if settings.jwt_algorithm not in ASYMMETRIC_JWT_ALGORITHMS:
+        return JWTKeys(settings.jwt_algorithm, settings.jwt_secret_key, settings.jwt_secret_key)
+
+    if settings.jwt_private_key is None or settings.jwt_public_key is None:
+        raise ValueError(f"{settings.jwt_algorithm} 알고리즘은 JWT_PRIVATE_KEY와 JWT_PUBLIC_KEY 설정이 필요합니다.")
+
+    try:
+        algorithm = jwt.get_algorithm_by_name(settings.jwt_algorithm)
+    except NotImplementedError as exc:
+        raise ValueError(f"{settings.jwt_algorithm} 알고리즘을 사용하려면 PyJWT[crypto]를 설치해야 합니다.") from exc
+
+    return JWTKeys(
+        algorithm=settings.jwt_algorithm,
+        signing_key=algorithm.prepare_key(settings.jwt_private_key),
+        verification_key=algorithm.prepare_key(settings.jwt_public_key),
+    )
+
+
+jwt_keys = load_jwt_keys(settings)
+token_cache = VerifiedTokenCache(settings.jwt_token_cache_size)
+
 
 def get_password_hash(password: str) -> str:
     return bcrypt.hashpw(password.encode("utf-8"), bcrypt.gensalt()).decode("utf-8")
 
 
 def create_access_token(data: TokenPayload, expires_delta: timedelta | None = None) -> str:
-    to_encode = data.model_dump()
+    to_encode = data.model_dump(exclude_none=True)
     if expires_delta:
         expire = datetime.now(UTC) + expires_delta
     else:
         expire = datetime.now(UTC) + timedelta(minutes=settings.jwt_access_token_expire_minutes)
     to_encode.update({"exp": expire, "sub": data.sub})
-    encoded_jwt = jwt.encode(to_encode, settings.jwt_secret_key, algorithm=settings.jwt_algorithm)
+    encoded_jwt = jwt.encode(to_encode, jwt_keys.signing_key, algorithm=jwt_keys.algorithm)
     return encoded_jwt
 
 
+def generate_refresh_token() -> str:
+    """추측할 수 없는 불투명(opaque) 리프레시 토큰을 생성합니다."""
+    return secrets.token_urlsafe(32)
+
+
+def hash_refresh_token(token: str) -> str:
+    """리프레시 토큰을 저장/조회할 때 사용하는 해시를 반환합니다. (원문은 저장하지 않음)"""
+    return hashlib.sha256(token.encode("utf-8")).hexdigest()
+
+
 def decode_access_token(token: str) -> TokenPayload:
     """
     JWT 토큰을 디코딩하여 페이로드를 반환합니다.
 
+    검증된 토큰은 만료 시각까지 캐시하여 같은 토큰의 서명 검증을 반복하지 않습니다.
+
     Args:
         token: 디코딩할 JWT 토큰
 
@@ -46,9 +107,12 @@ def decode_access_token(token: str) -> TokenPayload:
     Raises:
         HTTPException: 토큰이 유효하지 않거나 만료된 경우
     """
+    cached: TokenPayload | None = token_cache.get(token)
+    if cached is not None:
+        return cached
+
     try:
-        payload = jwt.decode(token, settings.jwt_secret_key, algorithms=[settings.jwt_algorithm])
-        return TokenPayload(**payload)
+        payload = jwt.decode(token, jwt_keys.verification_key, algorithms=[jwt_keys.algorithm])
     except jwt.ExpiredSignatureError as exc:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -62,6 +126,11 @@ def decode_access_token(token: str) -> TokenPayload:
             headers={"WWW-Authenticate": "Bearer"},
         ) from exc
 
+    token_payload = TokenPayload(**payload)
+    if "exp" in payload:
+        token_cache.put(token, token_payload, payload["exp"])
+    return token_payload
+
 
 @inject
 async def get_current_user(
@@ -81,8 +150,49 @@ async def get_current_user(
     Raises:
         HTTPException: 인증에 실패한 경우
     """
-    token_data = decode_access_token(credentials.credentials)
+    with tracer.start_span("auth.get_current_user"):
+        token_data = decode_access_token(credentials.credentials)
+        return await _load_user(token_data, user_repository)
+
+
+@dataclass(frozen=True)
+class AuthenticatedSeller:
+    """인증된 판매자 (판매자 API 권한 확인에 필요한 식별자만 포함)"""
+
+    id: int
+    user_id: int
+
+
+@inject
+async def get_current_seller(
+    credentials: Annotated[HTTPAuthorizationCredentials, Depends(security_scheme)],
+    user_repository: Annotated[IUserRepository, Depends(Provide["user_repository"])],
+) -> AuthenticatedSeller:
+    """
+    현재 인증된 사용자가 판매자인 경우 판매자 정보를 반환합니다.
 
+    액세스 토큰에 판매자 클레임(`uid`, `role`, `seller_id`)이 있으면 DB를 조회하지 않고 권한을 확인합니다.
+    판매자 등록 전에 발급된 토큰처럼 클레임이 없으면 DB에서 사용자를 조회합니다.
+
+    클레임만으로 권한을 확인하므로, 토큰 발급 이후 비활성화되거나 판매자 권한을 잃은 사용자도 액세스 토큰이
+    만료될 때까지(`JWT_ACCESS_TOKEN_EXPIRE_MINUTES`)는 판매자 API를 호출할 수 있습니다.
+    재발급 시에는 DB의 현재 상태로 클레임을 다시 만들고 비활성 사용자는 거부하므로 지연은 액세스 토큰 수명으로
+    제한됩니다. 사용자 비활성화나 권한 회수 기능을 추가할 때는 해당 사용자의 리프레시 토큰 묶음도 함께 폐기해야 합니다.
+    """
+    with tracer.start_span("auth.get_current_seller"):
+        token_data = decode_access_token(credentials.credentials)
+        if token_data.role == UserRole.SELLER and token_data.uid is not None and token_data.seller_id is not None:
+            set_read_affinity(f"user:{token_data.uid}")
+            return AuthenticatedSeller(id=token_data.seller_id, user_id=token_data.uid)
+
+        current_user = await _load_user(token_data, user_repository)
+        if not current_user.is_seller or not current_user.seller:
+            raise ForbiddenException(message="판매자 권한이 필요합니다.")
+
+        return AuthenticatedSeller(id=current_user.seller.id, user_id=current_user.seller.user_id)
+
+
+async def _load_user(token_data: TokenPayload, user_repository: IUserRepository) -> User:
     user = await user_repository.get_by_email(token_data.sub)
 
     if user is None:
@@ -95,20 +205,19 @@ async def get_current_user(
     if not user.is_active:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Inactive user")
 
+    # 이 사용자가 방금 쓴 데이터는 복제 지연과 관계없이 읽을 수 있도록 read-your-writes 기준 키 설정
+    set_read_affinity(f"user:{user.id}")
+
     return user
 
 
-async def get_current_seller(
+async def get_current_admin(
     current_user: Annotated[User, Depends(get_current_user)],
-) -> Seller:
+) -> User:
     """
-    현재 인증된 사용자가 판매자인 경우 판매자 정보를 반환합니다.
+    현재 인증된 사용자가 관리자인 경우 사용자 정보를 반환합니다.
     """
-    if not current_user.is_seller or not current_user.seller:
-        raise ForbiddenException(message="판매자 권한이 필요합니다.")
-
-    if current_user.seller.id is None:
-        # DB 무결성 상 발생하지 않아야 함
-        raise ForbiddenException(message="유효하지 않은 판매자 정보입니다.")
+    if current_user.role != UserRole.ADMIN:
+        raise ForbiddenException(message="관리자 권한이 필요합니다.")
 
-    return current_user.seller
+    return current_user
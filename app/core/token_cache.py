@@ -0,0 +1,60 @@
+import hashlib
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from typing import Any
+
+
+class VerifiedTokenCache:
+    """
+    서명 검증을 마친 토큰의 페이로드를 만료 시각(`exp`)까지 보관하는 LRU 캐시
+
+    같은 토큰이 요청마다 반복해서 들어오므로 HMAC/서명 검증과 페이로드 검증을 한 번만 수행합니다.
+    키는 토큰 원문이 아니라 SHA-256 해시를 사용하여 메모리에 토큰을 남기지 않습니다.
+    """
+
+    def __init__(self, max_size: int, clock: Callable[[], float] = time.time):
+        self.max_size = max_size
+        self._clock = clock
+        # 토큰 해시 -> (페이로드, 만료 시각(epoch 초))
+        self._entries: OrderedDict[bytes, tuple[Any, float]] = OrderedDict()
+        # 적중/실패 횟수 (메트릭으로 노출)
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, token: str) -> Any | None:
+        key = self._key(token)
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        payload, expires_at = entry
+        if expires_at <= self._clock():
+            del self._entries[key]
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return payload
+
+    def put(self, token: str, payload: Any, expires_at: float) -> None:
+        if self.max_size <= 0 or expires_at <= self._clock():
+            return
+
+        key = self._key(token)
+        self._entries[key] = (payload, expires_at)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    @staticmethod
+    def _key(token: str) -> bytes:
+        return hashlib.sha256(token.encode("utf-8")).digest()
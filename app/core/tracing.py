@@ -0,0 +1,595 @@
+"""
+OpenTelemetry 호환 분산 추적
+
+요청(API) → 인증 → 유즈케이스 → 작업 단위(UoW) 커밋/롤백 → SQL 문 단위로 스팬을 기록합니다.
+W3C Trace Context(`traceparent`)로 상위 서비스의 추적을 이어받고, 스팬은 교체 가능한 exporter로 내보냅니다.
+
+- console: 스팬을 한 줄씩 표준 출력에 기록
+- otlp_file: OTLP/JSON 형식으로 파일에 기록 (OpenTelemetry Collector `otlpjsonfile` 수신기로 읽을 수 있음)
+- memory: 메모리에 보관 (테스트용)
+
+파일로 내보낸 추적은 다음 명령으로 트리 형태로 확인할 수 있습니다.
+
+    python -m app.core.tracing traces.jsonl [--trace-id TRACE_ID]
+"""
+
+import argparse
+import json
+import queue
+import random
+import re
+import sys
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections.abc import Iterator, Sequence
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from enum import IntEnum
+from pathlib import Path
+from typing import IO, Any
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+from starlette import status
+from starlette.routing import Route
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.config import Settings
+
+TRACEPARENT_HEADER = b"traceparent"
+_TRACEPARENT_PATTERN = re.compile(r"^00-([0-9a-f]{32})-([0-9a-f]{16})-([0-9a-f]{2})$")
+_INVALID_TRACE_ID = "0" * 32
+_INVALID_SPAN_ID = "0" * 16
+_SAMPLED_FLAG = 0x01
+# 기록하는 SQL 문 최대 길이
+MAX_STATEMENT_LENGTH = 2000
+
+AttributeValue = str | int | float | bool
+
+
+class SpanKind(IntEnum):
+    """OTLP 스팬 종류"""
+
+    INTERNAL = 1
+    SERVER = 2
+    CLIENT = 3
+
+
+class StatusCode(IntEnum):
+    """OTLP 스팬 상태"""
+
+    UNSET = 0
+    OK = 1
+    ERROR = 2
+
+
+@dataclass(frozen=True)
+class SpanContext:
+    trace_id: str
+    span_id: str
+    sampled: bool
+
+    def to_traceparent(self) -> str:
+        return f"00-{self.trace_id}-{self.span_id}-{_SAMPLED_FLAG if self.sampled else 0:02x}"
+
+
+@dataclass
+class Span:
+    name: str
+    context: SpanContext
+    parent_span_id: str | None = None
+    kind: SpanKind = SpanKind.INTERNAL
+    attributes: dict[str, AttributeValue] = field(default_factory=dict)
+    start_time_ns: int = field(default_factory=time.time_ns)
+    end_time_ns: int | None = None
+    status: StatusCode = StatusCode.UNSET
+    status_message: str | None = None
+
+    @property
+    def duration_ms(self) -> float:
+        end = self.end_time_ns if self.end_time_ns is not None else time.time_ns()
+        return (end - self.start_time_ns) / 1_000_000
+
+    def set_attribute(self, key: str, value: AttributeValue) -> None:
+        self.attributes[key] = value
+
+    def record_error(self, exc: BaseException) -> None:
+        self.status = StatusCode.ERROR
+        self.status_message = f"{type(exc).__name__}: {exc}"
+
+
+def parse_traceparent(value: str) -> SpanContext | None:
+    """W3C `traceparent` 헤더를 해석합니다. 형식이 잘못되었으면 None을 반환합니다."""
+    match = _TRACEPARENT_PATTERN.match(value.strip().lower())
+    if match is None:
+        return None
+    trace_id, span_id, flags = match.groups()
+    if trace_id == _INVALID_TRACE_ID or span_id == _INVALID_SPAN_ID:
+        return None
+    return SpanContext(trace_id=trace_id, span_id=span_id, sampled=bool(int(flags, 16) & _SAMPLED_FLAG))
+
+
+class SpanExporter(ABC):
+    """완료된 스팬을 내보내는 인터페이스"""
+
+    @abstractmethod
+    def export(self, spans: Sequence[Span]) -> None:
+        pass
+
+
+class InMemorySpanExporter(SpanExporter):
+    """스팬을 메모리에 보관합니다. (테스트용)"""
+
+    def __init__(self) -> None:
+        self.spans: list[Span] = []
+        self._lock = threading.Lock()
+
+    def export(self, spans: Sequence[Span]) -> None:
+        with self._lock:
+            self.spans.extend(spans)
+
+    def clear(self) -> None:
+        with self._lock:
+            self.spans.clear()
+
+
+class ConsoleSpanExporter(SpanExporter):
+    """스팬을 한 줄씩 출력합니다."""
+
+    def __init__(self, stream: IO[str] | None = None):
+        self._stream = stream or sys.stdout
+
+    def export(self, spans: Sequence[Span]) -> None:
+        for span in spans:
+            parent = span.parent_span_id or "-"
+            self._stream.write(
+                f"[trace] {span.context.trace_id} {span.context.span_id} parent={parent} "
+                f"{span.name} {span.duration_ms:.3f}ms status={span.status.name} {json.dumps(span.attributes)}\n"
+            )
+        self._stream.flush()
+
+
+def _otlp_value(value: AttributeValue) -> dict[str, Any]:
+    # bool은 int의 하위 타입이므로 먼저 확인
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    return {"stringValue": value}
+
+
+def to_otlp_json(spans: Sequence[Span], service_name: str) -> dict[str, Any]:
+    """스팬 목록을 OTLP/JSON `ExportTraceServiceRequest` 형식으로 변환합니다."""
+    return {
+        "resourceSpans": [
+            {
+                "resource": {"attributes": [{"key": "service.name", "value": {"stringValue": service_name}}]},
+                "scopeSpans": [
+                    {
+                        "scope": {"name": "app"},
+                        "spans": [
+                            {
+                                "traceId": span.context.trace_id,
+                                "spanId": span.context.span_id,
+                                "parentSpanId": span.parent_span_id or "",
+                                "name": span.name,
+                                "kind": int(span.kind),
+                                "startTimeUnixNano": str(span.start_time_ns),
+                                "endTimeUnixNano": str(span.end_time_ns or span.start_time_ns),
+                                "attributes": [
+                                    {"key": key, "value": _otlp_value(value)} for key, value in span.attributes.items()
+                                ],
+                                "status": {"code": int(span.status), "message": span.status_message or ""},
+                            }
+                            for span in spans
+                        ],
+                    }
+                ],
+            }
+        ]
+    }
+
+
+class OTLPFileSpanExporter(SpanExporter):
+    """스팬을 OTLP/JSON 형식으로 파일에 한 줄(배치)씩 추가합니다."""
+
+    def __init__(self, path: str | Path, service_name: str):
+        self.path = Path(path)
+        self.service_name = service_name
+
+    def export(self, spans: Sequence[Span]) -> None:
+        line = json.dumps(to_otlp_json(spans, self.service_name), ensure_ascii=False)
+        with self.path.open("a", encoding="utf-8") as file:
+            file.write(line + "\n")
+
+
+class SpanProcessor(ABC):
+    @abstractmethod
+    def on_end(self, span: Span) -> None:
+        pass
+
+    @abstractmethod
+    def force_flush(self) -> None:
+        """아직 내보내지 않은 스팬을 모두 내보냅니다."""
+        pass
+
+
+class SimpleSpanProcessor(SpanProcessor):
+    """스팬이 끝날 때마다 바로 내보냅니다. (메모리 exporter용)"""
+
+    def __init__(self, exporter: SpanExporter):
+        self.exporter = exporter
+
+    def on_end(self, span: Span) -> None:
+        self.exporter.export([span])
+
+    def force_flush(self) -> None:
+        # 스팬이 끝날 때 바로 내보내므로 남은 스팬이 없음
+        pass
+
+
+class BatchSpanProcessor(SpanProcessor):
+    """
+    완료된 스팬을 큐에 넣고 백그라운드 스레드에서 모아서 내보냅니다.
+
+    이벤트 루프에서는 큐에 넣는 비용만 들며, 큐가 가득 차면 스팬을 버리고 버린 수를 집계합니다.
+    """
+
+    def __init__(
+        self,
+        exporter: SpanExporter,
+        max_queue_size: int = 10_000,
+        max_batch_size: int = 512,
+        schedule_delay_seconds: float = 1.0,
+    ):
+        self.exporter = exporter
+        self.max_batch_size = max_batch_size
+        self.schedule_delay_seconds = schedule_delay_seconds
+        self.dropped = 0
+        self._queue: queue.Queue[Span] = queue.Queue(max_queue_size)
+        self._flush_requested = threading.Event()
+        self._flushed = threading.Condition()
+        self._worker: threading.Thread | None = None
+        self._worker_lock = threading.Lock()
+
+    def on_end(self, span: Span) -> None:
+        self._ensure_worker()
+        try:
+            self._queue.put_nowait(span)
+        except queue.Full:
+            self.dropped += 1
+
+    def force_flush(self, timeout: float = 5.0) -> None:
+        """큐에 남은 스팬을 모두 내보낼 때까지 기다립니다."""
+        if self._worker is None:
+            return
+        with self._flushed:
+            self._flush_requested.set()
+            self._flushed.wait_for(lambda: self._queue.empty() and not self._flush_requested.is_set(), timeout)
+
+    def _ensure_worker(self) -> None:
+        if self._worker is not None:
+            return
+        with self._worker_lock:
+            if self._worker is None:
+                self._worker = threading.Thread(target=self._run, name="span-exporter", daemon=True)
+                self._worker.start()
+
+    def _run(self) -> None:
+        while True:
+            self._flush_requested.wait(self.schedule_delay_seconds)
+            while not self._queue.empty():
+                batch: list[Span] = []
+                while len(batch) < self.max_batch_size:
+                    try:
+                        batch.append(self._queue.get_nowait())
+                    except queue.Empty:
+                        break
+                if batch:
+                    self.exporter.export(batch)
+            with self._flushed:
+                self._flush_requested.clear()
+                self._flushed.notify_all()
+
+
+_current_span: ContextVar[Span | None] = ContextVar("tracing_current_span", default=None)
+# 현재 요청의 trace ID (루트 스팬이 끝난 뒤 미들웨어 바깥의 500 핸들러가 남기는 로그에도 포함하기 위함)
+_request_trace_id: ContextVar[str | None] = ContextVar("tracing_request_trace_id", default=None)
+
+
+def _new_trace_id() -> str:
+    return f"{random.getrandbits(128):032x}"
+
+
+def _new_span_id() -> str:
+    return f"{random.getrandbits(64):016x}"
+
+
+class Tracer:
+    """
+    스팬을 만들고 현재 스팬을 컨텍스트에 유지합니다.
+
+    추적은 API 요청마다 루트 스팬(`start_request_span`)에서 샘플링 여부를 정하고,
+    하위 스팬(`start_span`)은 샘플링된 요청 안에서만 기록합니다.
+    따라서 추적이 꺼져 있거나 샘플링되지 않은 요청에서는 컨텍스트 변수 조회 한 번의 비용만 듭니다.
+    """
+
+    def __init__(self) -> None:
+        self.processor: SpanProcessor | None = None
+        self.sample_ratio = 1.0
+
+    @property
+    def enabled(self) -> bool:
+        return self.processor is not None
+
+    def configure(self, processor: SpanProcessor | None, sample_ratio: float = 1.0) -> None:
+        if self.processor is not None:
+            self.processor.force_flush()
+        self.processor = processor
+        self.sample_ratio = sample_ratio
+
+    def force_flush(self) -> None:
+        if self.processor is not None:
+            self.processor.force_flush()
+
+    def current_span(self) -> Span | None:
+        return _current_span.get()
+
+    def is_recording(self) -> bool:
+        """현재 샘플링된 스팬 안에서 실행 중인지 여부 (하위 스팬을 만들 필요가 있는지 빠르게 확인)"""
+        span = _current_span.get()
+        return span is not None and span.context.sampled
+
+    def should_sample(self, trace_id: str) -> bool:
+        """trace ID 하위 64비트 기준으로 비율 샘플링합니다. (같은 trace는 어느 서비스에서든 같은 결정)"""
+        if self.sample_ratio >= 1:
+            return True
+        return int(trace_id[16:], 16) < self.sample_ratio * 2**64
+
+    @contextmanager
+    def start_request_span(
+        self, name: str, parent: SpanContext | None = None, attributes: dict[str, AttributeValue] | None = None
+    ) -> Iterator[Span | None]:
+        """
+        요청의 루트 스팬을 시작합니다.
+
+        상위 서비스에서 전달된 `parent`가 있으면 같은 trace를 이어가고 샘플링 결정도 따릅니다.
+        """
+        if not self.enabled:
+            yield None
+            return
+
+        trace_id = parent.trace_id if parent is not None else _new_trace_id()
+        sampled = parent.sampled if parent is not None else self.should_sample(trace_id)
+        span = Span(
+            name=name,
+            context=SpanContext(trace_id=trace_id, span_id=_new_span_id(), sampled=sampled),
+            parent_span_id=parent.span_id if parent is not None else None,
+            kind=SpanKind.SERVER,
+            attributes=dict(attributes or {}),
+        )
+        with self._activate(span):
+            yield span
+
+    @contextmanager
+    def start_span(
+        self, name: str, kind: SpanKind = SpanKind.INTERNAL, attributes: dict[str, AttributeValue] | None = None
+    ) -> Iterator[Span | None]:
+        """현재 스팬의 하위 스팬을 시작합니다. 샘플링된 요청 밖에서는 아무것도 기록하지 않습니다."""
+        parent = _current_span.get()
+        if parent is None or not parent.context.sampled:
+            yield None
+            return
+
+        span = self.create_child(parent, name, kind, attributes)
+        with self._activate(span):
+            yield span
+
+    def create_child(
+        self,
+        parent: Span,
+        name: str,
+        kind: SpanKind = SpanKind.INTERNAL,
+        attributes: dict[str, AttributeValue] | None = None,
+    ) -> Span:
+        """현재 스팬으로 설정하지 않는 하위 스팬을 만듭니다. (SQL 문처럼 하위 스팬이 없는 경우) `end()`로 종료합니다."""
+        return Span(
+            name=name,
+            context=SpanContext(trace_id=parent.context.trace_id, span_id=_new_span_id(), sampled=True),
+            parent_span_id=parent.context.span_id,
+            kind=kind,
+            attributes=dict(attributes or {}),
+        )
+
+    def end(self, span: Span) -> None:
+        span.end_time_ns = time.time_ns()
+        if span.context.sampled and self.processor is not None:
+            self.processor.on_end(span)
+
+    @contextmanager
+    def _activate(self, span: Span) -> Iterator[None]:
+        token = _current_span.set(span)
+        try:
+            yield
+        except BaseException as e:
+            span.record_error(e)
+            raise
+        finally:
+            _current_span.reset(token)
+            self.end(span)
+
+
+tracer = Tracer()
+
+
+def current_trace_id() -> str | None:
+    span = _current_span.get()
+    return span.context.trace_id if span is not None else _request_trace_id.get()
+
+
+def inject_traceparent(headers: dict[str, str]) -> None:
+    """다른 서비스를 호출할 때 현재 추적을 이어가도록 `traceparent` 헤더를 추가합니다."""
+    span = _current_span.get()
+    if span is not None:
+        headers["traceparent"] = span.context.to_traceparent()
+
+
+class TracingMiddleware:
+    """
+    요청마다 루트 스팬을 만드는 ASGI 미들웨어
+
+    스팬 이름은 라우팅이 끝난 뒤 `GET /api/v1/products/{product_id}`처럼 경로 템플릿으로 정합니다.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not tracer.enabled:
+            await self.app(scope, receive, send)
+            return
+
+        parent = None
+        for name, value in scope["headers"]:
+            if name == TRACEPARENT_HEADER:
+                parent = parse_traceparent(value.decode("latin-1"))
+                break
+
+        method = scope["method"]
+        attributes: dict[str, AttributeValue] = {"http.request.method": method, "url.path": scope["path"]}
+        with tracer.start_request_span(f"{method} {scope['path']}", parent, attributes) as span:
+            # 처리되지 않은 예외는 이 미들웨어 바깥의 500 핸들러에서 기록되므로 trace ID를 되돌리지 않음
+            # (요청마다 별도의 태스크 컨텍스트에서 실행되어 다른 요청에 영향을 주지 않음)
+            if span is not None:
+                _request_trace_id.set(span.context.trace_id)
+
+            async def send_with_status(message: Message) -> None:
+                if span is not None and message["type"] == "http.response.start":
+                    span.set_attribute("http.response.status_code", message["status"])
+                    if message["status"] >= status.HTTP_500_INTERNAL_SERVER_ERROR:
+                        span.status = StatusCode.ERROR
+                await send(message)
+
+            try:
+                await self.app(scope, receive, send_with_status)
+            finally:
+                route = scope.get("route")
+                if span is not None and isinstance(route, Route):
+                    span.name = f"{method} {route.path}"
+                    span.set_attribute("http.route", route.path)
+
+
+def instrument_engine(engine: AsyncEngine) -> None:
+    """엔진에서 실행되는 SQL 문마다 현재 스팬의 하위 스팬을 기록합니다."""
+    sync_engine = engine.sync_engine
+    db_system = sync_engine.dialect.name
+
+    @event.listens_for(sync_engine, "before_cursor_execute", named=True)
+    def _before_cursor_execute(**kwargs: Any) -> None:
+        parent = _current_span.get()
+        context = kwargs["context"]
+        if parent is None or not parent.context.sampled or context is None:
+            return
+        statement: str = kwargs["statement"]
+        operation = statement.lstrip().split(" ", 1)[0].upper()
+        context._trace_span = tracer.create_child(
+            parent,
+            f"SQL {operation}",
+            SpanKind.CLIENT,
+            {"db.system": db_system, "db.statement": statement[:MAX_STATEMENT_LENGTH]},
+        )
+
+    @event.listens_for(sync_engine, "after_cursor_execute", named=True)
+    def _after_cursor_execute(**kwargs: Any) -> None:
+        context = kwargs["context"]
+        span = getattr(context, "_trace_span", None)
+        if span is not None:
+            context._trace_span = None
+            tracer.end(span)
+
+    @event.listens_for(sync_engine, "handle_error")
+    def _handle_error(exception_context: Any) -> None:
+        span = getattr(exception_context.execution_context, "_trace_span", None)
+        if span is not None:
+            exception_context.execution_context._trace_span = None
+            span.record_error(exception_context.original_exception)
+            tracer.end(span)
+
+
+def configure_tracing(settings: Settings) -> None:
+    """설정에 따라 exporter를 선택합니다. (`TRACING_EXPORTER=none`이면 추적하지 않음)"""
+    exporter: SpanExporter
+    match settings.tracing_exporter:
+        case "none":
+            tracer.configure(None)
+            return
+        case "console":
+            exporter = ConsoleSpanExporter()
+        case "otlp_file":
+            exporter = OTLPFileSpanExporter(settings.tracing_file_path, settings.title)
+        case "memory":
+            tracer.configure(SimpleSpanProcessor(InMemorySpanExporter()), settings.tracing_sample_ratio)
+            return
+        case _:
+            raise ValueError(f"지원하지 않는 TRACING_EXPORTER입니다: {settings.tracing_exporter}")
+    tracer.configure(BatchSpanProcessor(exporter), settings.tracing_sample_ratio)
+
+
+def _load_spans(path: Path) -> list[dict[str, Any]]:
+    spans: list[dict[str, Any]] = []
+    with path.open(encoding="utf-8") as file:
+        for line in file:
+            if not line.strip():
+                continue
+            for resource_spans in json.loads(line)["resourceSpans"]:
+                for scope_spans in resource_spans["scopeSpans"]:
+                    spans.extend(scope_spans["spans"])
+    return spans
+
+
+def format_trace_tree(spans: Sequence[dict[str, Any]]) -> list[str]:
+    """OTLP/JSON 스팬을 trace별 호출 트리(이름, 소요 시간)로 출력할 줄 목록으로 만듭니다."""
+    lines: list[str] = []
+    by_trace: dict[str, list[dict[str, Any]]] = {}
+    for span in spans:
+        by_trace.setdefault(span["traceId"], []).append(span)
+
+    for trace_id, trace_spans in by_trace.items():
+        span_ids = {span["spanId"] for span in trace_spans}
+        children: dict[str, list[dict[str, Any]]] = {}
+        for span in trace_spans:
+            # 상위 스팬이 이 파일에 없으면(상위 서비스 스팬) 루트로 출력
+            parent = span["parentSpanId"] if span["parentSpanId"] in span_ids else ""
+            children.setdefault(parent, []).append(span)
+
+        lines.append(f"trace {trace_id}")
+        _append_subtree(lines, children, "", 1)
+    return lines
+
+
+def _append_subtree(lines: list[str], children: dict[str, list[dict[str, Any]]], parent_id: str, depth: int) -> None:
+    for span in sorted(children.get(parent_id, []), key=lambda item: int(item["startTimeUnixNano"])):
+        duration_ms = (int(span["endTimeUnixNano"]) - int(span["startTimeUnixNano"])) / 1_000_000
+        error = " [ERROR]" if span["status"]["code"] == StatusCode.ERROR else ""
+        lines.append(f"{'  ' * depth}{span['name']} {duration_ms:.3f}ms{error}")
+        _append_subtree(lines, children, span["spanId"], depth + 1)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="OTLP/JSON 추적 파일을 호출 트리로 출력합니다.")
+    parser.add_argument("path", type=Path)
+    parser.add_argument("--trace-id", help="지정한 trace만 출력")
+    args = parser.parse_args()
+
+    spans = _load_spans(args.path)
+    if args.trace_id:
+        spans = [span for span in spans if span["traceId"] == args.trace_id]
+    print("\n".join(format_trace_tree(spans)))
+
+
+if __name__ == "__main__":
+    main()
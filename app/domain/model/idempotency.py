@@ -0,0 +1,26 @@
+from datetime import datetime
+from typing import Annotated
+
+from pydantic import BaseModel, ConfigDict, Field
+
+
+class IdempotencyRecord(BaseModel):
+    """
+    멱등성 키(`Idempotency-Key`)로 처리한 요청과 그 응답
+
+    같은 사용자가 같은 키로 다시 요청하면 작업을 다시 실행하지 않고 저장된 응답을 반환합니다.
+    키는 작업과 같은 트랜잭션에서 선점하고 응답과 함께 커밋되므로, 커밋된 기록에는 항상 응답이 있습니다.
+    """
+
+    user_id: Annotated[int, Field(title="사용자 ID")]
+    key: Annotated[str, Field(title="멱등성 키", description="클라이언트가 요청마다 생성한 키")]
+    operation: Annotated[str, Field(title="작업", description="예: orders:create-order")]
+    request_fingerprint: Annotated[str, Field(title="요청 지문", description="작업과 요청 본문의 SHA-256 해시")]
+    response_body: Annotated[str | None, Field(title="응답 본문", description="JSON 직렬화한 작업 결과")] = None
+    created_at: Annotated[datetime, Field(title="생성 일시")]
+
+    model_config = ConfigDict(from_attributes=True)
+
+    def matches(self, operation: str, request_fingerprint: str) -> bool:
+        """같은 작업에 같은 요청 본문으로 다시 요청했는지 여부"""
+        return self.operation == operation and self.request_fingerprint == request_fingerprint
@@ -13,6 +13,8 @@ class OrderStatus(StrEnum):
     SHIPPED = "SHIPPED"
     DELIVERED = "DELIVERED"
     CANCELLED = "CANCELLED"
+    # 재고 선점 만료 시각까지 결제되지 않아 자동 취소된 주문
+    EXPIRED = "EXPIRED"
 
 
 class OrderItem(BaseModel):
@@ -50,3 +52,39 @@ class Order(BaseModel):
         if self.status not in [OrderStatus.PENDING, OrderStatus.PAID]:
             raise InvalidDomainException("이미 배송이 시작되었거나 취소된 주문은 취소할 수 없습니다.")
         self.status = OrderStatus.CANCELLED
+
+
+class OrderSummary(BaseModel):
+    """
+    주문 목록 조회용 요약 도메인 모델 (order_summary 프로젝션)
+
+    주문 항목을 읽지 않고 목록을 그릴 수 있도록 주문 생성/상태 변경 시 함께 갱신됩니다.
+    """
+
+    model_config = ConfigDict(from_attributes=True)
+
+    order_id: Annotated[int, Field(title="주문 ID")]
+    user_id: Annotated[int, Field(title="주문자 ID")]
+    status: Annotated[OrderStatus, Field(title="주문 상태")]
+    item_count: Annotated[int, Field(ge=0, title="주문 항목 수")]
+    total_price: Annotated[float, Field(ge=0, title="총 주문 금액")]
+    first_product_name: Annotated[str | None, Field(title="첫 번째 상품명")] = None
+    created_at: Annotated[datetime, Field(title="생성 일시")]
+    updated_at: Annotated[datetime, Field(title="수정 일시")]
+
+    @classmethod
+    def from_order(cls, order: Order, first_product_name: str | None) -> "OrderSummary":
+        """저장된 주문으로부터 요약을 생성합니다."""
+        if order.id is None:
+            raise InvalidDomainException("저장되지 않은 주문은 요약할 수 없습니다.")
+
+        return cls(
+            order_id=order.id,
+            user_id=order.user_id,
+            status=order.status,
+            item_count=len(order.items),
+            total_price=order.total_price,
+            first_product_name=first_product_name,
+            created_at=order.created_at,
+            updated_at=order.updated_at,
+        )
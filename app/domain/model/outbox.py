@@ -0,0 +1,38 @@
+from datetime import datetime, timedelta
+from enum import StrEnum
+from typing import Annotated, Any
+
+from pydantic import BaseModel, ConfigDict, Field
+
+
+class OutboxEventType(StrEnum):
+    ORDER_CREATED = "order.created"
+    ORDER_CANCELLED = "order.cancelled"
+
+
+class OutboxEvent(BaseModel):
+    """
+    outbox 이벤트 도메인 모델
+
+    주문 생성/취소 같은 도메인 변경과 같은 트랜잭션에서 기록되어, 변경이 커밋된 경우에만 외부(메일, 물류, 분석 등)로
+    전달됩니다. 전달은 백그라운드 전달기가 맡으며, 실패하면 `next_attempt_at`까지 미뤘다가 다시 시도합니다.
+    한 이벤트가 두 번 이상 전달될 수 있으므로(at-least-once) 받는 쪽은 `id`로 중복을 걸러야 합니다.
+    """
+
+    id: Annotated[int | None, Field(title="고유 ID")] = None
+    event_type: Annotated[OutboxEventType, Field(title="이벤트 종류")]
+    aggregate_id: Annotated[int, Field(title="대상 ID", description="이벤트가 발생한 주문 등의 ID")]
+    payload: Annotated[dict[str, Any], Field(title="이벤트 본문")]
+    created_at: Annotated[datetime, Field(title="생성 일시")] = Field(default_factory=datetime.now)
+    attempts: Annotated[int, Field(ge=0, title="전달 시도 횟수")] = 0
+    next_attempt_at: Annotated[datetime, Field(title="다음 전달 시도 일시")] = Field(default_factory=datetime.now)
+    dispatched_at: Annotated[datetime | None, Field(title="전달 완료 일시")] = None
+    last_error: Annotated[str | None, Field(title="마지막 전달 오류")] = None
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+def next_retry_at(attempts: int, now: datetime, base_seconds: float, max_seconds: float) -> datetime:
+    """전달에 `attempts`번 실패한 이벤트의 다음 시도 시각 (시도마다 간격을 두 배로 늘리되 `max_seconds`를 넘지 않음)"""
+    delay = min(max_seconds, base_seconds * 2 ** max(attempts - 1, 0))
+    return now + timedelta(seconds=delay)
@@ -8,7 +8,12 @@ from app.domain.exceptions import (
 
 
 class Product(BaseModel):
-    """상품 도메인 모델"""
+    """
+    상품 도메인 모델
+
+    `stock_shards`가 1 이상이면 재고를 여러 샤드 행에 나눠 저장합니다. (주문이 몰리는 상품의 행 경합 분산)
+    이때 `stock`은 샤드 합계입니다.
+    """
 
     id: int | None = Field(default=None, title="고유 ID", description="상품의 고유 식별자")
     name: str = Field(title="상품명", description="상품의 이름")
@@ -17,6 +22,9 @@ class Product(BaseModel):
     stock: int = Field(ge=0, title="재고 수량", description="남아있는 상품의 수량. 0 이상이어야 합니다.")
     seller_id: int = Field(title="판매자 ID", description="상품을 등록한 판매자의 고유 ID")
     version: int = Field(default=1, title="버전", description="낙관적 락을 위한 버전 정보")
+    stock_shards: int = Field(
+        default=0, ge=0, title="재고 샤드 수", description="재고를 나눠 저장하는 샤드 행 수 (0이면 상품 행에 저장)"
+    )
 
     model_config = ConfigDict(from_attributes=True)
 
@@ -51,6 +59,31 @@ class Product(BaseModel):
             raise InvalidDomainException("추가할 수량은 0보다 커야 합니다.")
         self.stock += quantity
 
+    def adjust_inventory(
+        self,
+        stock: int | None = None,
+        stock_delta: int | None = None,
+        price: float | None = None,
+    ) -> None:
+        """
+        재고/가격을 조정합니다. (재고 동기화용)
+        stock은 재고를 절대값으로 설정하고, stock_delta는 현재 재고에 증감합니다.
+        """
+        if stock is not None and stock_delta is not None:
+            raise InvalidDomainException("재고 설정값과 증감값은 동시에 지정할 수 없습니다.")
+
+        if stock is not None:
+            if stock < 0:
+                raise InvalidDomainException("재고는 0보다 적을 수 없습니다.")
+            self.stock = stock
+        elif stock_delta is not None and stock_delta > 0:
+            self.add_stock(stock_delta)
+        elif stock_delta is not None and stock_delta < 0:
+            self.decrease_stock(-stock_delta)
+
+        if price is not None:
+            self.update_price(price)
+
     def update_details(
         self,
         name: str | None = None,
@@ -75,3 +108,17 @@ class Product(BaseModel):
             if stock < 0:
                 raise InvalidDomainException("재고는 0보다 적을 수 없습니다.")
             self.stock = stock
+
+
+class InventoryAdjustment(BaseModel):
+    """상품 재고/가격 일괄 조정 요청 항목"""
+
+    product_id: int = Field(title="상품 ID", description="조정할 상품의 ID")
+    stock: int | None = Field(default=None, ge=0, title="재고 수량", description="설정할 재고 수량 (절대값)")
+    stock_delta: int | None = Field(default=None, title="재고 증감량", description="현재 재고에 더할 증감량")
+    price: float | None = Field(default=None, gt=0, title="가격", description="변경할 가격")
+    expected_version: int | None = Field(
+        default=None,
+        title="기대 버전",
+        description="지정 시 현재 버전이 일치하는 경우에만 조정합니다. (낙관적 락)",
+    )
@@ -0,0 +1,29 @@
+from datetime import datetime
+from typing import Annotated
+
+from pydantic import BaseModel, ConfigDict, Field
+
+
+class RefreshToken(BaseModel):
+    """
+    리프레시 토큰 도메인 모델
+
+    토큰 원문은 클라이언트에만 있고 서버는 해시만 보관합니다.
+    같은 로그인에서 회전(rotation)으로 이어진 토큰은 같은 family_id를 가지며,
+    이미 회전되어 폐기된 토큰이 다시 사용되면 탈취로 보고 family 전체를 폐기합니다.
+    """
+
+    token_hash: Annotated[str, Field(title="토큰 해시", description="리프레시 토큰의 SHA-256 해시")]
+    user_id: Annotated[int, Field(title="사용자 ID")]
+    family_id: Annotated[str, Field(title="토큰 묶음 ID", description="로그인 한 번에서 회전으로 이어진 토큰 묶음")]
+    expires_at: Annotated[datetime, Field(title="만료 일시")]
+    revoked_at: Annotated[datetime | None, Field(title="폐기 일시")] = None
+
+    model_config = ConfigDict(from_attributes=True)
+
+    @property
+    def is_revoked(self) -> bool:
+        return self.revoked_at is not None
+
+    def is_expired(self, now: datetime) -> bool:
+        return self.expires_at <= now
@@ -0,0 +1,27 @@
+from datetime import datetime
+from typing import Annotated
+
+from pydantic import BaseModel, ConfigDict, Field
+
+
+class StockReservation(BaseModel):
+    """
+    재고 선점(hold) 도메인 모델
+
+    주문을 생성하면 주문 항목마다 만료 시각이 있는 선점이 만들어지고, 그만큼 상품 재고(`Product.stock`)가 차감됩니다.
+    따라서 `Product.stock`은 판매 가능 재고(보유 재고 - 활성 선점 수량)입니다.
+    만료 시각까지 결제되지 않은(PENDING) 주문은 만료 처리기가 EXPIRED로 바꾸고 선점 수량을 재고로 되돌립니다.
+    """
+
+    id: Annotated[int | None, Field(title="고유 ID")] = None
+    order_id: Annotated[int, Field(title="주문 ID")]
+    product_id: Annotated[int, Field(title="상품 ID")]
+    quantity: Annotated[int, Field(gt=0, title="선점 수량")]
+    expires_at: Annotated[datetime, Field(title="만료 일시")]
+    released_at: Annotated[datetime | None, Field(title="해제 일시")] = None
+
+    model_config = ConfigDict(from_attributes=True)
+
+    @property
+    def is_active(self) -> bool:
+        return self.released_at is None
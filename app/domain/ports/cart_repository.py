@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from collections.abc import Sequence
 
 from app.domain.model.cart import CartItem
 
@@ -36,6 +37,11 @@ class ICartRepository(ABC):
         """사용자 ID와 여러 상품 ID로 장바구니 항목들을 삭제합니다."""
         pass
 
+    @abstractmethod
+    async def delete_product_for_users(self, product_id: int, user_ids: Sequence[int]) -> None:
+        """여러 사용자의 장바구니에서 한 상품의 항목을 한 번에 삭제합니다."""
+        pass
+
     @abstractmethod
     async def delete_all_by_user_id(self, user_id: int) -> None:
         """사용자의 모든 장바구니 항목을 삭제합니다."""
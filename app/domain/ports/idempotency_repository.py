@@ -0,0 +1,27 @@
+from abc import ABC, abstractmethod
+
+from app.domain.model.idempotency import IdempotencyRecord
+
+
+class IIdempotencyRepository(ABC):
+    """멱등성 키 리포지토리 인터페이스"""
+
+    @abstractmethod
+    async def get(self, user_id: int, key: str) -> IdempotencyRecord | None:
+        """사용자의 멱등성 키 기록을 조회합니다."""
+        pass
+
+    @abstractmethod
+    async def claim(self, record: IdempotencyRecord) -> None:
+        """
+        현재 트랜잭션에서 멱등성 키를 선점합니다.
+
+        다른 트랜잭션이 같은 키를 먼저 저장했으면 ConcurrentModificationException을 발생시킵니다.
+        (재시도하면 먼저 저장된 응답을 조회하게 됨)
+        """
+        pass
+
+    @abstractmethod
+    async def save_response(self, user_id: int, key: str, response_body: str) -> None:
+        """선점한 멱등성 키에 작업 결과를 저장합니다."""
+        pass
@@ -1,4 +1,6 @@
 from abc import ABC, abstractmethod
+from collections.abc import Sequence
+from datetime import datetime
 
 from app.domain.model.order import Order
 
@@ -11,6 +13,11 @@ class IOrderRepository(ABC):
         """주문을 저장하거나 업데이트합니다."""
         pass
 
+    @abstractmethod
+    async def save_many(self, orders: Sequence[Order]) -> list[Order]:
+        """새 주문 여러 건을 항목과 함께 한 번에 저장합니다. 반환 목록의 순서는 입력 순서와 같습니다."""
+        pass
+
     @abstractmethod
     async def find_by_id(self, order_id: int) -> Order | None:
         """ID로 주문을 조회합니다."""
@@ -23,5 +30,21 @@ class IOrderRepository(ABC):
 
     @abstractmethod
     async def find_by_user_id(self, user_id: int, skip: int, limit: int) -> list[Order]:
-        """사용자 ID로 주문 목록을 조회합니다."""
+        """사용자 ID로 주문 목록을 최신순으로 조회합니다."""
+        pass
+
+    @abstractmethod
+    async def find_many_by_ids_for_user(self, user_id: int, order_ids: Sequence[int]) -> list[Order]:
+        """
+        여러 ID의 주문 중 해당 사용자 소유의 주문만 한 번에 조회합니다.
+        존재하지 않거나 다른 사용자의 주문은 결과에서 제외됩니다. (순서 보장 없음)
+        """
+        pass
+
+    @abstractmethod
+    async def expire_pending(self, order_ids: Sequence[int], updated_at: datetime) -> list[int]:
+        """
+        여러 주문 중 PENDING 상태인 주문만 집합 단위로 EXPIRED로 바꾸고 버전을 올립니다.
+        실제로 만료된 주문 ID 목록을 반환합니다. (그 사이 취소/결제된 주문은 제외)
+        """
         pass
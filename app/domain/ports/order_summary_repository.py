@@ -0,0 +1,34 @@
+from abc import ABC, abstractmethod
+from collections.abc import Sequence
+from datetime import datetime
+
+from app.domain.model.order import OrderStatus, OrderSummary
+
+
+class IOrderSummaryRepository(ABC):
+    """주문 요약(order_summary) 프로젝션 리포지토리 인터페이스"""
+
+    @abstractmethod
+    async def save(self, summary: OrderSummary) -> OrderSummary:
+        """주문 요약을 저장하거나 덮어씁니다."""
+        pass
+
+    @abstractmethod
+    async def save_many(self, summaries: Sequence[OrderSummary]) -> None:
+        """새 주문 요약 여러 건을 한 번에 저장합니다."""
+        pass
+
+    @abstractmethod
+    async def update_status(self, order_id: int, status: OrderStatus, updated_at: datetime) -> None:
+        """주문 요약의 상태를 갱신합니다."""
+        pass
+
+    @abstractmethod
+    async def update_status_many(self, order_ids: Sequence[int], status: OrderStatus, updated_at: datetime) -> None:
+        """여러 주문 요약의 상태를 한 번에 갱신합니다."""
+        pass
+
+    @abstractmethod
+    async def find_by_user_id(self, user_id: int, skip: int, limit: int) -> list[OrderSummary]:
+        """사용자 ID로 주문 요약 목록을 최신순으로 조회합니다."""
+        pass
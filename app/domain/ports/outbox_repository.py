@@ -0,0 +1,38 @@
+from abc import ABC, abstractmethod
+from collections.abc import Mapping, Sequence
+from datetime import datetime
+
+from app.domain.model.outbox import OutboxEvent
+
+
+class IOutboxRepository(ABC):
+    """outbox 이벤트 리포지토리 인터페이스"""
+
+    @abstractmethod
+    async def save_many(self, events: Sequence[OutboxEvent]) -> None:
+        """이벤트를 한 번에 저장합니다."""
+        pass
+
+    @abstractmethod
+    async def claim_due(self, now: datetime, limit: int, lease_until: datetime) -> list[OutboxEvent]:
+        """
+        전달되지 않았고 다음 시도 시각이 지난 이벤트를 시도 시각이 이른 순으로 최대 `limit`개 가져옵니다.
+        가져온 이벤트는 시도 횟수를 올리고 다음 시도 시각을 `lease_until`로 미뤄, 전달하는 동안
+        다른 전달기가 같은 이벤트를 가져가지 않도록 합니다. (다른 트랜잭션이 잠근 행은 건너뜀)
+        """
+        pass
+
+    @abstractmethod
+    async def mark_dispatched(self, event_ids: Sequence[int], dispatched_at: datetime) -> None:
+        """이벤트들을 전달 완료로 표시합니다."""
+        pass
+
+    @abstractmethod
+    async def reschedule_many(self, next_attempts: Mapping[int, datetime], error: str) -> None:
+        """전달에 실패한 이벤트들의 다음 시도 시각(이벤트 ID별)과 오류를 한 번에 기록합니다."""
+        pass
+
+    @abstractmethod
+    async def oldest_pending_created_at(self) -> datetime | None:
+        """전달되지 않은 이벤트 중 가장 이른 생성 시각 (없으면 None)"""
+        pass
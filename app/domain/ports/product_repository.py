@@ -1,7 +1,7 @@
 from abc import ABC, abstractmethod
-from collections.abc import Sequence
+from collections.abc import Mapping, Sequence
 
-from app.domain.model.product import Product
+from app.domain.model.product import InventoryAdjustment, Product
 
 
 class IProductRepository(ABC):
@@ -12,11 +12,45 @@ class IProductRepository(ABC):
         """새로운 상품을 생성합니다."""
         raise NotImplementedError
 
+    @abstractmethod
+    async def create_many(self, products: Sequence[Product]) -> list[Product]:
+        """여러 상품을 한 번에 생성합니다. 반환 목록의 순서는 입력 순서와 같습니다."""
+        raise NotImplementedError
+
     @abstractmethod
     async def get_by_id(self, product_id: int) -> Product | None:
         """ID로 상품을 조회합니다."""
         raise NotImplementedError
 
+    @abstractmethod
+    async def get_many_by_ids(self, product_ids: Sequence[int]) -> list[Product]:
+        """여러 ID로 상품을 한 번에 조회합니다. 존재하지 않는 ID는 결과에서 제외됩니다. (순서 보장 없음)"""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def lock_many_by_ids(self, product_ids: Sequence[int]) -> list[Product]:
+        """
+        여러 ID로 상품을 ID 순으로 조회하고, 트랜잭션이 끝날 때까지 행을 잠급니다. (`SELECT ... FOR UPDATE`)
+        모든 트랜잭션이 같은 순서로 잠그므로 상품이 겹치는 주문끼리 교착 상태에 빠지지 않습니다.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def apply_inventory_adjustments(
+        self, seller_id: int, adjustments: Sequence[InventoryAdjustment]
+    ) -> list[Product]:
+        """
+        판매자 소유 상품의 재고/가격 조정을 집합 단위로 적용하고, 적용된 상품 목록을 반환합니다.
+        소유자 불일치, 버전 불일치, 재고 부족 등 조건을 만족하지 않는 항목은 적용되지 않고 결과에서 제외됩니다.
+        product_id는 중복되지 않아야 합니다.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def restore_stock(self, quantities: Mapping[int, int]) -> None:
+        """상품 ID별 수량만큼 재고를 집합 단위로 늘리고 버전을 올립니다. (만료된 재고 선점 해제용)"""
+        raise NotImplementedError
+
     @abstractmethod
     async def list(self, offset: int, limit: int, seller_id: int | None = None) -> Sequence[Product]:
         """상품 목록을 조회합니다. seller_id가 제공되면 해당 판매자의 상품만 조회합니다."""
@@ -24,5 +58,30 @@ class IProductRepository(ABC):
 
     @abstractmethod
     async def update(self, product: Product) -> Product:
-        """상품 정보를 업데이트합니다."""
+        """
+        상품 정보를 업데이트합니다.
+        재고 샤드를 사용하는 상품은 재고를 절대값 대신 조회 시점의 샤드 합계와 비교한 변경량으로
+        샤드에 반영합니다.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def configure_stock_shards(self, product_id: int, shard_count: int) -> Product | None:
+        """
+        상품 재고를 shard_count개의 샤드 행에 고르게 나눠 저장하도록 바꾸고 버전을 올립니다.
+        shard_count가 0이면 샤드 재고를 상품 행으로 합칩니다. 상품이 없으면 None을 반환합니다.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def rebalance_stock_shards(self, product_id: int) -> Product | None:
+        """
+        샤드 재고 합계를 유지한 채 샤드마다 고르게 다시 나눕니다.
+        상품이 없거나 재고 샤드를 사용하지 않으면 None을 반환합니다.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def list_stock_sharded_ids(self) -> Sequence[int]:
+        """재고 샤드를 사용하는 상품의 ID 목록을 조회합니다. (순서 보장 없음)"""
         raise NotImplementedError
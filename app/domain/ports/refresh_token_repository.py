@@ -0,0 +1,33 @@
+from abc import ABC, abstractmethod
+from datetime import datetime
+
+from app.domain.model.refresh_token import RefreshToken
+
+
+class IRefreshTokenRepository(ABC):
+    """리프레시 토큰 리포지토리 인터페이스"""
+
+    @abstractmethod
+    async def save(self, token: RefreshToken) -> RefreshToken:
+        """리프레시 토큰을 저장합니다."""
+        pass
+
+    @abstractmethod
+    async def get_by_hash(self, token_hash: str) -> RefreshToken | None:
+        """토큰 해시로 리프레시 토큰을 조회합니다."""
+        pass
+
+    @abstractmethod
+    async def revoke(self, token_hash: str, revoked_at: datetime) -> bool:
+        """
+        아직 폐기되지 않은 토큰을 폐기합니다.
+
+        Returns:
+            bool: 이번 호출로 폐기했으면 True (동시에 같은 토큰으로 회전을 시도하면 한 쪽만 True)
+        """
+        pass
+
+    @abstractmethod
+    async def revoke_family(self, family_id: str, revoked_at: datetime) -> None:
+        """같은 묶음의 아직 폐기되지 않은 토큰을 모두 폐기합니다."""
+        pass
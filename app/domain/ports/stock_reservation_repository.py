@@ -0,0 +1,33 @@
+from abc import ABC, abstractmethod
+from collections.abc import Sequence
+from datetime import datetime
+
+from app.domain.model.reservation import StockReservation
+
+
+class IStockReservationRepository(ABC):
+    """재고 선점 리포지토리 인터페이스"""
+
+    @abstractmethod
+    async def save_many(self, reservations: Sequence[StockReservation]) -> None:
+        """재고 선점을 한 번에 저장합니다."""
+        pass
+
+    @abstractmethod
+    async def find_expired_order_ids(self, now: datetime, limit: int, skip_locked: bool = False) -> list[int]:
+        """
+        만료 시각이 지난 활성 선점을 만료 시각이 이른 순으로 최대 `limit`개 읽어,
+        해당 주문 ID 목록(중복 제거)을 반환합니다.
+        `skip_locked`이면 읽은 선점 행을 잠그고, 다른 트랜잭션이 잠근 행은 건너뜁니다. (`FOR UPDATE SKIP LOCKED`)
+        """
+        pass
+
+    @abstractmethod
+    async def release_by_order_ids(self, order_ids: Sequence[int], released_at: datetime) -> list[StockReservation]:
+        """주문들의 활성 선점을 집합 단위로 해제하고, 해제한 선점 목록을 반환합니다."""
+        pass
+
+    @abstractmethod
+    async def oldest_expired_at(self, now: datetime) -> datetime | None:
+        """아직 해제되지 않은 만료 선점 중 가장 이른 만료 시각 (없으면 None)"""
+        pass
@@ -1,5 +1,9 @@
 from abc import ABC, abstractmethod
-from typing import Self
+from collections.abc import Awaitable, Callable
+from typing import Any, Self
+
+# 커밋이 성공한 뒤 실행할 콜백
+OnCommitCallback = Callable[[], Awaitable[Any]]
 
 
 class IUnitOfWork(ABC):
@@ -16,3 +20,7 @@ class IUnitOfWork(ABC):
 
     @abstractmethod
     async def rollback(self) -> None: ...
+
+    @abstractmethod
+    def on_commit(self, callback: OnCommitCallback) -> None:
+        """다음 커밋이 성공하면 실행할 콜백을 등록합니다. 롤백되거나 커밋에 실패하면 실행하지 않고 버립니다."""
@@ -0,0 +1,32 @@
+from collections.abc import AsyncIterator
+from typing import Annotated
+
+from fastapi import Depends, Request
+from sqlmodel.ext.asyncio.session import AsyncSession
+from starlette.routing import Route
+
+from app.core.db import bind_request_session, get_session, route_scope
+from app.core.di import request_instance_scope
+
+
+async def track_route(request: Request) -> AsyncIterator[None]:
+    """
+    요청을 처리하는 동안 점유한 DB 커넥션 시간을 라우트 경로 템플릿 기준으로 집계합니다.
+    (예: `GET /api/v1/products/{product_id}`)
+    """
+    route = request.scope.get("route")
+    path = route.path if isinstance(route, Route) else request.url.path
+    with route_scope(f"{request.method} {path}"):
+        yield
+
+
+async def request_scope(session: Annotated[AsyncSession, Depends(get_session)]) -> AsyncIterator[None]:
+    """
+    요청마다 세션을 하나 만들어 DI 컨테이너(`Container.db_session`)가 사용하도록 바인딩합니다.
+
+    같은 요청 안의 리포지토리와 UoW는 이 세션을 공유하고, 동시에 처리되는 다른 요청과는 공유하지 않습니다.
+    리포지토리/UoW/유즈케이스 인스턴스도 요청당 한 번만 생성됩니다. (`RequestScoped`)
+    세션은 요청이 끝나면 `get_session`의 종료 처리로 닫힙니다.
+    """
+    with bind_request_session(session), request_instance_scope():
+        yield
@@ -0,0 +1,102 @@
+from collections.abc import Iterable
+
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import QueuePool
+
+from app.core.db import connection_hold_metrics, engine, reader_engines
+from app.core.metrics import LabelValues, MetricsRegistry, registry
+from app.core.rate_limit import rate_limiter
+from app.core.route_names import RouteName
+from app.core.security import token_cache
+
+router = APIRouter(tags=["metrics"])
+
+
+def _engines() -> list[tuple[str, AsyncEngine]]:
+    return [("writer", engine), *((f"reader{index}", reader) for index, reader in enumerate(reader_engines))]
+
+
+def _collect_pool_connections() -> Iterable[tuple[LabelValues, float]]:
+    for name, target in _engines():
+        pool = target.pool
+        # SQLite 인메모리 등 고정 커넥션 풀은 크기/점유 상태를 제공하지 않음
+        if isinstance(pool, QueuePool):
+            yield (name, "checked_out"), pool.checkedout()
+            yield (name, "idle"), pool.checkedin()
+            yield (name, "overflow"), max(pool.overflow(), 0)
+
+
+def _collect_pool_size() -> Iterable[tuple[LabelValues, float]]:
+    for name, target in _engines():
+        if isinstance(target.pool, QueuePool):
+            yield (name,), target.pool.size()
+
+
+def register_runtime_metrics(target: MetricsRegistry) -> None:
+    """
+    다른 모듈에서 이미 집계하고 있는 값(커넥션 풀, 커넥션 점유 시간, 요청 제한, 토큰 캐시)을 메트릭으로 노출합니다.
+    값은 `/metrics` 조회 시점에 읽으므로 요청 처리 경로에 추가 비용이 없습니다.
+    """
+    target.callback(
+        "db_pool_connections", "엔진별 커넥션 풀 상태별 커넥션 수", ("engine", "state"), _collect_pool_connections
+    )
+    target.callback("db_pool_size", "엔진별 커넥션 풀 크기", ("engine",), _collect_pool_size)
+    target.callback(
+        "db_connection_checkouts_total",
+        "라우트별 커넥션 획득 횟수",
+        ("route",),
+        lambda: (((route,), stats.checkouts) for route, stats in connection_hold_metrics.snapshot().items()),
+        type_name="counter",
+    )
+    target.callback(
+        "db_connection_hold_seconds_total",
+        "라우트별 커넥션 총 점유 시간(초)",
+        ("route",),
+        lambda: (((route,), stats.total_seconds) for route, stats in connection_hold_metrics.snapshot().items()),
+        type_name="counter",
+    )
+    target.callback(
+        "rate_limit_requests_total",
+        "요청 제한 규칙별 허용/거부 요청 수",
+        ("rule", "decision"),
+        lambda: (
+            item
+            for rule, stats in rate_limiter.snapshot().items()
+            for item in (((rule, "allowed"), stats.allowed), ((rule, "rejected"), stats.rejected))
+        ),
+        type_name="counter",
+    )
+    target.callback(
+        "cache_hits_total",
+        "캐시 적중 수",
+        ("cache",),
+        lambda: [(("jwt_token",), token_cache.hits)],
+        type_name="counter",
+    )
+    target.callback(
+        "cache_misses_total",
+        "캐시 실패 수",
+        ("cache",),
+        lambda: [(("jwt_token",), token_cache.misses)],
+        type_name="counter",
+    )
+    target.callback("cache_entries", "캐시 항목 수", ("cache",), lambda: [(("jwt_token",), len(token_cache))])
+
+
+register_runtime_metrics(registry)
+
+
+@router.get(
+    "/metrics",
+    summary="Prometheus 메트릭",
+    response_class=PlainTextResponse,
+    name=RouteName.METRICS,
+)
+async def get_metrics() -> PlainTextResponse:
+    """
+    라우트/유즈케이스/리포지토리 처리 시간, 낙관적 락 충돌, 커넥션 풀, 캐시 적중 등의 메트릭을
+    Prometheus 텍스트 형식으로 반환합니다.
+    """
+    return PlainTextResponse(registry.render(), media_type=MetricsRegistry.CONTENT_TYPE)
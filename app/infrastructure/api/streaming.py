@@ -0,0 +1,124 @@
+import codecs
+import csv
+import json
+from collections.abc import AsyncIterator
+from typing import Any
+
+from fastapi import Request
+
+from app.core.exceptions import BadRequestException, UnsupportedMediaTypeException
+
+JSON_MEDIA_TYPE = "application/json"
+NDJSON_MEDIA_TYPES = ("application/x-ndjson", "application/jsonl")
+CSV_MEDIA_TYPE = "text/csv"
+
+
+async def iter_request_rows(request: Request) -> AsyncIterator[Any]:
+    """
+    요청 본문을 Content-Type에 맞게 파싱하여 행 단위로 반환합니다.
+
+    - application/json: 객체 배열 (본문 전체를 읽은 뒤 파싱)
+    - application/x-ndjson: 한 줄에 하나의 JSON 객체 (스트리밍 파싱)
+    - text/csv: 첫 줄이 헤더인 CSV (스트리밍 파싱)
+
+    파싱할 수 없는 행은 ValueError 인스턴스로 반환되어 행 단위 오류로 보고됩니다.
+
+    Raises:
+        UnsupportedMediaTypeException: 지원하지 않는 Content-Type인 경우
+        BadRequestException: JSON 본문이 배열이 아니거나 JSON 형식이 아닌 경우
+    """
+    media_type = request.headers.get("content-type", "").split(";")[0].strip().lower()
+
+    if media_type == JSON_MEDIA_TYPE:
+        rows = _parse_json_array(await request.body())
+        for row in rows:
+            yield row
+    elif media_type in NDJSON_MEDIA_TYPES:
+        async for row in iter_ndjson(request.stream()):
+            yield row
+    elif media_type == CSV_MEDIA_TYPE:
+        async for row in iter_csv(request.stream()):
+            yield row
+    else:
+        raise UnsupportedMediaTypeException(
+            message=f"지원하지 않는 Content-Type입니다: {media_type or '(없음)'}",
+        )
+
+
+def _parse_json_array(body: bytes) -> list[Any]:
+    try:
+        rows = json.loads(body)
+    except json.JSONDecodeError as e:
+        raise BadRequestException(message=f"JSON 형식이 올바르지 않습니다: {e.msg}") from e
+
+    if not isinstance(rows, list):
+        raise BadRequestException(message="JSON 본문은 배열이어야 합니다.")
+    return rows
+
+
+async def iter_ndjson(chunks: AsyncIterator[bytes]) -> AsyncIterator[Any]:
+    """NDJSON 스트림을 한 줄씩 파싱합니다. 빈 줄은 건너뜁니다."""
+    async for line in _iter_lines(chunks):
+        if not line.strip():
+            continue
+        try:
+            yield json.loads(line)
+        except json.JSONDecodeError as e:
+            yield ValueError(f"JSON 형식이 올바르지 않습니다: {e.msg}")
+
+
+async def iter_csv(chunks: AsyncIterator[bytes]) -> AsyncIterator[Any]:
+    """
+    헤더가 있는 CSV 스트림을 한 행씩 dict로 파싱합니다.
+    빈 값은 None으로 변환되며, 따옴표로 감싼 필드 안의 줄바꿈도 지원합니다.
+    """
+    header: list[str] | None = None
+    async for record in _iter_csv_records(chunks):
+        values = next(csv.reader([record]), [])
+        if not values:
+            continue
+
+        if header is None:
+            header = [name.strip() for name in values]
+            continue
+
+        if len(values) != len(header):
+            yield ValueError(f"컬럼 수가 헤더와 일치하지 않습니다. (헤더: {len(header)}, 행: {len(values)})")
+            continue
+
+        yield {name: value if value != "" else None for name, value in zip(header, values, strict=True)}
+
+
+async def _iter_csv_records(chunks: AsyncIterator[bytes]) -> AsyncIterator[str]:
+    """
+    줄 단위 입력을 CSV 레코드 단위로 묶습니다.
+    RFC 4180에서 이스케이프된 따옴표는 두 번 연속으로 쓰이므로,
+    따옴표 개수가 홀수인 동안에는 필드 안의 줄바꿈으로 보고 다음 줄을 이어 붙입니다.
+    """
+    pending: list[str] = []
+    quote_count = 0
+    async for line in _iter_lines(chunks):
+        pending.append(line)
+        quote_count += line.count('"')
+        if quote_count % 2 == 0:
+            yield "\n".join(pending)
+            pending = []
+            quote_count = 0
+
+    if pending:
+        yield "\n".join(pending)
+
+
+async def _iter_lines(chunks: AsyncIterator[bytes]) -> AsyncIterator[str]:
+    """바이트 스트림을 UTF-8(BOM 허용)로 디코딩하여 줄 단위로 반환합니다."""
+    decoder = codecs.getincrementaldecoder("utf-8-sig")(errors="replace")
+    buffer = ""
+    async for chunk in chunks:
+        buffer += decoder.decode(chunk)
+        *lines, buffer = buffer.split("\n")
+        for line in lines:
+            yield line.removesuffix("\r")
+
+    buffer += decoder.decode(b"", final=True)
+    if buffer:
+        yield buffer.removesuffix("\r")
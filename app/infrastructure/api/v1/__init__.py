@@ -1,10 +1,12 @@
-from fastapi import APIRouter
+from fastapi import APIRouter, Depends
 
-from app.infrastructure.api.v1 import carts, orders, products, users
+from app.infrastructure.api.dependencies import request_scope, track_route
+from app.infrastructure.api.v1 import carts, debug, orders, products, users
 
-api_v1_router = APIRouter(prefix="/api/v1")
+api_v1_router = APIRouter(prefix="/api/v1", dependencies=[Depends(track_route), Depends(request_scope)])
 
 api_v1_router.include_router(users.router)
 api_v1_router.include_router(products.router)
 api_v1_router.include_router(orders.router)
 api_v1_router.include_router(carts.router)
+api_v1_router.include_router(debug.router)
@@ -0,0 +1,166 @@
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, Query
+from fastapi.responses import JSONResponse, PlainTextResponse, Response
+
+from app.application.dto.debug_dto import (
+    AsyncioTaskRead,
+    ConnectionHoldStatsRead,
+    LoopBlockRead,
+    RateLimitStatsRead,
+    SlowQueryRead,
+)
+from app.application.dto.response import BaseResponse
+from app.core.db import connection_hold_metrics, slow_query_log
+from app.core.loop_monitor import loop_monitor
+from app.core.profiler import ProfileFormat, dump_tasks, profile_event_loop
+from app.core.rate_limit import rate_limiter
+from app.core.route_names import RouteName
+from app.core.security import get_current_admin
+
+MILLISECONDS_PER_SECOND = 1000
+MAX_PROFILE_SECONDS = 60
+MAX_SLOW_QUERIES = 100
+
+router = APIRouter(prefix="/debug", tags=["debug"], dependencies=[Depends(get_current_admin)])
+
+
+@router.get(
+    "/db/connections",
+    summary="라우트별 DB 커넥션 점유 통계",
+    response_model=BaseResponse[list[ConnectionHoldStatsRead]],
+    name=RouteName.DEBUG_DB_CONNECTIONS,
+)
+async def get_connection_hold_stats() -> BaseResponse[list[ConnectionHoldStatsRead]]:
+    """
+    커넥션 풀에서 커넥션을 가져와 반환하기까지의 시간을 라우트별로 집계하여 총 점유 시간 순으로 반환합니다.
+    """
+    stats = [
+        ConnectionHoldStatsRead(
+            route=route,
+            checkouts=hold.checkouts,
+            total_ms=hold.total_seconds * MILLISECONDS_PER_SECOND,
+            avg_ms=hold.total_seconds / hold.checkouts * MILLISECONDS_PER_SECOND if hold.checkouts else 0.0,
+            max_ms=hold.max_seconds * MILLISECONDS_PER_SECOND,
+        )
+        for route, hold in connection_hold_metrics.snapshot().items()
+    ]
+    stats.sort(key=lambda item: item.total_ms, reverse=True)
+    return BaseResponse(result=stats)
+
+
+@router.get(
+    "/rate-limits",
+    summary="요청 제한 규칙별 허용/거부 통계",
+    response_model=BaseResponse[list[RateLimitStatsRead]],
+    name=RouteName.DEBUG_RATE_LIMITS,
+)
+async def get_rate_limit_stats() -> BaseResponse[list[RateLimitStatsRead]]:
+    """
+    요청 제한 규칙별로 허용/거부된 요청 수를 거부 횟수 순으로 반환합니다.
+    """
+    stats = [
+        RateLimitStatsRead(rule=rule, allowed=counts.allowed, rejected=counts.rejected)
+        for rule, counts in rate_limiter.snapshot().items()
+    ]
+    stats.sort(key=lambda item: item.rejected, reverse=True)
+    return BaseResponse(result=stats)
+
+
+@router.get(
+    "/profile",
+    summary="이벤트 루프 샘플링 프로파일",
+    response_class=PlainTextResponse,
+    name=RouteName.DEBUG_PROFILE,
+)
+async def get_profile(
+    seconds: Annotated[float, Query(gt=0, le=MAX_PROFILE_SECONDS, title="프로파일링 시간(초)")],
+    output_format: Annotated[
+        ProfileFormat,
+        Query(
+            alias="format", title="출력 형식", description="collapsed: 한 줄에 스택 하나, speedscope: speedscope JSON"
+        ),
+    ] = ProfileFormat.COLLAPSED,
+    interval_ms: Annotated[float, Query(ge=1, le=100, title="샘플링 간격(ms)")] = 10,
+) -> Response:
+    """
+    지정한 시간 동안 이벤트 루프 스레드의 호출 스택을 샘플링하여 라우트 이름별로 집계합니다.
+    collapsed 형식의 각 줄은 `라우트;바깥 프레임;...;안쪽 프레임 샘플 수`이며, 요청을 처리하지 않을 때는
+    `(idle)` 또는 `(no request)`로 집계됩니다. 프로파일링은 한 번에 하나만 실행할 수 있습니다.
+    """
+    profile = await profile_event_loop(seconds, interval_ms / MILLISECONDS_PER_SECOND)
+    if output_format is ProfileFormat.SPEEDSCOPE:
+        return JSONResponse(profile.to_speedscope())
+    return PlainTextResponse(profile.to_collapsed())
+
+
+@router.get(
+    "/asyncio",
+    summary="대기 중인 asyncio 태스크 목록",
+    response_model=BaseResponse[list[AsyncioTaskRead]],
+    name=RouteName.DEBUG_ASYNCIO,
+)
+async def get_asyncio_tasks() -> BaseResponse[list[AsyncioTaskRead]]:
+    """
+    대기 중인 asyncio 태스크마다 처리 중인 라우트와 await 중인 호출 스택을 반환합니다.
+    커넥션 풀, 스레드 풀(bcrypt), aiosqlite 응답 중 어디에서 요청이 멈춰 있는지 확인할 때 사용합니다.
+    """
+    tasks = [
+        AsyncioTaskRead(
+            name=task.name, route=task.route, coroutine=task.coroutine, awaiting=task.awaiting, stack=task.stack
+        )
+        for task in dump_tasks()
+    ]
+    return BaseResponse(result=tasks)
+
+
+@router.get(
+    "/event-loop/blocks",
+    summary="이벤트 루프를 막은 호출 목록",
+    response_model=BaseResponse[list[LoopBlockRead]],
+    name=RouteName.DEBUG_EVENT_LOOP_BLOCKS,
+)
+async def get_event_loop_blocks() -> BaseResponse[list[LoopBlockRead]]:
+    """
+    임계값(`LOOP_BLOCK_THRESHOLD_MS`) 이상 이벤트 루프를 막은 최근 호출을 최신순으로 반환합니다.
+    각 항목은 차단 당시 처리 중이던 요청의 라우트와 호출 스택을 포함합니다.
+    """
+    blocks = [
+        LoopBlockRead(
+            route=block.route,
+            duration_ms=block.duration * MILLISECONDS_PER_SECOND,
+            stack=block.stack,
+            occurred_at=block.occurred_at,
+        )
+        for block in reversed(list(loop_monitor.blocks))
+    ]
+    return BaseResponse(result=blocks)
+
+
+@router.get(
+    "/slow-queries",
+    summary="느린 SQL 문 상위 목록",
+    response_model=BaseResponse[list[SlowQueryRead]],
+    name=RouteName.DEBUG_SLOW_QUERIES,
+)
+async def get_slow_queries(
+    limit: Annotated[int, Query(ge=1, le=MAX_SLOW_QUERIES)] = 20,
+) -> BaseResponse[list[SlowQueryRead]]:
+    """
+    실행 시간이 `SLOW_QUERY_THRESHOLD_MS`를 넘은 SQL 문을 정규화한 문장별로 집계하여 총 실행 시간 순으로 반환합니다.
+    각 문장을 실행한 리포지토리 메서드, 바인드 파라미터 형태, 실행 계획을 함께 반환합니다.
+    """
+    queries = [
+        SlowQueryRead(
+            statement=stats.statement,
+            count=stats.count,
+            total_ms=stats.total_seconds * MILLISECONDS_PER_SECOND,
+            avg_ms=stats.total_seconds / stats.count * MILLISECONDS_PER_SECOND,
+            max_ms=stats.max_seconds * MILLISECONDS_PER_SECOND,
+            callers=dict(stats.callers.most_common()),
+            parameter_shapes=dict(stats.parameter_shapes.most_common()),
+            plan=stats.plan,
+        )
+        for stats in slow_query_log.top(limit)
+    ]
+    return BaseResponse(result=queries)
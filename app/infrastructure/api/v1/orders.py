@@ -1,18 +1,32 @@
 from typing import Annotated
 
 from dependency_injector.wiring import Provide, inject
-from fastapi import APIRouter, Depends, Query, status
+from fastapi import APIRouter, Depends, Header, Query, status
 
-from app.application.dto.order_dto import OrderCreate, OrderRead
+from app.application.dto.base import MAX_BATCH_GET_IDS
+from app.application.dto.order_dto import OrderBatchRead, OrderCreate, OrderListView, OrderRead, OrderSummaryRead
 from app.application.dto.response import BaseResponse
 from app.application.dto.user_dto import UserRead
 from app.application.use_cases.order_use_case import OrderUseCase
 from app.containers import Container
+from app.core.idempotency import IDEMPOTENCY_KEY_HEADER, MAX_IDEMPOTENCY_KEY_LENGTH
+from app.core.rate_limit import ORDER_PER_USER, rate_limit, token_subject
 from app.core.route_names import RouteName
 from app.core.security import get_current_user
 
 router = APIRouter(prefix="/orders", tags=["orders"])
 
+IdempotencyKey = Annotated[
+    str | None,
+    Header(
+        alias=IDEMPOTENCY_KEY_HEADER,
+        min_length=1,
+        max_length=MAX_IDEMPOTENCY_KEY_LENGTH,
+        title="멱등성 키",
+        description="같은 키로 다시 요청하면 주문을 새로 만들지 않고 처음 처리한 결과를 반환합니다.",
+    ),
+]
+
 
 @router.post(
     "",
@@ -20,16 +34,19 @@ router = APIRouter(prefix="/orders", tags=["orders"])
     response_model=BaseResponse[OrderRead],
     status_code=status.HTTP_201_CREATED,
     name=RouteName.ORDERS_CREATE,
+    dependencies=[Depends(rate_limit(ORDER_PER_USER, token_subject))],
 )
 @inject
 async def create_order(
     order_create: OrderCreate,
     current_user: Annotated[UserRead, Depends(get_current_user)],
     order_use_case: Annotated[OrderUseCase, Depends(Provide[Container.order_use_case])],
+    idempotency_key: IdempotencyKey = None,
 ) -> BaseResponse[OrderRead]:
     created_order = await order_use_case.create_order(
         user_id=current_user.id,
         order_create=order_create,
+        idempotency_key=idempotency_key,
     )
     return BaseResponse(result=created_order)
 
@@ -40,17 +57,20 @@ async def create_order(
     response_model=BaseResponse[OrderRead],
     status_code=status.HTTP_201_CREATED,
     name=RouteName.ORDERS_CHECKOUT,
+    dependencies=[Depends(rate_limit(ORDER_PER_USER, token_subject))],
 )
 @inject
 async def checkout_from_cart(
     current_user: Annotated[UserRead, Depends(get_current_user)],
     order_use_case: Annotated[OrderUseCase, Depends(Provide[Container.order_use_case])],
+    idempotency_key: IdempotencyKey = None,
 ) -> BaseResponse[OrderRead]:
     """
     장바구니에 있는 모든 상품을 주문합니다.
     """
     created_order = await order_use_case.create_order_from_cart(
         user_id=current_user.id,
+        idempotency_key=idempotency_key,
     )
     return BaseResponse(result=created_order)
 
@@ -58,7 +78,7 @@ async def checkout_from_cart(
 @router.get(
     "",
     summary="내 주문 목록 조회",
-    response_model=BaseResponse[list[OrderRead]],
+    response_model=BaseResponse[list[OrderRead] | list[OrderSummaryRead]],
     name=RouteName.ORDERS_LIST,
 )
 @inject
@@ -67,7 +87,19 @@ async def list_orders(
     order_use_case: Annotated[OrderUseCase, Depends(Provide[Container.order_use_case])],
     offset: Annotated[int, Query(ge=0)] = 0,
     limit: Annotated[int, Query(ge=1, le=100)] = 10,
-) -> BaseResponse[list[OrderRead]]:
+    view: Annotated[
+        OrderListView,
+        Query(title="조회 방식", description="summary: 주문 항목 없이 요약 정보만 최신순으로 조회"),
+    ] = OrderListView.FULL,
+) -> BaseResponse[list[OrderRead] | list[OrderSummaryRead]]:
+    if view == OrderListView.SUMMARY:
+        summaries = await order_use_case.list_order_summaries(
+            user_id=current_user.id,
+            offset=offset,
+            limit=limit,
+        )
+        return BaseResponse(result=summaries)
+
     orders = await order_use_case.list_orders(
         user_id=current_user.id,
         offset=offset,
@@ -76,6 +108,32 @@ async def list_orders(
     return BaseResponse(result=orders)
 
 
+@router.get(
+    ":batchGet",
+    summary="주문 다건 조회",
+    response_model=BaseResponse[OrderBatchRead],
+    name=RouteName.ORDERS_BATCH_GET,
+)
+@inject
+async def batch_get_orders(
+    current_user: Annotated[UserRead, Depends(get_current_user)],
+    order_use_case: Annotated[OrderUseCase, Depends(Provide[Container.order_use_case])],
+    ids: Annotated[
+        list[int],
+        Query(min_length=1, max_length=MAX_BATCH_GET_IDS, title="주문 ID 목록", description="예: ?ids=1&ids=2"),
+    ],
+) -> BaseResponse[OrderBatchRead]:
+    """
+    여러 주문을 한 번에 조회합니다. 결과는 요청한 ID 순서를 따르며,
+    존재하지 않거나 본인 주문이 아닌 ID는 notFoundIds로 반환됩니다.
+    """
+    orders = await order_use_case.batch_get_orders(
+        user_id=current_user.id,
+        order_ids=ids,
+    )
+    return BaseResponse(result=orders)
+
+
 @router.get(
     "/{order_id}",
     summary="주문 상세 조회",
@@ -1,19 +1,25 @@
 from typing import Annotated
 
 from dependency_injector.wiring import Provide, inject
-from fastapi import APIRouter, Depends, Query, status
+from fastapi import APIRouter, Depends, Query, Request, status
 
+from app.application.dto.base import MAX_BATCH_GET_IDS
 from app.application.dto.product_dto import (
+    ProductBatchRead,
     ProductCreate,
+    ProductImportReport,
+    ProductInventoryUpdate,
+    ProductInventoryUpdateReport,
     ProductRead,
+    ProductStockShardConfig,
     ProductUpdate,
 )
 from app.application.dto.response import BaseResponse
 from app.application.use_cases.product_use_case import ProductUseCase
 from app.containers import Container
 from app.core.route_names import RouteName
-from app.core.security import get_current_seller
-from app.domain.model.seller import Seller
+from app.core.security import AuthenticatedSeller, get_current_admin, get_current_seller
+from app.infrastructure.api.streaming import CSV_MEDIA_TYPE, JSON_MEDIA_TYPE, NDJSON_MEDIA_TYPES, iter_request_rows
 
 router = APIRouter(prefix="/products", tags=["products"])
 
@@ -29,14 +35,64 @@ router = APIRouter(prefix="/products", tags=["products"])
 async def create_product(
     product_create: ProductCreate,
     product_use_case: Annotated[ProductUseCase, Depends(Provide[Container.product_use_case])],
-    seller: Annotated[Seller, Depends(get_current_seller)],
+    seller: Annotated[AuthenticatedSeller, Depends(get_current_seller)],
 ) -> BaseResponse[ProductRead]:
-    assert seller.id is not None
-
     created_product = await product_use_case.create_product(seller_id=seller.id, product_create=product_create)
     return BaseResponse(result=created_product)
 
 
+@router.post(
+    "/bulk",
+    summary="상품 대량 등록",
+    response_model=BaseResponse[ProductImportReport],
+    status_code=status.HTTP_200_OK,
+    name=RouteName.PRODUCTS_BULK_IMPORT,
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {
+                JSON_MEDIA_TYPE: {"schema": {"type": "array", "items": ProductCreate.model_json_schema()}},
+                NDJSON_MEDIA_TYPES[0]: {"schema": {"type": "string"}},
+                CSV_MEDIA_TYPE: {"schema": {"type": "string"}},
+            },
+        }
+    },
+)
+@inject
+async def import_products(
+    request: Request,
+    product_use_case: Annotated[ProductUseCase, Depends(Provide[Container.product_use_case])],
+    seller: Annotated[AuthenticatedSeller, Depends(get_current_seller)],
+) -> BaseResponse[ProductImportReport]:
+    """
+    JSON 배열, NDJSON, CSV(헤더 포함) 형식의 상품 목록을 한 번에 등록합니다.
+    NDJSON과 CSV는 스트리밍으로 파싱되며, 행 단위 처리 결과를 리포트로 반환합니다.
+    """
+    report = await product_use_case.import_products(seller_id=seller.id, rows=iter_request_rows(request))
+    return BaseResponse(result=report)
+
+
+@router.patch(
+    "/bulk",
+    summary="상품 재고/가격 일괄 조정",
+    response_model=BaseResponse[ProductInventoryUpdateReport],
+    status_code=status.HTTP_200_OK,
+    name=RouteName.PRODUCTS_BULK_UPDATE_INVENTORY,
+)
+@inject
+async def bulk_update_inventory(
+    inventory_update: ProductInventoryUpdate,
+    product_use_case: Annotated[ProductUseCase, Depends(Provide[Container.product_use_case])],
+    seller: Annotated[AuthenticatedSeller, Depends(get_current_seller)],
+) -> BaseResponse[ProductInventoryUpdateReport]:
+    """
+    여러 상품의 재고(절대값 또는 증감량)와 가격을 한 트랜잭션에서 일괄 조정합니다.
+    소유권, 기대 버전, 재고 부족 등으로 적용되지 않은 항목은 배치를 중단하지 않고 항목별 결과로 반환합니다.
+    """
+    report = await product_use_case.bulk_update_inventory(seller_id=seller.id, inventory_update=inventory_update)
+    return BaseResponse(result=report)
+
+
 @router.get(
     "",
     summary="상품 목록 조회",
@@ -54,6 +110,53 @@ async def list_products(
     return BaseResponse(result=list(products))
 
 
+@router.get(
+    ":batchGet",
+    summary="상품 다건 조회",
+    response_model=BaseResponse[ProductBatchRead],
+    name=RouteName.PRODUCTS_BATCH_GET,
+)
+@inject
+async def batch_get_products(
+    product_use_case: Annotated[ProductUseCase, Depends(Provide[Container.product_use_case])],
+    ids: Annotated[
+        list[int],
+        Query(min_length=1, max_length=MAX_BATCH_GET_IDS, title="상품 ID 목록", description="예: ?ids=1&ids=2"),
+    ],
+) -> BaseResponse[ProductBatchRead]:
+    """
+    여러 상품을 한 번에 조회합니다. 결과는 요청한 ID 순서를 따르며,
+    존재하지 않는 ID는 notFoundIds로 반환됩니다.
+    """
+    products = await product_use_case.batch_get_products(product_ids=ids)
+    return BaseResponse(result=products)
+
+
+@router.post(
+    "/stock-shards:rebalance",
+    summary="재고 샤드 재분배 (관리자)",
+    response_model=BaseResponse[list[ProductRead]],
+    dependencies=[Depends(get_current_admin)],
+    name=RouteName.PRODUCTS_REBALANCE_STOCK_SHARDS,
+)
+@inject
+async def rebalance_stock_shards(
+    product_use_case: Annotated[ProductUseCase, Depends(Provide[Container.product_use_case])],
+    ids: Annotated[
+        list[int] | None,
+        Query(
+            max_length=MAX_BATCH_GET_IDS, title="상품 ID 목록", description="생략하면 재고 샤드를 사용하는 모든 상품"
+        ),
+    ] = None,
+) -> BaseResponse[list[ProductRead]]:
+    """
+    상품별 재고 샤드의 수량을 합계를 유지한 채 고르게 다시 나누고, 재분배한 상품 목록을 반환합니다.
+    주문은 임의의 샤드에서 재고를 차감하므로, 주기적으로 실행하면 빈 샤드를 거쳐 다른 샤드를 찾는 경우가 줄어듭니다.
+    """
+    products = await product_use_case.rebalance_stock_shards(product_ids=ids)
+    return BaseResponse(result=products)
+
+
 @router.get(
     "/{product_id}",
     summary="단일 상품 조회",
@@ -80,11 +183,30 @@ async def update_product(
     product_id: int,
     product_update: ProductUpdate,
     product_use_case: Annotated[ProductUseCase, Depends(Provide[Container.product_use_case])],
-    seller: Annotated[Seller, Depends(get_current_seller)],
+    seller: Annotated[AuthenticatedSeller, Depends(get_current_seller)],
 ) -> BaseResponse[ProductRead]:
-    assert seller.id is not None
-
     updated_product = await product_use_case.update_product(
         seller_id=seller.id, product_id=product_id, product_update=product_update
     )
     return BaseResponse(result=updated_product)
+
+
+@router.put(
+    "/{product_id}/stock-shards",
+    summary="재고 샤드 설정 (관리자)",
+    response_model=BaseResponse[ProductRead],
+    dependencies=[Depends(get_current_admin)],
+    name=RouteName.PRODUCTS_CONFIGURE_STOCK_SHARDS,
+)
+@inject
+async def configure_stock_shards(
+    product_id: int,
+    shard_config: ProductStockShardConfig,
+    product_use_case: Annotated[ProductUseCase, Depends(Provide[Container.product_use_case])],
+) -> BaseResponse[ProductRead]:
+    """
+    주문이 몰리는 상품의 재고를 여러 샤드 행에 나눠 저장하여, 동시 주문이 하나의 상품 행을 두고 경합하지 않도록 합니다.
+    현재 재고는 샤드마다 고르게 배정되며, 조회 시 재고는 샤드 합계입니다. shardCount가 0이면 샤드를 사용하지 않습니다.
+    """
+    product = await product_use_case.configure_stock_shards(product_id=product_id, shard_config=shard_config)
+    return BaseResponse(result=product)
@@ -5,11 +5,12 @@ from fastapi import APIRouter, Depends, HTTPException, status
 
 from app.application.dto.response import BaseResponse
 from app.application.dto.seller_dto import SellerCreate, SellerRead
-from app.application.dto.token import Token
+from app.application.dto.token import Token, TokenRefresh
 from app.application.dto.user_dto import UserCreate, UserLogin, UserRead, UserUpdate
 from app.application.use_cases.seller_use_case import SellerUseCase
 from app.application.use_cases.user_use_case import UserUseCase
 from app.containers import Container
+from app.core.rate_limit import LOGIN_PER_EMAIL, LOGIN_PER_IP, SIGNUP_PER_IP, TOKEN_PER_IP, json_field, rate_limit
 from app.core.route_names import RouteName
 from app.core.security import get_current_user
 from app.domain.model.user import User
@@ -23,6 +24,7 @@ router = APIRouter(prefix="/users", tags=["users"])
     response_model=BaseResponse[UserRead],
     status_code=status.HTTP_201_CREATED,
     name=RouteName.USERS_CREATE_USER,
+    dependencies=[Depends(rate_limit(SIGNUP_PER_IP))],
 )
 @inject
 async def create_user(
@@ -42,6 +44,11 @@ async def create_user(
     response_model=BaseResponse[Token],
     status_code=status.HTTP_200_OK,
     name=RouteName.USERS_LOGIN,
+    # 비밀번호 검증(bcrypt)과 DB 조회 전에 IP/이메일별로 시도 횟수를 제한
+    dependencies=[
+        Depends(rate_limit(LOGIN_PER_IP)),
+        Depends(rate_limit(LOGIN_PER_EMAIL, json_field("email"))),
+    ],
 )
 @inject
 async def login_for_access_token(
@@ -49,10 +56,54 @@ async def login_for_access_token(
     user_use_case: Annotated[UserUseCase, Depends(Provide[Container.user_use_case])],
 ) -> BaseResponse[Token]:
     """
-    사용자 로그인을 처리하고 액세스 토큰을 반환합니다.
+    사용자 로그인을 처리하고 액세스 토큰과 리프레시 토큰을 반환합니다.
     """
-    access_token = await user_use_case.login_user(user_login.email, user_login.password)
-    return BaseResponse(result=Token(access_token=access_token))
+    token = await user_use_case.login_user(user_login.email, user_login.password)
+    return BaseResponse(result=token)
+
+
+@router.post(
+    "/token/refresh",
+    summary="액세스 토큰 재발급",
+    response_model=BaseResponse[Token],
+    status_code=status.HTTP_200_OK,
+    name=RouteName.USERS_REFRESH_TOKEN,
+    # 리프레시 토큰 대입 시도를 막기 위해 토큰 조회 전에 IP별로 제한 (재발급/폐기가 같은 버킷을 공유)
+    dependencies=[Depends(rate_limit(TOKEN_PER_IP))],
+)
+@inject
+async def refresh_access_token(
+    token_refresh: TokenRefresh,
+    user_use_case: Annotated[UserUseCase, Depends(Provide[Container.user_use_case])],
+) -> BaseResponse[Token]:
+    """
+    리프레시 토큰으로 액세스 토큰을 재발급합니다.
+    사용한 리프레시 토큰은 폐기되고 새 리프레시 토큰이 함께 발급됩니다.
+    """
+    token = await user_use_case.refresh_access_token(token_refresh.refresh_token)
+    return BaseResponse(result=token)
+
+
+@router.post(
+    "/token/revoke",
+    summary="리프레시 토큰 폐기 (로그아웃)",
+    response_model=BaseResponse[None],
+    status_code=status.HTTP_200_OK,
+    name=RouteName.USERS_REVOKE_TOKEN,
+    # 리프레시 토큰 대입 시도를 막기 위해 토큰 조회 전에 IP별로 제한 (재발급/폐기가 같은 버킷을 공유)
+    dependencies=[Depends(rate_limit(TOKEN_PER_IP))],
+)
+@inject
+async def revoke_refresh_token(
+    token_refresh: TokenRefresh,
+    user_use_case: Annotated[UserUseCase, Depends(Provide[Container.user_use_case])],
+) -> BaseResponse[None]:
+    """
+    리프레시 토큰과 같은 로그인에서 발급된 리프레시 토큰을 모두 폐기합니다.
+    이미 발급된 액세스 토큰은 만료 시각까지 유효합니다.
+    """
+    await user_use_case.revoke_refresh_token(token_refresh.refresh_token)
+    return BaseResponse(result=None)
 
 
 @router.get(
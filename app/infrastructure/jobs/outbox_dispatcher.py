@@ -0,0 +1,216 @@
+"""
+outbox 이벤트 전달기
+
+이벤트 루프의 백그라운드 태스크로 주기적으로 실행되어, 주문과 같은 트랜잭션에서 outbox에 기록된 이벤트를
+배치 단위로 가져와 설정된 sink로 전달합니다. 전달은 트랜잭션 밖에서 하므로 외부 시스템이 느려도 DB 락을 잡지 않으며,
+주문 처리(요청)에는 outbox INSERT 한 번만 추가됩니다.
+전달에 실패한 배치는 시도 횟수에 따라 늘어나는 간격 뒤에 다시 전달합니다.
+이벤트를 기록한 트랜잭션이 커밋되면 작업 큐(`OUTBOX_DISPATCH_JOB`)로 전달기를 깨워 확인 주기를 기다리지 않고 전달합니다.
+
+처리량과 지연은 메트릭으로 노출합니다.
+- `outbox_events_dispatched_total`: 전달한 이벤트 수 (이벤트 종류별)
+- `outbox_dispatch_failures_total`: 전달에 실패한 이벤트 수
+- `outbox_delivery_delay_seconds`: 이벤트가 기록된 뒤 전달되기까지 걸린 시간
+- `outbox_dispatcher_lag_seconds`: 마지막 실행 후 남아 있는 가장 오래된 미전달 이벤트가 기록된 지 지난 시간
+"""
+
+import asyncio
+import contextlib
+import logging
+from collections.abc import Callable
+from contextlib import AbstractAsyncContextManager
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.application.use_cases.outbox_use_case import OUTBOX_DISPATCH_JOB, OutboxUseCase
+from app.core.config import Settings
+from app.core.db import bind_request_session, create_routing_session, engine, route_scope
+from app.core.di import request_instance_scope
+from app.core.job_queue import job_queue
+from app.core.metrics import registry
+from app.infrastructure.jobs.outbox_sinks import FileOutboxSink, HttpOutboxSink, InMemoryOutboxSink, OutboxSink
+
+# 커넥션 점유 시간 집계에 사용하는 라우트 이름
+DISPATCHER_ROUTE = "job outbox-dispatcher"
+
+logger = logging.getLogger(__name__)
+
+SessionFactory = Callable[[], AbstractAsyncContextManager[AsyncSession]]
+
+outbox_events_dispatched_total = registry.counter(
+    "outbox_events_dispatched_total", "외부로 전달한 outbox 이벤트 수", ("event_type",)
+)
+outbox_dispatch_failures_total = registry.counter(
+    "outbox_dispatch_failures_total", "전달에 실패해 다시 시도하도록 미룬 outbox 이벤트 수"
+)
+outbox_delivery_delay_seconds = registry.histogram(
+    "outbox_delivery_delay_seconds",
+    "outbox 이벤트가 기록된 뒤 전달되기까지 걸린 시간(초)",
+    buckets=(0.01, 0.05, 0.1, 0.5, 1, 2.5, 5, 10, 30, 60, 300, 900),
+)
+outbox_dispatch_errors_total = registry.counter("outbox_dispatch_errors_total", "outbox 전달기 실행 실패 횟수")
+
+
+def _default_session_factory() -> AbstractAsyncContextManager[AsyncSession]:
+    return create_routing_session(engine)
+
+
+class OutboxDispatcher:
+    """outbox 이벤트를 주기적으로 sink에 전달하는 백그라운드 태스크"""
+
+    def __init__(
+        self, sink: OutboxSink | None = None, interval: float = 1, batch_size: int = 100, enabled: bool = False
+    ):
+        self.sink = sink or InMemoryOutboxSink()
+        self.interval = interval
+        self.batch_size = batch_size
+        self.enabled = enabled
+        # 마지막 실행 후 전달되지 않고 남은 가장 오래된 이벤트의 지연(초)
+        self.lag = 0.0
+        self._task: asyncio.Task[None] | None = None
+        self._wake: asyncio.Event | None = None
+
+    def start(
+        self,
+        use_case_provider: Callable[[], OutboxUseCase],
+        session_factory: SessionFactory = _default_session_factory,
+    ) -> None:
+        """현재 이벤트 루프에서 주기적인 전달을 시작합니다."""
+        if not self.enabled or self._task is not None:
+            return
+        self._wake = asyncio.Event()
+        self._task = asyncio.create_task(
+            self._run(use_case_provider, session_factory, self._wake), name="outbox-dispatcher"
+        )
+
+    def wake(self) -> None:
+        """다음 확인 주기를 기다리지 않고 바로 전달하도록 깨웁니다."""
+        if self._wake is not None:
+            self._wake.set()
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+        self._wake = None
+        await self.sink.close()
+
+    async def _run(
+        self, use_case_provider: Callable[[], OutboxUseCase], session_factory: SessionFactory, wake: asyncio.Event
+    ) -> None:
+        while True:
+            # 전달하는 동안 깨우면 끝난 뒤 바로 한 번 더 전달
+            wake.clear()
+            try:
+                await self.drain(use_case_provider, session_factory)
+            except Exception:
+                outbox_dispatch_errors_total.inc()
+                logger.exception("outbox 이벤트 전달에 실패했습니다.")
+            with contextlib.suppress(TimeoutError):
+                await asyncio.wait_for(wake.wait(), self.interval)
+
+    async def drain(
+        self,
+        use_case_provider: Callable[[], OutboxUseCase],
+        session_factory: SessionFactory = _default_session_factory,
+        now: datetime | None = None,
+    ) -> int:
+        """전달할 차례가 된 이벤트를 배치 단위로 모두 전달하고, 전달한 이벤트 수를 반환합니다."""
+        dispatched = 0
+        while True:
+            count, claimed = await self.dispatch_batch(use_case_provider, session_factory, now)
+            dispatched += count
+            # 전달에 실패했거나 남은 이벤트가 없으면 다음 주기까지 대기
+            if count < claimed or claimed < self.batch_size:
+                break
+
+        async with session_factory() as session:
+            with bind_request_session(session), request_instance_scope(), route_scope(DISPATCHER_ROUTE):
+                oldest = await use_case_provider().oldest_pending_created_at()
+        self.lag = 0.0 if oldest is None else max((datetime.now() - oldest).total_seconds(), 0.0)
+        return dispatched
+
+    async def dispatch_batch(
+        self,
+        use_case_provider: Callable[[], OutboxUseCase],
+        session_factory: SessionFactory = _default_session_factory,
+        now: datetime | None = None,
+    ) -> tuple[int, int]:
+        """
+        이벤트 한 배치를 가져와 sink로 전달하고 (전달한 수, 가져온 수)를 반환합니다.
+        배치마다 요청과 같은 방식으로 세션과 DI 스코프를 열어 유즈케이스를 실행합니다.
+        """
+        async with session_factory() as session:
+            with bind_request_session(session), request_instance_scope(), route_scope(DISPATCHER_ROUTE):
+                events = await use_case_provider().claim_due_events(now or datetime.now(), self.batch_size)
+        if not events:
+            return 0, 0
+
+        try:
+            await self.sink.send(events)
+        except Exception as e:
+            outbox_dispatch_failures_total.inc(len(events))
+            logger.warning(
+                "outbox 이벤트 %d건의 전달에 실패해 다시 시도합니다. (%s)",
+                len(events),
+                e,
+                extra={"events": len(events), "sink": type(self.sink).__name__},
+            )
+            async with session_factory() as session:
+                with bind_request_session(session), request_instance_scope(), route_scope(DISPATCHER_ROUTE):
+                    await use_case_provider().reschedule_failed(events, datetime.now(), repr(e))
+            return 0, len(events)
+
+        dispatched_at = datetime.now()
+        async with session_factory() as session:
+            with bind_request_session(session), request_instance_scope(), route_scope(DISPATCHER_ROUTE):
+                await use_case_provider().mark_dispatched([event.id for event in events], dispatched_at)
+        for event in events:
+            outbox_events_dispatched_total.labels(event.event_type).inc()
+            outbox_delivery_delay_seconds.observe((dispatched_at - event.created_at).total_seconds())
+        return len(events), len(events)
+
+
+outbox_dispatcher = OutboxDispatcher()
+
+registry.callback(
+    "outbox_dispatcher_lag_seconds",
+    "마지막 전달 후 남아 있는 가장 오래된 미전달 outbox 이벤트가 기록된 지 지난 시간(초)",
+    (),
+    lambda: [((), outbox_dispatcher.lag)],
+)
+
+
+async def _wake_outbox_dispatcher(payload: dict[str, Any]) -> None:
+    outbox_dispatcher.wake()
+
+
+job_queue.register(OUTBOX_DISPATCH_JOB, _wake_outbox_dispatcher)
+
+
+def create_outbox_sink(settings: Settings) -> OutboxSink:
+    """설정에 따라 sink를 선택합니다."""
+    match settings.outbox_sink:
+        case "memory":
+            return InMemoryOutboxSink()
+        case "file":
+            return FileOutboxSink(Path(settings.outbox_file_path))
+        case "http":
+            return HttpOutboxSink(settings.outbox_http_url, settings.outbox_http_timeout_seconds)
+        case _:
+            raise ValueError(f"지원하지 않는 OUTBOX_SINK입니다: {settings.outbox_sink}")
+
+
+def configure_outbox_dispatcher(settings: Settings) -> None:
+    outbox_dispatcher.enabled = settings.outbox_enabled
+    outbox_dispatcher.sink = create_outbox_sink(settings)
+    outbox_dispatcher.interval = settings.outbox_poll_interval_seconds
+    outbox_dispatcher.batch_size = settings.outbox_batch_size
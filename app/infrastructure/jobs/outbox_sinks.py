@@ -0,0 +1,76 @@
+"""
+outbox 이벤트 전달 대상(sink)
+
+전달기는 이벤트를 배치 단위로 `send`에 넘기며, `send`가 예외를 발생시키면 배치 전체를 나중에 다시 전달합니다.
+이벤트는 `OutboxEventRead`의 camelCase JSON(`id`, `eventType`, `aggregateId`, `payload`, `createdAt`, `attempts`)으로
+전달되며, 같은 이벤트가 두 번 이상 전달될 수 있으므로 받는 쪽은 `id`로 중복을 거릅니다.
+"""
+
+import asyncio
+import json
+from abc import ABC, abstractmethod
+from collections.abc import Sequence
+from pathlib import Path
+from typing import Any
+
+import httpx
+
+from app.application.dto.outbox_dto import OutboxEventRead
+
+
+def to_message(event: OutboxEventRead) -> dict[str, Any]:
+    return event.model_dump(mode="json", by_alias=True)
+
+
+class OutboxSink(ABC):
+    """outbox 이벤트를 외부로 전달하는 인터페이스"""
+
+    @abstractmethod
+    async def send(self, events: Sequence[OutboxEventRead]) -> None:
+        pass
+
+    async def close(self) -> None:  # noqa: B027
+        """사용한 연결 등을 정리합니다."""
+
+
+class InMemoryOutboxSink(OutboxSink):
+    """이벤트를 메모리에 보관합니다. (테스트용)"""
+
+    def __init__(self) -> None:
+        self.messages: list[dict[str, Any]] = []
+
+    async def send(self, events: Sequence[OutboxEventRead]) -> None:
+        self.messages.extend(to_message(event) for event in events)
+
+    def clear(self) -> None:
+        self.messages.clear()
+
+
+class FileOutboxSink(OutboxSink):
+    """이벤트를 JSON 한 줄씩 파일에 추가합니다. (파일 쓰기는 이벤트 루프를 막지 않도록 스레드 풀에서 실행)"""
+
+    def __init__(self, path: str | Path):
+        self.path = Path(path)
+
+    async def send(self, events: Sequence[OutboxEventRead]) -> None:
+        lines = "".join(json.dumps(to_message(event), ensure_ascii=False) + "\n" for event in events)
+        await asyncio.to_thread(self._append, lines)
+
+    def _append(self, lines: str) -> None:
+        with self.path.open("a", encoding="utf-8") as file:
+            file.write(lines)
+
+
+class HttpOutboxSink(OutboxSink):
+    """이벤트 배치를 JSON 배열로 POST합니다. 2xx가 아닌 응답이나 연결 오류는 전달 실패로 처리합니다."""
+
+    def __init__(self, url: str, timeout: float, transport: httpx.AsyncBaseTransport | None = None):
+        self.url = url
+        self._client = httpx.AsyncClient(timeout=timeout, transport=transport)
+
+    async def send(self, events: Sequence[OutboxEventRead]) -> None:
+        response = await self._client.post(self.url, json=[to_message(event) for event in events])
+        response.raise_for_status()
+
+    async def close(self) -> None:
+        await self._client.aclose()
@@ -0,0 +1,139 @@
+"""
+재고 선점 만료 처리기
+
+이벤트 루프의 백그라운드 태스크로 주기적으로 실행되어, 선점 만료 시각까지 결제되지 않은 주문을 배치 단위로
+EXPIRED 처리하고 선점한 재고를 되돌립니다. 배치마다 별도의 세션/트랜잭션을 사용하므로
+만료된 주문이 많아도 한 트랜잭션이 오래 락을 잡지 않습니다.
+
+처리량과 지연은 메트릭으로 노출합니다.
+- `reservation_expired_orders_total`, `reservation_released_quantity_total`: 만료 처리한 주문 수, 되돌린 재고 수량
+- `reservation_sweep_batch_duration_seconds`: 배치(트랜잭션) 한 번의 처리 시간
+- `reservation_sweeper_lag_seconds`: 마지막 실행 후 남아 있는 가장 오래된 만료 선점이 만료된 지 지난 시간
+"""
+
+import asyncio
+import logging
+import time
+from collections.abc import Callable
+from contextlib import AbstractAsyncContextManager
+from datetime import datetime
+
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.application.use_cases.order_use_case import OrderUseCase
+from app.core.config import Settings
+from app.core.db import bind_request_session, create_routing_session, engine, route_scope
+from app.core.di import request_instance_scope
+from app.core.metrics import registry
+
+# 커넥션 점유 시간 집계에 사용하는 라우트 이름
+SWEEPER_ROUTE = "job reservation-sweeper"
+
+logger = logging.getLogger(__name__)
+
+SessionFactory = Callable[[], AbstractAsyncContextManager[AsyncSession]]
+
+reservation_expired_orders_total = registry.counter(
+    "reservation_expired_orders_total", "선점 만료로 EXPIRED 처리한 주문 수"
+)
+reservation_released_quantity_total = registry.counter(
+    "reservation_released_quantity_total", "선점 만료로 재고에 되돌린 수량"
+)
+reservation_sweep_batch_duration_seconds = registry.histogram(
+    "reservation_sweep_batch_duration_seconds", "선점 만료 처리 배치(트랜잭션) 한 번의 처리 시간(초)"
+)
+reservation_sweep_errors_total = registry.counter("reservation_sweep_errors_total", "선점 만료 처리 실패 횟수")
+
+
+def _default_session_factory() -> AbstractAsyncContextManager[AsyncSession]:
+    return create_routing_session(engine)
+
+
+class ReservationSweeper:
+    """만료된 재고 선점을 주기적으로 해제하는 백그라운드 태스크"""
+
+    def __init__(self, interval: float = 30, batch_size: int = 500, enabled: bool = True):
+        self.interval = interval
+        self.batch_size = batch_size
+        self.enabled = enabled
+        # 마지막 실행 후 처리되지 않고 남은 가장 오래된 만료 선점의 지연(초)
+        self.lag = 0.0
+        self._task: asyncio.Task[None] | None = None
+
+    def start(
+        self, use_case_provider: Callable[[], OrderUseCase], session_factory: SessionFactory = _default_session_factory
+    ) -> None:
+        """현재 이벤트 루프에서 주기적인 만료 처리를 시작합니다."""
+        if not self.enabled or self._task is not None:
+            return
+        self._task = asyncio.create_task(self._run(use_case_provider, session_factory), name="reservation-sweeper")
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def _run(self, use_case_provider: Callable[[], OrderUseCase], session_factory: SessionFactory) -> None:
+        while True:
+            try:
+                await self.sweep(use_case_provider, session_factory)
+            except Exception:
+                reservation_sweep_errors_total.inc()
+                logger.exception("재고 선점 만료 처리에 실패했습니다.")
+            await asyncio.sleep(self.interval)
+
+    async def sweep(
+        self,
+        use_case_provider: Callable[[], OrderUseCase],
+        session_factory: SessionFactory = _default_session_factory,
+        now: datetime | None = None,
+    ) -> int:
+        """
+        `now` 기준으로 만료된 선점을 배치 단위로 모두 처리하고, 만료 처리한 주문 수를 반환합니다.
+        배치마다 요청과 같은 방식으로 세션과 DI 스코프를 열어 유즈케이스를 실행합니다.
+        """
+        now = now or datetime.now()
+        expired_orders = 0
+        while True:
+            started_at = time.perf_counter()
+            async with session_factory() as session:
+                with bind_request_session(session), request_instance_scope(), route_scope(SWEEPER_ROUTE):
+                    result = await use_case_provider().expire_reservations(now, self.batch_size)
+            reservation_sweep_batch_duration_seconds.observe(time.perf_counter() - started_at)
+            reservation_expired_orders_total.inc(len(result.expired_order_ids))
+            reservation_released_quantity_total.inc(result.released_quantity)
+            expired_orders += len(result.expired_order_ids)
+            if result.released_count == 0:
+                break
+
+        async with session_factory() as session:
+            with bind_request_session(session), request_instance_scope(), route_scope(SWEEPER_ROUTE):
+                oldest = await use_case_provider().oldest_expired_reservation_at(datetime.now())
+        self.lag = 0.0 if oldest is None else (datetime.now() - oldest).total_seconds()
+
+        if expired_orders:
+            logger.info(
+                "재고 선점이 만료된 주문 %d건을 처리했습니다.", expired_orders, extra={"expired": expired_orders}
+            )
+        return expired_orders
+
+
+reservation_sweeper = ReservationSweeper()
+
+registry.callback(
+    "reservation_sweeper_lag_seconds",
+    "마지막 만료 처리 후 남아 있는 가장 오래된 만료 선점이 만료된 지 지난 시간(초)",
+    (),
+    lambda: [((), reservation_sweeper.lag)],
+)
+
+
+def configure_reservation_sweeper(settings: Settings) -> None:
+    reservation_sweeper.enabled = settings.reservation_sweeper_enabled
+    reservation_sweeper.interval = settings.reservation_sweep_interval_seconds
+    reservation_sweeper.batch_size = settings.reservation_sweep_batch_size
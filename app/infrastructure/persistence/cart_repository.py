@@ -1,11 +1,16 @@
-from sqlmodel import select
+from collections.abc import Sequence
+
+from sqlalchemy import delete
+from sqlmodel import col, select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
+from app.core.metrics import instrumented
 from app.domain.model.cart import CartItem
 from app.domain.ports.cart_repository import ICartRepository
 from app.infrastructure.persistence.models.cart_entity import CartItemEntity
 
 
+@instrumented("repository")
 class SQLCartRepository(ICartRepository):
     """SQLModel 기반 장바구니 리포지토리 구현"""
 
@@ -74,6 +79,15 @@ class SQLCartRepository(ICartRepository):
         for entity in entities:
             await self.session.delete(entity)
 
+    async def delete_product_for_users(self, product_id: int, user_ids: Sequence[int]) -> None:
+        if not user_ids:
+            return
+        statement = delete(CartItemEntity).where(
+            col(CartItemEntity.user_id).in_(set(user_ids)),
+            col(CartItemEntity.product_id) == product_id,
+        )
+        await self.session.exec(statement)
+
     async def delete_all_by_user_id(self, user_id: int) -> None:
         statement = select(CartItemEntity).where(CartItemEntity.user_id == user_id)
         result = await self.session.exec(statement)
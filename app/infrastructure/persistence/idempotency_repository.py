@@ -0,0 +1,43 @@
+from sqlalchemy import update
+from sqlalchemy.exc import IntegrityError
+from sqlmodel import col
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.core.metrics import instrumented
+from app.domain.exceptions import ConcurrentModificationException
+from app.domain.model.idempotency import IdempotencyRecord
+from app.domain.ports.idempotency_repository import IIdempotencyRepository
+from app.infrastructure.persistence.models.idempotency_entity import IdempotencyKeyEntity
+
+
+@instrumented("repository")
+class SQLIdempotencyRepository(IIdempotencyRepository):
+    """SQLModel 기반 멱등성 키 리포지토리 구현"""
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def get(self, user_id: int, key: str) -> IdempotencyRecord | None:
+        entity = await self.session.get(IdempotencyKeyEntity, (user_id, key))
+        if entity is None:
+            return None
+        return IdempotencyRecord.model_validate(entity)
+
+    async def claim(self, record: IdempotencyRecord) -> None:
+        # 다른 트랜잭션이 같은 키를 선점했으면 PK 제약 때문에 그 트랜잭션이 끝날 때까지 대기한 뒤 실패함
+        self.session.add(IdempotencyKeyEntity.model_validate(record))
+        try:
+            await self.session.flush()
+        except IntegrityError as e:
+            await self.session.rollback()
+            raise ConcurrentModificationException(
+                f"같은 멱등성 키로 처리 중인 요청이 있습니다. (key: {record.key})"
+            ) from e
+
+    async def save_response(self, user_id: int, key: str, response_body: str) -> None:
+        statement = (
+            update(IdempotencyKeyEntity)
+            .where(col(IdempotencyKeyEntity.user_id) == user_id, col(IdempotencyKeyEntity.key) == key)
+            .values(response_body=response_body)
+        )
+        await self.session.exec(statement)
@@ -1,4 +1,4 @@
-from typing import Annotated, ClassVar
+from typing import Annotated, Any, ClassVar
 
 from sqlmodel import Field, Relationship, SQLModel, UniqueConstraint
 
@@ -8,7 +8,7 @@ from app.infrastructure.persistence.models.user_entity import UserEntity
 
 class CartItemEntity(SQLModel, table=True):
     __tablename__: ClassVar[str] = "cart_item"
-    __table_args__ = (UniqueConstraint("user_id", "product_id"),)
+    __table_args__: ClassVar[tuple[Any, ...]] = (UniqueConstraint("user_id", "product_id"),)
 
     id: Annotated[
         int | None,
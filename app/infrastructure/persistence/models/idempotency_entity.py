@@ -0,0 +1,33 @@
+from datetime import datetime
+from typing import Annotated, ClassVar
+
+from sqlmodel import Field, SQLModel
+
+
+class IdempotencyKeyEntity(SQLModel, table=True):
+    __tablename__: ClassVar[str] = "idempotency_key"
+
+    user_id: Annotated[
+        int,
+        Field(foreign_key="user.id", primary_key=True, title="사용자 ID"),
+    ]
+    key: Annotated[
+        str,
+        Field(primary_key=True, max_length=255, title="멱등성 키"),
+    ]
+    operation: Annotated[
+        str,
+        Field(max_length=64, title="작업"),
+    ]
+    request_fingerprint: Annotated[
+        str,
+        Field(max_length=64, title="요청 지문"),
+    ]
+    response_body: Annotated[
+        str | None,
+        Field(default=None, title="응답 본문", description="JSON 직렬화한 작업 결과"),
+    ] = None
+    created_at: Annotated[
+        datetime,
+        Field(default_factory=datetime.now, title="생성 일시"),
+    ]
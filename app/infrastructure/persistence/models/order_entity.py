@@ -1,7 +1,7 @@
 from datetime import datetime
 from typing import Annotated, Any, ClassVar
 
-from sqlalchemy import Column, Integer
+from sqlalchemy import Column, Index, Integer, desc
 from sqlmodel import Field, Relationship, SQLModel
 
 from app.domain.model.order import OrderStatus
@@ -12,6 +12,10 @@ version_col = Column("version", Integer, default=1, nullable=False)
 
 class OrderEntity(SQLModel, table=True):
     __tablename__: ClassVar[str] = "order"
+    # 사용자별 최신순 주문 목록 (역방향 인덱스 스캔으로 created_at DESC, id DESC 정렬까지 처리)
+    __table_args__: ClassVar[tuple[Any, ...]] = (
+        Index("ix_order_user_id_created_at_id", "user_id", "created_at", "id"),
+    )
     __mapper_args__: ClassVar[dict[str, Any]] = {"version_id_col": version_col}
 
     id: Annotated[
@@ -20,7 +24,7 @@ class OrderEntity(SQLModel, table=True):
     ] = None
     user_id: Annotated[
         int,
-        Field(foreign_key="user.id", index=True, title="주문자 ID"),
+        Field(foreign_key="user.id", title="주문자 ID"),
     ]
     status: Annotated[
         OrderStatus,
@@ -68,3 +72,47 @@ class OrderItemEntity(SQLModel, table=True):
     ]
 
     order: OrderEntity = Relationship(back_populates="items")
+
+
+class OrderSummaryEntity(SQLModel, table=True):
+    """주문 목록 조회용 요약 프로젝션 (주문 항목을 읽지 않고 목록을 그리기 위함)"""
+
+    __tablename__: ClassVar[str] = "order_summary"
+    # 사용자별 최신순 목록 조회가 정렬 없이 하나의 인덱스 범위 스캔으로 끝나도록
+    # (user_id, created_at DESC, order_id DESC) 복합 인덱스 사용 (order_id는 동일 시각 주문의 정렬 보조 키)
+    __table_args__: ClassVar[tuple[Any, ...]] = (
+        Index("ix_order_summary_user_id_created_at", "user_id", desc("created_at"), desc("order_id")),
+    )
+
+    order_id: Annotated[
+        int,
+        Field(foreign_key="order.id", primary_key=True, title="주문 ID"),
+    ]
+    user_id: Annotated[
+        int,
+        Field(foreign_key="user.id", title="주문자 ID"),
+    ]
+    status: Annotated[
+        OrderStatus,
+        Field(title="주문 상태"),
+    ]
+    item_count: Annotated[
+        int,
+        Field(ge=0, title="주문 항목 수"),
+    ]
+    total_price: Annotated[
+        float,
+        Field(ge=0, title="총 주문 금액"),
+    ]
+    first_product_name: Annotated[
+        str | None,
+        Field(default=None, title="첫 번째 상품명"),
+    ] = None
+    created_at: Annotated[
+        datetime,
+        Field(title="생성 일시"),
+    ]
+    updated_at: Annotated[
+        datetime,
+        Field(title="수정 일시"),
+    ]
@@ -0,0 +1,50 @@
+from datetime import datetime
+from typing import Annotated, Any, ClassVar
+
+from sqlalchemy import JSON, Index
+from sqlmodel import Field, SQLModel
+
+
+class OutboxEventEntity(SQLModel, table=True):
+    __tablename__: ClassVar[str] = "outbox_event"
+    # 전달기가 미전달(dispatched_at IS NULL) 이벤트를 다음 시도 시각 순으로 읽는 범위 스캔용
+    __table_args__: ClassVar[tuple[Any, ...]] = (
+        Index("ix_outbox_event_dispatched_at_next_attempt_at", "dispatched_at", "next_attempt_at"),
+    )
+
+    id: Annotated[
+        int | None,
+        Field(default=None, primary_key=True, title="고유 ID"),
+    ] = None
+    event_type: Annotated[
+        str,
+        Field(max_length=64, title="이벤트 종류"),
+    ]
+    aggregate_id: Annotated[
+        int,
+        Field(title="대상 ID"),
+    ]
+    payload: Annotated[
+        dict[str, Any],
+        Field(sa_type=JSON, title="이벤트 본문"),
+    ]
+    created_at: Annotated[
+        datetime,
+        Field(default_factory=datetime.now, title="생성 일시"),
+    ]
+    attempts: Annotated[
+        int,
+        Field(default=0, title="전달 시도 횟수"),
+    ] = 0
+    next_attempt_at: Annotated[
+        datetime,
+        Field(default_factory=datetime.now, title="다음 전달 시도 일시"),
+    ]
+    dispatched_at: Annotated[
+        datetime | None,
+        Field(default=None, title="전달 완료 일시"),
+    ] = None
+    last_error: Annotated[
+        str | None,
+        Field(default=None, max_length=1000, title="마지막 전달 오류"),
+    ] = None
@@ -1,6 +1,6 @@
 from typing import TYPE_CHECKING, Annotated, Any, ClassVar
 
-from sqlalchemy import Column, Integer
+from sqlalchemy import Column, Index, Integer
 from sqlmodel import Field, Relationship, SQLModel
 
 if TYPE_CHECKING:
@@ -13,6 +13,12 @@ version_col = Column("version", Integer, default=1, nullable=False)
 
 class ProductEntity(SQLModel, table=True):
     __tablename__: ClassVar[str] = "product"
+    __table_args__: ClassVar[tuple[Any, ...]] = (
+        # 판매자별 상품 목록(seller_id 필터 + id 순 페이지네이션)
+        Index("ix_product_seller_id_id", "seller_id", "id"),
+        # 재고 샤드 재분배 작업이 샤드를 사용하는 상품만 찾는 범위 스캔용
+        Index("ix_product_stock_shards", "stock_shards"),
+    )
     __mapper_args__: ClassVar[dict[str, Any]] = {"version_id_col": version_col}
 
     id: Annotated[
@@ -38,12 +44,16 @@ class ProductEntity(SQLModel, table=True):
     ]
     stock: Annotated[
         int,
-        Field(title="재고 수량", description="남아있는 상품의 수량"),
+        Field(title="재고 수량", description="남아있는 상품의 수량 (재고 샤드를 사용하면 0이며 샤드 합계가 재고)"),
     ]
     seller_id: Annotated[
         int,
         Field(foreign_key="seller.id", title="판매자 ID", description="상품을 등록한 판매자의 ID"),
     ]
+    stock_shards: Annotated[
+        int,
+        Field(default=0, title="재고 샤드 수", description="재고를 나눠 저장하는 샤드 행 수 (0이면 stock 컬럼 사용)"),
+    ] = 0
     version: int | None = Field(
         default=1,
         sa_column=version_col,
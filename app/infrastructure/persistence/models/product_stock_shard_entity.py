@@ -0,0 +1,25 @@
+from typing import Annotated, ClassVar
+
+from sqlmodel import Field, SQLModel
+
+
+class ProductStockShardEntity(SQLModel, table=True):
+    """
+    재고 샤드 행 (`product.stock_shards`가 1 이상인 상품의 재고를 나눠 저장)
+    주문마다 서로 다른 샤드 행을 갱신하므로 하나의 상품 행에 쓰기 락이 몰리지 않습니다.
+    """
+
+    __tablename__: ClassVar[str] = "product_stock_shard"
+
+    product_id: Annotated[
+        int,
+        Field(foreign_key="product.id", primary_key=True, title="상품 ID"),
+    ]
+    shard_index: Annotated[
+        int,
+        Field(primary_key=True, title="샤드 번호", description="0부터 stock_shards - 1까지"),
+    ]
+    quantity: Annotated[
+        int,
+        Field(ge=0, title="재고 수량", description="샤드에 배정된 재고 수량"),
+    ]
@@ -0,0 +1,29 @@
+from datetime import datetime
+from typing import Annotated, ClassVar
+
+from sqlmodel import Field, SQLModel
+
+
+class RefreshTokenEntity(SQLModel, table=True):
+    __tablename__: ClassVar[str] = "refresh_token"
+
+    token_hash: Annotated[
+        str,
+        Field(primary_key=True, max_length=64, title="토큰 해시", description="리프레시 토큰의 SHA-256 해시"),
+    ]
+    user_id: Annotated[
+        int,
+        Field(foreign_key="user.id", index=True, title="사용자 ID"),
+    ]
+    family_id: Annotated[
+        str,
+        Field(index=True, max_length=32, title="토큰 묶음 ID"),
+    ]
+    expires_at: Annotated[
+        datetime,
+        Field(title="만료 일시"),
+    ]
+    revoked_at: Annotated[
+        datetime | None,
+        Field(default=None, title="폐기 일시"),
+    ] = None
@@ -0,0 +1,38 @@
+from datetime import datetime
+from typing import Annotated, Any, ClassVar
+
+from sqlalchemy import Index
+from sqlmodel import Field, SQLModel
+
+
+class StockReservationEntity(SQLModel, table=True):
+    __tablename__: ClassVar[str] = "stock_reservation"
+    # 만료 처리기가 활성(released_at IS NULL) 선점을 만료 시각 순으로 읽는 범위 스캔용
+    __table_args__: ClassVar[tuple[Any, ...]] = (
+        Index("ix_stock_reservation_released_at_expires_at", "released_at", "expires_at"),
+    )
+
+    id: Annotated[
+        int | None,
+        Field(default=None, primary_key=True, title="고유 ID"),
+    ] = None
+    order_id: Annotated[
+        int,
+        Field(foreign_key="order.id", index=True, title="주문 ID"),
+    ]
+    product_id: Annotated[
+        int,
+        Field(foreign_key="product.id", title="상품 ID"),
+    ]
+    quantity: Annotated[
+        int,
+        Field(gt=0, title="선점 수량"),
+    ]
+    expires_at: Annotated[
+        datetime,
+        Field(title="만료 일시"),
+    ]
+    released_at: Annotated[
+        datetime | None,
+        Field(default=None, title="해제 일시"),
+    ] = None
@@ -1,14 +1,21 @@
+from collections import defaultdict
+from collections.abc import Sequence
+from datetime import datetime
+
+from sqlalchemy import insert, update
 from sqlalchemy.orm import selectinload
 from sqlalchemy.orm.exc import StaleDataError
-from sqlmodel import select
+from sqlmodel import col, select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
+from app.core.metrics import instrumented
 from app.domain.exceptions import ConcurrentModificationException
-from app.domain.model.order import Order, OrderItem
+from app.domain.model.order import Order, OrderItem, OrderStatus
 from app.domain.ports.order_repository import IOrderRepository
 from app.infrastructure.persistence.models.order_entity import OrderEntity, OrderItemEntity
 
 
+@instrumented("repository")
 class SQLOrderRepository(IOrderRepository):
     """SQLModel 기반 주문 리포지토리 구현"""
 
@@ -55,6 +62,34 @@ class SQLOrderRepository(IOrderRepository):
 
         return self._to_domain(order_entity)
 
+    async def save_many(self, orders: Sequence[Order]) -> list[Order]:
+        if not orders:
+            return []
+
+        # 상품 create_many와 같이 다중 행 `INSERT ... RETURNING` 문으로 저장하고,
+        # 자동 증가 ID가 VALUES 순서대로 부여된다는 점을 이용해 ID 순으로 정렬하여 입력 순서를 복원합니다.
+        order_table = OrderEntity.__table__  # type: ignore[attr-defined]
+        item_table = OrderItemEntity.__table__  # type: ignore[attr-defined]
+        result = await self.session.exec(
+            insert(order_table).returning(*order_table.c),
+            params=[order.model_dump(exclude={"id", "items"}) for order in orders],
+        )
+        order_rows = sorted(result.all(), key=lambda row: row.id)
+
+        result = await self.session.exec(
+            insert(item_table).returning(*item_table.c),
+            params=[
+                {**item.model_dump(exclude={"id"}), "order_id": row.id}
+                for order, row in zip(orders, order_rows, strict=True)
+                for item in order.items
+            ],
+        )
+        items_by_order_id: defaultdict[int, list[OrderItem]] = defaultdict(list)
+        for row in sorted(result.all(), key=lambda row: row.id):
+            items_by_order_id[row.order_id].append(OrderItem.model_validate(row._mapping))
+
+        return [Order.model_validate({**row._mapping, "items": items_by_order_id[row.id]}) for row in order_rows]
+
     async def find_by_id(self, order_id: int) -> Order | None:
         statement = select(OrderEntity).where(OrderEntity.id == order_id).options(selectinload(OrderEntity.items))  # type: ignore
         result = await self.session.exec(statement)
@@ -76,6 +111,7 @@ class SQLOrderRepository(IOrderRepository):
         statement = (
             select(OrderEntity)
             .where(OrderEntity.user_id == user_id)
+            .order_by(col(OrderEntity.created_at).desc(), col(OrderEntity.id).desc())
             .offset(skip)
             .limit(limit)
             .options(selectinload(OrderEntity.items))  # type: ignore
@@ -85,6 +121,34 @@ class SQLOrderRepository(IOrderRepository):
 
         return [self._to_domain(entity) for entity in order_entities]
 
+    async def find_many_by_ids_for_user(self, user_id: int, order_ids: Sequence[int]) -> list[Order]:
+        if not order_ids:
+            return []
+
+        # 소유권 검증을 WHERE 절에 포함하여 다른 사용자의 주문은 조회 단계에서 제외
+        statement = (
+            select(OrderEntity)
+            .where(OrderEntity.id.in_(set(order_ids)), OrderEntity.user_id == user_id)  # type: ignore[union-attr]
+            .options(selectinload(OrderEntity.items))  # type: ignore
+        )
+        result = await self.session.exec(statement)
+        return [self._to_domain(entity) for entity in result.all()]
+
+    async def expire_pending(self, order_ids: Sequence[int], updated_at: datetime) -> list[int]:
+        if not order_ids:
+            return []
+
+        # 상태 조건과 버전 증가로 같은 주문을 동시에 취소하는 트랜잭션과 한쪽만 성공하도록 함
+        table = OrderEntity.__table__  # type: ignore[attr-defined]
+        statement = (
+            update(table)
+            .where(table.c.id.in_(order_ids), table.c.status == OrderStatus.PENDING)
+            .values(status=OrderStatus.EXPIRED, updated_at=updated_at, version=table.c.version + 1)
+            .returning(table.c.id)
+        )
+        result = await self.session.exec(statement)
+        return list(result.scalars().all())
+
     def _to_domain(self, entity: OrderEntity) -> Order:
         """OrderEntity를 Order 도메인 모델로 변환"""
         items = [
@@ -0,0 +1,59 @@
+from collections.abc import Sequence
+from datetime import datetime
+
+from sqlalchemy import insert, update
+from sqlmodel import col, select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.core.metrics import instrumented
+from app.domain.model.order import OrderStatus, OrderSummary
+from app.domain.ports.order_summary_repository import IOrderSummaryRepository
+from app.infrastructure.persistence.models.order_entity import OrderSummaryEntity
+
+
+@instrumented("repository")
+class SQLOrderSummaryRepository(IOrderSummaryRepository):
+    """SQLModel 기반 주문 요약 프로젝션 리포지토리 구현"""
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def save(self, summary: OrderSummary) -> OrderSummary:
+        entity = await self.session.merge(OrderSummaryEntity.model_validate(summary))
+        await self.session.flush()
+        return OrderSummary.model_validate(entity)
+
+    async def save_many(self, summaries: Sequence[OrderSummary]) -> None:
+        if not summaries:
+            return
+        table = OrderSummaryEntity.__table__  # type: ignore[attr-defined]
+        await self.session.exec(insert(table), params=[summary.model_dump() for summary in summaries])
+
+    async def update_status(self, order_id: int, status: OrderStatus, updated_at: datetime) -> None:
+        statement = (
+            update(OrderSummaryEntity)
+            .where(col(OrderSummaryEntity.order_id) == order_id)
+            .values(status=status, updated_at=updated_at)
+        )
+        await self.session.exec(statement)
+
+    async def update_status_many(self, order_ids: Sequence[int], status: OrderStatus, updated_at: datetime) -> None:
+        if not order_ids:
+            return
+        statement = (
+            update(OrderSummaryEntity)
+            .where(col(OrderSummaryEntity.order_id).in_(order_ids))
+            .values(status=status, updated_at=updated_at)
+        )
+        await self.session.exec(statement)
+
+    async def find_by_user_id(self, user_id: int, skip: int, limit: int) -> list[OrderSummary]:
+        statement = (
+            select(OrderSummaryEntity)
+            .where(OrderSummaryEntity.user_id == user_id)
+            .order_by(col(OrderSummaryEntity.created_at).desc(), col(OrderSummaryEntity.order_id).desc())
+            .offset(skip)
+            .limit(limit)
+        )
+        result = await self.session.exec(statement)
+        return [OrderSummary.model_validate(entity) for entity in result.all()]
@@ -0,0 +1,81 @@
+from collections.abc import Mapping, Sequence
+from datetime import datetime
+
+from sqlalchemy import bindparam, func, insert, update
+from sqlmodel import col, select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.core.metrics import instrumented
+from app.domain.model.outbox import OutboxEvent
+from app.domain.ports.outbox_repository import IOutboxRepository
+from app.infrastructure.persistence.models.outbox_entity import OutboxEventEntity
+
+# 전달 오류 메시지 저장 최대 길이
+MAX_ERROR_LENGTH = 1000
+
+
+@instrumented("repository")
+class SQLOutboxRepository(IOutboxRepository):
+    """SQLModel 기반 outbox 이벤트 리포지토리 구현"""
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def save_many(self, events: Sequence[OutboxEvent]) -> None:
+        if not events:
+            return
+        await self.session.exec(
+            insert(OutboxEventEntity),
+            params=[event.model_dump(exclude={"id"}) for event in events],
+        )
+
+    async def claim_due(self, now: datetime, limit: int, lease_until: datetime) -> list[OutboxEvent]:
+        # (dispatched_at, next_attempt_at) 인덱스 순서대로 읽고, 여러 전달기가 동시에 실행되면 잠긴 행은 건너뜀
+        statement = (
+            select(OutboxEventEntity.id)
+            .where(col(OutboxEventEntity.dispatched_at).is_(None), col(OutboxEventEntity.next_attempt_at) <= now)
+            .order_by(col(OutboxEventEntity.next_attempt_at))
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        event_ids = list((await self.session.exec(statement)).all())
+        if not event_ids:
+            return []
+
+        table = OutboxEventEntity.__table__  # type: ignore[attr-defined]
+        result = await self.session.exec(
+            update(table)
+            .where(table.c.id.in_(event_ids), table.c.dispatched_at.is_(None))
+            .values(attempts=table.c.attempts + 1, next_attempt_at=lease_until)
+            .returning(*table.c)
+        )
+        events = {row.id: OutboxEvent.model_validate(row._mapping) for row in result.all()}
+        return [events[event_id] for event_id in event_ids if event_id in events]
+
+    async def mark_dispatched(self, event_ids: Sequence[int], dispatched_at: datetime) -> None:
+        if not event_ids:
+            return
+        table = OutboxEventEntity.__table__  # type: ignore[attr-defined]
+        await self.session.exec(
+            update(table).where(table.c.id.in_(event_ids)).values(dispatched_at=dispatched_at, last_error=None)
+        )
+
+    async def reschedule_many(self, next_attempts: Mapping[int, datetime], error: str) -> None:
+        if not next_attempts:
+            return
+        # 이벤트마다 다음 시도 시각이 다르므로, 하나의 UPDATE 문을 파라미터 목록과 함께 executemany로 실행
+        table = OutboxEventEntity.__table__  # type: ignore[attr-defined]
+        await self.session.exec(
+            update(table)
+            .where(table.c.id == bindparam("event_id"), table.c.dispatched_at.is_(None))
+            .values(next_attempt_at=bindparam("retry_at"), last_error=error[:MAX_ERROR_LENGTH]),
+            params=[
+                {"event_id": event_id, "retry_at": next_attempt_at}
+                for event_id, next_attempt_at in next_attempts.items()
+            ],
+        )
+
+    async def oldest_pending_created_at(self) -> datetime | None:
+        statement = select(func.min(OutboxEventEntity.created_at)).where(col(OutboxEventEntity.dispatched_at).is_(None))
+        result = await self.session.exec(statement)
+        return result.one()
@@ -1,20 +1,61 @@
-from collections.abc import Sequence
+import random
+from collections.abc import Iterable, Mapping, Sequence
+from typing import Any
 
+from sqlalchemy import ColumnElement, and_, case, delete, func, insert, or_, update
 from sqlalchemy.orm.exc import StaleDataError
-from sqlmodel import select
+from sqlmodel import col, select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
-from app.domain.exceptions import ConcurrentModificationException
-from app.domain.model.product import Product
+from app.core.metrics import instrumented
+from app.domain.exceptions import ConcurrentModificationException, DomainException
+from app.domain.model.product import InventoryAdjustment, Product
 from app.domain.ports.product_repository import IProductRepository
 from app.infrastructure.persistence.models.product_entity import ProductEntity
+from app.infrastructure.persistence.models.product_stock_shard_entity import ProductStockShardEntity
 
+# 재고 일괄 조정 시 UPDATE 한 문장에 담는 항목 수
+# (SQLite는 OR 체인을 깊은 트리로 파싱하므로 표현식 깊이 한도(1000)를 넘지 않도록 제한)
+INVENTORY_ADJUSTMENT_CHUNK_SIZE = 200
 
+
+def distribute_evenly(total: int, shard_count: int) -> list[int]:
+    """total을 shard_count개의 샤드에 고르게 나눈 수량 목록 (나머지는 앞쪽 샤드부터 1개씩 더 배정)"""
+    base, remainder = divmod(total, shard_count)
+    return [base + 1 if index < remainder else base for index in range(shard_count)]
+
+
+def plan_shard_takes(quantities: Sequence[int], need: int, start: int) -> dict[int, int] | None:
+    """
+    start 위치의 샤드부터 순환하며 need만큼 차감할 (샤드 위치, 차감 수량)을 계산합니다.
+    샤드 합계가 need보다 적으면 None을 반환합니다.
+    """
+    takes: dict[int, int] = {}
+    for offset in range(len(quantities)):
+        if need == 0:
+            break
+        position = (start + offset) % len(quantities)
+        take = min(quantities[position], need)
+        if take > 0:
+            takes[position] = take
+            need -= take
+    return takes if need == 0 else None
+
+
+def _stock_conflict(product_id: int | None) -> ConcurrentModificationException:
+    return ConcurrentModificationException(
+        f"상품 정보가 변경되었습니다. 최신 정보를 다시 확인해주세요. (ID: {product_id})"
+    )
+
+
+@instrumented("repository")
 class SQLProductRepository(IProductRepository):
     """SQL 데이터베이스에 대한 상품 리포지토리 구현체"""
 
     def __init__(self, session: AsyncSession):
         self.session = session
+        # 재고 샤드를 사용하는 상품을 조회한 시점의 샤드 합계 (update에서 재고 변경량을 계산할 때 사용)
+        self._loaded_shard_stock: dict[int, int] = {}
 
     async def create(self, product: Product) -> Product:
         db_product = ProductEntity.model_validate(product)
@@ -23,21 +64,228 @@ class SQLProductRepository(IProductRepository):
         await self.session.refresh(db_product)
         return Product.model_validate(db_product)
 
+    async def create_many(self, products: Sequence[Product]) -> list[Product]:
+        if not products:
+            return []
+
+        # Core INSERT + executemany 조합은 SQLAlchemy의 insertmanyvalues에 의해
+        # 다중 행 `INSERT ... VALUES (...), (...) RETURNING ...` 문으로 묶여 실행됩니다.
+        # sort_by_parameter_order=True는 SQLite에서 행 단위 실행으로 후퇴하므로 사용하지 않고,
+        # 자동 증가 ID가 VALUES 순서대로 부여된다는 점을 이용해 ID 순으로 정렬하여 입력 순서를 복원합니다.
+        table = ProductEntity.__table__  # type: ignore[attr-defined]
+        statement = insert(table).returning(*table.c)
+        params = [product.model_dump(exclude={"id", "version"}) for product in products]
+        result = await self.session.exec(statement, params=params)
+        rows = sorted(result.all(), key=lambda row: row.id)
+        return [Product.model_validate(row._mapping) for row in rows]
+
     async def get_by_id(self, product_id: int) -> Product | None:
         db_product = await self.session.get(ProductEntity, product_id)
         if db_product:
-            return Product.model_validate(db_product)
+            return (await self._to_products([db_product]))[0]
         return None
 
+    async def get_many_by_ids(self, product_ids: Sequence[int]) -> list[Product]:
+        if not product_ids:
+            return []
+
+        statement = select(ProductEntity).where(ProductEntity.id.in_(set(product_ids)))  # type: ignore[union-attr]
+        result = await self.session.exec(statement)
+        return await self._to_products(result.all())
+
+    async def lock_many_by_ids(self, product_ids: Sequence[int]) -> list[Product]:
+        if not product_ids:
+            return []
+
+        # 이미 세션에 로드된 엔티티도 잠근 시점의 값으로 덮어씀
+        statement = (
+            select(ProductEntity)
+            .where(col(ProductEntity.id).in_(set(product_ids)))
+            .order_by(col(ProductEntity.id))
+            .with_for_update()
+            .execution_options(populate_existing=True)
+        )
+        result = await self.session.exec(statement)
+        return await self._to_products(result.all())
+
+    async def _to_products(self, db_products: Iterable[Any]) -> list[Product]:
+        """
+        엔티티(또는 행)를 도메인 모델로 변환합니다.
+        재고 샤드를 사용하는 상품이 있으면 한 번의 집계 쿼리로 샤드 합계를 읽어 재고로 채웁니다.
+        """
+        products = [Product.model_validate(db_product) for db_product in db_products]
+        sharded_ids = [product.id for product in products if product.stock_shards]
+        if sharded_ids:
+            shard = ProductStockShardEntity
+            statement = (
+                select(shard.product_id, func.sum(shard.quantity))
+                .where(col(shard.product_id).in_(sharded_ids))
+                .group_by(col(shard.product_id))
+            )
+            totals = dict((await self.session.exec(statement)).all())
+            for product in products:
+                if product.stock_shards and product.id is not None:
+                    product.stock = self._loaded_shard_stock[product.id] = totals.get(product.id, 0)
+        return products
+
+    async def apply_inventory_adjustments(
+        self, seller_id: int, adjustments: Sequence[InventoryAdjustment]
+    ) -> list[Product]:
+        # 재고 샤드를 사용하는 상품은 샤드 변경량 반영이 필요하므로 항목별로 적용
+        sharded_ids = await self._sharded_ids([adjustment.product_id for adjustment in adjustments])
+        plain = [adjustment for adjustment in adjustments if adjustment.product_id not in sharded_ids]
+
+        applied: list[Product] = []
+        for start in range(0, len(plain), INVENTORY_ADJUSTMENT_CHUNK_SIZE):
+            chunk = plain[start : start + INVENTORY_ADJUSTMENT_CHUNK_SIZE]
+            applied.extend(await self._apply_inventory_chunk(seller_id, chunk))
+        for adjustment in adjustments:
+            if adjustment.product_id in sharded_ids:
+                product = await self._apply_sharded_adjustment(seller_id, adjustment)
+                if product is not None:
+                    applied.append(product)
+        return applied
+
+    async def _sharded_ids(self, product_ids: Sequence[int]) -> set[int]:
+        if not product_ids:
+            return set()
+        statement = select(ProductEntity.id).where(
+            col(ProductEntity.id).in_(set(product_ids)), col(ProductEntity.stock_shards) > 0
+        )
+        return {product_id for product_id in (await self.session.exec(statement)).all() if product_id is not None}
+
+    async def _apply_sharded_adjustment(self, seller_id: int, adjustment: InventoryAdjustment) -> Product | None:
+        """
+        재고 샤드를 사용하는 상품의 조정 항목을 적용합니다.
+        상품 행(가격, 버전)의 조건부 갱신과 샤드 반영을 한 SAVEPOINT 안에서 실행하여,
+        어느 쪽이든 실패하면 이 항목의 변경만 함께 롤백하고 None을 반환합니다. (배치의 다른 항목은 계속 적용)
+        """
+        db_product = await self.session.get(ProductEntity, adjustment.product_id)
+        if db_product is None or db_product.seller_id != seller_id:
+            return None
+        product = (await self._to_products([db_product]))[0]
+        if adjustment.expected_version is not None and product.version != adjustment.expected_version:
+            return None
+
+        loaded_stock = product.stock
+        try:
+            product.adjust_inventory(stock=adjustment.stock, stock_delta=adjustment.stock_delta, price=adjustment.price)
+        except DomainException:
+            return None
+
+        table = ProductEntity.__table__  # type: ignore[attr-defined]
+        statement = (
+            update(table)
+            .where(
+                table.c.id == product.id,
+                table.c.stock_shards == product.stock_shards,
+                table.c.version == product.version,
+            )
+            .values(price=product.price, version=table.c.version + 1)
+            .returning(table.c.version)
+        )
+        try:
+            async with self.session.begin_nested():
+                row = (await self.session.exec(statement)).first()
+                if row is None:
+                    raise _stock_conflict(product.id)
+                await self._apply_shard_delta(adjustment.product_id, product.stock_shards, product.stock - loaded_stock)
+        except ConcurrentModificationException:
+            return None
+
+        product.version = row.version
+        return product
+
+    async def _apply_inventory_chunk(self, seller_id: int, adjustments: Sequence[InventoryAdjustment]) -> list[Product]:
+        """
+        항목별 조건을 CASE/OR 식으로 묶어 단일 `UPDATE ... RETURNING` 문으로 적용합니다.
+        조건(소유자, 기대 버전, 재고 하한)을 만족하지 않는 행은 WHERE 절에서 걸러지므로
+        RETURNING 결과에 포함되지 않습니다.
+
+        Core UPDATE는 세션의 identity map을 갱신하지 않지만,
+        UoW 커밋 시 세션의 모든 객체가 만료되므로 이후 조회에는 갱신된 값이 반영됩니다.
+        """
+        table = ProductEntity.__table__  # type: ignore[attr-defined]
+
+        stock_cases: list[tuple[ColumnElement[bool], ColumnElement[int] | int]] = []
+        price_cases: list[tuple[ColumnElement[bool], float]] = []
+        row_conditions: list[ColumnElement[bool]] = []
+        for adjustment in adjustments:
+            matches_id = table.c.id == adjustment.product_id
+            conditions = [matches_id]
+
+            if adjustment.stock is not None:
+                stock_cases.append((matches_id, adjustment.stock))
+            elif adjustment.stock_delta is not None:
+                new_stock = table.c.stock + adjustment.stock_delta
+                stock_cases.append((matches_id, new_stock))
+                conditions.append(new_stock >= 0)
+
+            if adjustment.price is not None:
+                price_cases.append((matches_id, adjustment.price))
+
+            if adjustment.expected_version is not None:
+                conditions.append(table.c.version == adjustment.expected_version)
+
+            row_conditions.append(and_(*conditions))
+
+        # 조회 이후 재고 샤드로 전환된 상품은 상품 행의 재고를 바꾸지 않도록 제외 (충돌로 보고됨)
+
+        values: dict[str, ColumnElement[object]] = {"version": table.c.version + 1}
+        if stock_cases:
+            values["stock"] = case(*stock_cases, else_=table.c.stock)
+        if price_cases:
+            values["price"] = case(*price_cases, else_=table.c.price)
+
+        statement = (
+            update(table)
+            .where(
+                table.c.id.in_([adjustment.product_id for adjustment in adjustments]),
+                table.c.seller_id == seller_id,
+                table.c.stock_shards == 0,
+                or_(*row_conditions),
+            )
+            .values(values)
+            .returning(*table.c)
+        )
+        result = await self.session.exec(statement)
+        return [Product.model_validate(row._mapping) for row in result.all()]
+
+    async def restore_stock(self, quantities: Mapping[int, int]) -> None:
+        table = ProductEntity.__table__  # type: ignore[attr-defined]
+        shards = ProductStockShardEntity.__table__  # type: ignore[attr-defined]
+        product_ids = sorted(quantities)
+        for start in range(0, len(product_ids), INVENTORY_ADJUSTMENT_CHUNK_SIZE):
+            chunk = product_ids[start : start + INVENTORY_ADJUSTMENT_CHUNK_SIZE]
+            restored = case(*((table.c.id == product_id, quantities[product_id]) for product_id in chunk))
+            # 버전을 올려 같은 상품을 읽고 있던 주문 트랜잭션이 낙관적 락 충돌로 재시도하도록 함
+            statement = (
+                update(table)
+                .where(table.c.id.in_(chunk))
+                .values(
+                    stock=case((table.c.stock_shards == 0, table.c.stock + restored), else_=table.c.stock),
+                    version=table.c.version + 1,
+                )
+            )
+            await self.session.exec(statement)
+            # 재고 샤드를 사용하는 상품은 0번 샤드에 더함 (샤드가 없는 상품은 일치하는 행이 없음)
+            await self.session.exec(
+                update(shards)
+                .where(shards.c.product_id.in_(chunk), shards.c.shard_index == 0)
+                .values(
+                    quantity=shards.c.quantity
+                    + case(*((shards.c.product_id == product_id, quantities[product_id]) for product_id in chunk))
+                )
+            )
+
     async def list(self, offset: int, limit: int, seller_id: int | None = None) -> Sequence[Product]:
         statement = select(ProductEntity)
         if seller_id is not None:
             statement = statement.where(ProductEntity.seller_id == seller_id)
 
-        statement = statement.offset(offset).limit(limit)
+        statement = statement.order_by(col(ProductEntity.id)).offset(offset).limit(limit)
         result = await self.session.exec(statement)
-        db_products = result.all()
-        return [Product.model_validate(p) for p in db_products]
+        return await self._to_products(result.all())
 
     async def update(self, product: Product) -> Product:
         if product.id is None:
@@ -65,19 +313,128 @@ class SQLProductRepository(IProductRepository):
                 f"상품 정보가 변경되었습니다. 최신 정보를 다시 확인해주세요. (ID: {product.id})"
             )
 
-        # 3. 필드 업데이트
-        product_data = product.model_dump(exclude_unset=True)
+        # 3. 필드 업데이트 (재고 샤드 수는 configure_stock_shards로만 변경)
+        excluded = {"id", "version", "stock_shards"}
+        if db_product.stock_shards:
+            # 샤드 재고는 변경량으로만 반영하므로, 재고만 바뀌었다면 상품 행을 갱신하지 않음 (버전도 유지)
+            excluded.add("stock")
+        product_data = product.model_dump(exclude_unset=True, exclude=excluded)
         for key, value in product_data.items():
-            if key not in ["id", "version"]:
-                setattr(db_product, key, value)
+            setattr(db_product, key, value)
+        # 샤드 재고는 조회 시점의 샤드 합계와 비교한 변경량만 반영 (조회 이후 다른 주문의 차감을 덮어쓰지 않음)
+        stock_delta = 0
+        if db_product.stock_shards:
+            loaded_stock = self._loaded_shard_stock.get(product.id)
+            if loaded_stock is None:
+                loaded_stock = (await self._to_products([db_product]))[0].stock
+            stock_delta = product.stock - loaded_stock
 
         try:
             self.session.add(db_product)
             await self.session.flush()
+            if stock_delta:
+                await self._apply_shard_delta(product.id, db_product.stock_shards, stock_delta)
             await self.session.refresh(db_product)
-            return Product.model_validate(db_product)
+            return (await self._to_products([db_product]))[0]
         except StaleDataError as e:
             await self.session.rollback()
-            raise ConcurrentModificationException(
-                f"상품 정보가 변경되었습니다. 최신 정보를 다시 확인해주세요. (ID: {product.id})"
-            ) from e
+            raise _stock_conflict(product.id) from e
+
+    async def _change_shard(self, product_id: int, shard_index: int, change: int) -> bool:
+        """샤드 수량이 0 미만이 되지 않는 경우에만 change만큼 바꾸고, 바꿨는지 여부를 반환합니다."""
+        shards = ProductStockShardEntity.__table__  # type: ignore[attr-defined]
+        statement = (
+            update(shards)
+            .where(
+                shards.c.product_id == product_id,
+                shards.c.shard_index == shard_index,
+                shards.c.quantity + change >= 0,
+            )
+            .values(quantity=shards.c.quantity + change)
+            .returning(shards.c.shard_index)
+        )
+        return (await self.session.exec(statement)).first() is not None
+
+    async def _apply_shard_delta(self, product_id: int, shard_count: int, delta: int) -> None:
+        """
+        재고 변경량을 샤드에 반영합니다.
+        임의의 샤드 하나에 한 번에 반영하고, 차감할 수량이 모자라면 샤드별 수량을 읽어 여러 샤드에서 나눠 차감합니다.
+        샤드 합계가 모자라면(조회 이후 다른 주문이 차감) `ConcurrentModificationException`을 발생시켜,
+        재시도 시 최신 재고로 도메인 규칙(`Product.check_stock`)을 다시 검사하도록 합니다.
+        이미 반영한 차감은 호출자의 SAVEPOINT 또는 트랜잭션 롤백으로 함께 되돌려집니다.
+        """
+        if delta == 0 or await self._change_shard(product_id, random.randrange(shard_count), delta):
+            return
+        if delta > 0:
+            # 조회 이후 재고 샤드 설정이 바뀌어 샤드가 없어진 경우
+            raise _stock_conflict(product_id)
+
+        rows = await self._lock_shards(product_id)
+        takes = plan_shard_takes([quantity for _, quantity in rows], -delta, start=random.randrange(len(rows) or 1))
+        if takes is None:
+            raise _stock_conflict(product_id)
+
+        for position, take in takes.items():
+            if not await self._change_shard(product_id, rows[position][0], -take):
+                raise _stock_conflict(product_id)
+
+    async def _lock_shards(self, product_id: int) -> Sequence[tuple[int, int]]:
+        """상품의 (샤드 번호, 수량)을 샤드 번호 순으로 읽고, 트랜잭션이 끝날 때까지 행을 잠급니다."""
+        shard = ProductStockShardEntity
+        statement = (
+            select(shard.shard_index, shard.quantity)
+            .where(shard.product_id == product_id)
+            .order_by(col(shard.shard_index))
+            .with_for_update()
+        )
+        return (await self.session.exec(statement)).all()
+
+    async def configure_stock_shards(self, product_id: int, shard_count: int) -> Product | None:
+        db_product = await self.session.get(ProductEntity, product_id, with_for_update=True)
+        if db_product is None:
+            return None
+
+        # 진행 중인 샤드 차감이 끝난 뒤의 수량을 합치도록 샤드 행도 잠근 상태에서 합계를 계산
+        shards = ProductStockShardEntity.__table__  # type: ignore[attr-defined]
+        total = db_product.stock + sum(quantity for _, quantity in await self._lock_shards(product_id))
+        await self.session.exec(delete(shards).where(shards.c.product_id == product_id))
+        if shard_count:
+            await self.session.exec(
+                insert(shards),
+                params=[
+                    {"product_id": product_id, "shard_index": shard_index, "quantity": quantity}
+                    for shard_index, quantity in enumerate(distribute_evenly(total, shard_count))
+                ],
+            )
+
+        db_product.stock = 0 if shard_count else total
+        db_product.stock_shards = shard_count
+        self.session.add(db_product)
+        await self.session.flush()
+        await self.session.refresh(db_product)
+        return (await self._to_products([db_product]))[0]
+
+    async def rebalance_stock_shards(self, product_id: int) -> Product | None:
+        db_product = await self.session.get(ProductEntity, product_id)
+        if db_product is None or not db_product.stock_shards:
+            return None
+
+        rows = await self._lock_shards(product_id)
+        targets = distribute_evenly(sum(quantity for _, quantity in rows), len(rows) or 1)
+        changes = {
+            shard_index: target
+            for (shard_index, quantity), target in zip(rows, targets, strict=False)
+            if quantity != target
+        }
+        if changes:
+            shards = ProductStockShardEntity.__table__  # type: ignore[attr-defined]
+            await self.session.exec(
+                update(shards)
+                .where(shards.c.product_id == product_id, shards.c.shard_index.in_(changes))
+                .values(quantity=case(*((shards.c.shard_index == index, target) for index, target in changes.items())))
+            )
+        return (await self._to_products([db_product]))[0]
+
+    async def list_stock_sharded_ids(self) -> Sequence[int]:
+        statement = select(ProductEntity.id).where(col(ProductEntity.stock_shards) > 0)
+        return [product_id for product_id in (await self.session.exec(statement)).all() if product_id is not None]
@@ -0,0 +1,557 @@
+"""
+리포지토리 쿼리 인덱스 점검 도구
+
+시드 데이터를 넣은 SQLite 데이터베이스에서 모든 SQL 리포지토리 메서드를 실행하고,
+실행된 SELECT/UPDATE/DELETE 문마다 `EXPLAIN QUERY PLAN`을 수집하여
+인덱스 없이 테이블 전체를 스캔하거나 임시 B-트리로 정렬하는 쿼리를 찾아냅니다.
+
+    python -m app.infrastructure.persistence.query_plan_advisor
+
+위반 쿼리가 있으면 종료 코드 1로 끝나며, 같은 검사가 테스트(CI)에서도 실행됩니다.
+"""
+
+import asyncio
+import inspect
+import re
+import sys
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.engine import Connection
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from sqlmodel import SQLModel
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.domain.model.cart import CartItem
+from app.domain.model.idempotency import IdempotencyRecord
+from app.domain.model.order import Order, OrderItem, OrderStatus, OrderSummary
+from app.domain.model.outbox import OutboxEvent, OutboxEventType
+from app.domain.model.product import InventoryAdjustment, Product
+from app.domain.model.refresh_token import RefreshToken
+from app.domain.model.reservation import StockReservation
+from app.domain.model.user import User, UserRole
+from app.infrastructure.persistence.cart_repository import SQLCartRepository
+from app.infrastructure.persistence.idempotency_repository import SQLIdempotencyRepository
+from app.infrastructure.persistence.models import (  # noqa: F401  # 메타데이터에 모든 테이블 등록
+    cart_entity,
+    idempotency_entity,
+    order_entity,
+    outbox_entity,
+    product_entity,
+    product_stock_shard_entity,
+    refresh_token_entity,
+    reservation_entity,
+    seller_entity,
+    user_entity,
+)
+from app.infrastructure.persistence.order_repository import SQLOrderRepository
+from app.infrastructure.persistence.order_summary_repository import SQLOrderSummaryRepository
+from app.infrastructure.persistence.outbox_repository import SQLOutboxRepository
+from app.infrastructure.persistence.product_repository import SQLProductRepository
+from app.infrastructure.persistence.refresh_token_repository import SQLRefreshTokenRepository
+from app.infrastructure.persistence.seller_repository import SQLSellerRepository
+from app.infrastructure.persistence.stock_reservation_repository import SQLStockReservationRepository
+from app.infrastructure.persistence.user_repository import SQLUserRepository
+
+# 점검 대상 리포지토리 (새 리포지토리를 추가하면 여기에 등록하고 워크로드에서 모든 메서드를 호출해야 함)
+REPOSITORY_CLASSES: tuple[type, ...] = (
+    SQLUserRepository,
+    SQLSellerRepository,
+    SQLProductRepository,
+    SQLOrderRepository,
+    SQLOrderSummaryRepository,
+    SQLCartRepository,
+    SQLRefreshTokenRepository,
+    SQLIdempotencyRepository,
+    SQLStockReservationRepository,
+    SQLOutboxRepository,
+)
+
+# 필터 없이 전체 목록을 페이지네이션하는 쿼리처럼 전체 스캔이 의도된 쿼리 (라벨 기준)
+FULL_SCAN_ALLOWLIST = frozenset(
+    {
+        "SQLOrderRepository.find_all",
+        "SQLProductRepository.list",
+    }
+)
+
+SEED_BUYER_COUNT = 20
+SEED_PRODUCT_COUNT = 200
+SEED_ORDER_COUNT = 200
+SEED_CART_ITEM_COUNT = 5
+SEED_REFRESH_TOKEN_ROTATIONS = 3
+SEED_RESERVATION_TTL_MINUTES = 60
+SEED_STOCK_SHARDS = 4
+
+_PLANNED_STATEMENTS = ("SELECT", "UPDATE", "DELETE")
+_FULL_SCAN_PATTERN = re.compile(r"^SCAN (?!CONSTANT ROW)(\S+)")
+_TEMP_SORT_DETAIL = "USE TEMP B-TREE FOR ORDER BY"
+
+_current_label: ContextVar[str | None] = ContextVar("query_plan_label", default=None)
+
+
+@dataclass
+class QueryPlan:
+    """한 번 실행된 쿼리와 그 실행 계획"""
+
+    label: str
+    statement: str
+    details: list[str]
+
+    @property
+    def full_scans(self) -> list[str]:
+        """인덱스 없이 전체 스캔하는 테이블 목록"""
+        return [match.group(1) for detail in self.details if (match := _FULL_SCAN_PATTERN.match(detail))]
+
+    @property
+    def uses_temp_sort(self) -> bool:
+        """인덱스 대신 임시 B-트리로 정렬하는지 여부"""
+        return any(detail.startswith(_TEMP_SORT_DETAIL) for detail in self.details)
+
+    @property
+    def method(self) -> str:
+        """라벨에서 변형 표기(`[...]`)를 뗀 리포지토리 메서드 이름"""
+        return self.label.split("[", 1)[0]
+
+
+@dataclass
+class QueryPlanRecorder:
+    """엔진에서 실행되는 쿼리를 가로채 `EXPLAIN QUERY PLAN` 결과를 수집합니다."""
+
+    plans: list[QueryPlan] = field(default_factory=list)
+    exercised: set[str] = field(default_factory=set)
+
+    def attach(self, engine: AsyncEngine) -> None:
+        event.listen(engine.sync_engine, "before_cursor_execute", self._explain)
+
+    def detach(self, engine: AsyncEngine) -> None:
+        event.remove(engine.sync_engine, "before_cursor_execute", self._explain)
+
+    @contextmanager
+    def label(self, name: str) -> Iterator[None]:
+        """블록 안에서 실행된 쿼리에 라벨(`클래스.메서드[변형]`)을 붙입니다."""
+        token = _current_label.set(name)
+        try:
+            yield
+        finally:
+            _current_label.reset(token)
+
+    def violations(self, allowlist: frozenset[str] = FULL_SCAN_ALLOWLIST) -> list[QueryPlan]:
+        """허용 목록에 없는 전체 스캔 또는 임시 정렬 쿼리 목록"""
+        return [plan for plan in self.plans if plan.label not in allowlist and (plan.full_scans or plan.uses_temp_sort)]
+
+    def uncovered_methods(self) -> list[str]:
+        """워크로드에서 한 번도 호출되지 않은 리포지토리 메서드 목록"""
+        return [name for name in _repository_methods() if name not in self.exercised]
+
+    def _explain(  # noqa: PLR0913  # SQLAlchemy before_cursor_execute 이벤트 시그니처
+        self,
+        conn: Connection,
+        cursor: Any,
+        statement: str,
+        parameters: Any,
+        context: Any,
+        executemany: bool,
+    ) -> None:
+        label = _current_label.get()
+        if label is None:
+            return
+
+        plan = QueryPlan(label=label, statement=statement, details=[])
+        self.exercised.add(plan.method)
+        # INSERT 등 계획 점검이 필요 없는 문장은 호출 기록만 남김
+        if executemany or not statement.lstrip().upper().startswith(_PLANNED_STATEMENTS):
+            return
+
+        explain_cursor = conn.connection.dbapi_connection.cursor()  # type: ignore[union-attr]
+        try:
+            explain_cursor.execute(f"EXPLAIN QUERY PLAN {statement}", parameters)
+            plan.details = [row[3] for row in explain_cursor.fetchall()]
+        finally:
+            explain_cursor.close()
+        self.plans.append(plan)
+
+
+def _repository_methods() -> list[str]:
+    return [
+        f"{repository.__name__}.{name}"
+        for repository in REPOSITORY_CLASSES
+        for name, member in inspect.getmembers(repository, inspect.iscoroutinefunction)
+        if not name.startswith("_")
+    ]
+
+
+class _RepositoryWorkload:
+    """시드 데이터를 만든 뒤 모든 리포지토리 메서드를 한 번 이상 호출하는 점검용 워크로드"""
+
+    def __init__(self, session: AsyncSession, recorder: QueryPlanRecorder):
+        self.session = session
+        self.recorder = recorder
+        self.users = SQLUserRepository(session)
+        self.sellers = SQLSellerRepository(session)
+        self.products = SQLProductRepository(session)
+        self.orders = SQLOrderRepository(session)
+        self.summaries = SQLOrderSummaryRepository(session)
+        self.carts = SQLCartRepository(session)
+        self.refresh_tokens = SQLRefreshTokenRepository(session)
+        self.idempotency_keys = SQLIdempotencyRepository(session)
+        self.reservations = SQLStockReservationRepository(session)
+        self.outbox = SQLOutboxRepository(session)
+
+    async def run(self) -> None:
+        await self._seed()
+        # 통계를 갱신하여 실제 데이터 분포 기준의 실행 계획을 얻음
+        await (await self.session.connection()).exec_driver_sql("ANALYZE")
+
+        await self._exercise_users()
+        await self._exercise_products()
+        await self._exercise_orders()
+        await self._exercise_carts()
+        await self._exercise_refresh_tokens()
+        await self._exercise_idempotency_keys()
+        await self._exercise_reservations()
+        await self._exercise_outbox()
+        await self.session.commit()
+
+    async def _seed(self) -> None:
+        label = self.recorder.label
+        # 실행 계획이 실제 분포와 비슷하도록 여러 사용자에게 데이터를 나눠 시드함
+        with label("SQLUserRepository.create"):
+            buyers = [
+                await self.users.create(User(email=f"buyer{i}@example.com", hashed_password="-"))
+                for i in range(SEED_BUYER_COUNT)
+            ]
+            self.seller_user = await self.users.create(
+                User(email="seller@example.com", hashed_password="-", role=UserRole.SELLER)
+            )
+        self.buyer = buyers[0]
+        self.buyer_id = _require_id(self.buyer.id)
+        buyer_ids = [_require_id(user.id) for user in buyers]
+
+        with label("SQLSellerRepository.create"):
+            self.seller = await self.sellers.create(_require_id(self.seller_user.id), "Advisor Store")
+
+        with label("SQLProductRepository.create_many"):
+            seeded = await self.products.create_many(
+                [
+                    Product(name=f"상품 {i}", price=1000, stock=100, seller_id=self.seller.id)
+                    for i in range(SEED_PRODUCT_COUNT)
+                ]
+            )
+        with label("SQLProductRepository.create"):
+            self.product = await self.products.create(
+                Product(name="단건 상품", price=1000, stock=100, seller_id=self.seller.id)
+            )
+        self.product_ids = [_require_id(product.id) for product in seeded]
+
+        with label("SQLOrderRepository.save"):
+            saved_orders = [
+                await self.orders.save(
+                    Order(
+                        user_id=buyer_ids[i % len(buyer_ids)],
+                        total_price=1000,
+                        items=[OrderItem(product_id=self.product_ids[i % SEED_PRODUCT_COUNT], price=1000, quantity=1)],
+                    )
+                )
+                for i in range(SEED_ORDER_COUNT)
+            ]
+        self.order_ids = [_require_id(order.id) for order in saved_orders if order.user_id == self.buyer_id]
+
+        with label("SQLOrderSummaryRepository.save"):
+            for order in saved_orders:
+                await self.summaries.save(OrderSummary.from_order(order, "상품"))
+
+        with label("SQLOrderRepository.save_many"):
+            batched_orders = await self.orders.save_many(
+                [
+                    Order(
+                        user_id=user_id,
+                        total_price=1000,
+                        items=[OrderItem(product_id=_require_id(self.product.id), price=1000, quantity=1)],
+                    )
+                    for user_id in buyer_ids
+                ]
+            )
+        with label("SQLOrderSummaryRepository.save_many"):
+            await self.summaries.save_many([OrderSummary.from_order(order, "상품") for order in batched_orders])
+
+        with label("SQLStockReservationRepository.save_many"):
+            await self.reservations.save_many(
+                [
+                    StockReservation(
+                        order_id=_require_id(order.id),
+                        product_id=item.product_id,
+                        quantity=item.quantity,
+                        expires_at=order.created_at + timedelta(minutes=i % SEED_RESERVATION_TTL_MINUTES),
+                        released_at=None if i % 2 else order.created_at,
+                    )
+                    for i, order in enumerate(saved_orders)
+                    for item in order.items
+                ]
+            )
+
+        with label("SQLOutboxRepository.save_many"):
+            # 절반은 이미 전달된 이벤트로 시드하여 미전달 이벤트만 읽는 범위 스캔을 확인
+            await self.outbox.save_many(
+                [
+                    OutboxEvent(
+                        event_type=OutboxEventType.ORDER_CREATED,
+                        aggregate_id=_require_id(order.id),
+                        payload={"id": order.id},
+                        created_at=order.created_at,
+                        next_attempt_at=order.created_at,
+                        dispatched_at=None if i % 2 else order.created_at,
+                    )
+                    for i, order in enumerate(saved_orders)
+                ]
+            )
+
+        with label("SQLCartRepository.save"):
+            self.cart_item = await self.carts.save(
+                CartItem(user_id=self.buyer_id, product_id=_require_id(self.product.id), quantity=1)
+            )
+            for user_id in buyer_ids:
+                for product_id in self.product_ids[:SEED_CART_ITEM_COUNT]:
+                    await self.carts.save(CartItem(user_id=user_id, product_id=product_id, quantity=1))
+
+        with label("SQLRefreshTokenRepository.save"):
+            expires_at = datetime.now() + timedelta(days=1)
+            for i, user_id in enumerate(buyer_ids):
+                for rotation in range(SEED_REFRESH_TOKEN_ROTATIONS):
+                    await self.refresh_tokens.save(
+                        RefreshToken(
+                            token_hash=f"{i:032x}{rotation:032x}",
+                            user_id=user_id,
+                            family_id=f"{i:032x}",
+                            expires_at=expires_at,
+                        )
+                    )
+
+    async def _exercise_users(self) -> None:
+        label = self.recorder.label
+        with label("SQLUserRepository.get_by_email"):
+            await self.users.get_by_email(self.buyer.email)
+        with label("SQLUserRepository.get_by_id"):
+            await self.users.get_by_id(self.buyer_id)
+        with label("SQLUserRepository.update"):
+            self.buyer.update_info(full_name="Buyer")
+            await self.users.update(self.buyer)
+
+        with label("SQLSellerRepository.get_by_user_id"):
+            await self.sellers.get_by_user_id(self.seller.user_id)
+        with label("SQLSellerRepository.update"):
+            self.seller.update_info(description="설명")
+            await self.sellers.update(self.seller)
+
+    async def _exercise_products(self) -> None:
+        label = self.recorder.label
+        with label("SQLProductRepository.get_by_id"):
+            await self.products.get_by_id(_require_id(self.product.id))
+        with label("SQLProductRepository.get_many_by_ids"):
+            await self.products.get_many_by_ids(self.product_ids[:10])
+        with label("SQLProductRepository.lock_many_by_ids"):
+            await self.products.lock_many_by_ids(self.product_ids[:10])
+        with label("SQLProductRepository.list"):
+            await self.products.list(offset=0, limit=10)
+        with label("SQLProductRepository.list[seller_id]"):
+            await self.products.list(offset=0, limit=10, seller_id=self.seller.id)
+        with label("SQLProductRepository.update"):
+            self.product.decrease_stock(1)
+            await self.products.update(self.product)
+        with label("SQLProductRepository.restore_stock"):
+            await self.products.restore_stock(dict.fromkeys(self.product_ids[:10], 1))
+        with label("SQLProductRepository.apply_inventory_adjustments"):
+            await self.products.apply_inventory_adjustments(
+                self.seller.id,
+                [InventoryAdjustment(product_id=product_id, stock_delta=-1) for product_id in self.product_ids[:10]],
+            )
+        await self._exercise_stock_shards()
+
+    async def _exercise_stock_shards(self) -> None:
+        label = self.recorder.label
+        sharded_ids = self.product_ids[10:20]
+        with label("SQLProductRepository.configure_stock_shards"):
+            for product_id in sharded_ids:
+                await self.products.configure_stock_shards(product_id, SEED_STOCK_SHARDS)
+        with label("SQLProductRepository.get_many_by_ids[sharded]"):
+            sharded = await self.products.get_many_by_ids(sharded_ids)
+        with label("SQLProductRepository.update[sharded]"):
+            # 샤드 하나의 수량보다 많이 차감하여 여러 샤드에서 나눠 차감하는 경로까지 실행
+            sharded[0].decrease_stock(sharded[0].stock // SEED_STOCK_SHARDS + 1)
+            await self.products.update(sharded[0])
+        with label("SQLProductRepository.apply_inventory_adjustments[sharded]"):
+            await self.products.apply_inventory_adjustments(
+                self.seller.id,
+                [InventoryAdjustment(product_id=product_id, stock_delta=-1) for product_id in sharded_ids],
+            )
+        with label("SQLProductRepository.restore_stock[sharded]"):
+            await self.products.restore_stock(dict.fromkeys(sharded_ids, 1))
+        with label("SQLProductRepository.list_stock_sharded_ids"):
+            await self.products.list_stock_sharded_ids()
+        with label("SQLProductRepository.rebalance_stock_shards"):
+            await self.products.rebalance_stock_shards(sharded_ids[0])
+
+    async def _exercise_orders(self) -> None:
+        label = self.recorder.label
+        with label("SQLOrderRepository.find_by_id"):
+            order = await self.orders.find_by_id(self.order_ids[0])
+        with label("SQLOrderRepository.find_all"):
+            await self.orders.find_all(skip=0, limit=10)
+        with label("SQLOrderRepository.find_by_user_id"):
+            await self.orders.find_by_user_id(self.buyer_id, skip=0, limit=10)
+        with label("SQLOrderRepository.find_many_by_ids_for_user"):
+            await self.orders.find_many_by_ids_for_user(self.buyer_id, self.order_ids[:10])
+        if order is None:
+            raise RuntimeError("시드한 주문을 찾을 수 없습니다.")
+        with label("SQLOrderRepository.save[update]"):
+            order.cancel()
+            await self.orders.save(order)
+
+        with label("SQLOrderSummaryRepository.find_by_user_id"):
+            await self.summaries.find_by_user_id(self.buyer_id, skip=0, limit=10)
+        with label("SQLOrderSummaryRepository.update_status"):
+            await self.summaries.update_status(self.order_ids[0], OrderStatus.CANCELLED, order.updated_at)
+        with label("SQLOrderRepository.expire_pending"):
+            await self.orders.expire_pending(self.order_ids[1:10], datetime.now())
+        with label("SQLOrderSummaryRepository.update_status_many"):
+            await self.summaries.update_status_many(self.order_ids[1:10], OrderStatus.EXPIRED, datetime.now())
+
+    async def _exercise_carts(self) -> None:
+        label = self.recorder.label
+        with label("SQLCartRepository.get_by_user_and_product"):
+            await self.carts.get_by_user_and_product(self.buyer_id, self.cart_item.product_id)
+        with label("SQLCartRepository.get_all_by_user_id"):
+            await self.carts.get_all_by_user_id(self.buyer_id)
+        with label("SQLCartRepository.save[update]"):
+            self.cart_item.update_quantity(2)
+            await self.carts.save(self.cart_item)
+        # 삭제는 flush 시점에 실행되므로 라벨 안에서 flush
+        with label("SQLCartRepository.delete"):
+            await self.carts.delete(self.cart_item)
+            await self.session.flush()
+        with label("SQLCartRepository.delete_by_user_and_product"):
+            await self.carts.delete_by_user_and_product(self.buyer_id, self.product_ids[0])
+            await self.session.flush()
+        with label("SQLCartRepository.delete_product_for_users"):
+            await self.carts.delete_product_for_users(self.product_ids[3], [self.buyer_id])
+            await self.session.flush()
+        with label("SQLCartRepository.delete_items_by_user_id"):
+            await self.carts.delete_items_by_user_id(self.buyer_id, self.product_ids[1:3])
+            await self.session.flush()
+        with label("SQLCartRepository.delete_all_by_user_id"):
+            await self.carts.delete_all_by_user_id(self.buyer_id)
+            await self.session.flush()
+
+    async def _exercise_refresh_tokens(self) -> None:
+        label = self.recorder.label
+        token_hash = f"{0:032x}{0:032x}"
+        with label("SQLRefreshTokenRepository.get_by_hash"):
+            await self.refresh_tokens.get_by_hash(token_hash)
+        with label("SQLRefreshTokenRepository.revoke"):
+            await self.refresh_tokens.revoke(token_hash, datetime.now())
+        with label("SQLRefreshTokenRepository.revoke_family"):
+            await self.refresh_tokens.revoke_family(f"{0:032x}", datetime.now())
+
+    async def _exercise_reservations(self) -> None:
+        label = self.recorder.label
+        now = datetime.now() + timedelta(minutes=SEED_RESERVATION_TTL_MINUTES // 2)
+        with label("SQLStockReservationRepository.find_expired_order_ids"):
+            order_ids = await self.reservations.find_expired_order_ids(now, limit=10)
+        with label("SQLStockReservationRepository.find_expired_order_ids[skip_locked]"):
+            await self.reservations.find_expired_order_ids(now, limit=10, skip_locked=True)
+        with label("SQLStockReservationRepository.release_by_order_ids"):
+            await self.reservations.release_by_order_ids(order_ids, now)
+        with label("SQLStockReservationRepository.oldest_expired_at"):
+            await self.reservations.oldest_expired_at(now)
+
+    async def _exercise_outbox(self) -> None:
+        label = self.recorder.label
+        now = datetime.now()
+        with label("SQLOutboxRepository.claim_due"):
+            events = await self.outbox.claim_due(now, limit=10, lease_until=now + timedelta(minutes=1))
+        event_ids = [_require_id(event.id) for event in events]
+        with label("SQLOutboxRepository.mark_dispatched"):
+            await self.outbox.mark_dispatched(event_ids[1:], now)
+        with label("SQLOutboxRepository.reschedule_many"):
+            await self.outbox.reschedule_many({event_ids[0]: now + timedelta(seconds=1)}, "advisor")
+        with label("SQLOutboxRepository.oldest_pending_created_at"):
+            await self.outbox.oldest_pending_created_at()
+
+    async def _exercise_idempotency_keys(self) -> None:
+        label = self.recorder.label
+        key = "advisor-key"
+        with label("SQLIdempotencyRepository.get"):
+            await self.idempotency_keys.get(self.buyer_id, key)
+        with label("SQLIdempotencyRepository.claim"):
+            await self.idempotency_keys.claim(
+                IdempotencyRecord(
+                    user_id=self.buyer_id,
+                    key=key,
+                    operation="create_order",
+                    request_fingerprint="0" * 64,
+                    created_at=datetime.now(),
+                )
+            )
+        with label("SQLIdempotencyRepository.save_response"):
+            await self.idempotency_keys.save_response(self.buyer_id, key, "{}")
+
+
+def _require_id(entity_id: int | None) -> int:
+    if entity_id is None:
+        raise RuntimeError("저장된 엔티티에 ID가 없습니다.")
+    return entity_id
+
+
+async def collect_query_plans(database_url: str = "sqlite+aiosqlite:///:memory:") -> QueryPlanRecorder:
+    """빈 데이터베이스에 스키마를 만들고 워크로드를 실행하여 실행 계획을 수집합니다."""
+    engine = create_async_engine(database_url)
+    recorder = QueryPlanRecorder()
+    try:
+        async with engine.begin() as conn:
+            await conn.run_sync(SQLModel.metadata.create_all)
+
+        recorder.attach(engine)
+        async with AsyncSession(engine) as session:
+            await _RepositoryWorkload(session, recorder).run()
+        recorder.detach(engine)
+    finally:
+        await engine.dispose()
+    return recorder
+
+
+def format_report(recorder: QueryPlanRecorder) -> str:
+    """라벨별 실행 계획과 위반 항목을 사람이 읽기 쉬운 형태로 정리합니다."""
+    violations = recorder.violations()
+    lines: list[str] = []
+    reported: set[tuple[str, str]] = set()
+    for plan in recorder.plans:
+        # 같은 라벨에서 반복 실행된 동일 쿼리는 한 번만 출력
+        if (plan.label, plan.statement) in reported:
+            continue
+        reported.add((plan.label, plan.statement))
+
+        mark = "!!" if plan in violations else "ok"
+        lines.append(f"[{mark}] {plan.label}")
+        lines.extend(f"       {detail}" for detail in plan.details)
+
+    lines.append("")
+    lines.append(f"쿼리 {len(recorder.plans)}건, 위반 {len(violations)}건")
+    uncovered = recorder.uncovered_methods()
+    if uncovered:
+        lines.append(f"워크로드에서 호출되지 않은 메서드: {', '.join(uncovered)}")
+    return "\n".join(lines)
+
+
+async def main() -> int:
+    recorder = await collect_query_plans()
+    print(format_report(recorder))
+    return 1 if recorder.violations() or recorder.uncovered_methods() else 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
@@ -0,0 +1,48 @@
+from datetime import datetime
+
+from sqlalchemy import update
+from sqlmodel import col
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.core.metrics import instrumented
+from app.domain.model.refresh_token import RefreshToken
+from app.domain.ports.refresh_token_repository import IRefreshTokenRepository
+from app.infrastructure.persistence.models.refresh_token_entity import RefreshTokenEntity
+
+
+@instrumented("repository")
+class SQLRefreshTokenRepository(IRefreshTokenRepository):
+    """SQLModel 기반 리프레시 토큰 리포지토리 구현"""
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def save(self, token: RefreshToken) -> RefreshToken:
+        entity = RefreshTokenEntity.model_validate(token)
+        self.session.add(entity)
+        await self.session.flush()
+        return RefreshToken.model_validate(entity)
+
+    async def get_by_hash(self, token_hash: str) -> RefreshToken | None:
+        entity = await self.session.get(RefreshTokenEntity, token_hash)
+        if entity is None:
+            return None
+        return RefreshToken.model_validate(entity)
+
+    async def revoke(self, token_hash: str, revoked_at: datetime) -> bool:
+        # 조건부 UPDATE로 폐기하여 같은 토큰의 동시 회전 중 하나만 성공하도록 함
+        statement = (
+            update(RefreshTokenEntity)
+            .where(col(RefreshTokenEntity.token_hash) == token_hash, col(RefreshTokenEntity.revoked_at).is_(None))
+            .values(revoked_at=revoked_at)
+        )
+        result = await self.session.exec(statement)
+        return bool(result.rowcount)
+
+    async def revoke_family(self, family_id: str, revoked_at: datetime) -> None:
+        statement = (
+            update(RefreshTokenEntity)
+            .where(col(RefreshTokenEntity.family_id) == family_id, col(RefreshTokenEntity.revoked_at).is_(None))
+            .values(revoked_at=revoked_at)
+        )
+        await self.session.exec(statement)
@@ -1,11 +1,13 @@
 from sqlmodel import select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
+from app.core.metrics import instrumented
 from app.domain.model.seller import Seller
 from app.domain.ports.seller_repository import ISellerRepository
 from app.infrastructure.persistence.models.seller_entity import SellerEntity
 
 
+@instrumented("repository")
 class SQLSellerRepository(ISellerRepository):
     """SQLModel 기반 판매자 리포지토리 구현"""
 
@@ -0,0 +1,63 @@
+from collections.abc import Sequence
+from datetime import datetime
+
+from sqlalchemy import func, insert, update
+from sqlmodel import col, select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.core.metrics import instrumented
+from app.domain.model.reservation import StockReservation
+from app.domain.ports.stock_reservation_repository import IStockReservationRepository
+from app.infrastructure.persistence.models.reservation_entity import StockReservationEntity
+
+
+@instrumented("repository")
+class SQLStockReservationRepository(IStockReservationRepository):
+    """SQLModel 기반 재고 선점 리포지토리 구현"""
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def save_many(self, reservations: Sequence[StockReservation]) -> None:
+        if not reservations:
+            return
+        await self.session.exec(
+            insert(StockReservationEntity),
+            params=[reservation.model_dump(exclude={"id"}) for reservation in reservations],
+        )
+
+    async def find_expired_order_ids(self, now: datetime, limit: int, skip_locked: bool = False) -> list[int]:
+        # (released_at, expires_at) 인덱스 순서대로 읽어 정렬/그룹화 없이 범위 스캔으로 끝냄
+        # (주문 하나의 선점은 만료 시각이 같으므로 이어서 읽히며, 중복 주문 ID는 읽은 순서를 유지하며 제거)
+        statement = (
+            select(StockReservationEntity.order_id)
+            .where(col(StockReservationEntity.released_at).is_(None), col(StockReservationEntity.expires_at) <= now)
+            .order_by(col(StockReservationEntity.expires_at))
+            .limit(limit)
+        )
+        if skip_locked:
+            # 여러 만료 처리기가 동시에 실행되어도 서로 다른 선점을 나눠 처리하도록 잠긴 행은 건너뜀
+            statement = statement.with_for_update(skip_locked=True)
+        result = await self.session.exec(statement)
+        return list(dict.fromkeys(result.all()))
+
+    async def release_by_order_ids(self, order_ids: Sequence[int], released_at: datetime) -> list[StockReservation]:
+        if not order_ids:
+            return []
+        table = StockReservationEntity.__table__  # type: ignore[attr-defined]
+        # 조건부 UPDATE로 해제하여 주문 취소와 만료가 겹쳐도 같은 선점을 두 번 해제하지 않음
+        statement = (
+            update(table)
+            .where(table.c.order_id.in_(order_ids), table.c.released_at.is_(None))
+            .values(released_at=released_at)
+            .returning(*table.c)
+        )
+        result = await self.session.exec(statement)
+        return [StockReservation.model_validate(row._mapping) for row in result.all()]
+
+    async def oldest_expired_at(self, now: datetime) -> datetime | None:
+        statement = select(func.min(StockReservationEntity.expires_at)).where(
+            col(StockReservationEntity.released_at).is_(None), col(StockReservationEntity.expires_at) <= now
+        )
+        result = await self.session.exec(statement)
+        return result.one()
@@ -1,6 +1,12 @@
+import logging
+
 from sqlmodel.ext.asyncio.session import AsyncSession
 
-from app.domain.ports.unit_of_work import IUnitOfWork
+from app.core.db import UOW_DEPTH_KEY
+from app.core.tracing import tracer
+from app.domain.ports.unit_of_work import IUnitOfWork, OnCommitCallback
+
+logger = logging.getLogger(__name__)
 
 
 class SQLAlchemyUnitOfWork(IUnitOfWork):
@@ -8,11 +14,15 @@ class SQLAlchemyUnitOfWork(IUnitOfWork):
 
     def __init__(self, session: AsyncSession):
         self.session = session
+        self._on_commit: list[OnCommitCallback] = []
 
     async def __aenter__(self) -> "SQLAlchemyUnitOfWork":
+        # 작업 단위 진행 중에는 세션이 조회 후 커넥션을 반환하지 않도록 표시
+        self.session.info[UOW_DEPTH_KEY] = self.session.info.get(UOW_DEPTH_KEY, 0) + 1
         return self
 
     async def __aexit__(self, exc_type: type | None, exc_value: Exception | None, traceback: object | None) -> None:
+        self.session.info[UOW_DEPTH_KEY] -= 1
         if exc_type:
             await self.rollback()
         else:
@@ -29,7 +39,22 @@ class SQLAlchemyUnitOfWork(IUnitOfWork):
         # dependency-injector의 Resource로 관리되므로 여기서는 닫지 않음.
 
     async def commit(self) -> None:
-        await self.session.commit()
+        # 커밋에 실패하면(버전 충돌 등) 콜백을 버림. 재시도하는 유즈케이스는 콜백을 다시 등록함
+        callbacks, self._on_commit = self._on_commit, []
+        with tracer.start_span("uow.commit"):
+            await self.session.commit()
+
+        # 커밋은 이미 끝났으므로 콜백이 실패해도 요청을 실패시키지 않음
+        for callback in callbacks:
+            try:
+                await callback()
+            except Exception:
+                logger.exception("커밋 후 콜백 실행에 실패했습니다.")
 
     async def rollback(self) -> None:
-        await self.session.rollback()
+        self._on_commit.clear()
+        with tracer.start_span("uow.rollback"):
+            await self.session.rollback()
+
+    def on_commit(self, callback: OnCommitCallback) -> None:
+        self._on_commit.append(callback)
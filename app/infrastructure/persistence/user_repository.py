@@ -2,11 +2,13 @@ from sqlalchemy.orm import selectinload
 from sqlmodel import select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
+from app.core.metrics import instrumented
 from app.domain.model.user import User
 from app.domain.ports.user_repository import IUserRepository
 from app.infrastructure.persistence.models.user_entity import UserEntity
 
 
+@instrumented("repository")
 class SQLUserRepository(IUserRepository):
     """SQL 데이터베이스에 대한 사용자 리포지토리 구현체"""
 
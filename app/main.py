@@ -1,21 +1,50 @@
 from collections.abc import AsyncIterator
 from contextlib import asynccontextmanager
+from typing import cast
 
 from fastapi import FastAPI
 
 from app.containers import Container
 from app.core.config import get_settings
-from app.core.db import create_db_and_tables
+from app.core.db import create_db_and_tables, warn_if_lock_strategy_unsupported
 from app.core.exception_handlers import configure_exception_handlers
+from app.core.job_queue import configure_job_queue, job_queue
+from app.core.log import RequestLoggingMiddleware, configure_logging
+from app.core.loop_monitor import configure_loop_monitor, loop_monitor
+from app.core.metrics import MetricsMiddleware
+from app.core.tracing import TracingMiddleware, configure_tracing, tracer
+from app.core.types import AppWithContainer
 from app.infrastructure.api.routes import configure_routers
+from app.infrastructure.jobs.outbox_dispatcher import configure_outbox_dispatcher, outbox_dispatcher
+from app.infrastructure.jobs.reservation_sweeper import configure_reservation_sweeper, reservation_sweeper
+
+log_listener = configure_logging(get_settings())
+configure_tracing(get_settings())
+configure_loop_monitor(get_settings())
+configure_job_queue(get_settings())
+configure_reservation_sweeper(get_settings())
+configure_outbox_dispatcher(get_settings())
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncIterator[None]:
     # 시작 시 실행
+    log_listener.start()
+    warn_if_lock_strategy_unsupported()
     await create_db_and_tables()
+    loop_monitor.start()
+    await job_queue.start()
+    reservation_sweeper.start(cast(AppWithContainer, app).container.order_use_case)
+    outbox_dispatcher.start(cast(AppWithContainer, app).container.outbox_use_case)
     yield
-    # 종료 시 실행
+    # 종료 시 실행 (큐에 남은 스팬과 로그를 모두 출력)
+    await outbox_dispatcher.stop()
+    await reservation_sweeper.stop()
+    # 요청 처리 중 커밋 후 넣은 작업을 마저 실행 (끝내지 못한 작업은 저장소에 남음)
+    await job_queue.stop()
+    loop_monitor.stop()
+    tracer.force_flush()
+    log_listener.stop()
 
 
 def create_app() -> FastAPI:
@@ -29,6 +58,10 @@ def create_app() -> FastAPI:
     )
     app.container = container  # type: ignore
 
+    # 나중에 추가한 미들웨어가 바깥쪽에서 실행됨: 접근 로그가 루트 스팬 안에서 기록되도록 추적을 가장 바깥에 둠
+    app.add_middleware(MetricsMiddleware)
+    app.add_middleware(RequestLoggingMiddleware)
+    app.add_middleware(TracingMiddleware)
     configure_exception_handlers(app)
     configure_routers(app)
 
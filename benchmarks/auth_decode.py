@@ -0,0 +1,48 @@
+"""
+요청당 토큰 검증 비용 마이크로 벤치마크
+
+같은 액세스 토큰으로 반복 요청할 때 `decode_access_token`이 걸리는 시간을 비교합니다.
+
+- verify: 매번 서명 검증 + 페이로드 검증 (캐시를 비운 상태, 기존 방식)
+- cached: 검증된 토큰 캐시 적중
+
+실행: `python -m benchmarks.auth_decode [--iterations N]`
+"""
+
+import argparse
+import timeit
+from collections.abc import Callable
+
+from app.application.dto.token import TokenPayload
+from app.core.security import create_access_token, decode_access_token, jwt_keys, token_cache
+
+DEFAULT_ITERATIONS = 50_000
+MICROSECONDS_PER_SECOND = 1_000_000
+
+
+def measure(label: str, run: Callable[[], object], iterations: int) -> float:
+    elapsed = min(timeit.repeat(run, number=iterations, repeat=3))
+    per_request = elapsed / iterations * MICROSECONDS_PER_SECOND
+    print(f"{label:<8} {per_request:8.2f} µs/request")
+    return per_request
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--iterations", type=int, default=DEFAULT_ITERATIONS)
+    args = parser.parse_args()
+
+    token = create_access_token(TokenPayload(sub="bench@example.com"))
+    print(f"algorithm: {jwt_keys.algorithm}")
+
+    def verify() -> None:
+        token_cache.clear()
+        decode_access_token(token)
+
+    baseline = measure("verify", verify, args.iterations)
+    cached = measure("cached", lambda: decode_access_token(token), args.iterations)
+    print(f"speedup  {baseline / cached:8.2f}x")
+
+
+if __name__ == "__main__":
+    main()
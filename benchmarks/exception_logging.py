@@ -0,0 +1,85 @@
+"""
+이벤트 루프에서 예외 로그 한 건을 기록하는 비용 마이크로 벤치마크
+
+404 같은 예상된 예외를 기록할 때 호출한 쪽(이벤트 루프)에서 소비하는 시간을 비교합니다.
+출력은 /dev/null로 보내 터미널 출력 비용은 제외합니다.
+
+- sync: 트레이스백 포함 ERROR를 동기 StreamHandler로 출력 (기존 방식)
+- queued: 트레이스백 포함 ERROR를 백그라운드 큐 핸들러로 전달 (포맷팅/출력은 리스너 스레드)
+- sampled: 4xx 정책 적용 (트레이스백 없이 INFO, 샘플링되지 않으면 기록하지 않음)
+
+실행: `python -m benchmarks.exception_logging [--iterations N]`
+"""
+
+import argparse
+import logging
+import os
+import queue
+import timeit
+from collections.abc import Callable
+
+from app.core.log import BackgroundQueueHandler, JsonFormatter, LogSampler
+
+DEFAULT_ITERATIONS = 20_000
+DEFAULT_SAMPLE_RATE = 0.1
+MICROSECONDS_PER_SECOND = 1_000_000
+
+
+def measure(label: str, run: Callable[[], object], iterations: int) -> float:
+    elapsed = min(timeit.repeat(run, number=iterations, repeat=3))
+    per_request = elapsed / iterations * MICROSECONDS_PER_SECOND
+    print(f"{label:<8} {per_request:8.2f} µs/request")
+    return per_request
+
+
+def make_logger(name: str, handler: logging.Handler) -> logging.Logger:
+    logger = logging.getLogger(f"benchmarks.exception_logging.{name}")
+    logger.propagate = False
+    logger.setLevel(logging.INFO)
+    logger.addHandler(handler)
+    return logger
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--iterations", type=int, default=DEFAULT_ITERATIONS)
+    parser.add_argument("--sample-rate", type=float, default=DEFAULT_SAMPLE_RATE)
+    args = parser.parse_args()
+
+    with open(os.devnull, "w") as devnull:
+        stream = logging.StreamHandler(devnull)
+        stream.setFormatter(JsonFormatter())
+        sync_logger = make_logger("sync", stream)
+
+        # 리스너 없이 큐에 넣는 비용만 측정 (큐는 측정마다 비움)
+        log_queue: queue.Queue[logging.LogRecord] = queue.Queue()
+        queued_logger = make_logger("queued", BackgroundQueueHandler(log_queue))
+        sampler = LogSampler(args.sample_rate)
+
+        try:
+            raise ValueError("Product not found")
+        except ValueError as e:
+            exc = e
+
+        def sync() -> None:
+            sync_logger.error("Product not found", exc_info=exc)
+
+        def queued() -> None:
+            queued_logger.error("Product not found", exc_info=exc)
+            if log_queue.qsize() > DEFAULT_ITERATIONS:
+                log_queue.queue.clear()
+
+        def sampled() -> None:
+            if sampler.should_log():
+                queued_logger.info("Product not found", extra={"status_code": 404})
+            if log_queue.qsize() > DEFAULT_ITERATIONS:
+                log_queue.queue.clear()
+
+        baseline = measure("sync", sync, args.iterations)
+        measure("queued", queued, args.iterations)
+        policy = measure("sampled", sampled, args.iterations)
+        print(f"speedup  {baseline / policy:8.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,165 @@
+"""
+여러 상품을 담은 주문의 동시성 제어 방식(`LOCK_STRATEGY`)별 충돌 재시도 수/처리량 벤치마크
+
+무작위로 겹치는 장바구니(상품 여러 개, 무작위 순서)로 실제 `OrderUseCase.create_order`를 동시에 호출합니다.
+주문마다 별도의 세션/작업 단위를 사용하며, `retry_on_conflict`가 재시도한 횟수(`optimistic_lock_conflicts_total`)와
+재시도를 모두 소진했거나 다른 오류로 실패한 주문 수, 처리량을 방식별로 출력합니다.
+
+기본값은 임시 디렉터리의 파일 SQLite입니다. SQLite는 쓰기를 데이터베이스 단위 락으로 직렬화하고
+`FOR UPDATE`를 생략하므로 두 방식이 같은 SQL로 실행됩니다. 행 락 경합과 비관적 락의 효과는
+`--database-url`에 PostgreSQL(예: `postgresql+asyncpg://...`, 드라이버 별도 설치)을 지정해 측정합니다.
+지정한 DB의 테이블은 방식마다 삭제 후 다시 만듭니다.
+
+실행: `python -m benchmarks.lock_ordering [--orders N] [--concurrency C] [--products P] [--cart-size K]
+      [--database-url URL]`
+"""
+
+import argparse
+import asyncio
+import random
+import tempfile
+import time
+from collections import Counter
+from pathlib import Path
+from typing import Literal
+
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from sqlmodel import SQLModel
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+import app.main  # noqa: F401  # 메타데이터에 모든 테이블 등록
+from app.application.dto.order_dto import OrderCreate, OrderItemCreate
+from app.application.use_cases.order_use_case import OrderUseCase
+from app.core.config import get_settings
+from app.core.metrics import optimistic_lock_conflicts_total
+from app.infrastructure.persistence.cart_repository import SQLCartRepository
+from app.infrastructure.persistence.idempotency_repository import SQLIdempotencyRepository
+from app.infrastructure.persistence.models.product_entity import ProductEntity
+from app.infrastructure.persistence.models.seller_entity import SellerEntity
+from app.infrastructure.persistence.models.user_entity import UserEntity
+from app.infrastructure.persistence.order_repository import SQLOrderRepository
+from app.infrastructure.persistence.order_summary_repository import SQLOrderSummaryRepository
+from app.infrastructure.persistence.outbox_repository import SQLOutboxRepository
+from app.infrastructure.persistence.product_repository import SQLProductRepository
+from app.infrastructure.persistence.stock_reservation_repository import SQLStockReservationRepository
+from app.infrastructure.persistence.unit_of_work import SQLAlchemyUnitOfWork
+
+DEFAULT_ORDERS = 500
+DEFAULT_CONCURRENCY = 16
+DEFAULT_PRODUCTS = 20
+DEFAULT_CART_SIZE = 3
+MODES: tuple[Literal["optimistic", "pessimistic"], ...] = ("optimistic", "pessimistic")
+CREATE_ORDER = "OrderUseCase.create_order"
+SELLER_ID = 1
+
+
+def _use_case(session: AsyncSession) -> OrderUseCase:
+    return OrderUseCase(
+        order_repository=SQLOrderRepository(session),
+        product_repository=SQLProductRepository(session),
+        cart_repository=SQLCartRepository(session),
+        order_summary_repository=SQLOrderSummaryRepository(session),
+        idempotency_repository=SQLIdempotencyRepository(session),
+        reservation_repository=SQLStockReservationRepository(session),
+        outbox_repository=SQLOutboxRepository(session),
+        uow=SQLAlchemyUnitOfWork(session),
+    )
+
+
+async def _reset(engine: AsyncEngine, args: argparse.Namespace) -> None:
+    """테이블을 다시 만들고 판매자 1명, 구매자 `concurrency`명, 상품 `products`개를 저장합니다."""
+    async with engine.begin() as conn:
+        await conn.run_sync(SQLModel.metadata.drop_all)
+        await conn.run_sync(SQLModel.metadata.create_all)
+        await conn.execute(
+            insert(UserEntity),
+            [
+                {"id": user_id, "email": f"bench{user_id}@example.com", "hashed_password": "-"}
+                for user_id in range(1, args.concurrency + 2)
+            ],
+        )
+        await conn.execute(insert(SellerEntity), [{"id": SELLER_ID, "user_id": 1, "store_name": "bench"}])
+        await conn.execute(
+            insert(ProductEntity),
+            [
+                {
+                    "id": product_id,
+                    "name": f"상품 {product_id}",
+                    "price": 1000,
+                    "stock": args.orders * args.cart_size,
+                    "seller_id": SELLER_ID,
+                }
+                for product_id in range(1, args.products + 1)
+            ],
+        )
+
+
+async def measure(engine: AsyncEngine, carts: list[list[int]], concurrency: int) -> tuple[float, Counter[str]]:
+    """구매자 `concurrency`명이 장바구니를 나눠 주문하고, 처리량과 결과별 주문 수를 반환합니다."""
+    pending = iter(carts)
+    outcomes: Counter[str] = Counter()
+
+    async def buyer(user_id: int) -> None:
+        for cart in pending:
+            async with AsyncSession(engine, expire_on_commit=False) as session:
+                order_create = OrderCreate(items=[OrderItemCreate(product_id=pid, quantity=1) for pid in cart])
+                try:
+                    await _use_case(session).create_order(user_id, order_create)
+                    outcomes["ok"] += 1
+                except Exception as e:
+                    outcomes[type(e).__name__] += 1
+
+    started_at = time.perf_counter()
+    await asyncio.gather(*(buyer(user_id) for user_id in range(2, concurrency + 2)))
+    return len(carts) / (time.perf_counter() - started_at), outcomes
+
+
+async def run(args: argparse.Namespace) -> None:
+    with tempfile.TemporaryDirectory() as directory:
+        url = args.database_url or f"sqlite+aiosqlite:///{Path(directory) / 'lock_ordering.db'}"
+        # SQLite 외의 DB는 구매자마다 연결을 하나씩 쓸 수 있도록 풀 크기를 맞춤
+        pool_options = {} if url.startswith("sqlite") else {"pool_size": args.concurrency}
+        engine = create_async_engine(url, **pool_options)
+        print(
+            f"database: {engine.dialect.name}, orders: {args.orders}, concurrency: {args.concurrency}, "
+            f"products: {args.products}, cart size: {args.cart_size}"
+        )
+        rng = random.Random(0)
+        carts = [rng.sample(range(1, args.products + 1), args.cart_size) for _ in range(args.orders)]
+        settings = get_settings()
+        original_strategy = settings.lock_strategy
+        try:
+            for mode in MODES:
+                settings.lock_strategy = mode
+                await _reset(engine, args)
+                conflicts_before = optimistic_lock_conflicts_total.value(CREATE_ORDER)
+                throughput, outcomes = await measure(engine, carts, args.concurrency)
+                retries = optimistic_lock_conflicts_total.value(CREATE_ORDER) - conflicts_before
+                failed = ", ".join(f"{name} {count}" for name, count in outcomes.items() if name != "ok") or "-"
+                print(
+                    f"{mode:<12} {throughput:10.1f} orders/s  ok {outcomes['ok']:6}  "
+                    f"conflict retries {retries:6.0f}  failed: {failed}"
+                )
+        finally:
+            settings.lock_strategy = original_strategy
+            await engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--orders", type=int, default=DEFAULT_ORDERS)
+    parser.add_argument("--concurrency", type=int, default=DEFAULT_CONCURRENCY)
+    parser.add_argument("--products", type=int, default=DEFAULT_PRODUCTS)
+    parser.add_argument("--cart-size", type=int, default=DEFAULT_CART_SIZE)
+    parser.add_argument(
+        "--database-url",
+        default=None,
+        help="측정할 DB URL (기본값: 임시 파일 SQLite). 행 락 경합은 PostgreSQL 등에서만 재현됨",
+    )
+    args = parser.parse_args()
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,191 @@
+"""
+재고 샤드 수에 따른 인기 상품 동시 차감 처리량 벤치마크
+
+상품 하나에 주문이 몰리는 상황에서, 주문 유스케이스와 같은 리포지토리 경로(`get_many_by_ids` → `decrease_stock` →
+`update`)로 재고를 1개씩 동시에 차감합니다. 샤드 상품의 `update`는 임의 샤드 하나에 조건부 UPDATE를 시도하고,
+수량이 모자라면 `_lock_shards`로 샤드를 잠가 여러 샤드에서 나눠 차감합니다(`_apply_shard_delta`).
+샤드 수(K)별로 처리량, 나눠 차감한 횟수(fallbacks), 충돌 등으로 실패한 차감 수를 출력합니다.
+`--hold-ms`는 차감 후 커밋 전까지 트랜잭션을 유지하는 시간(주문 저장 등 나머지 작업)을 흉내 냅니다.
+
+기본값은 임시 디렉터리의 파일 SQLite입니다. SQLite는 쓰기 트랜잭션을 한 번에 하나만 허용하므로 K를 늘려도
+처리량이 거의 변하지 않으며, 샤드 행 락의 효과는 `--database-url`에 PostgreSQL 등을 지정해 측정합니다.
+지정한 DB의 테이블은 K마다 삭제 후 다시 만듭니다.
+
+마지막 표는 DB 없이 샤드마다 asyncio 락 하나를 두고 같은 시간 동안 잡는 모델로 계산한 이론적 상한입니다.
+실제 DB 결과가 아니며, 행 락 외의 비용이 없을 때 K에 비례해 늘어나는 처리량의 기준선으로만 사용합니다.
+
+실행: `python -m benchmarks.stock_shard_contention [--orders N] [--concurrency C] [--hold-ms MS]
+      [--database-url URL]`
+"""
+
+import argparse
+import asyncio
+import random
+import tempfile
+import time
+from collections import Counter
+from collections.abc import Sequence
+from pathlib import Path
+
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from sqlmodel import SQLModel
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+import app.main  # noqa: F401  # 메타데이터에 모든 테이블 등록
+from app.infrastructure.persistence.models.product_entity import ProductEntity
+from app.infrastructure.persistence.product_repository import (
+    SQLProductRepository,
+    distribute_evenly,
+    plan_shard_takes,
+)
+
+DEFAULT_ORDERS = 1000
+DEFAULT_CONCURRENCY = 32
+DEFAULT_HOLD_MS = 2.0
+SHARD_COUNTS = (1, 2, 4, 8, 16)
+ORDER_QUANTITY = 1
+MILLISECONDS_PER_SECOND = 1000
+PRODUCT_ID = 1
+SELLER_ID = 1
+
+
+class CountingProductRepository(SQLProductRepository):
+    """여러 샤드에서 나눠 차감한 횟수(샤드 잠금 조회 수)를 세는 리포지토리"""
+
+    fallbacks = 0
+
+    async def _lock_shards(self, product_id: int) -> Sequence[tuple[int, int]]:
+        CountingProductRepository.fallbacks += 1
+        return await super()._lock_shards(product_id)
+
+
+async def _reset(engine: AsyncEngine, stock: int, shard_count: int) -> None:
+    """테이블을 다시 만들고 재고 `stock`개를 `shard_count`개 샤드에 나눈 상품을 저장합니다."""
+    async with engine.begin() as conn:
+        await conn.run_sync(SQLModel.metadata.drop_all)
+        await conn.run_sync(SQLModel.metadata.create_all)
+        await conn.execute(
+            insert(ProductEntity),
+            [{"id": PRODUCT_ID, "name": "인기 상품", "price": 1000, "stock": stock, "seller_id": SELLER_ID}],
+        )
+    async with AsyncSession(engine) as session:
+        await SQLProductRepository(session).configure_stock_shards(PRODUCT_ID, shard_count)
+        await session.commit()
+
+
+async def measure(
+    engine: AsyncEngine, orders: int, concurrency: int, hold_seconds: float
+) -> tuple[float, Counter[str]]:
+    """구매자 `concurrency`명이 `orders`번 차감하고, 처리량과 결과별 차감 수를 반환합니다."""
+    pending = iter(range(orders))
+    outcomes: Counter[str] = Counter()
+
+    async def buyer() -> None:
+        for _ in pending:
+            async with AsyncSession(engine, expire_on_commit=False) as session:
+                repository = CountingProductRepository(session)
+                try:
+                    [product] = await repository.get_many_by_ids([PRODUCT_ID])
+                    product.decrease_stock(ORDER_QUANTITY)
+                    await repository.update(product)
+                    await asyncio.sleep(hold_seconds)
+                    await session.commit()
+                    outcomes["ok"] += 1
+                except Exception as e:
+                    outcomes[type(e).__name__] += 1
+
+    started_at = time.perf_counter()
+    await asyncio.gather(*(buyer() for _ in range(concurrency)))
+    return orders / (time.perf_counter() - started_at), outcomes
+
+
+class ShardedStock:
+    """이론적 상한 모델: 샤드별 수량과 행 락 (DB 없이 asyncio 락으로 행 락만 흉내 냄)"""
+
+    def __init__(self, total: int, shard_count: int, hold_seconds: float):
+        self.quantities = distribute_evenly(total, shard_count)
+        self.locks = [asyncio.Lock() for _ in range(shard_count)]
+        self.hold_seconds = hold_seconds
+
+    async def _take(self, index: int, quantity: int) -> bool:
+        # 조건부 UPDATE: 행 락을 잡고 트랜잭션이 끝날 때까지 유지
+        async with self.locks[index]:
+            await asyncio.sleep(self.hold_seconds)
+            if self.quantities[index] < quantity:
+                return False
+            self.quantities[index] -= quantity
+            return True
+
+    async def decrease(self, quantity: int) -> bool:
+        if await self._take(random.randrange(len(self.quantities)), quantity):
+            return True
+        takes = plan_shard_takes(self.quantities, quantity, start=random.randrange(len(self.quantities)))
+        if takes is None:
+            return False
+        return all([await self._take(index, take) for index, take in takes.items()])
+
+
+async def model_upper_bound(shard_count: int, orders: int, concurrency: int, hold_seconds: float) -> float:
+    stock = ShardedStock(orders * ORDER_QUANTITY, shard_count, hold_seconds)
+    pending = iter(range(orders))
+
+    async def buyer() -> None:
+        for _ in pending:
+            await stock.decrease(ORDER_QUANTITY)
+
+    started_at = time.perf_counter()
+    await asyncio.gather(*(buyer() for _ in range(concurrency)))
+    return orders / (time.perf_counter() - started_at)
+
+
+async def run(args: argparse.Namespace) -> None:
+    hold_seconds = args.hold_ms / MILLISECONDS_PER_SECOND
+    with tempfile.TemporaryDirectory() as directory:
+        url = args.database_url or f"sqlite+aiosqlite:///{Path(directory) / 'stock_shards.db'}"
+        # 행 락을 기다리는 구매자가 연결 풀에서 막히지 않도록 동시 구매자 수만큼 연결을 허용 (SQLite 제외)
+        pool_options = {} if url.startswith("sqlite") else {"pool_size": args.concurrency}
+        engine = create_async_engine(url, **pool_options)
+        print(
+            f"database: {engine.dialect.name}, orders: {args.orders}, concurrency: {args.concurrency}, "
+            f"hold: {args.hold_ms}ms"
+        )
+        try:
+            baseline = 0.0
+            for shard_count in SHARD_COUNTS:
+                await _reset(engine, args.orders * ORDER_QUANTITY, shard_count)
+                CountingProductRepository.fallbacks = 0
+                throughput, outcomes = await measure(engine, args.orders, args.concurrency, hold_seconds)
+                baseline = baseline or throughput
+                failed = ", ".join(f"{name} {count}" for name, count in outcomes.items() if name != "ok") or "-"
+                print(
+                    f"K={shard_count:<3} {throughput:10.1f} orders/s  speedup {throughput / baseline:6.2f}x  "
+                    f"ok {outcomes['ok']:6}  fallbacks {CountingProductRepository.fallbacks:6}  failed: {failed}"
+                )
+        finally:
+            await engine.dispose()
+
+    print("theoretical upper bound (row lock model, no database)")
+    baseline = 0.0
+    for shard_count in SHARD_COUNTS:
+        throughput = await model_upper_bound(shard_count, args.orders, args.concurrency, hold_seconds)
+        baseline = baseline or throughput
+        print(f"K={shard_count:<3} {throughput:10.1f} orders/s  speedup {throughput / baseline:6.2f}x")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--orders", type=int, default=DEFAULT_ORDERS)
+    parser.add_argument("--concurrency", type=int, default=DEFAULT_CONCURRENCY)
+    parser.add_argument("--hold-ms", type=float, default=DEFAULT_HOLD_MS)
+    parser.add_argument(
+        "--database-url",
+        default=None,
+        help="측정할 DB URL (기본값: 임시 파일 SQLite). 샤드 행 락의 효과는 PostgreSQL 등에서만 재현됨",
+    )
+    args = parser.parse_args()
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""
+로그인 대비 토큰 재발급 비용 마이크로 벤치마크
+
+액세스 토큰이 만료됐을 때 클라이언트가 다시 로그인하는 경우(bcrypt 검증 + 사용자 조회)와
+리프레시 토큰으로 재발급받는 경우(토큰 조회/회전 + 사용자 조회)의 요청당 시간을 비교합니다.
+인메모리 SQLite를 사용하므로 DB 왕복 비용은 실제보다 작게 측정됩니다.
+
+실행: `python -m benchmarks.token_refresh [--iterations N]`
+"""
+
+import argparse
+import asyncio
+import time
+
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlmodel import SQLModel
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+import app.main  # noqa: F401  # 메타데이터에 모든 테이블 등록
+from app.application.dto.user_dto import UserCreate
+from app.application.use_cases.user_use_case import UserUseCase
+from app.infrastructure.persistence.refresh_token_repository import SQLRefreshTokenRepository
+from app.infrastructure.persistence.unit_of_work import SQLAlchemyUnitOfWork
+from app.infrastructure.persistence.user_repository import SQLUserRepository
+
+DEFAULT_ITERATIONS = 20
+BENCH_EMAIL = "bench@example.com"
+BENCH_PASSWORD = "benchpassword"
+MILLISECONDS_PER_SECOND = 1000
+
+
+async def run(iterations: int) -> None:
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.run_sync(SQLModel.metadata.create_all)
+
+    async with AsyncSession(engine) as session:
+        use_case = UserUseCase(
+            user_repository=SQLUserRepository(session),
+            refresh_token_repository=SQLRefreshTokenRepository(session),
+            uow=SQLAlchemyUnitOfWork(session),
+        )
+        await use_case.create_user(UserCreate(email=BENCH_EMAIL, password=BENCH_PASSWORD, full_name="Bench User"))
+
+        started = time.perf_counter()
+        for _ in range(iterations):
+            token = await use_case.login_user(BENCH_EMAIL, BENCH_PASSWORD)
+        login_ms = (time.perf_counter() - started) / iterations * MILLISECONDS_PER_SECOND
+
+        started = time.perf_counter()
+        for _ in range(iterations):
+            token = await use_case.refresh_access_token(token.refresh_token)
+        refresh_ms = (time.perf_counter() - started) / iterations * MILLISECONDS_PER_SECOND
+
+    await engine.dispose()
+    print(f"login    {login_ms:8.2f} ms/request")
+    print(f"refresh  {refresh_ms:8.2f} ms/request")
+    print(f"speedup  {login_ms / refresh_ms:8.2f}x")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--iterations", type=int, default=DEFAULT_ITERATIONS)
+    args = parser.parse_args()
+    asyncio.run(run(args.iterations))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,19 +1,37 @@
+import asyncio
 from collections.abc import AsyncGenerator, Generator
-from typing import cast
 
 import pytest
-from dependency_injector import providers
 from fastapi import FastAPI
 from fastapi.testclient import TestClient
 from sqlalchemy.ext.asyncio import create_async_engine
 from sqlmodel import SQLModel
 from sqlmodel.ext.asyncio.session import AsyncSession
 
-from app.core.db import get_session
-from app.core.types import AppWithContainer
+from app.core.db import connection_hold_metrics, create_routing_session, get_session, slow_query_log
+from app.core.loop_monitor import LoopBlock, loop_monitor
+from app.core.rate_limit import rate_limiter
+from app.core.tracing import instrument_engine
 from app.main import app
 
 
+def pytest_addoption(parser: pytest.Parser) -> None:
+    parser.addoption(
+        "--max-loop-block-ms",
+        type=float,
+        default=None,
+        help="이벤트 루프를 이 시간(ms) 이상 막는 호출이 있으면 해당 테스트를 실패시킴 (bcrypt 등 차단 호출 점검용)",
+    )
+
+
+def _format_loop_blocks(blocks: list[LoopBlock]) -> str:
+    lines = []
+    for block in blocks:
+        lines.append(f"- {block.route}: {block.duration * 1000:.1f}ms")
+        lines.extend(f"    {location}" for location in block.stack)
+    return "\n".join(lines)
+
+
 @pytest.fixture(scope="function")
 def test_app() -> FastAPI:
     """
@@ -23,32 +41,45 @@ def test_app() -> FastAPI:
 
 
 @pytest.fixture(scope="function")
-def client(test_app: FastAPI) -> Generator[TestClient]:
+def client(test_app: FastAPI, request: pytest.FixtureRequest) -> Generator[TestClient]:
     """
     테스트용 FastAPI 클라이언트를 생성합니다.
     각 테스트마다 새로운 인메모리 데이터베이스를 사용합니다.
     """
     # 테스트용 인메모리 데이터베이스 엔진 생성
     test_engine = create_async_engine("sqlite+aiosqlite:///:memory:", echo=False)
+    connection_hold_metrics.attach(test_engine)
+    slow_query_log.attach(test_engine)
+    instrument_engine(test_engine)
 
     async def override_get_session() -> AsyncGenerator[AsyncSession]:
         # 테이블 생성
         async with test_engine.begin() as conn:
             await conn.run_sync(SQLModel.metadata.create_all)
 
-        # 세션 제공
-        async with AsyncSession(test_engine) as session:
+        # 세션 제공 (운영과 동일하게 지연 커넥션 점유 세션 사용)
+        async with create_routing_session(test_engine) as session:
             yield session
 
     test_app.dependency_overrides[get_session] = override_get_session
 
-    # DI 컨테이너 오버라이드
-    if hasattr(test_app, "container"):
-        cast(AppWithContainer, test_app).container.db_session.override(providers.Resource(override_get_session))
+    # 요청 제한 버킷은 프로세스 전역이므로 테스트 간에 공유되지 않도록 초기화
+    asyncio.run(rate_limiter.reset())
+
+    # 이벤트 루프 차단, 느린 SQL 문 기록도 프로세스 전역이므로 초기화
+    loop_monitor.reset()
+    slow_query_log.reset()
+    max_loop_block_ms: float | None = request.config.getoption("--max-loop-block-ms")
+    if max_loop_block_ms is not None:
+        # 임계값을 조금만 넘는 차단도 놓치지 않도록 측정 간격을 임계값보다 충분히 짧게 설정
+        loop_monitor.threshold = max_loop_block_ms / 1000
+        loop_monitor.interval = loop_monitor.threshold / 4
 
     with TestClient(test_app) as test_client:
         yield test_client
 
-    if hasattr(test_app, "container"):
-        cast(AppWithContainer, test_app).container.db_session.reset_override()
     test_app.dependency_overrides.clear()
+
+    if max_loop_block_ms is not None and loop_monitor.blocks:
+        blocks = _format_loop_blocks(list(loop_monitor.blocks))
+        pytest.fail(f"이벤트 루프가 {max_loop_block_ms}ms 이상 차단되었습니다.\n{blocks}")
@@ -1,9 +1,12 @@
 from typing import Self
 
-from app.domain.ports.unit_of_work import IUnitOfWork
+from app.domain.ports.unit_of_work import IUnitOfWork, OnCommitCallback
 
 
 class FakeUnitOfWork(IUnitOfWork):
+    def __init__(self) -> None:
+        self.on_commit_callbacks: list[OnCommitCallback] = []
+
     async def __aenter__(self) -> Self:
         return self
 
@@ -15,3 +18,6 @@ class FakeUnitOfWork(IUnitOfWork):
 
     async def rollback(self) -> None:
         pass
+
+    def on_commit(self, callback: OnCommitCallback) -> None:
+        self.on_commit_callbacks.append(callback)
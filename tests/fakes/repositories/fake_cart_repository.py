@@ -1,3 +1,5 @@
+from collections.abc import Sequence
+
 from app.domain.model.cart import CartItem
 from app.domain.ports.cart_repository import ICartRepository
 
@@ -45,6 +47,10 @@ class FakeCartRepository(ICartRepository):
             if item_id is not None and item_id in self._data:
                 del self._data[item_id]
 
+    async def delete_product_for_users(self, product_id: int, user_ids: Sequence[int]) -> None:
+        for user_id in user_ids:
+            await self.delete_by_user_and_product(user_id, product_id)
+
     async def delete_all_by_user_id(self, user_id: int) -> None:
         items_to_delete = [item.id for item in self._data.values() if item.user_id == user_id]
         for item_id in items_to_delete:
@@ -1,4 +1,7 @@
-from app.domain.model.order import Order
+from collections.abc import Sequence
+from datetime import datetime
+
+from app.domain.model.order import Order, OrderStatus
 from app.domain.ports.order_repository import IOrderRepository
 
 
@@ -16,6 +19,9 @@ class FakeOrderRepository(IOrderRepository):
             self._data[order.id] = order
         return order
 
+    async def save_many(self, orders: Sequence[Order]) -> list[Order]:
+        return [await self.save(order) for order in orders]
+
     async def find_by_id(self, order_id: int) -> Order | None:
         return self._data.get(order_id)
 
@@ -24,5 +30,27 @@ class FakeOrderRepository(IOrderRepository):
         return orders[skip : skip + limit]
 
     async def find_by_user_id(self, user_id: int, skip: int, limit: int) -> list[Order]:
-        orders = [o for o in self._data.values() if o.user_id == user_id]
+        orders = sorted(
+            (o for o in self._data.values() if o.user_id == user_id),
+            key=lambda o: (o.created_at, o.id or 0),
+            reverse=True,
+        )
         return orders[skip : skip + limit]
+
+    async def find_many_by_ids_for_user(self, user_id: int, order_ids: Sequence[int]) -> list[Order]:
+        return [
+            order
+            for order_id in set(order_ids)
+            if (order := self._data.get(order_id)) is not None and order.user_id == user_id
+        ]
+
+    async def expire_pending(self, order_ids: Sequence[int], updated_at: datetime) -> list[int]:
+        expired = []
+        for order_id in order_ids:
+            order = self._data.get(order_id)
+            if order is not None and order.status == OrderStatus.PENDING:
+                order.status = OrderStatus.EXPIRED
+                order.updated_at = updated_at
+                order.version += 1
+                expired.append(order_id)
+        return expired
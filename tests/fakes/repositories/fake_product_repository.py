@@ -1,6 +1,7 @@
-from collections.abc import Sequence
+from collections.abc import Mapping, Sequence
 
-from app.domain.model.product import Product
+from app.domain.exceptions import DomainException
+from app.domain.model.product import InventoryAdjustment, Product
 from app.domain.ports.product_repository import IProductRepository
 
 
@@ -18,9 +19,49 @@ class FakeProductRepository(IProductRepository):
             self._data[product.id] = product
         return product
 
+    async def create_many(self, products: Sequence[Product]) -> list[Product]:
+        return [await self.create(product) for product in products]
+
     async def get_by_id(self, product_id: int) -> Product | None:
         return self._data.get(product_id)
 
+    async def get_many_by_ids(self, product_ids: Sequence[int]) -> list[Product]:
+        return [self._data[product_id] for product_id in set(product_ids) if product_id in self._data]
+
+    async def lock_many_by_ids(self, product_ids: Sequence[int]) -> list[Product]:
+        return [self._data[product_id] for product_id in sorted(set(product_ids)) if product_id in self._data]
+
+    async def apply_inventory_adjustments(
+        self, seller_id: int, adjustments: Sequence[InventoryAdjustment]
+    ) -> list[Product]:
+        applied = []
+        for adjustment in adjustments:
+            product = self._data.get(adjustment.product_id)
+            if product is None or product.seller_id != seller_id:
+                continue
+            if adjustment.expected_version is not None and product.version != adjustment.expected_version:
+                continue
+
+            updated = product.model_copy()
+            try:
+                updated.adjust_inventory(
+                    stock=adjustment.stock, stock_delta=adjustment.stock_delta, price=adjustment.price
+                )
+            except DomainException:
+                continue
+
+            updated.version += 1
+            self._data[adjustment.product_id] = updated
+            applied.append(updated)
+        return applied
+
+    async def restore_stock(self, quantities: Mapping[int, int]) -> None:
+        for product_id, quantity in quantities.items():
+            product = self._data.get(product_id)
+            if product is not None:
+                product.add_stock(quantity)
+                product.version += 1
+
     async def list(self, offset: int, limit: int, seller_id: int | None = None) -> Sequence[Product]:
         products = list(self._data.values())
         if seller_id is not None:
@@ -32,3 +73,17 @@ class FakeProductRepository(IProductRepository):
         if product.id is not None and product.id in self._data:
             self._data[product.id] = product
         return product
+
+    async def configure_stock_shards(self, product_id: int, shard_count: int) -> Product | None:
+        product = self._data.get(product_id)
+        if product is not None and product.stock_shards != shard_count:
+            product.stock_shards = shard_count
+            product.version += 1
+        return product
+
+    async def rebalance_stock_shards(self, product_id: int) -> Product | None:
+        product = self._data.get(product_id)
+        return product if product is not None and product.stock_shards else None
+
+    async def list_stock_sharded_ids(self) -> Sequence[int]:
+        return [product_id for product_id, product in self._data.items() if product.stock_shards]
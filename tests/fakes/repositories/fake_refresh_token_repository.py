@@ -0,0 +1,29 @@
+from datetime import datetime
+
+from app.domain.model.refresh_token import RefreshToken
+from app.domain.ports.refresh_token_repository import IRefreshTokenRepository
+
+
+class FakeRefreshTokenRepository(IRefreshTokenRepository):
+    def __init__(self) -> None:
+        self._data: dict[str, RefreshToken] = {}
+
+    async def save(self, token: RefreshToken) -> RefreshToken:
+        self._data[token.token_hash] = token.model_copy()
+        return token
+
+    async def get_by_hash(self, token_hash: str) -> RefreshToken | None:
+        token = self._data.get(token_hash)
+        return token.model_copy() if token else None
+
+    async def revoke(self, token_hash: str, revoked_at: datetime) -> bool:
+        token = self._data.get(token_hash)
+        if token is None or token.is_revoked:
+            return False
+        token.revoked_at = revoked_at
+        return True
+
+    async def revoke_family(self, family_id: str, revoked_at: datetime) -> None:
+        for token in self._data.values():
+            if token.family_id == family_id and not token.is_revoked:
+                token.revoked_at = revoked_at
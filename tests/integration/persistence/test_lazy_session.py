@@ -0,0 +1,133 @@
+from collections.abc import AsyncIterator
+from pathlib import Path
+
+import pytest
+import pytest_asyncio
+from fastapi import HTTPException
+from fastapi.security import HTTPAuthorizationCredentials
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from sqlmodel import SQLModel
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.application.use_cases.product_use_case import ProductUseCase
+from app.application.use_cases.user_use_case import UserUseCase
+from app.core.db import ConnectionHoldMetrics, create_routing_session, route_scope
+from app.core.exceptions import InvalidCredentialsException
+from app.core.security import get_current_user
+from app.domain.model.user import User
+from app.infrastructure.persistence.models.product_entity import ProductEntity
+from app.infrastructure.persistence.product_repository import SQLProductRepository
+from app.infrastructure.persistence.refresh_token_repository import SQLRefreshTokenRepository
+from app.infrastructure.persistence.unit_of_work import SQLAlchemyUnitOfWork
+from app.infrastructure.persistence.user_repository import SQLUserRepository
+
+TEST_PRODUCT_ID = 1
+TEST_SELLER_ID = 1
+TEST_ROUTE = "GET /api/v1/products/{product_id}"
+TEST_PRODUCT_STOCK = 10
+TEST_EMAIL = "login@example.com"
+TEST_PASSWORD = "password123"
+
+
+@pytest_asyncio.fixture
+async def engine(tmp_path: Path) -> AsyncIterator[AsyncEngine]:
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'lazy.db'}")
+    async with engine.begin() as conn:
+        await conn.run_sync(SQLModel.metadata.create_all)
+    async with AsyncSession(engine) as session:
+        session.add(
+            ProductEntity(
+                id=TEST_PRODUCT_ID, name="상품", price=1000, stock=TEST_PRODUCT_STOCK, seller_id=TEST_SELLER_ID
+            )
+        )
+        await session.commit()
+    yield engine
+    await engine.dispose()
+
+
+@pytest.fixture
+def metrics(engine: AsyncEngine) -> ConnectionHoldMetrics:
+    # 테이블 생성/시드 데이터 이후의 커넥션 점유만 집계
+    metrics = ConnectionHoldMetrics()
+    metrics.attach(engine)
+    return metrics
+
+
+def create_use_case(session: AsyncSession) -> ProductUseCase:
+    return ProductUseCase(product_repository=SQLProductRepository(session), uow=SQLAlchemyUnitOfWork(session))
+
+
+@pytest.mark.asyncio
+class TestLazySession:
+    """지연 커넥션 점유 세션 테스트"""
+
+    async def test_unauthenticated_request_does_not_checkout(
+        self, engine: AsyncEngine, metrics: ConnectionHoldMetrics
+    ) -> None:
+        """토큰 검증에 실패한 요청은 커넥션을 가져오지 않아야 함"""
+        async with create_routing_session(engine) as session:
+            credentials = HTTPAuthorizationCredentials(scheme="Bearer", credentials="invalid-token")
+            with pytest.raises(HTTPException):
+                await get_current_user(credentials=credentials, user_repository=SQLUserRepository(session))
+
+        assert metrics.snapshot() == {}
+
+    async def test_read_outside_unit_of_work_releases_connection(
+        self, engine: AsyncEngine, metrics: ConnectionHoldMetrics
+    ) -> None:
+        """UoW 밖의 조회는 결과를 읽은 직후 커넥션을 반환해야 함"""
+        async with create_routing_session(engine) as session:
+            with route_scope(TEST_ROUTE):
+                product = await create_use_case(session).get_product_by_id(TEST_PRODUCT_ID)
+
+            # 세션이 살아있는 동안에도 커넥션은 이미 반환된 상태
+            assert not session.in_transaction()
+            assert metrics.snapshot()[TEST_ROUTE].checkouts == 1
+
+        assert product.stock == TEST_PRODUCT_STOCK
+
+    async def test_unit_of_work_holds_connection_until_commit(
+        self, engine: AsyncEngine, metrics: ConnectionHoldMetrics
+    ) -> None:
+        """UoW 안의 조회는 커밋될 때까지 같은 커넥션(트랜잭션)을 유지해야 함"""
+        async with create_routing_session(engine) as session:
+            uow = SQLAlchemyUnitOfWork(session)
+            async with uow:
+                await SQLProductRepository(session).get_by_id(TEST_PRODUCT_ID)
+                assert session.in_transaction()
+
+            assert not session.in_transaction()
+
+        assert sum(stats.checkouts for stats in metrics.snapshot().values()) == 1
+
+    async def test_login_verifies_password_without_holding_connection(
+        self, engine: AsyncEngine, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """로그인은 커넥션을 반환한 뒤에 비밀번호를 검증하고, 실패한 로그인은 트랜잭션을 열지 않아야 함"""
+        user = User(email=TEST_EMAIL, hashed_password="-")
+        user.set_password(TEST_PASSWORD)
+        async with AsyncSession(engine) as session:
+            await SQLUserRepository(session).create(user)
+            await session.commit()
+
+        in_transaction_during_verify: list[bool] = []
+        verify_password = User.verify_password
+
+        async with create_routing_session(engine) as session:
+
+            def spy(self: User, password: str) -> bool:
+                in_transaction_during_verify.append(session.in_transaction())
+                return verify_password(self, password)
+
+            monkeypatch.setattr(User, "verify_password", spy)
+            use_case = UserUseCase(
+                user_repository=SQLUserRepository(session),
+                refresh_token_repository=SQLRefreshTokenRepository(session),
+                uow=SQLAlchemyUnitOfWork(session),
+            )
+            with pytest.raises(InvalidCredentialsException):
+                await use_case.login_user(TEST_EMAIL, "wrong-password")
+            token = await use_case.login_user(TEST_EMAIL, TEST_PASSWORD)
+
+        assert in_transaction_during_verify == [False, False]
+        assert token.refresh_token
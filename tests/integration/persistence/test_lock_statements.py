@@ -0,0 +1,75 @@
+from datetime import datetime
+from typing import Any, cast
+
+import pytest
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.sql import ClauseElement
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.core.config import get_settings
+from app.core.db import warn_if_lock_strategy_unsupported
+from app.infrastructure.persistence.product_repository import SQLProductRepository
+from app.infrastructure.persistence.stock_reservation_repository import SQLStockReservationRepository
+
+TEST_PRODUCT_IDS = [2, 1]
+TEST_LIMIT = 10
+POSTGRESQL = postgresql.dialect()  # type: ignore[no-untyped-call]
+SQLITE = sqlite.dialect()  # type: ignore[no-untyped-call]
+
+
+class _EmptyResult:
+    def all(self) -> list[Any]:
+        return []
+
+
+class RecordingSession:
+    """실행한 문장을 기록하고 빈 결과를 반환하는 세션 (DB 없이 방언별 SQL을 확인하기 위함)"""
+
+    def __init__(self) -> None:
+        self.statements: list[ClauseElement] = []
+
+    async def exec(self, statement: ClauseElement, **kwargs: Any) -> _EmptyResult:
+        self.statements.append(statement)
+        return _EmptyResult()
+
+
+def _compile(statement: ClauseElement, dialect: Any) -> str:
+    return str(statement.compile(dialect=dialect))
+
+
+@pytest.mark.asyncio
+async def test_lock_many_by_ids_locks_rows_on_postgresql() -> None:
+    """상품 잠금 조회는 PostgreSQL에서 FOR UPDATE로, SQLite에서는 잠금 절 없이 컴파일되어야 함"""
+    session = RecordingSession()
+    await SQLProductRepository(cast(AsyncSession, session)).lock_many_by_ids(TEST_PRODUCT_IDS)
+
+    [statement] = session.statements
+    assert _compile(statement, POSTGRESQL).endswith("FOR UPDATE")
+    assert "FOR UPDATE" not in _compile(statement, SQLITE)
+
+
+@pytest.mark.asyncio
+async def test_find_expired_order_ids_skips_locked_rows_on_postgresql() -> None:
+    """skip_locked 만료 선점 조회는 PostgreSQL에서 FOR UPDATE SKIP LOCKED로 컴파일되어야 함"""
+    session = RecordingSession()
+    repository = SQLStockReservationRepository(cast(AsyncSession, session))
+    await repository.find_expired_order_ids(datetime.now(), TEST_LIMIT, skip_locked=True)
+    await repository.find_expired_order_ids(datetime.now(), TEST_LIMIT)
+
+    locked, unlocked = session.statements
+    assert _compile(locked, POSTGRESQL).endswith("FOR UPDATE SKIP LOCKED")
+    assert "FOR UPDATE" not in _compile(locked, SQLITE)
+    assert "FOR UPDATE" not in _compile(unlocked, POSTGRESQL)
+
+
+@pytest.mark.parametrize(("lock_strategy", "warned"), [("pessimistic", True), ("optimistic", False)])
+def test_warns_pessimistic_lock_strategy_on_sqlite(
+    monkeypatch: pytest.MonkeyPatch, caplog: pytest.LogCaptureFixture, lock_strategy: str, warned: bool
+) -> None:
+    """SQLite에서 비관적 락 모드를 사용하면 행을 잠그지 못한다는 경고를 남겨야 함"""
+    monkeypatch.setattr(get_settings(), "lock_strategy", lock_strategy)
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+
+    assert warn_if_lock_strategy_unsupported(engine) is warned
+    assert ("LOCK_STRATEGY=pessimistic" in caplog.text) is warned
@@ -0,0 +1,77 @@
+from collections.abc import AsyncIterator
+from pathlib import Path
+
+import pytest
+import pytest_asyncio
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from sqlmodel import SQLModel
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.domain.model.product import InventoryAdjustment
+from app.infrastructure.persistence.models.product_entity import ProductEntity
+from app.infrastructure.persistence.product_repository import SQLProductRepository
+
+TEST_SHARDED_PRODUCT_ID = 1
+TEST_PLAIN_PRODUCT_ID = 2
+TEST_SELLER_ID = 1
+TEST_PRICE = 1000
+TEST_NEW_PRICE = 2000
+TEST_STOCK = 8
+TEST_SHARD_COUNT = 4
+# 첫 번째 시도(임의 샤드 한 곳)와 첫 샤드 차감 다음, 두 번째 샤드 차감 호출
+TEST_FAILING_SHARD_CALL = 3
+
+
+@pytest_asyncio.fixture
+async def engine(tmp_path: Path) -> AsyncIterator[AsyncEngine]:
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'shards.db'}")
+    async with engine.begin() as conn:
+        await conn.run_sync(SQLModel.metadata.create_all)
+    async with AsyncSession(engine) as session:
+        for product_id in (TEST_SHARDED_PRODUCT_ID, TEST_PLAIN_PRODUCT_ID):
+            session.add(
+                ProductEntity(id=product_id, name="상품", price=TEST_PRICE, stock=TEST_STOCK, seller_id=TEST_SELLER_ID)
+            )
+        await session.flush()
+        await SQLProductRepository(session).configure_stock_shards(TEST_SHARDED_PRODUCT_ID, TEST_SHARD_COUNT)
+        await session.commit()
+    yield engine
+    await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_failed_shard_adjustment_rolls_back_to_savepoint(
+    engine: AsyncEngine, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """샤드 반영 도중 실패한 항목은 상품 행과 샤드 변경이 함께 롤백되고, 배치의 다른 항목은 적용되어야 함"""
+    async with AsyncSession(engine) as session:
+        repository = SQLProductRepository(session)
+        change_shard = repository._change_shard
+        calls: list[int] = []
+
+        # 여러 샤드에서 나눠 차감하는 도중 두 번째 샤드 차감이 실패하도록 함 (조회 이후 다른 주문이 차감한 상황)
+        async def flaky_change_shard(product_id: int, shard_index: int, change: int) -> bool:
+            calls.append(shard_index)
+            return len(calls) != TEST_FAILING_SHARD_CALL and await change_shard(product_id, shard_index, change)
+
+        monkeypatch.setattr(repository, "_change_shard", flaky_change_shard)
+        applied = await repository.apply_inventory_adjustments(
+            TEST_SELLER_ID,
+            [
+                InventoryAdjustment(product_id=TEST_SHARDED_PRODUCT_ID, stock_delta=-5, price=TEST_NEW_PRICE),
+                InventoryAdjustment(product_id=TEST_PLAIN_PRODUCT_ID, price=TEST_NEW_PRICE),
+            ],
+        )
+        await session.commit()
+
+    async with AsyncSession(engine) as session:
+        repository = SQLProductRepository(session)
+        sharded = await repository.get_by_id(TEST_SHARDED_PRODUCT_ID)
+        plain = await repository.get_by_id(TEST_PLAIN_PRODUCT_ID)
+
+    assert len(calls) == TEST_FAILING_SHARD_CALL
+    assert [product.id for product in applied] == [TEST_PLAIN_PRODUCT_ID]
+    assert sharded is not None
+    assert (sharded.stock, sharded.price, sharded.version) == (TEST_STOCK, TEST_PRICE, 2)
+    assert plain is not None
+    assert plain.price == TEST_NEW_PRICE
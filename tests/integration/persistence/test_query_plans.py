@@ -0,0 +1,40 @@
+import asyncio
+
+import pytest
+
+from app.infrastructure.persistence.query_plan_advisor import (
+    QueryPlan,
+    QueryPlanRecorder,
+    collect_query_plans,
+    format_report,
+)
+
+
+@pytest.fixture(scope="module")
+def recorder() -> QueryPlanRecorder:
+    return asyncio.run(collect_query_plans())
+
+
+class TestQueryPlans:
+    """리포지토리 쿼리의 인덱스 사용 여부 점검 (새 쿼리가 인덱스 없이 추가되면 실패)"""
+
+    def test_no_full_scan_or_temp_sort(self, recorder: QueryPlanRecorder) -> None:
+        """허용 목록 외의 쿼리는 전체 스캔이나 임시 정렬 없이 인덱스를 사용해야 함"""
+        assert recorder.violations() == [], format_report(recorder)
+
+    def test_every_repository_method_is_exercised(self, recorder: QueryPlanRecorder) -> None:
+        """새 리포지토리 메서드는 점검 워크로드에 추가되어야 함"""
+        assert recorder.uncovered_methods() == []
+
+
+def test_query_plan_detects_full_scan_and_temp_sort() -> None:
+    """실행 계획에서 전체 스캔과 임시 정렬을 감지하는지 테스트"""
+    plan = QueryPlan(
+        label="SQLProductRepository.list[name]",
+        statement="SELECT * FROM product ORDER BY name",
+        details=["SCAN product", "USE TEMP B-TREE FOR ORDER BY"],
+    )
+
+    assert plan.full_scans == ["product"]
+    assert plan.uses_temp_sort
+    assert plan.method == "SQLProductRepository.list"
@@ -0,0 +1,90 @@
+from collections.abc import AsyncIterator
+from pathlib import Path
+
+import pytest
+import pytest_asyncio
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from sqlmodel import SQLModel
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.application.use_cases.product_use_case import ProductUseCase
+from app.core.db import ReadYourWritesTracker, create_routing_session, set_read_affinity
+from app.infrastructure.persistence.models.product_entity import ProductEntity
+from app.infrastructure.persistence.product_repository import SQLProductRepository
+from app.infrastructure.persistence.unit_of_work import SQLAlchemyUnitOfWork
+
+TEST_PRODUCT_ID = 1
+TEST_SELLER_ID = 1
+TEST_WINDOW_SECONDS = 60.0
+PRIMARY_NAME = "primary"
+REPLICA_NAME = "replica"
+
+
+async def create_engine_with_product(path: Path, name: str) -> AsyncEngine:
+    """파일 기반 SQLite 엔진을 만들고 같은 ID의 상품을 서로 다른 이름으로 저장합니다."""
+    engine = create_async_engine(f"sqlite+aiosqlite:///{path}")
+    async with engine.begin() as conn:
+        await conn.run_sync(SQLModel.metadata.create_all)
+    async with AsyncSession(engine) as session:
+        session.add(ProductEntity(id=TEST_PRODUCT_ID, name=name, price=1000, stock=10, seller_id=TEST_SELLER_ID))
+        await session.commit()
+    return engine
+
+
+@pytest_asyncio.fixture
+async def engines(tmp_path: Path) -> AsyncIterator[tuple[AsyncEngine, AsyncEngine]]:
+    # 복제가 일어나지 않는 두 파일을 사용하여, 읽은 값으로 어느 엔진에 라우팅됐는지 확인
+    writer = await create_engine_with_product(tmp_path / "primary.db", PRIMARY_NAME)
+    reader = await create_engine_with_product(tmp_path / "replica.db", REPLICA_NAME)
+    yield writer, reader
+    await writer.dispose()
+    await reader.dispose()
+
+
+def create_use_case(session: AsyncSession) -> ProductUseCase:
+    return ProductUseCase(product_repository=SQLProductRepository(session), uow=SQLAlchemyUnitOfWork(session))
+
+
+@pytest.mark.asyncio
+class TestReadReplicaRouting:
+    """읽기 복제본 라우팅 테스트"""
+
+    async def test_read_only_use_case_reads_from_replica(self, engines: tuple[AsyncEngine, AsyncEngine]) -> None:
+        """읽기 전용으로 표시된 유즈케이스는 복제본에서 읽어야 함"""
+        writer, reader = engines
+
+        async with create_routing_session(writer, [reader]) as session:
+            product = await create_use_case(session).get_product_by_id(TEST_PRODUCT_ID)
+
+        assert product.name == REPLICA_NAME
+
+    async def test_untagged_reads_go_to_writer(self, engines: tuple[AsyncEngine, AsyncEngine]) -> None:
+        """읽기 전용으로 표시되지 않은 조회는 쓰기 엔진에서 읽어야 함"""
+        writer, reader = engines
+
+        async with create_routing_session(writer, [reader]) as session:
+            product = await SQLProductRepository(session).get_by_id(TEST_PRODUCT_ID)
+
+        assert product is not None
+        assert product.name == PRIMARY_NAME
+
+    async def test_read_your_writes_after_commit(self, engines: tuple[AsyncEngine, AsyncEngine]) -> None:
+        """쓰기를 커밋한 사용자는 고정 시간 동안 쓰기 엔진에서 읽고, 다른 사용자는 복제본에서 읽어야 함"""
+        writer, reader = engines
+        tracker = ReadYourWritesTracker(TEST_WINDOW_SECONDS)
+
+        set_read_affinity("user:1")
+        async with create_routing_session(writer, [reader], tracker) as session:
+            repository = SQLProductRepository(session)
+            product = await repository.get_by_id(TEST_PRODUCT_ID)
+            assert product is not None
+            product.name = "updated"
+            await repository.update(product)
+            await session.commit()
+
+        async with create_routing_session(writer, [reader], tracker) as session:
+            assert (await create_use_case(session).get_product_by_id(TEST_PRODUCT_ID)).name == "updated"
+
+        set_read_affinity("user:2")
+        async with create_routing_session(writer, [reader], tracker) as session:
+            assert (await create_use_case(session).get_product_by_id(TEST_PRODUCT_ID)).name == REPLICA_NAME
@@ -0,0 +1,92 @@
+from collections.abc import AsyncIterator
+from pathlib import Path
+
+import pytest
+import pytest_asyncio
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from sqlmodel import SQLModel
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.infrastructure.persistence.models.product_entity import ProductEntity
+from app.infrastructure.persistence.unit_of_work import SQLAlchemyUnitOfWork
+
+TEST_PRODUCT_ID = 1
+TEST_SELLER_ID = 1
+
+
+@pytest_asyncio.fixture
+async def engine(tmp_path: Path) -> AsyncIterator[AsyncEngine]:
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'uow.db'}")
+    async with engine.begin() as conn:
+        await conn.run_sync(SQLModel.metadata.create_all)
+    yield engine
+    await engine.dispose()
+
+
+def _product() -> ProductEntity:
+    return ProductEntity(id=TEST_PRODUCT_ID, name="상품", price=1000, stock=1, seller_id=TEST_SELLER_ID)
+
+
+@pytest.mark.asyncio
+async def test_on_commit_runs_after_commit(engine: AsyncEngine) -> None:
+    """커밋 후 콜백은 커밋이 끝난 뒤 실행되어 다른 세션에서도 변경을 볼 수 있어야 함"""
+    seen: list[ProductEntity | None] = []
+
+    async def callback() -> None:
+        async with AsyncSession(engine) as other:
+            seen.append(await other.get(ProductEntity, TEST_PRODUCT_ID))
+
+    async with AsyncSession(engine) as session:
+        uow = SQLAlchemyUnitOfWork(session)
+        async with uow:
+            session.add(_product())
+            uow.on_commit(callback)
+            assert seen == []
+
+    assert len(seen) == 1
+    assert seen[0] is not None
+
+
+@pytest.mark.asyncio
+async def test_on_commit_is_discarded_on_rollback(engine: AsyncEngine) -> None:
+    """롤백된 작업 단위의 콜백은 실행되지 않고, 다음 커밋에도 남지 않아야 함"""
+    calls: list[str] = []
+
+    async def callback() -> None:
+        calls.append("called")
+
+    async with AsyncSession(engine) as session:
+        uow = SQLAlchemyUnitOfWork(session)
+        with pytest.raises(RuntimeError):
+            async with uow:
+                session.add(_product())
+                uow.on_commit(callback)
+                raise RuntimeError("실패")
+
+        async with uow:
+            pass
+
+    assert calls == []
+
+
+@pytest.mark.asyncio
+async def test_failing_callback_does_not_fail_commit(engine: AsyncEngine) -> None:
+    """콜백이 실패해도 커밋된 변경은 유지되고 나머지 콜백은 실행되어야 함"""
+    calls: list[str] = []
+
+    async def failing() -> None:
+        raise RuntimeError("콜백 실패")
+
+    async def callback() -> None:
+        calls.append("called")
+
+    async with AsyncSession(engine) as session:
+        uow = SQLAlchemyUnitOfWork(session)
+        async with uow:
+            session.add(_product())
+            uow.on_commit(failing)
+            uow.on_commit(callback)
+
+    async with AsyncSession(engine) as session:
+        assert await session.get(ProductEntity, TEST_PRODUCT_ID) is not None
+    assert calls == ["called"]
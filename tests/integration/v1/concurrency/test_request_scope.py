@@ -0,0 +1,127 @@
+import asyncio
+from collections.abc import AsyncGenerator, AsyncIterator
+from pathlib import Path
+from typing import cast
+
+import pytest
+import pytest_asyncio
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from sqlmodel import SQLModel
+from sqlmodel.ext.asyncio.session import AsyncSession
+from starlette import status
+
+from app.application.dto.product_dto import ProductRead
+from app.application.dto.response import BaseResponse
+from app.core.db import bind_request_session, create_routing_session, get_request_session, get_session
+from app.core.route_names import RouteName
+from app.core.types import AppWithContainer
+from app.infrastructure.persistence.models.product_entity import ProductEntity
+
+TEST_PRODUCT_COUNT = 20
+TEST_CONCURRENT_REQUESTS = 100
+TEST_SELLER_ID = 1
+# 요청들이 세션을 잡은 채로 겹치도록 세션 생성 직후 잠시 양보
+SESSION_HOLD_SECONDS = 0.01
+
+
+class SessionTracker:
+    """요청 스코프 세션의 생성/종료와 동시에 열린 세션 수를 기록합니다."""
+
+    def __init__(self) -> None:
+        self.opened: list[AsyncSession] = []
+        self.closed: list[AsyncSession] = []
+        self.active = 0
+        self.max_active = 0
+
+
+@pytest_asyncio.fixture
+async def engine(tmp_path: Path) -> AsyncIterator[AsyncEngine]:
+    # 인메모리 DB는 커넥션 하나를 공유하므로(StaticPool) 풀 누수를 확인할 수 있도록 파일 DB 사용
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'load.db'}")
+    async with engine.begin() as conn:
+        await conn.run_sync(SQLModel.metadata.create_all)
+    async with AsyncSession(engine) as session:
+        session.add_all(
+            ProductEntity(id=i, name=f"상품 {i}", price=1000, stock=10, seller_id=TEST_SELLER_ID)
+            for i in range(1, TEST_PRODUCT_COUNT + 1)
+        )
+        await session.commit()
+    yield engine
+    await engine.dispose()
+
+
+@pytest_asyncio.fixture
+async def tracked_client(test_app: FastAPI, engine: AsyncEngine) -> AsyncIterator[tuple[AsyncClient, SessionTracker]]:
+    tracker = SessionTracker()
+
+    async def override_get_session() -> AsyncGenerator[AsyncSession]:
+        async with create_routing_session(engine) as session:
+            tracker.opened.append(session)
+            tracker.active += 1
+            tracker.max_active = max(tracker.max_active, tracker.active)
+            await asyncio.sleep(SESSION_HOLD_SECONDS)
+            try:
+                yield session
+            finally:
+                tracker.active -= 1
+                tracker.closed.append(session)
+
+    test_app.dependency_overrides[get_session] = override_get_session
+    async with AsyncClient(transport=ASGITransport(app=test_app), base_url="http://test") as client:
+        yield client, tracker
+    test_app.dependency_overrides.clear()
+
+
+@pytest.mark.asyncio
+class TestRequestScope:
+    """요청 스코프 세션 테스트"""
+
+    async def test_concurrent_requests_do_not_share_session(
+        self, test_app: FastAPI, engine: AsyncEngine, tracked_client: tuple[AsyncClient, SessionTracker]
+    ) -> None:
+        """동시 요청은 각자 세션을 사용하고, 요청이 끝나면 세션과 커넥션이 모두 반환되어야 함"""
+        client, tracker = tracked_client
+        product_ids = [i % TEST_PRODUCT_COUNT + 1 for i in range(TEST_CONCURRENT_REQUESTS)]
+
+        responses = await asyncio.gather(
+            *(
+                client.get(test_app.url_path_for(RouteName.PRODUCTS_GET, product_id=product_id))
+                for product_id in product_ids
+            )
+        )
+
+        for product_id, response in zip(product_ids, responses, strict=True):
+            assert response.status_code == status.HTTP_200_OK
+            product = BaseResponse[ProductRead].model_validate(response.json()).result
+            assert product.name == f"상품 {product_id}"
+
+        # 요청마다 서로 다른 세션이 만들어지고 실제로 동시에 열려 있었어야 함
+        assert len({id(session) for session in tracker.opened}) == TEST_CONCURRENT_REQUESTS
+        assert tracker.max_active > 1
+        # 모든 세션이 닫히고 풀에서 빌려간 커넥션이 남아있지 않아야 함
+        assert len(tracker.closed) == TEST_CONCURRENT_REQUESTS
+        assert tracker.active == 0
+        assert engine.sync_engine.pool.checkedout() == 0  # type: ignore[attr-defined]
+
+    async def test_container_resolves_session_bound_to_current_task(
+        self, test_app: FastAPI, engine: AsyncEngine
+    ) -> None:
+        """컨테이너의 리포지토리/UoW는 현재 실행 흐름에 바인딩된 세션을 사용해야 함"""
+        container = cast(AppWithContainer, test_app).container
+
+        async def resolve(session: AsyncSession) -> tuple[AsyncSession, AsyncSession]:
+            with bind_request_session(session):
+                await asyncio.sleep(0)
+                return container.product_repository().session, container.uow().session
+
+        async with create_routing_session(engine) as first, create_routing_session(engine) as second:
+            results = await asyncio.gather(resolve(first), resolve(second))
+
+        assert list(results) == [(first, first), (second, second)]
+
+    async def test_session_outside_request_scope(self) -> None:
+        """요청 스코프 밖에서 세션을 요청하면 오류가 발생해야 함"""
+        with pytest.raises(RuntimeError):
+            get_request_session()
@@ -77,6 +77,7 @@ async def test_cancel_order_retry_success() -> None:
     mock_order_repo = AsyncMock()
     mock_product_repo = AsyncMock()
     mock_cart_repo = AsyncMock()
+    mock_order_summary_repo = AsyncMock()
     mock_uow = AsyncMock()
     mock_uow.__aenter__.return_value = None
     mock_uow.__aexit__.return_value = None
@@ -85,6 +86,10 @@ async def test_cancel_order_retry_success() -> None:
         order_repository=mock_order_repo,
         product_repository=mock_product_repo,
         cart_repository=mock_cart_repo,
+        order_summary_repository=mock_order_summary_repo,
+        idempotency_repository=AsyncMock(),
+        reservation_repository=AsyncMock(),
+        outbox_repository=AsyncMock(),
         uow=mock_uow,
     )
 
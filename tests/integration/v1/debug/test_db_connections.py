@@ -0,0 +1,51 @@
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from starlette import status
+
+from app.application.dto.debug_dto import ConnectionHoldStatsRead
+from app.application.dto.response import BaseResponse
+from app.core.db import connection_hold_metrics
+from app.core.route_names import RouteName
+from app.core.security import get_current_admin
+from app.domain.model.user import User, UserRole
+from tests.integration.v1.products.helpers import create_test_product
+from tests.integration.v1.users.helpers import create_test_user, login_and_get_token
+
+PRODUCT_GET_ROUTE = "GET /api/v1/products/{product_id}"
+
+
+def get_admin() -> User:
+    return User(id=1, email="admin@example.com", hashed_password="unused", role=UserRole.ADMIN)
+
+
+class TestDbConnectionStats:
+    """DB 커넥션 점유 통계 조회 테스트"""
+
+    def test_stats_grouped_by_route_template(self, test_app: FastAPI, client: TestClient) -> None:
+        """커넥션 점유 시간이 경로 템플릿 기준으로 집계되는지 테스트"""
+        product = create_test_product(test_app, client)
+        connection_hold_metrics.reset()
+        client.get(test_app.url_path_for(RouteName.PRODUCTS_GET, product_id=product.id))
+        test_app.dependency_overrides[get_current_admin] = get_admin
+
+        response = client.get(test_app.url_path_for(RouteName.DEBUG_DB_CONNECTIONS))
+
+        assert response.status_code == status.HTTP_200_OK
+        stats = {
+            item.route: item
+            for item in BaseResponse[list[ConnectionHoldStatsRead]].model_validate(response.json()).result
+        }
+        assert stats[PRODUCT_GET_ROUTE].checkouts >= 1
+        assert stats[PRODUCT_GET_ROUTE].max_ms <= stats[PRODUCT_GET_ROUTE].total_ms
+
+    def test_stats_forbidden_for_non_admin(self, test_app: FastAPI, client: TestClient) -> None:
+        """관리자가 아니면 통계를 조회할 수 없어야 함"""
+        create_test_user(test_app, client)
+        token = login_and_get_token(test_app, client)
+
+        response = client.get(
+            test_app.url_path_for(RouteName.DEBUG_DB_CONNECTIONS),
+            headers={"Authorization": f"Bearer {token}"},
+        )
+
+        assert response.status_code == status.HTTP_403_FORBIDDEN
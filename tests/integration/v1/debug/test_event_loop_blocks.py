@@ -0,0 +1,53 @@
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from starlette import status
+
+from app.application.dto.debug_dto import LoopBlockRead
+from app.application.dto.response import BaseResponse
+from app.core.loop_monitor import loop_monitor
+from app.core.route_names import RouteName
+from app.core.security import get_current_admin
+from app.domain.model.user import User, UserRole
+from tests.integration.v1.users.helpers import create_test_user, login_and_get_token
+
+TEST_INTERVAL = 0.01
+TEST_THRESHOLD = 0.02
+
+
+def get_admin() -> User:
+    return User(id=1, email="admin@example.com", hashed_password="unused", role=UserRole.ADMIN)
+
+
+class TestEventLoopBlocks:
+    """이벤트 루프 차단 기록 조회 테스트"""
+
+    def test_login_password_check_blocks_event_loop(
+        self, test_app: FastAPI, client: TestClient, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """로그인의 bcrypt 비밀번호 검증이 로그인 라우트의 차단으로 기록되어야 함"""
+        monkeypatch.setattr(loop_monitor, "interval", TEST_INTERVAL)
+        monkeypatch.setattr(loop_monitor, "threshold", TEST_THRESHOLD)
+        create_test_user(test_app, client)
+        login_and_get_token(test_app, client)
+        test_app.dependency_overrides[get_current_admin] = get_admin
+
+        response = client.get(test_app.url_path_for(RouteName.DEBUG_EVENT_LOOP_BLOCKS))
+
+        assert response.status_code == status.HTTP_200_OK
+        blocks = BaseResponse[list[LoopBlockRead]].model_validate(response.json()).result
+        login_blocks = [block for block in blocks if block.route == RouteName.USERS_LOGIN]
+        assert login_blocks
+        assert any("User.verify_password" in location for block in login_blocks for location in block.stack)
+
+    def test_blocks_forbidden_for_non_admin(self, test_app: FastAPI, client: TestClient) -> None:
+        """관리자가 아니면 차단 기록을 조회할 수 없어야 함"""
+        create_test_user(test_app, client)
+        token = login_and_get_token(test_app, client)
+
+        response = client.get(
+            test_app.url_path_for(RouteName.DEBUG_EVENT_LOOP_BLOCKS),
+            headers={"Authorization": f"Bearer {token}"},
+        )
+
+        assert response.status_code == status.HTTP_403_FORBIDDEN
@@ -0,0 +1,85 @@
+import re
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from starlette import status
+
+from app.application.dto.debug_dto import AsyncioTaskRead
+from app.application.dto.response import BaseResponse
+from app.core.profiler import SPEEDSCOPE_SCHEMA
+from app.core.route_names import RouteName
+from app.core.security import get_current_admin
+from app.domain.model.user import User, UserRole
+from tests.integration.v1.users.helpers import create_test_user, login_and_get_token
+
+TEST_SECONDS = "0.1"
+COLLAPSED_LINE = re.compile(r"^[^;]+(;.+)* \d+$")
+
+
+def get_admin() -> User:
+    return User(id=1, email="admin@example.com", hashed_password="unused", role=UserRole.ADMIN)
+
+
+class TestProfile:
+    """이벤트 루프 샘플링 프로파일 조회 테스트"""
+
+    def test_profile_collapsed(self, test_app: FastAPI, client: TestClient) -> None:
+        """기본 형식은 라우트별 collapsed 스택이어야 함"""
+        test_app.dependency_overrides[get_current_admin] = get_admin
+
+        response = client.get(test_app.url_path_for(RouteName.DEBUG_PROFILE), params={"seconds": TEST_SECONDS})
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.headers["content-type"].startswith("text/plain")
+        lines = response.text.splitlines()
+        assert lines
+        assert all(COLLAPSED_LINE.match(line) for line in lines)
+
+    def test_profile_speedscope(self, test_app: FastAPI, client: TestClient) -> None:
+        """speedscope 형식은 라우트마다 sampled 프로파일을 담아야 함"""
+        test_app.dependency_overrides[get_current_admin] = get_admin
+
+        response = client.get(
+            test_app.url_path_for(RouteName.DEBUG_PROFILE), params={"seconds": TEST_SECONDS, "format": "speedscope"}
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        document = response.json()
+        assert document["$schema"] == SPEEDSCOPE_SCHEMA
+        assert document["profiles"]
+        assert all(profile["type"] == "sampled" for profile in document["profiles"])
+
+    def test_profile_rejects_too_long_duration(self, test_app: FastAPI, client: TestClient) -> None:
+        """프로파일링 시간이 최대값을 넘으면 요청이 거부되어야 함"""
+        test_app.dependency_overrides[get_current_admin] = get_admin
+
+        response = client.get(test_app.url_path_for(RouteName.DEBUG_PROFILE), params={"seconds": "61"})
+
+        assert response.status_code == status.HTTP_422_UNPROCESSABLE_CONTENT
+
+    def test_profile_forbidden_for_non_admin(self, test_app: FastAPI, client: TestClient) -> None:
+        """관리자가 아니면 프로파일링할 수 없어야 함"""
+        create_test_user(test_app, client)
+        token = login_and_get_token(test_app, client)
+
+        response = client.get(
+            test_app.url_path_for(RouteName.DEBUG_PROFILE),
+            params={"seconds": TEST_SECONDS},
+            headers={"Authorization": f"Bearer {token}"},
+        )
+
+        assert response.status_code == status.HTTP_403_FORBIDDEN
+
+
+class TestAsyncioTasks:
+    """대기 중인 asyncio 태스크 조회 테스트"""
+
+    def test_asyncio_tasks(self, test_app: FastAPI, client: TestClient) -> None:
+        """대기 중인 태스크 목록을 반환해야 함"""
+        test_app.dependency_overrides[get_current_admin] = get_admin
+
+        response = client.get(test_app.url_path_for(RouteName.DEBUG_ASYNCIO))
+
+        assert response.status_code == status.HTTP_200_OK
+        tasks = BaseResponse[list[AsyncioTaskRead]].model_validate(response.json()).result
+        assert all(task.stack for task in tasks)
@@ -0,0 +1,65 @@
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from starlette import status
+
+from app.application.dto.debug_dto import SlowQueryRead
+from app.application.dto.response import BaseResponse
+from app.core.db import slow_query_log
+from app.core.route_names import RouteName
+from app.core.security import get_current_admin
+from app.domain.model.user import User, UserRole
+from tests.integration.v1.products.helpers import create_test_product
+from tests.integration.v1.users.helpers import create_test_user, login_and_get_token
+
+PRODUCT_LIST_CALLER = "SQLProductRepository.list"
+
+
+def get_admin() -> User:
+    return User(id=1, email="admin@example.com", hashed_password="unused", role=UserRole.ADMIN)
+
+
+class TestSlowQueries:
+    """느린 SQL 문 목록 조회 테스트"""
+
+    def test_slow_queries_include_caller_and_plan(
+        self, test_app: FastAPI, client: TestClient, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """느린 문장은 실행한 리포지토리 메서드, 파라미터 형태, 실행 계획과 함께 집계되어야 함"""
+        product = create_test_product(test_app, client)
+        # 모든 문장을 느린 문장으로 기록
+        monkeypatch.setattr(slow_query_log, "threshold", 0.0)
+        client.get(test_app.url_path_for(RouteName.PRODUCTS_LIST), params={"seller_id": product.seller_id})
+        test_app.dependency_overrides[get_current_admin] = get_admin
+
+        response = client.get(test_app.url_path_for(RouteName.DEBUG_SLOW_QUERIES))
+
+        assert response.status_code == status.HTTP_200_OK
+        queries = BaseResponse[list[SlowQueryRead]].model_validate(response.json()).result
+        [query] = [query for query in queries if PRODUCT_LIST_CALLER in query.callers]
+        assert query.statement.startswith("SELECT")
+        assert "seller_id = ?" in query.statement
+        assert query.parameter_shapes
+        assert query.plan
+
+    def test_fast_queries_are_not_recorded(self, test_app: FastAPI, client: TestClient) -> None:
+        """임계값보다 빠른 문장은 기록하지 않아야 함"""
+        create_test_product(test_app, client)
+        test_app.dependency_overrides[get_current_admin] = get_admin
+
+        response = client.get(test_app.url_path_for(RouteName.DEBUG_SLOW_QUERIES))
+
+        assert response.status_code == status.HTTP_200_OK
+        assert BaseResponse[list[SlowQueryRead]].model_validate(response.json()).result == []
+
+    def test_slow_queries_forbidden_for_non_admin(self, test_app: FastAPI, client: TestClient) -> None:
+        """관리자가 아니면 느린 SQL 문 목록을 조회할 수 없어야 함"""
+        create_test_user(test_app, client)
+        token = login_and_get_token(test_app, client)
+
+        response = client.get(
+            test_app.url_path_for(RouteName.DEBUG_SLOW_QUERIES),
+            headers={"Authorization": f"Bearer {token}"},
+        )
+
+        assert response.status_code == status.HTTP_403_FORBIDDEN
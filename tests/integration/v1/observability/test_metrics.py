@@ -0,0 +1,59 @@
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from starlette import status
+
+from app.core.metrics import MetricsRegistry, registry
+from app.core.route_names import RouteName
+from tests.integration.v1.users.helpers import create_test_user, login_and_get_token
+
+TEST_PRODUCT_ID_NONEXISTENT = 999
+
+
+class TestMetrics:
+    """메트릭 조회 테스트"""
+
+    def test_route_metrics_use_route_name(self, test_app: FastAPI, client: TestClient) -> None:
+        """요청 수와 처리 시간이 라우트 이름과 상태 코드별로 기록되어야 함"""
+        registry.reset()
+        client.get(test_app.url_path_for(RouteName.PRODUCTS_GET, product_id=TEST_PRODUCT_ID_NONEXISTENT))
+        client.get("/not-found")
+
+        response = client.get(test_app.url_path_for(RouteName.METRICS))
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.headers["content-type"] == MetricsRegistry.CONTENT_TYPE
+        assert f'http_requests_total{{route="{RouteName.PRODUCTS_GET}",method="GET",status="404"}} 1' in response.text
+        assert 'http_requests_total{route="unmatched",method="GET",status="404"} 1' in response.text
+        assert (
+            f'http_request_duration_seconds_count{{route="{RouteName.PRODUCTS_GET}",method="GET"}} 1' in response.text
+        )
+
+    def test_use_case_and_repository_metrics(self, test_app: FastAPI, client: TestClient) -> None:
+        """유즈케이스와 리포지토리 메서드 실행 시간이 기록되어야 함"""
+        registry.reset()
+        client.get(test_app.url_path_for(RouteName.PRODUCTS_GET, product_id=TEST_PRODUCT_ID_NONEXISTENT))
+
+        response = client.get(test_app.url_path_for(RouteName.METRICS))
+
+        assert (
+            'use_case_duration_seconds_count{use_case="ProductUseCase",method="get_product_by_id",outcome="error"} 1'
+            in response.text
+        )
+        assert (
+            'repository_duration_seconds_count{repository="SQLProductRepository",method="get_by_id",outcome="success"}'
+            in response.text
+        )
+
+    def test_runtime_metrics_exposed(self, test_app: FastAPI, client: TestClient) -> None:
+        """커넥션 점유 시간, 요청 제한, 토큰 캐시 적중 수가 노출되어야 함"""
+        create_test_user(test_app, client)
+        token = login_and_get_token(test_app, client)
+        client.get(
+            test_app.url_path_for(RouteName.USERS_GET_CURRENT_USER), headers={"Authorization": f"Bearer {token}"}
+        )
+
+        response = client.get(test_app.url_path_for(RouteName.METRICS))
+
+        assert 'db_connection_checkouts_total{route="POST /api/v1/users/login"}' in response.text
+        assert 'rate_limit_requests_total{rule="login:ip",decision="allowed"} 1' in response.text
+        assert 'cache_hits_total{cache="jwt_token"}' in response.text
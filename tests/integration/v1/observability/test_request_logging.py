@@ -0,0 +1,157 @@
+import logging
+import queue
+from collections.abc import Generator
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from starlette import status
+
+from app.application.use_cases.product_use_case import ProductUseCase
+from app.core.exception_handlers import client_error_sampler
+from app.core.log import BackgroundQueueHandler
+from app.core.route_names import RouteName
+from app.core.tracing import InMemorySpanExporter, SimpleSpanProcessor, tracer
+
+TEST_REQUEST_ID = "test-request-id"
+TEST_PRODUCT_ID_NONEXISTENT = 999
+TEST_ERROR_MESSAGE = "test unhandled error"
+NANOSECONDS_PER_SECOND = 1_000_000_000
+
+
+@pytest.fixture
+def exporter() -> Generator[InMemorySpanExporter]:
+    """테스트 동안 스팬을 메모리에 기록합니다."""
+    exporter = InMemorySpanExporter()
+    processor, sample_ratio = tracer.processor, tracer.sample_ratio
+    tracer.configure(SimpleSpanProcessor(exporter))
+    yield exporter
+    tracer.configure(processor, sample_ratio)
+
+
+@pytest.fixture
+def queued_records() -> Generator["queue.Queue[logging.LogRecord]"]:
+    """앱 로그가 실제 큐 핸들러에서 준비된(요청 ID, trace ID가 채워진) 레코드를 모읍니다."""
+    records: queue.Queue[logging.LogRecord] = queue.Queue()
+    handler = BackgroundQueueHandler(records)
+    app_logger = logging.getLogger("app")
+    level = app_logger.level
+    app_logger.addHandler(handler)
+    app_logger.setLevel(logging.INFO)
+    yield records
+    app_logger.removeHandler(handler)
+    app_logger.setLevel(level)
+
+
+def _drain(records: "queue.Queue[logging.LogRecord]", name: str) -> list[logging.LogRecord]:
+    drained = [records.get_nowait() for _ in range(records.qsize())]
+    return [record for record in drained if record.name == name]
+
+
+class TestRequestLogging:
+    """요청 로깅 테스트"""
+
+    def test_request_id_echoed(self, test_app: FastAPI, client: TestClient) -> None:
+        """클라이언트가 보낸 요청 ID를 응답 헤더로 돌려줘야 함"""
+        response = client.get(
+            test_app.url_path_for(RouteName.PRODUCTS_GET, product_id=TEST_PRODUCT_ID_NONEXISTENT),
+            headers={"X-Request-ID": TEST_REQUEST_ID},
+        )
+
+        assert response.headers["X-Request-ID"] == TEST_REQUEST_ID
+
+    def test_invalid_request_id_replaced(self, test_app: FastAPI, client: TestClient) -> None:
+        """허용되지 않는 문자가 포함된 요청 ID는 새로 생성해야 함"""
+        response = client.get(
+            test_app.url_path_for(RouteName.PRODUCTS_GET, product_id=TEST_PRODUCT_ID_NONEXISTENT),
+            headers={"X-Request-ID": "bad id"},
+        )
+
+        assert response.headers["X-Request-ID"] not in ("", "bad id")
+
+    def test_access_log_uses_route_template(
+        self, test_app: FastAPI, client: TestClient, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        """접근 로그에 상태 코드, 경로 템플릿, 처리 시간이 기록되어야 함"""
+        with caplog.at_level(logging.INFO, logger="app.access"):
+            client.get(
+                test_app.url_path_for(RouteName.PRODUCTS_GET, product_id=TEST_PRODUCT_ID_NONEXISTENT),
+                headers={"X-Request-ID": TEST_REQUEST_ID},
+            )
+
+        record = next(record for record in caplog.records if record.name == "app.access")
+        assert record.__dict__["status_code"] == status.HTTP_404_NOT_FOUND
+        assert record.__dict__["route"] == "/api/v1/products/{product_id}"
+        assert record.__dict__["duration_ms"] >= 0
+
+    def test_client_error_logged_without_traceback(
+        self,
+        test_app: FastAPI,
+        client: TestClient,
+        caplog: pytest.LogCaptureFixture,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """예상된 4xx 오류는 트레이스백 없이 INFO로 기록되어야 함"""
+        monkeypatch.setattr(client_error_sampler, "rate", 1.0)
+
+        with caplog.at_level(logging.INFO, logger="app.core.exception_handlers"):
+            client.get(test_app.url_path_for(RouteName.PRODUCTS_GET, product_id=TEST_PRODUCT_ID_NONEXISTENT))
+
+        records = [record for record in caplog.records if record.name == "app.core.exception_handlers"]
+        assert len(records) == 1
+        assert records[0].levelno == logging.INFO
+        assert records[0].exc_info is None
+
+    def test_client_error_not_logged_when_not_sampled(
+        self,
+        test_app: FastAPI,
+        client: TestClient,
+        caplog: pytest.LogCaptureFixture,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """샘플링되지 않은 4xx 오류는 기록하지 않아야 함"""
+        monkeypatch.setattr(client_error_sampler, "rate", 0.0)
+
+        with caplog.at_level(logging.INFO, logger="app.core.exception_handlers"):
+            client.get(test_app.url_path_for(RouteName.PRODUCTS_GET, product_id=TEST_PRODUCT_ID_NONEXISTENT))
+
+        assert not [record for record in caplog.records if record.name == "app.core.exception_handlers"]
+
+    def test_access_log_includes_root_span_trace_id(
+        self,
+        test_app: FastAPI,
+        client: TestClient,
+        exporter: InMemorySpanExporter,
+        queued_records: "queue.Queue[logging.LogRecord]",
+    ) -> None:
+        """접근 로그는 요청 루트 스팬 안에서 기록되어 루트 스팬의 trace ID를 포함해야 함"""
+        client.get(test_app.url_path_for(RouteName.PRODUCTS_GET, product_id=TEST_PRODUCT_ID_NONEXISTENT))
+
+        [root] = [span for span in exporter.spans if span.parent_span_id is None]
+        [record] = _drain(queued_records, "app.access")
+        assert record.__dict__["trace_id"] == root.context.trace_id
+        assert root.end_time_ns is not None
+        assert record.created <= root.end_time_ns / NANOSECONDS_PER_SECOND
+
+    def test_unhandled_error_log_includes_trace_id(
+        self,
+        test_app: FastAPI,
+        client: TestClient,
+        exporter: InMemorySpanExporter,
+        queued_records: "queue.Queue[logging.LogRecord]",
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """미들웨어 바깥의 500 핸들러가 남기는 오류 로그에도 요청의 trace ID가 포함되어야 함"""
+
+        async def fail(self: ProductUseCase, product_id: int) -> None:
+            raise RuntimeError(TEST_ERROR_MESSAGE)
+
+        monkeypatch.setattr(ProductUseCase, "get_product_by_id", fail)
+
+        with pytest.raises(RuntimeError, match=TEST_ERROR_MESSAGE):
+            client.get(test_app.url_path_for(RouteName.PRODUCTS_GET, product_id=TEST_PRODUCT_ID_NONEXISTENT))
+
+        [root] = [span for span in exporter.spans if span.parent_span_id is None]
+        [record] = _drain(queued_records, "app.core.exception_handlers")
+        assert record.levelno == logging.ERROR
+        assert record.__dict__["trace_id"] == root.context.trace_id
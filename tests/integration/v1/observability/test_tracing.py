@@ -0,0 +1,78 @@
+from collections.abc import Generator
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from starlette import status
+
+from app.core.route_names import RouteName
+from app.core.tracing import InMemorySpanExporter, SimpleSpanProcessor, SpanKind, tracer
+from tests.integration.v1.users.helpers import create_test_user, login_and_get_token
+
+TEST_TRACE_ID = "0af7651916cd43dd8448eb211c80319c"
+TEST_PARENT_SPAN_ID = "b7ad6b7169203331"
+
+
+@pytest.fixture
+def exporter() -> Generator[InMemorySpanExporter]:
+    """테스트 동안 스팬을 메모리에 기록합니다."""
+    exporter = InMemorySpanExporter()
+    processor, sample_ratio = tracer.processor, tracer.sample_ratio
+    tracer.configure(SimpleSpanProcessor(exporter))
+    yield exporter
+    tracer.configure(processor, sample_ratio)
+
+
+class TestTracing:
+    """요청 추적 테스트"""
+
+    def test_request_spans_across_layers(
+        self, test_app: FastAPI, client: TestClient, exporter: InMemorySpanExporter
+    ) -> None:
+        """라우트, 유즈케이스, 리포지토리, 커밋, SQL 문 스팬이 하나의 trace로 기록되어야 함"""
+        create_test_user(test_app, client)
+
+        spans = {span.name: span for span in exporter.spans}
+        root = spans["POST /api/v1/users"]
+        use_case = spans["UserUseCase.create_user"]
+        repository = spans["SQLUserRepository.create"]
+        assert root.kind == SpanKind.SERVER
+        assert root.attributes["http.response.status_code"] == status.HTTP_201_CREATED
+        assert use_case.parent_span_id == root.context.span_id
+        assert repository.parent_span_id == use_case.context.span_id
+        assert spans["uow.commit"].parent_span_id == use_case.context.span_id
+        assert spans["SQL INSERT"].kind == SpanKind.CLIENT
+        assert {span.context.trace_id for span in exporter.spans} == {root.context.trace_id}
+
+    def test_traceparent_propagated(
+        self, test_app: FastAPI, client: TestClient, exporter: InMemorySpanExporter
+    ) -> None:
+        """상위 서비스의 traceparent를 이어받아야 함"""
+        create_test_user(test_app, client)
+        token = login_and_get_token(test_app, client)
+        exporter.clear()
+
+        client.get(
+            test_app.url_path_for(RouteName.USERS_GET_CURRENT_USER),
+            headers={
+                "Authorization": f"Bearer {token}",
+                "traceparent": f"00-{TEST_TRACE_ID}-{TEST_PARENT_SPAN_ID}-01",
+            },
+        )
+
+        spans = {span.name: span for span in exporter.spans}
+        root = spans["GET /api/v1/users/me"]
+        assert root.context.trace_id == TEST_TRACE_ID
+        assert root.parent_span_id == TEST_PARENT_SPAN_ID
+        assert spans["auth.get_current_user"].parent_span_id == root.context.span_id
+
+    def test_not_sampled_request_records_nothing(
+        self, test_app: FastAPI, client: TestClient, exporter: InMemorySpanExporter
+    ) -> None:
+        """상위 서비스가 샘플링하지 않은 요청은 스팬을 기록하지 않아야 함"""
+        client.get(
+            test_app.url_path_for(RouteName.PRODUCTS_LIST),
+            headers={"traceparent": f"00-{TEST_TRACE_ID}-{TEST_PARENT_SPAN_ID}-00"},
+        )
+
+        assert exporter.spans == []
@@ -0,0 +1,127 @@
+import asyncio
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from httpx import ASGITransport, AsyncClient, Response
+from starlette import status
+
+from app.application.dto.order_dto import OrderRead
+from app.application.dto.product_dto import ProductRead
+from app.application.dto.response import BaseResponse
+from app.application.use_cases.order_use_case import inventory_allocator
+from app.core.config import get_settings
+from app.core.exceptions import ExceptionCode
+from app.core.idempotency import IDEMPOTENCY_KEY_HEADER
+from app.core.route_names import RouteName
+from tests.integration.v1.orders.helpers import TEST_ORDER_QUANTITY
+from tests.integration.v1.products.helpers import create_test_product
+from tests.integration.v1.users.helpers import create_test_user, login_and_get_token
+
+TEST_ALLOCATED_STOCK = 10
+TEST_CONCURRENT_ORDERS = 8
+TEST_WINDOW_MS = 50
+TEST_IDEMPOTENCY_KEY = "allocator-key"
+
+
+def _get_product(test_app: FastAPI, client: TestClient, product_id: int) -> ProductRead:
+    response = client.get(test_app.url_path_for(RouteName.PRODUCTS_GET, product_id=product_id))
+    return BaseResponse[ProductRead].model_validate(response.json()).result
+
+
+class TestInventoryAllocator:
+    """인기 상품 재고 할당기를 통한 주문 생성 테스트"""
+
+    @pytest.fixture
+    def setup(
+        self, test_app: FastAPI, client: TestClient, monkeypatch: pytest.MonkeyPatch
+    ) -> tuple[dict[str, str], ProductRead]:
+        create_test_user(test_app, client)
+        product = create_test_product(test_app, client, stock=TEST_ALLOCATED_STOCK)
+        token = login_and_get_token(test_app, client)
+        monkeypatch.setattr(get_settings(), "inventory_allocator_product_ids", [product.id])
+        monkeypatch.setattr(get_settings(), "inventory_allocator_window_ms", TEST_WINDOW_MS)
+        return {"Authorization": f"Bearer {token}"}, product
+
+    def _order_body(self, product: ProductRead) -> dict[str, list[dict[str, int]]]:
+        return {"items": [{"productId": product.id, "quantity": TEST_ORDER_QUANTITY}]}
+
+    def test_sequential_orders(
+        self, test_app: FastAPI, client: TestClient, setup: tuple[dict[str, str], ProductRead]
+    ) -> None:
+        """할당기로 처리한 주문도 주문 목록, 요약, 재고에 일반 주문과 같이 반영된다."""
+        # Given
+        headers, product = setup
+
+        # When
+        response = client.post(
+            test_app.url_path_for(RouteName.ORDERS_CREATE), headers=headers, json=self._order_body(product)
+        )
+
+        # Then
+        assert response.status_code == status.HTTP_201_CREATED
+        order = BaseResponse[OrderRead].model_validate(response.json()).result
+        assert order.items[0].product_id == product.id
+        assert _get_product(test_app, client, product.id).stock == TEST_ALLOCATED_STOCK - TEST_ORDER_QUANTITY
+
+        detail = client.get(test_app.url_path_for(RouteName.ORDERS_GET, order_id=order.id), headers=headers)
+        assert BaseResponse[OrderRead].model_validate(detail.json()).result.id == order.id
+        summaries = client.get(
+            test_app.url_path_for(RouteName.ORDERS_LIST), headers=headers, params={"view": "summary"}
+        ).json()["result"]
+        assert [summary["id"] for summary in summaries] == [order.id]
+        assert len(inventory_allocator) == 0
+
+    def test_concurrent_orders_are_batched(
+        self, test_app: FastAPI, client: TestClient, setup: tuple[dict[str, str], ProductRead]
+    ) -> None:
+        """동시에 들어온 주문은 한 배치로 처리되며, 재고를 넘는 주문만 실패하고 나머지는 성공한다."""
+        # Given
+        headers, product = setup
+        url = test_app.url_path_for(RouteName.ORDERS_CREATE)
+
+        async def order_concurrently() -> list[Response]:
+            async with AsyncClient(transport=ASGITransport(app=test_app), base_url="http://test") as async_client:
+                return await asyncio.gather(
+                    *(
+                        async_client.post(url, headers=headers, json=self._order_body(product))
+                        for _ in range(TEST_CONCURRENT_ORDERS)
+                    )
+                )
+
+        # When
+        assert client.portal is not None
+        responses = client.portal.call(order_concurrently)
+
+        # Then
+        accepted = TEST_ALLOCATED_STOCK // TEST_ORDER_QUANTITY
+        status_codes = [response.status_code for response in responses]
+        assert status_codes.count(status.HTTP_201_CREATED) == accepted
+        assert status_codes.count(status.HTTP_422_UNPROCESSABLE_ENTITY) == TEST_CONCURRENT_ORDERS - accepted
+        rejected = next(
+            response for response in responses if response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+        )
+        assert rejected.json()["code"] == ExceptionCode.INSUFFICIENT_STOCK
+        assert _get_product(test_app, client, product.id).stock == 0
+
+        orders = client.get(test_app.url_path_for(RouteName.ORDERS_LIST), headers=headers).json()["result"]
+        assert len(orders) == accepted
+        assert len(inventory_allocator) == 0
+
+    def test_idempotent_replay(
+        self, test_app: FastAPI, client: TestClient, setup: tuple[dict[str, str], ProductRead]
+    ) -> None:
+        """같은 멱등성 키로 다시 요청하면 재고를 다시 차감하지 않고 같은 주문을 반환한다."""
+        # Given
+        headers, product = setup
+        headers[IDEMPOTENCY_KEY_HEADER] = TEST_IDEMPOTENCY_KEY
+        url = test_app.url_path_for(RouteName.ORDERS_CREATE)
+
+        # When
+        first = client.post(url, headers=headers, json=self._order_body(product))
+        second = client.post(url, headers=headers, json=self._order_body(product))
+
+        # Then
+        assert first.status_code == status.HTTP_201_CREATED
+        assert second.json() == first.json()
+        assert _get_product(test_app, client, product.id).stock == TEST_ALLOCATED_STOCK - TEST_ORDER_QUANTITY
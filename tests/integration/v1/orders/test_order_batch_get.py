@@ -0,0 +1,74 @@
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from starlette import status
+
+from app.application.dto.base import MAX_BATCH_GET_IDS
+from app.application.dto.order_dto import OrderBatchRead
+from app.application.dto.response import BaseResponse
+from app.core.route_names import RouteName
+from tests.integration.v1.orders.helpers import TEST_ORDER_ID_NONEXISTENT, create_test_order
+from tests.integration.v1.users.helpers import (
+    TEST_USER_PASSWORD_ALT,
+    create_test_user,
+    login_and_get_token,
+)
+
+TEST_OTHER_USER_EMAIL = "other@example.com"
+
+
+class TestOrderBatchGet:
+    """주문 다건 조회 테스트"""
+
+    def test_batch_get_orders_preserves_request_order(self, test_app: FastAPI, client: TestClient) -> None:
+        """요청한 ID 순서대로 반환되고, 없는 ID는 notFoundIds로 반환되는지 테스트"""
+        first = create_test_order(test_app, client)
+        second = create_test_order(test_app, client)
+        token = login_and_get_token(test_app, client)
+
+        response = client.get(
+            test_app.url_path_for(RouteName.ORDERS_BATCH_GET),
+            headers={"Authorization": f"Bearer {token}"},
+            params={"ids": [second.id, TEST_ORDER_ID_NONEXISTENT, first.id, second.id]},
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        result = BaseResponse[OrderBatchRead].model_validate(response.json()).result
+        assert [order.id for order in result.items] == [second.id, first.id]
+        assert result.not_found_ids == [TEST_ORDER_ID_NONEXISTENT]
+        assert result.items[0].items
+
+    def test_batch_get_orders_hides_other_users_orders(self, test_app: FastAPI, client: TestClient) -> None:
+        """다른 사용자의 주문은 존재 여부를 노출하지 않고 notFoundIds로 반환되는지 테스트"""
+        order = create_test_order(test_app, client)
+        create_test_user(test_app, client, email=TEST_OTHER_USER_EMAIL, password=TEST_USER_PASSWORD_ALT)
+        token = login_and_get_token(test_app, client, email=TEST_OTHER_USER_EMAIL, password=TEST_USER_PASSWORD_ALT)
+
+        response = client.get(
+            test_app.url_path_for(RouteName.ORDERS_BATCH_GET),
+            headers={"Authorization": f"Bearer {token}"},
+            params={"ids": [order.id]},
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        result = BaseResponse[OrderBatchRead].model_validate(response.json()).result
+        assert result.items == []
+        assert result.not_found_ids == [order.id]
+
+    def test_batch_get_orders_too_many_ids(self, test_app: FastAPI, client: TestClient) -> None:
+        """최대 개수를 초과한 ID 요청은 422를 반환해야 함"""
+        create_test_user(test_app, client)
+        token = login_and_get_token(test_app, client)
+
+        response = client.get(
+            test_app.url_path_for(RouteName.ORDERS_BATCH_GET),
+            headers={"Authorization": f"Bearer {token}"},
+            params={"ids": list(range(1, MAX_BATCH_GET_IDS + 2))},
+        )
+
+        assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+    def test_batch_get_orders_unauthorized(self, test_app: FastAPI, client: TestClient) -> None:
+        """인증 없이 요청하면 401을 반환해야 함"""
+        response = client.get(test_app.url_path_for(RouteName.ORDERS_BATCH_GET), params={"ids": [1]})
+
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
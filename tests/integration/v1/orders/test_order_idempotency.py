@@ -0,0 +1,169 @@
+import asyncio
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from httpx import ASGITransport, AsyncClient, Response
+from starlette import status
+
+from app.application.dto.order_dto import OrderRead
+from app.application.dto.product_dto import ProductRead
+from app.application.dto.response import BaseResponse
+from app.core.exceptions import ExceptionCode
+from app.core.idempotency import IDEMPOTENCY_KEY_HEADER
+from app.core.route_names import RouteName
+from tests.integration.v1.carts.helpers import TEST_CART_ITEM_QUANTITY
+from tests.integration.v1.orders.helpers import TEST_ORDER_QUANTITY
+from tests.integration.v1.products.helpers import TEST_PRODUCT_STOCK, create_test_product
+from tests.integration.v1.users.helpers import create_test_user, login_and_get_token
+
+TEST_IDEMPOTENCY_KEY = "order-key-1"
+TEST_CONCURRENT_REQUESTS = 8
+
+
+def _get_product(test_app: FastAPI, client: TestClient, product_id: int) -> ProductRead:
+    response = client.get(test_app.url_path_for(RouteName.PRODUCTS_GET, product_id=product_id))
+    return BaseResponse[ProductRead].model_validate(response.json()).result
+
+
+class TestOrderIdempotency:
+    """멱등성 키를 사용한 주문 생성 테스트"""
+
+    def _setup(self, test_app: FastAPI, client: TestClient) -> tuple[dict[str, str], ProductRead]:
+        create_test_user(test_app, client)
+        product = create_test_product(test_app, client)
+        token = login_and_get_token(test_app, client)
+        return {"Authorization": f"Bearer {token}"}, product
+
+    def test_replay_returns_same_order(self, test_app: FastAPI, client: TestClient) -> None:
+        """같은 키로 다시 요청하면 같은 주문을 반환하고 재고는 한 번만 차감한다."""
+        # Given
+        headers, product = self._setup(test_app, client)
+        headers[IDEMPOTENCY_KEY_HEADER] = TEST_IDEMPOTENCY_KEY
+        body = {"items": [{"productId": product.id, "quantity": TEST_ORDER_QUANTITY}]}
+
+        # When
+        first = client.post(test_app.url_path_for(RouteName.ORDERS_CREATE), headers=headers, json=body)
+        second = client.post(test_app.url_path_for(RouteName.ORDERS_CREATE), headers=headers, json=body)
+
+        # Then
+        assert first.status_code == status.HTTP_201_CREATED
+        assert second.status_code == status.HTTP_201_CREATED
+        assert second.json() == first.json()
+        assert _get_product(test_app, client, product.id).stock == TEST_PRODUCT_STOCK - TEST_ORDER_QUANTITY
+
+        orders = client.get(test_app.url_path_for(RouteName.ORDERS_LIST), headers=headers).json()["result"]
+        assert len(orders) == 1
+
+    def test_concurrent_requests_create_one_order(self, test_app: FastAPI, client: TestClient) -> None:
+        """같은 키로 동시에 요청해도 주문은 하나만 만들고 재고는 한 번만 차감하며, 모든 응답이 같은 주문을 반환한다."""
+        # Given
+        headers, product = self._setup(test_app, client)
+        headers[IDEMPOTENCY_KEY_HEADER] = TEST_IDEMPOTENCY_KEY
+        body = {"items": [{"productId": product.id, "quantity": TEST_ORDER_QUANTITY}]}
+        url = test_app.url_path_for(RouteName.ORDERS_CREATE)
+
+        async def order_concurrently() -> list[Response]:
+            async with AsyncClient(transport=ASGITransport(app=test_app), base_url="http://test") as async_client:
+                return await asyncio.gather(
+                    *(async_client.post(url, headers=headers, json=body) for _ in range(TEST_CONCURRENT_REQUESTS))
+                )
+
+        # When
+        assert client.portal is not None
+        responses = client.portal.call(order_concurrently)
+
+        # Then
+        assert [response.status_code for response in responses] == [status.HTTP_201_CREATED] * len(responses)
+        order_ids = {BaseResponse[OrderRead].model_validate(response.json()).result.id for response in responses}
+        assert len(order_ids) == 1
+        assert _get_product(test_app, client, product.id).stock == TEST_PRODUCT_STOCK - TEST_ORDER_QUANTITY
+
+        orders = client.get(test_app.url_path_for(RouteName.ORDERS_LIST), headers=headers).json()["result"]
+        assert [order["id"] for order in orders] == list(order_ids)
+
+    def test_different_keys_create_separate_orders(self, test_app: FastAPI, client: TestClient) -> None:
+        """키가 다르거나 없으면 각각 새 주문을 만든다."""
+        # Given
+        headers, product = self._setup(test_app, client)
+        body = {"items": [{"productId": product.id, "quantity": TEST_ORDER_QUANTITY}]}
+
+        # When
+        responses = [
+            client.post(
+                test_app.url_path_for(RouteName.ORDERS_CREATE),
+                headers={**headers, IDEMPOTENCY_KEY_HEADER: key} if key else headers,
+                json=body,
+            )
+            for key in ("key-a", "key-b", None)
+        ]
+
+        # Then
+        order_ids = {BaseResponse[OrderRead].model_validate(response.json()).result.id for response in responses}
+        assert len(order_ids) == len(responses)
+        assert _get_product(test_app, client, product.id).stock == TEST_PRODUCT_STOCK - TEST_ORDER_QUANTITY * len(
+            responses
+        )
+
+    def test_reused_key_with_different_body(self, test_app: FastAPI, client: TestClient) -> None:
+        """같은 키로 다른 본문을 보내면 422를 반환한다."""
+        # Given
+        headers, product = self._setup(test_app, client)
+        headers[IDEMPOTENCY_KEY_HEADER] = TEST_IDEMPOTENCY_KEY
+        client.post(
+            test_app.url_path_for(RouteName.ORDERS_CREATE),
+            headers=headers,
+            json={"items": [{"productId": product.id, "quantity": TEST_ORDER_QUANTITY}]},
+        )
+
+        # When
+        response = client.post(
+            test_app.url_path_for(RouteName.ORDERS_CREATE),
+            headers=headers,
+            json={"items": [{"productId": product.id, "quantity": TEST_ORDER_QUANTITY + 1}]},
+        )
+
+        # Then
+        assert response.status_code == status.HTTP_422_UNPROCESSABLE_CONTENT
+        assert response.json()["code"] == ExceptionCode.IDEMPOTENCY_KEY_MISMATCH
+
+    def test_failed_request_does_not_claim_key(self, test_app: FastAPI, client: TestClient) -> None:
+        """실패한 요청은 키를 남기지 않으므로 같은 키로 다시 시도할 수 있다."""
+        # Given
+        headers, product = self._setup(test_app, client)
+        headers[IDEMPOTENCY_KEY_HEADER] = TEST_IDEMPOTENCY_KEY
+        body = {"items": [{"productId": product.id, "quantity": TEST_ORDER_QUANTITY}]}
+
+        # When
+        failed = client.post(test_app.url_path_for(RouteName.ORDERS_CHECKOUT), headers=headers)
+        client.post(
+            test_app.url_path_for(RouteName.CARTS_ADD_ITEM),
+            headers=headers,
+            json={"productId": product.id, "quantity": TEST_CART_ITEM_QUANTITY},
+        )
+        retried = client.post(test_app.url_path_for(RouteName.ORDERS_CHECKOUT), headers=headers)
+        mismatched = client.post(test_app.url_path_for(RouteName.ORDERS_CREATE), headers=headers, json=body)
+
+        # Then
+        assert failed.status_code == status.HTTP_400_BAD_REQUEST
+        assert retried.status_code == status.HTTP_201_CREATED
+        assert mismatched.status_code == status.HTTP_422_UNPROCESSABLE_CONTENT
+
+    def test_checkout_replay(self, test_app: FastAPI, client: TestClient) -> None:
+        """장바구니 결제를 같은 키로 다시 요청하면 빈 장바구니 오류 대신 처음 주문을 반환한다."""
+        # Given
+        headers, product = self._setup(test_app, client)
+        headers[IDEMPOTENCY_KEY_HEADER] = TEST_IDEMPOTENCY_KEY
+        client.post(
+            test_app.url_path_for(RouteName.CARTS_ADD_ITEM),
+            headers=headers,
+            json={"productId": product.id, "quantity": TEST_CART_ITEM_QUANTITY},
+        )
+
+        # When
+        first = client.post(test_app.url_path_for(RouteName.ORDERS_CHECKOUT), headers=headers)
+        second = client.post(test_app.url_path_for(RouteName.ORDERS_CHECKOUT), headers=headers)
+
+        # Then
+        assert first.status_code == status.HTTP_201_CREATED
+        assert second.json() == first.json()
+        assert _get_product(test_app, client, product.id).stock == TEST_PRODUCT_STOCK - TEST_CART_ITEM_QUANTITY
@@ -0,0 +1,132 @@
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from starlette import status
+
+from app.application.dto.order_dto import OrderRead
+from app.application.dto.product_dto import ProductRead
+from app.application.dto.response import BaseResponse
+from app.core.config import get_settings
+from app.core.route_names import RouteName
+from app.domain.model.order import OrderStatus
+from app.domain.model.product import Product
+from app.infrastructure.persistence.product_repository import SQLProductRepository
+from tests.integration.v1.products.helpers import TEST_PRODUCT_STOCK, create_test_product
+from tests.integration.v1.users.helpers import create_test_user, login_and_get_token
+
+TEST_PRODUCT_COUNT = 3
+
+
+def _get_stock(test_app: FastAPI, client: TestClient, product_id: int) -> int:
+    response = client.get(test_app.url_path_for(RouteName.PRODUCTS_GET, product_id=product_id))
+    return BaseResponse[ProductRead].model_validate(response.json()).result.stock
+
+
+def _expected_locks(lock_strategy: str, *loads: list[int]) -> list[list[int]]:
+    """비관적 락 모드에서만 상품 행을 ID 순으로 잠가 조회해야 함 (낙관적 락 모드는 잠그지 않음)"""
+    return [sorted(ids) for ids in loads] if lock_strategy == "pessimistic" else []
+
+
+@pytest.mark.parametrize("lock_strategy", ["optimistic", "pessimistic"])
+class TestOrderLockStrategy:
+    """여러 상품을 담은 주문의 재고 잠금 순서와 잠금 방식 테스트"""
+
+    @pytest.fixture
+    def setup(
+        self, test_app: FastAPI, client: TestClient, monkeypatch: pytest.MonkeyPatch, lock_strategy: str
+    ) -> tuple[dict[str, str], list[ProductRead]]:
+        monkeypatch.setattr(get_settings(), "lock_strategy", lock_strategy)
+        create_test_user(test_app, client)
+        products = [create_test_product(test_app, client, name=f"상품 {i}") for i in range(TEST_PRODUCT_COUNT)]
+        token = login_and_get_token(test_app, client)
+        return {"Authorization": f"Bearer {token}"}, products
+
+    @pytest.fixture
+    def locked_ids(self, monkeypatch: pytest.MonkeyPatch) -> list[list[int]]:
+        """`lock_many_by_ids`로 잠가 조회한 상품 ID 목록을 호출마다 기록"""
+        calls: list[list[int]] = []
+        lock_many_by_ids = SQLProductRepository.lock_many_by_ids
+
+        async def spy(repository: SQLProductRepository, product_ids: list[int]) -> list[Product]:
+            calls.append(list(product_ids))
+            return await lock_many_by_ids(repository, product_ids)
+
+        monkeypatch.setattr(SQLProductRepository, "lock_many_by_ids", spy)
+        return calls
+
+    def test_items_keep_request_order(
+        self,
+        test_app: FastAPI,
+        client: TestClient,
+        setup: tuple[dict[str, str], list[ProductRead]],
+        locked_ids: list[list[int]],
+        lock_strategy: str,
+    ) -> None:
+        """재고는 상품 ID 순으로 갱신하지만 주문 항목과 주문 요약의 첫 상품은 요청 순서를 따른다."""
+        # Given
+        headers, products = setup
+        requested = list(reversed(products))
+        body = {"items": [{"productId": product.id, "quantity": i + 1} for i, product in enumerate(requested)]}
+
+        # When
+        response = client.post(test_app.url_path_for(RouteName.ORDERS_CREATE), headers=headers, json=body)
+
+        # Then
+        assert response.status_code == status.HTTP_201_CREATED
+        order = BaseResponse[OrderRead].model_validate(response.json()).result
+        assert [item.product_id for item in order.items] == [product.id for product in requested]
+        for i, product in enumerate(requested):
+            assert _get_stock(test_app, client, product.id) == TEST_PRODUCT_STOCK - (i + 1)
+
+        summaries = client.get(
+            test_app.url_path_for(RouteName.ORDERS_LIST), headers=headers, params={"view": "summary"}
+        ).json()["result"]
+        assert summaries[0]["firstProductName"] == requested[0].name
+        assert locked_ids == _expected_locks(lock_strategy, [product.id for product in products])
+
+    def test_duplicate_items_are_summed(
+        self,
+        test_app: FastAPI,
+        client: TestClient,
+        setup: tuple[dict[str, str], list[ProductRead]],
+        locked_ids: list[list[int]],
+        lock_strategy: str,
+    ) -> None:
+        """같은 상품을 여러 항목으로 담으면 수량을 합쳐 한 번에 차감한다."""
+        # Given
+        headers, products = setup
+        body = {"items": [{"productId": products[0].id, "quantity": 1}, {"productId": products[0].id, "quantity": 2}]}
+
+        # When
+        response = client.post(test_app.url_path_for(RouteName.ORDERS_CREATE), headers=headers, json=body)
+
+        # Then
+        assert response.status_code == status.HTTP_201_CREATED
+        assert _get_stock(test_app, client, products[0].id) == TEST_PRODUCT_STOCK - 3  # noqa: PLR2004
+        assert locked_ids == _expected_locks(lock_strategy, [products[0].id])
+
+    def test_cancel_restores_all_items(
+        self,
+        test_app: FastAPI,
+        client: TestClient,
+        setup: tuple[dict[str, str], list[ProductRead]],
+        locked_ids: list[list[int]],
+        lock_strategy: str,
+    ) -> None:
+        """여러 상품을 담은 주문을 취소하면 모든 상품의 재고가 복구된다."""
+        # Given
+        headers, products = setup
+        body = {"items": [{"productId": product.id, "quantity": 1} for product in reversed(products)]}
+        created = client.post(test_app.url_path_for(RouteName.ORDERS_CREATE), headers=headers, json=body)
+        order = BaseResponse[OrderRead].model_validate(created.json()).result
+
+        # When
+        response = client.post(test_app.url_path_for(RouteName.ORDERS_CANCEL, order_id=order.id), headers=headers)
+
+        # Then
+        assert response.status_code == status.HTTP_200_OK
+        assert BaseResponse[OrderRead].model_validate(response.json()).result.status == OrderStatus.CANCELLED
+        for product in products:
+            assert _get_stock(test_app, client, product.id) == TEST_PRODUCT_STOCK
+        product_ids = [product.id for product in products]
+        assert locked_ids == _expected_locks(lock_strategy, product_ids, product_ids)
@@ -0,0 +1,205 @@
+import json
+import time
+from collections.abc import Callable
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta
+from typing import Any, cast
+
+import httpx
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from starlette import status
+
+from app.application.dto.order_dto import OrderRead
+from app.application.dto.product_dto import ProductRead
+from app.application.dto.response import BaseResponse
+from app.core.config import get_settings
+from app.core.db import get_session
+from app.core.job_queue import job_queue
+from app.core.route_names import RouteName
+from app.core.types import AppWithContainer
+from app.domain.model.outbox import OutboxEventType
+from app.infrastructure.jobs import outbox_dispatcher as outbox_dispatcher_module
+from app.infrastructure.jobs.outbox_dispatcher import OutboxDispatcher, outbox_dispatch_failures_total
+from app.infrastructure.jobs.outbox_sinks import HttpOutboxSink, InMemoryOutboxSink
+from tests.integration.v1.orders.helpers import TEST_ORDER_QUANTITY
+from tests.integration.v1.products.helpers import create_test_product
+from tests.integration.v1.users.helpers import create_test_user, login_and_get_token
+
+TEST_ORDER_COUNT = 3
+TEST_SINK_URL = "http://sink.test/events"
+# 한 번 실패한 뒤 다시 전달할 때의 시도 횟수
+TEST_RETRIED_ATTEMPTS = 2
+# 깨우지 않으면 테스트 중에 다시 확인하지 않도록 충분히 긴 전달기 확인 주기(초)
+TEST_POLL_INTERVAL = 600
+TEST_WAIT_SECONDS = 5
+
+
+class CountingDispatcher(OutboxDispatcher):
+    """실행을 마친 전달 횟수를 기록하는 전달기"""
+
+    drains = 0
+
+    async def drain(self, *args: Any, **kwargs: Any) -> int:
+        dispatched = await super().drain(*args, **kwargs)
+        self.drains += 1
+        return dispatched
+
+
+def _wait_until(condition: Callable[[], bool]) -> None:
+    deadline = time.monotonic() + TEST_WAIT_SECONDS
+    while not condition() and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+
+def _drain(test_app: FastAPI, client: TestClient, dispatcher: OutboxDispatcher, now: datetime | None = None) -> int:
+    """테스트 DB 세션으로 outbox 전달을 한 번 실행합니다."""
+    session_factory = asynccontextmanager(test_app.dependency_overrides[get_session])
+    use_case_provider = cast(AppWithContainer, test_app).container.outbox_use_case
+    assert client.portal is not None
+    dispatched: int = client.portal.call(dispatcher.drain, use_case_provider, session_factory, now)
+    return dispatched
+
+
+class TestOrderOutbox:
+    """주문 이벤트 outbox 기록과 전달 테스트"""
+
+    @pytest.fixture
+    def setup(
+        self, test_app: FastAPI, client: TestClient, monkeypatch: pytest.MonkeyPatch
+    ) -> tuple[dict[str, str], ProductRead]:
+        monkeypatch.setattr(get_settings(), "outbox_enabled", True)
+        create_test_user(test_app, client)
+        product = create_test_product(test_app, client)
+        token = login_and_get_token(test_app, client)
+        return {"Authorization": f"Bearer {token}"}, product
+
+    def _create_order(
+        self, test_app: FastAPI, client: TestClient, headers: dict[str, str], product: ProductRead
+    ) -> OrderRead:
+        response = client.post(
+            test_app.url_path_for(RouteName.ORDERS_CREATE),
+            headers=headers,
+            json={"items": [{"productId": product.id, "quantity": TEST_ORDER_QUANTITY}]},
+        )
+        assert response.status_code == status.HTTP_201_CREATED
+        return BaseResponse[OrderRead].model_validate(response.json()).result
+
+    def test_order_events_are_dispatched(
+        self, test_app: FastAPI, client: TestClient, setup: tuple[dict[str, str], ProductRead]
+    ) -> None:
+        """주문 생성/취소 이벤트가 기록된 순서대로 배치 크기와 관계없이 모두 한 번씩 전달된다."""
+        # Given
+        headers, product = setup
+        orders = [self._create_order(test_app, client, headers, product) for _ in range(TEST_ORDER_COUNT)]
+        client.post(test_app.url_path_for(RouteName.ORDERS_CANCEL, order_id=orders[0].id), headers=headers)
+        sink = InMemoryOutboxSink()
+        dispatcher = OutboxDispatcher(sink, batch_size=1)
+
+        # When
+        dispatched = _drain(test_app, client, dispatcher)
+
+        # Then
+        assert dispatched == TEST_ORDER_COUNT + 1
+        assert [(message["eventType"], message["aggregateId"]) for message in sink.messages] == [
+            *[(OutboxEventType.ORDER_CREATED, order.id) for order in orders],
+            (OutboxEventType.ORDER_CANCELLED, orders[0].id),
+        ]
+        assert sink.messages[0]["payload"]["items"][0]["quantity"] == TEST_ORDER_QUANTITY
+        assert sink.messages[-1]["payload"]["status"] == "CANCELLED"
+        assert len({message["id"] for message in sink.messages}) == len(sink.messages)
+        assert dispatcher.lag == 0
+
+        # 이미 전달한 이벤트는 다시 전달하지 않음
+        assert _drain(test_app, client, dispatcher) == 0
+
+    def test_failed_delivery_is_retried(
+        self, test_app: FastAPI, client: TestClient, setup: tuple[dict[str, str], ProductRead]
+    ) -> None:
+        """sink가 실패하면 이벤트를 미뤘다가 재시도 간격이 지난 뒤 다시 전달한다."""
+        # Given
+        headers, product = setup
+        order = self._create_order(test_app, client, headers, product)
+        received: list[list[dict[str, Any]]] = []
+        fail = True
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            if fail:
+                return httpx.Response(status.HTTP_503_SERVICE_UNAVAILABLE)
+            received.append(json.loads(request.content))
+            return httpx.Response(status.HTTP_204_NO_CONTENT)
+
+        sink = HttpOutboxSink(TEST_SINK_URL, timeout=1, transport=httpx.MockTransport(handler))
+        dispatcher = OutboxDispatcher(sink)
+        failures_before = outbox_dispatch_failures_total.value()
+
+        # When
+        failed = _drain(test_app, client, dispatcher)
+        fail = False
+        too_early = _drain(test_app, client, dispatcher)
+        retried = _drain(
+            test_app,
+            client,
+            dispatcher,
+            datetime.now() + timedelta(seconds=get_settings().outbox_retry_base_seconds + 1),
+        )
+
+        # Then
+        assert (failed, too_early, retried) == (0, 0, 1)
+        assert outbox_dispatch_failures_total.value() - failures_before == 1
+        assert len(received) == 1
+        assert received[0][0]["aggregateId"] == order.id
+        assert received[0][0]["attempts"] == TEST_RETRIED_ATTEMPTS
+
+    def test_disabled_outbox_records_nothing(
+        self,
+        test_app: FastAPI,
+        client: TestClient,
+        setup: tuple[dict[str, str], ProductRead],
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """outbox가 꺼져 있으면 주문 이벤트를 기록하지 않는다."""
+        # Given
+        headers, product = setup
+        monkeypatch.setattr(get_settings(), "outbox_enabled", False)
+        self._create_order(test_app, client, headers, product)
+        sink = InMemoryOutboxSink()
+
+        # When
+        dispatched = _drain(test_app, client, OutboxDispatcher(sink))
+
+        # Then
+        assert dispatched == 0
+        assert sink.messages == []
+
+    def test_commit_wakes_dispatcher(
+        self,
+        test_app: FastAPI,
+        client: TestClient,
+        setup: tuple[dict[str, str], ProductRead],
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """주문이 커밋되면 작업 큐가 전달기를 깨워 확인 주기를 기다리지 않고 전달한다."""
+        # Given
+        headers, product = setup
+        sink = InMemoryOutboxSink()
+        dispatcher = CountingDispatcher(sink, interval=TEST_POLL_INTERVAL, enabled=True)
+        monkeypatch.setattr(outbox_dispatcher_module, "outbox_dispatcher", dispatcher)
+        session_factory = asynccontextmanager(test_app.dependency_overrides[get_session])
+        use_case_provider = cast(AppWithContainer, test_app).container.outbox_use_case
+        assert client.portal is not None
+        client.portal.call(dispatcher.start, use_case_provider, session_factory)
+        # 테스트 DB는 커넥션 하나를 공유하므로 시작 직후의 전달이 끝난 뒤 주문
+        _wait_until(lambda: dispatcher.drains > 0)
+
+        # When
+        order = self._create_order(test_app, client, headers, product)
+        client.portal.call(job_queue.join)
+        _wait_until(lambda: bool(sink.messages))
+        client.portal.call(dispatcher.stop)
+
+        # Then
+        assert [(message["eventType"], message["aggregateId"]) for message in sink.messages] == [
+            (OutboxEventType.ORDER_CREATED, order.id)
+        ]
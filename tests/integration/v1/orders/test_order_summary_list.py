@@ -0,0 +1,66 @@
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from starlette import status
+
+from app.application.dto.order_dto import OrderListView, OrderSummaryRead
+from app.application.dto.response import BaseResponse
+from app.core.route_names import RouteName
+from app.domain.model.order import OrderStatus
+from tests.integration.v1.orders.helpers import TEST_ORDER_QUANTITY, create_test_order
+from tests.integration.v1.products.helpers import TEST_PRODUCT_NAME, TEST_PRODUCT_PRICE
+from tests.integration.v1.users.helpers import login_and_get_token
+
+
+def list_order_summaries(test_app: FastAPI, client: TestClient, token: str) -> list[OrderSummaryRead]:
+    response = client.get(
+        test_app.url_path_for(RouteName.ORDERS_LIST),
+        headers={"Authorization": f"Bearer {token}"},
+        params={"view": OrderListView.SUMMARY},
+    )
+    assert response.status_code == status.HTTP_200_OK
+    return BaseResponse[list[OrderSummaryRead]].model_validate(response.json()).result
+
+
+class TestOrderSummaryList:
+    """주문 목록 요약(summary) 뷰 조회 테스트"""
+
+    def test_list_order_summaries(self, test_app: FastAPI, client: TestClient) -> None:
+        """주문 생성 시 요약이 함께 저장되고, 최신순으로 조회되는지 테스트"""
+        first = create_test_order(test_app, client)
+        second = create_test_order(test_app, client)
+        token = login_and_get_token(test_app, client)
+
+        summaries = list_order_summaries(test_app, client, token)
+
+        assert [summary.id for summary in summaries] == [second.id, first.id]
+        summary = summaries[0]
+        assert summary.status == OrderStatus.PENDING
+        assert summary.item_count == len(second.items)
+        assert summary.total_price == TEST_PRODUCT_PRICE * TEST_ORDER_QUANTITY
+        assert summary.first_product_name == TEST_PRODUCT_NAME
+
+    def test_summary_status_follows_cancel(self, test_app: FastAPI, client: TestClient) -> None:
+        """주문 취소 시 요약의 상태도 같은 트랜잭션에서 갱신되는지 테스트"""
+        order = create_test_order(test_app, client)
+        token = login_and_get_token(test_app, client)
+
+        client.post(
+            test_app.url_path_for(RouteName.ORDERS_CANCEL, order_id=order.id),
+            headers={"Authorization": f"Bearer {token}"},
+        )
+
+        summaries = list_order_summaries(test_app, client, token)
+        assert summaries[0].status == OrderStatus.CANCELLED
+
+    def test_summary_view_has_no_items(self, test_app: FastAPI, client: TestClient) -> None:
+        """summary 뷰 응답에는 주문 항목이 포함되지 않아야 함"""
+        create_test_order(test_app, client)
+        token = login_and_get_token(test_app, client)
+
+        response = client.get(
+            test_app.url_path_for(RouteName.ORDERS_LIST),
+            headers={"Authorization": f"Bearer {token}"},
+            params={"view": OrderListView.SUMMARY},
+        )
+
+        assert "items" not in response.json()["result"][0]
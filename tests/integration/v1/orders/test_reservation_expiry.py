@@ -0,0 +1,135 @@
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta
+from typing import cast
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from starlette import status
+
+from app.application.dto.order_dto import OrderRead, OrderSummaryRead
+from app.application.dto.product_dto import ProductRead
+from app.application.dto.response import BaseResponse
+from app.core.config import get_settings
+from app.core.db import get_session
+from app.core.route_names import RouteName
+from app.core.types import AppWithContainer
+from app.domain.model.order import OrderStatus
+from app.infrastructure.jobs.reservation_sweeper import ReservationSweeper, reservation_expired_orders_total
+from tests.integration.v1.orders.helpers import TEST_ORDER_QUANTITY
+from tests.integration.v1.products.helpers import TEST_PRODUCT_STOCK, create_test_product
+from tests.integration.v1.users.helpers import create_test_user, login_and_get_token
+
+TEST_ORDER_COUNT = 3
+
+
+def _sweep(test_app: FastAPI, client: TestClient, sweeper: ReservationSweeper, now: datetime) -> int:
+    """테스트 DB 세션으로 만료 처리를 한 번 실행합니다."""
+    session_factory = asynccontextmanager(test_app.dependency_overrides[get_session])
+    use_case_provider = cast(AppWithContainer, test_app).container.order_use_case
+    assert client.portal is not None
+    expired: int = client.portal.call(sweeper.sweep, use_case_provider, session_factory, now)
+    return expired
+
+
+def _after_expiry() -> datetime:
+    return datetime.now() + timedelta(minutes=get_settings().reservation_ttl_minutes + 1)
+
+
+class TestReservationExpiry:
+    """재고 선점 만료 처리 테스트"""
+
+    @pytest.fixture
+    def setup(self, test_app: FastAPI, client: TestClient) -> tuple[dict[str, str], ProductRead]:
+        create_test_user(test_app, client)
+        product = create_test_product(test_app, client)
+        token = login_and_get_token(test_app, client)
+        return {"Authorization": f"Bearer {token}"}, product
+
+    def _create_order(
+        self, test_app: FastAPI, client: TestClient, headers: dict[str, str], product: ProductRead
+    ) -> OrderRead:
+        response = client.post(
+            test_app.url_path_for(RouteName.ORDERS_CREATE),
+            headers=headers,
+            json={"items": [{"productId": product.id, "quantity": TEST_ORDER_QUANTITY}]},
+        )
+        assert response.status_code == status.HTTP_201_CREATED
+        return BaseResponse[OrderRead].model_validate(response.json()).result
+
+    def _get_stock(self, test_app: FastAPI, client: TestClient, product_id: int) -> int:
+        response = client.get(test_app.url_path_for(RouteName.PRODUCTS_GET, product_id=product_id))
+        return BaseResponse[ProductRead].model_validate(response.json()).result.stock
+
+    def test_expired_orders_release_stock(
+        self, test_app: FastAPI, client: TestClient, setup: tuple[dict[str, str], ProductRead]
+    ) -> None:
+        """만료 시각이 지난 PENDING 주문은 배치 크기와 관계없이 모두 EXPIRED가 되고 재고가 복구된다."""
+        # Given
+        headers, product = setup
+        orders = [self._create_order(test_app, client, headers, product) for _ in range(TEST_ORDER_COUNT)]
+        expired_before = reservation_expired_orders_total.value()
+        sweeper = ReservationSweeper(batch_size=1)
+
+        # When
+        expired = _sweep(test_app, client, sweeper, _after_expiry())
+
+        # Then
+        assert expired == TEST_ORDER_COUNT
+        assert reservation_expired_orders_total.value() - expired_before == TEST_ORDER_COUNT
+        assert sweeper.lag == 0
+        assert self._get_stock(test_app, client, product.id) == TEST_PRODUCT_STOCK
+
+        detail = client.get(test_app.url_path_for(RouteName.ORDERS_GET, order_id=orders[0].id), headers=headers)
+        assert BaseResponse[OrderRead].model_validate(detail.json()).result.status == OrderStatus.EXPIRED
+        summaries = client.get(
+            test_app.url_path_for(RouteName.ORDERS_LIST), headers=headers, params={"view": "summary"}
+        ).json()["result"]
+        assert {OrderSummaryRead.model_validate(summary).status for summary in summaries} == {OrderStatus.EXPIRED}
+
+    def test_active_reservations_are_kept(
+        self, test_app: FastAPI, client: TestClient, setup: tuple[dict[str, str], ProductRead]
+    ) -> None:
+        """만료 시각 전의 선점은 해제하지 않는다."""
+        # Given
+        headers, product = setup
+        self._create_order(test_app, client, headers, product)
+
+        # When
+        expired = _sweep(test_app, client, ReservationSweeper(), datetime.now())
+
+        # Then
+        assert expired == 0
+        assert self._get_stock(test_app, client, product.id) == TEST_PRODUCT_STOCK - TEST_ORDER_QUANTITY
+
+    def test_cancelled_order_is_not_released_twice(
+        self, test_app: FastAPI, client: TestClient, setup: tuple[dict[str, str], ProductRead]
+    ) -> None:
+        """취소한 주문의 선점은 취소할 때 해제되므로 만료 처리에서 재고를 다시 되돌리지 않는다."""
+        # Given
+        headers, product = setup
+        order = self._create_order(test_app, client, headers, product)
+        client.post(test_app.url_path_for(RouteName.ORDERS_CANCEL, order_id=order.id), headers=headers)
+
+        # When
+        expired = _sweep(test_app, client, ReservationSweeper(), _after_expiry())
+
+        # Then
+        assert expired == 0
+        assert self._get_stock(test_app, client, product.id) == TEST_PRODUCT_STOCK
+
+    def test_expired_order_cannot_be_cancelled(
+        self, test_app: FastAPI, client: TestClient, setup: tuple[dict[str, str], ProductRead]
+    ) -> None:
+        """만료된 주문은 취소할 수 없다."""
+        # Given
+        headers, product = setup
+        order = self._create_order(test_app, client, headers, product)
+        _sweep(test_app, client, ReservationSweeper(), _after_expiry())
+
+        # When
+        response = client.post(test_app.url_path_for(RouteName.ORDERS_CANCEL, order_id=order.id), headers=headers)
+
+        # Then
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert self._get_stock(test_app, client, product.id) == TEST_PRODUCT_STOCK
@@ -0,0 +1,45 @@
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from starlette import status
+
+from app.application.dto.base import MAX_BATCH_GET_IDS
+from app.application.dto.product_dto import ProductBatchRead
+from app.application.dto.response import BaseResponse
+from app.core.route_names import RouteName
+from tests.integration.v1.products.helpers import create_test_product
+
+TEST_PRODUCT_ID_NONEXISTENT = 99999
+
+
+class TestProductBatchGet:
+    """상품 다건 조회 테스트"""
+
+    def test_batch_get_products_preserves_request_order(self, test_app: FastAPI, client: TestClient) -> None:
+        """요청한 ID 순서대로 반환되고, 없는 ID는 notFoundIds로 반환되는지 테스트"""
+        first = create_test_product(test_app, client, name="상품 1")
+        second = create_test_product(test_app, client, name="상품 2")
+
+        response = client.get(
+            test_app.url_path_for(RouteName.PRODUCTS_BATCH_GET),
+            params={"ids": [second.id, TEST_PRODUCT_ID_NONEXISTENT, first.id, first.id]},
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        result = BaseResponse[ProductBatchRead].model_validate(response.json()).result
+        assert [product.id for product in result.items] == [second.id, first.id]
+        assert result.not_found_ids == [TEST_PRODUCT_ID_NONEXISTENT]
+
+    def test_batch_get_products_requires_ids(self, test_app: FastAPI, client: TestClient) -> None:
+        """ids 파라미터가 없으면 422를 반환해야 함"""
+        response = client.get(test_app.url_path_for(RouteName.PRODUCTS_BATCH_GET))
+
+        assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+    def test_batch_get_products_too_many_ids(self, test_app: FastAPI, client: TestClient) -> None:
+        """최대 개수를 초과한 ID 요청은 422를 반환해야 함"""
+        response = client.get(
+            test_app.url_path_for(RouteName.PRODUCTS_BATCH_GET),
+            params={"ids": list(range(1, MAX_BATCH_GET_IDS + 2))},
+        )
+
+        assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
@@ -0,0 +1,138 @@
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from starlette import status
+
+from app.application.dto.product_dto import ProductImportReport, ProductRead
+from app.application.dto.response import BaseResponse
+from app.core.route_names import RouteName
+from tests.integration.v1.products.helpers import TEST_PRODUCT_PRICE, TEST_PRODUCT_STOCK, create_test_seller
+from tests.integration.v1.users.helpers import create_test_user, login_and_get_token
+
+TEST_IMPORT_ROW_COUNT = 3
+TEST_IMPORT_LARGE_ROW_COUNT = 2500
+
+
+class TestProductBulkImport:
+    """상품 대량 등록 테스트"""
+
+    def test_import_json_array(self, test_app: FastAPI, client: TestClient) -> None:
+        """JSON 배열로 대량 등록 성공 테스트"""
+        headers = create_test_seller(test_app, client)
+
+        response = client.post(
+            test_app.url_path_for(RouteName.PRODUCTS_BULK_IMPORT),
+            headers=headers,
+            json=[
+                {"name": f"상품 {i}", "price": TEST_PRODUCT_PRICE, "stock": TEST_PRODUCT_STOCK}
+                for i in range(TEST_IMPORT_ROW_COUNT)
+            ],
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        report = BaseResponse[ProductImportReport].model_validate(response.json()).result
+        assert report.total == TEST_IMPORT_ROW_COUNT
+        assert report.succeeded == TEST_IMPORT_ROW_COUNT
+        assert report.failed == 0
+
+        # 생성된 상품은 단건 조회로 확인할 수 있어야 함
+        first_id = report.results[0].product_id
+        assert first_id is not None
+        product_response = client.get(test_app.url_path_for(RouteName.PRODUCTS_GET, product_id=first_id))
+        product = BaseResponse[ProductRead].model_validate(product_response.json()).result
+        assert product.name == "상품 0"
+
+    def test_import_ndjson_with_invalid_rows(self, test_app: FastAPI, client: TestClient) -> None:
+        """NDJSON 대량 등록 시 잘못된 행은 행 단위 오류로 보고되는지 테스트"""
+        headers = create_test_seller(test_app, client)
+        body = "\n".join(
+            [
+                '{"name": "정상 상품", "price": 1000, "stock": 1}',
+                '{"name": "가격 오류", "price": -1, "stock": 1}',
+                "{not json}",
+                "",
+                '{"name": "정상 상품 2", "price": 2000, "stock": 2}',
+            ]
+        )
+
+        response = client.post(
+            test_app.url_path_for(RouteName.PRODUCTS_BULK_IMPORT),
+            headers={**headers, "Content-Type": "application/x-ndjson"},
+            content=body.encode("utf-8"),
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        report = BaseResponse[ProductImportReport].model_validate(response.json()).result
+        assert [result.success for result in report.results] == [True, False, False, True]
+        assert report.results[1].error is not None
+        assert report.results[2].error is not None
+
+    def test_import_csv(self, test_app: FastAPI, client: TestClient) -> None:
+        """헤더가 있는 CSV 대량 등록 테스트 (따옴표 안의 쉼표/줄바꿈 포함)"""
+        headers = create_test_seller(test_app, client)
+        body = 'name,description,price,stock\n"상품, A","여러 줄\n설명",1000,10\n상품 B,,2000,20\n'
+
+        response = client.post(
+            test_app.url_path_for(RouteName.PRODUCTS_BULK_IMPORT),
+            headers={**headers, "Content-Type": "text/csv"},
+            content=body.encode("utf-8"),
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        report = BaseResponse[ProductImportReport].model_validate(response.json()).result
+        assert report.succeeded == report.total
+
+        first_id = report.results[0].product_id
+        assert first_id is not None
+        product_response = client.get(test_app.url_path_for(RouteName.PRODUCTS_GET, product_id=first_id))
+        product = BaseResponse[ProductRead].model_validate(product_response.json()).result
+        assert product.name == "상품, A"
+        assert product.description == "여러 줄\n설명"
+
+    def test_import_spans_multiple_chunks_in_order(self, test_app: FastAPI, client: TestClient) -> None:
+        """청크 크기를 넘는 입력도 입력 순서대로 ID가 매핑되는지 테스트"""
+        headers = create_test_seller(test_app, client)
+        body = "\n".join(
+            f'{{"name": "상품 {i}", "price": 1000, "stock": 1}}' for i in range(TEST_IMPORT_LARGE_ROW_COUNT)
+        )
+
+        response = client.post(
+            test_app.url_path_for(RouteName.PRODUCTS_BULK_IMPORT),
+            headers={**headers, "Content-Type": "application/x-ndjson"},
+            content=body.encode("utf-8"),
+        )
+
+        report = BaseResponse[ProductImportReport].model_validate(response.json()).result
+        assert report.succeeded == TEST_IMPORT_LARGE_ROW_COUNT
+        product_ids = [result.product_id for result in report.results]
+        assert product_ids == sorted(product_ids)  # type: ignore[type-var]
+
+        last_id = product_ids[-1]
+        assert last_id is not None
+        product_response = client.get(test_app.url_path_for(RouteName.PRODUCTS_GET, product_id=last_id))
+        product = BaseResponse[ProductRead].model_validate(product_response.json()).result
+        assert product.name == f"상품 {TEST_IMPORT_LARGE_ROW_COUNT - 1}"
+
+    def test_import_unsupported_media_type(self, test_app: FastAPI, client: TestClient) -> None:
+        """지원하지 않는 Content-Type은 415를 반환해야 함"""
+        headers = create_test_seller(test_app, client)
+
+        response = client.post(
+            test_app.url_path_for(RouteName.PRODUCTS_BULK_IMPORT),
+            headers={**headers, "Content-Type": "application/xml"},
+            content=b"<products />",
+        )
+
+        assert response.status_code == status.HTTP_415_UNSUPPORTED_MEDIA_TYPE
+
+    def test_import_forbidden_for_buyer(self, test_app: FastAPI, client: TestClient) -> None:
+        """구매자는 대량 등록을 할 수 없어야 함"""
+        create_test_user(test_app, client)
+        token = login_and_get_token(test_app, client)
+
+        response = client.post(
+            test_app.url_path_for(RouteName.PRODUCTS_BULK_IMPORT),
+            headers={"Authorization": f"Bearer {token}"},
+            json=[{"name": "상품", "price": 1000, "stock": 1}],
+        )
+
+        assert response.status_code == status.HTTP_403_FORBIDDEN
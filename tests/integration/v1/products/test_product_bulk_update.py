@@ -0,0 +1,122 @@
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from starlette import status
+
+from app.application.dto.product_dto import ProductInventoryUpdateReport, ProductRead
+from app.application.dto.response import BaseResponse
+from app.core.exceptions import ExceptionCode
+from app.core.route_names import RouteName
+from tests.integration.v1.products.helpers import TEST_PRODUCT_STOCK, create_test_product, create_test_seller
+from tests.integration.v1.users.helpers import create_test_user, login_and_get_token
+
+TEST_OTHER_SELLER_EMAIL = "other-seller@example.com"
+TEST_OTHER_SELLER_PASSWORD = "othersellerpassword"
+TEST_STOCK_ABSOLUTE = 42
+TEST_STOCK_DELTA = -5
+TEST_PRICE_UPDATED = 12345.0
+TEST_STALE_VERSION = 99
+
+
+def create_other_seller_product(test_app: FastAPI, client: TestClient) -> ProductRead:
+    """다른 판매자 소유의 상품을 생성합니다."""
+    create_test_user(test_app, client, email=TEST_OTHER_SELLER_EMAIL, password=TEST_OTHER_SELLER_PASSWORD)
+    token = login_and_get_token(test_app, client, email=TEST_OTHER_SELLER_EMAIL, password=TEST_OTHER_SELLER_PASSWORD)
+    headers = {"Authorization": f"Bearer {token}"}
+    client.post(
+        test_app.url_path_for(RouteName.USERS_REGISTER_SELLER),
+        headers=headers,
+        json={"storeName": "Other Store"},
+    )
+    response = client.post(
+        test_app.url_path_for(RouteName.PRODUCTS_CREATE),
+        headers=headers,
+        json={"name": "다른 판매자 상품", "price": 1000, "stock": 10},
+    )
+    return BaseResponse[ProductRead].model_validate(response.json()).result
+
+
+def get_product(test_app: FastAPI, client: TestClient, product_id: int) -> ProductRead:
+    response = client.get(test_app.url_path_for(RouteName.PRODUCTS_GET, product_id=product_id))
+    return BaseResponse[ProductRead].model_validate(response.json()).result
+
+
+class TestProductBulkUpdateInventory:
+    """상품 재고/가격 일괄 조정 테스트"""
+
+    def test_bulk_update_success(self, test_app: FastAPI, client: TestClient) -> None:
+        """재고 절대값/증감량/가격 조정 성공 테스트"""
+        first = create_test_product(test_app, client, name="상품 1")
+        second = create_test_product(test_app, client, name="상품 2")
+        headers = create_test_seller(test_app, client)
+
+        response = client.patch(
+            test_app.url_path_for(RouteName.PRODUCTS_BULK_UPDATE_INVENTORY),
+            headers=headers,
+            json={
+                "items": [
+                    {"id": first.id, "stock": TEST_STOCK_ABSOLUTE, "price": TEST_PRICE_UPDATED},
+                    {"id": second.id, "stockDelta": TEST_STOCK_DELTA, "expectedVersion": second.version},
+                ]
+            },
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        report = BaseResponse[ProductInventoryUpdateReport].model_validate(response.json()).result
+        assert report.succeeded == len(report.results)
+
+        updated_first = get_product(test_app, client, first.id)
+        assert updated_first.stock == TEST_STOCK_ABSOLUTE
+        assert updated_first.price == TEST_PRICE_UPDATED
+        assert updated_first.version == first.version + 1
+
+        updated_second = get_product(test_app, client, second.id)
+        assert updated_second.stock == TEST_PRODUCT_STOCK + TEST_STOCK_DELTA
+
+    def test_bulk_update_conflicts_do_not_abort_batch(self, test_app: FastAPI, client: TestClient) -> None:
+        """항목별 충돌은 배치를 중단하지 않고 항목 단위 결과로 반환되는지 테스트"""
+        others = create_other_seller_product(test_app, client)
+        mine = create_test_product(test_app, client, name="내 상품")
+        stale = create_test_product(test_app, client, name="버전 충돌 상품")
+        headers = create_test_seller(test_app, client)
+
+        response = client.patch(
+            test_app.url_path_for(RouteName.PRODUCTS_BULK_UPDATE_INVENTORY),
+            headers=headers,
+            json={
+                "items": [
+                    {"id": others.id, "stock": 0},
+                    {"id": stale.id, "stock": 1, "expectedVersion": TEST_STALE_VERSION},
+                    {"id": mine.id, "stockDelta": -(TEST_PRODUCT_STOCK + 1)},
+                    {"id": 99999, "stock": 1},
+                    {"id": mine.id, "stock": TEST_STOCK_ABSOLUTE},
+                ]
+            },
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        report = BaseResponse[ProductInventoryUpdateReport].model_validate(response.json()).result
+        assert [result.code for result in report.results] == [
+            ExceptionCode.FORBIDDEN,
+            ExceptionCode.CONCURRENT_MODIFICATION,
+            ExceptionCode.INSUFFICIENT_STOCK,
+            ExceptionCode.PRODUCT_NOT_FOUND,
+            ExceptionCode.BAD_REQUEST,
+        ]
+        assert report.succeeded == 0
+
+        # 실패한 항목은 변경되지 않아야 함
+        assert get_product(test_app, client, others.id).stock == others.stock
+        assert get_product(test_app, client, mine.id).stock == TEST_PRODUCT_STOCK
+
+    def test_bulk_update_stock_and_delta_together(self, test_app: FastAPI, client: TestClient) -> None:
+        """stock과 stockDelta를 동시에 지정하면 422를 반환해야 함"""
+        product = create_test_product(test_app, client)
+        headers = create_test_seller(test_app, client)
+
+        response = client.patch(
+            test_app.url_path_for(RouteName.PRODUCTS_BULK_UPDATE_INVENTORY),
+            headers=headers,
+            json={"items": [{"id": product.id, "stock": 1, "stockDelta": 1}]},
+        )
+
+        assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
@@ -0,0 +1,153 @@
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from starlette import status
+
+from app.application.dto.product_dto import ProductInventoryUpdateReport, ProductRead
+from app.application.dto.response import BaseResponse
+from app.core.exceptions import ExceptionCode
+from app.core.route_names import RouteName
+from app.core.security import get_current_admin
+from app.domain.model.user import User, UserRole
+from tests.integration.v1.products.helpers import TEST_PRODUCT_STOCK, create_test_product, create_test_seller
+from tests.integration.v1.users.helpers import create_test_user, login_and_get_token
+
+TEST_SHARD_COUNT = 4
+# 샤드 하나의 수량(100 / 4)보다 많이 주문하여 여러 샤드에서 나눠 차감되도록 함
+TEST_ORDER_QUANTITY = 30
+TEST_ORDER_QUANTITY_EXCESS = TEST_PRODUCT_STOCK
+TEST_STOCK_DELTA = 7
+
+
+def get_admin() -> User:
+    return User(id=1, email="admin@example.com", hashed_password="unused", role=UserRole.ADMIN)
+
+
+def configure_shards(test_app: FastAPI, client: TestClient, product_id: int, shard_count: int) -> ProductRead:
+    test_app.dependency_overrides[get_current_admin] = get_admin
+    response = client.put(
+        test_app.url_path_for(RouteName.PRODUCTS_CONFIGURE_STOCK_SHARDS, product_id=product_id),
+        json={"shardCount": shard_count},
+    )
+    assert response.status_code == status.HTTP_200_OK
+    return BaseResponse[ProductRead].model_validate(response.json()).result
+
+
+def get_product(test_app: FastAPI, client: TestClient, product_id: int) -> ProductRead:
+    response = client.get(test_app.url_path_for(RouteName.PRODUCTS_GET, product_id=product_id))
+    return BaseResponse[ProductRead].model_validate(response.json()).result
+
+
+def order(test_app: FastAPI, client: TestClient, product_id: int, quantity: int) -> int:
+    create_test_user(test_app, client)
+    token = login_and_get_token(test_app, client)
+    response = client.post(
+        test_app.url_path_for(RouteName.ORDERS_CREATE),
+        headers={"Authorization": f"Bearer {token}"},
+        json={"items": [{"productId": product_id, "quantity": quantity}]},
+    )
+    return response.status_code
+
+
+class TestProductStockShards:
+    """상품 재고 샤드 테스트"""
+
+    def test_configure_stock_shards(self, test_app: FastAPI, client: TestClient) -> None:
+        """재고 샤드를 설정하면 재고는 샤드 합계로 유지되고 버전이 올라가야 함"""
+        product = create_test_product(test_app, client)
+
+        sharded = configure_shards(test_app, client, product.id, TEST_SHARD_COUNT)
+
+        assert sharded.stock_shards == TEST_SHARD_COUNT
+        assert sharded.stock == TEST_PRODUCT_STOCK
+        assert sharded.version == product.version + 1
+        assert get_product(test_app, client, product.id) == sharded
+
+    def test_configure_stock_shards_requires_admin(self, test_app: FastAPI, client: TestClient) -> None:
+        """관리자가 아니면 재고 샤드를 설정할 수 없어야 함"""
+        product = create_test_product(test_app, client)
+        headers = create_test_seller(test_app, client)
+
+        response = client.put(
+            test_app.url_path_for(RouteName.PRODUCTS_CONFIGURE_STOCK_SHARDS, product_id=product.id),
+            headers=headers,
+            json={"shardCount": TEST_SHARD_COUNT},
+        )
+
+        assert response.status_code == status.HTTP_403_FORBIDDEN
+
+    def test_order_decreases_sharded_stock(self, test_app: FastAPI, client: TestClient) -> None:
+        """주문은 샤드에서 재고를 차감하며, 상품 행을 갱신하지 않으므로 버전이 유지되어야 함"""
+        product = configure_shards(test_app, client, create_test_product(test_app, client).id, TEST_SHARD_COUNT)
+
+        assert order(test_app, client, product.id, TEST_ORDER_QUANTITY) == status.HTTP_201_CREATED
+
+        ordered = get_product(test_app, client, product.id)
+        assert ordered.stock == TEST_PRODUCT_STOCK - TEST_ORDER_QUANTITY
+        assert ordered.version == product.version
+
+    def test_order_exceeding_sharded_stock(self, test_app: FastAPI, client: TestClient) -> None:
+        """샤드 합계보다 많이 주문하면 재고 부족으로 거부되어야 함"""
+        product = configure_shards(test_app, client, create_test_product(test_app, client).id, TEST_SHARD_COUNT)
+        assert order(test_app, client, product.id, TEST_ORDER_QUANTITY) == status.HTTP_201_CREATED
+
+        assert order(test_app, client, product.id, TEST_ORDER_QUANTITY_EXCESS) == status.HTTP_422_UNPROCESSABLE_CONTENT
+        assert get_product(test_app, client, product.id).stock == TEST_PRODUCT_STOCK - TEST_ORDER_QUANTITY
+
+    def test_bulk_update_sharded_stock(self, test_app: FastAPI, client: TestClient) -> None:
+        """재고 일괄 조정의 증감량이 샤드 재고에 반영되어야 함"""
+        product = configure_shards(test_app, client, create_test_product(test_app, client).id, TEST_SHARD_COUNT)
+        headers = create_test_seller(test_app, client)
+
+        response = client.patch(
+            test_app.url_path_for(RouteName.PRODUCTS_BULK_UPDATE_INVENTORY),
+            headers=headers,
+            json={"items": [{"id": product.id, "stockDelta": -TEST_STOCK_DELTA, "expectedVersion": product.version}]},
+        )
+
+        report = BaseResponse[ProductInventoryUpdateReport].model_validate(response.json()).result
+        [result] = report.results
+        assert result.success
+        assert result.product is not None
+        assert result.product.stock == TEST_PRODUCT_STOCK - TEST_STOCK_DELTA
+        assert get_product(test_app, client, product.id) == result.product
+
+    def test_bulk_update_sharded_stock_insufficient(self, test_app: FastAPI, client: TestClient) -> None:
+        """샤드 합계보다 많이 차감하는 조정 항목은 재고 부족으로 보고되어야 함"""
+        product = configure_shards(test_app, client, create_test_product(test_app, client).id, TEST_SHARD_COUNT)
+        headers = create_test_seller(test_app, client)
+
+        response = client.patch(
+            test_app.url_path_for(RouteName.PRODUCTS_BULK_UPDATE_INVENTORY),
+            headers=headers,
+            json={"items": [{"id": product.id, "stockDelta": -(TEST_PRODUCT_STOCK + 1)}]},
+        )
+
+        [result] = BaseResponse[ProductInventoryUpdateReport].model_validate(response.json()).result.results
+        assert not result.success
+        assert result.code == ExceptionCode.INSUFFICIENT_STOCK
+        assert get_product(test_app, client, product.id) == product
+
+    def test_rebalance_stock_shards(self, test_app: FastAPI, client: TestClient) -> None:
+        """재분배는 재고 샤드를 사용하는 상품만 대상으로 하며 재고 합계를 유지해야 함"""
+        product = configure_shards(test_app, client, create_test_product(test_app, client).id, TEST_SHARD_COUNT)
+        create_test_product(test_app, client, name="샤드 미사용 상품")
+        order(test_app, client, product.id, TEST_ORDER_QUANTITY)
+
+        response = client.post(test_app.url_path_for(RouteName.PRODUCTS_REBALANCE_STOCK_SHARDS))
+
+        assert response.status_code == status.HTTP_200_OK
+        [rebalanced] = BaseResponse[list[ProductRead]].model_validate(response.json()).result
+        assert rebalanced.id == product.id
+        assert rebalanced.stock == TEST_PRODUCT_STOCK - TEST_ORDER_QUANTITY
+
+    def test_disable_stock_shards(self, test_app: FastAPI, client: TestClient) -> None:
+        """샤드 수를 0으로 설정하면 샤드 재고가 상품 행으로 합쳐져야 함"""
+        product = configure_shards(test_app, client, create_test_product(test_app, client).id, TEST_SHARD_COUNT)
+        order(test_app, client, product.id, TEST_ORDER_QUANTITY)
+
+        unsharded = configure_shards(test_app, client, product.id, 0)
+
+        assert unsharded.stock_shards == 0
+        assert unsharded.stock == TEST_PRODUCT_STOCK - TEST_ORDER_QUANTITY
+        assert order(test_app, client, product.id, TEST_ORDER_QUANTITY) == status.HTTP_201_CREATED
+        assert get_product(test_app, client, product.id).stock == TEST_PRODUCT_STOCK - 2 * TEST_ORDER_QUANTITY
@@ -0,0 +1,87 @@
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from starlette import status
+
+from app.application.dto.debug_dto import RateLimitStatsRead
+from app.application.dto.response import BaseResponse
+from app.core.exceptions import ExceptionCode
+from app.core.rate_limit import LOGIN_PER_EMAIL, LOGIN_PER_IP
+from app.core.route_names import RouteName
+from app.core.security import get_current_admin
+from app.domain.model.user import User, UserRole
+from app.infrastructure.persistence.user_repository import SQLUserRepository
+from tests.integration.v1.users.helpers import TEST_USER_EMAIL, TEST_USER_PASSWORD_WRONG, create_test_user
+
+TEST_OTHER_EMAIL = "other@example.com"
+
+
+def get_admin() -> User:
+    return User(id=1, email="admin@example.com", hashed_password="unused", role=UserRole.ADMIN)
+
+
+def login(test_app: FastAPI, client: TestClient, email: str) -> int:
+    response = client.post(
+        test_app.url_path_for(RouteName.USERS_LOGIN),
+        json={"email": email, "password": TEST_USER_PASSWORD_WRONG},
+    )
+    return response.status_code
+
+
+class TestLoginRateLimit:
+    """로그인 요청 제한 테스트"""
+
+    def test_login_rejected_per_email(self, test_app: FastAPI, client: TestClient) -> None:
+        """같은 이메일로 제한 횟수를 넘게 시도하면 429와 Retry-After 헤더를 반환해야 함"""
+        create_test_user(test_app, client)
+        for _ in range(LOGIN_PER_EMAIL.capacity):
+            assert login(test_app, client, TEST_USER_EMAIL) == status.HTTP_401_UNAUTHORIZED
+
+        # 대소문자만 바꿔서 우회할 수 없어야 함
+        response = client.post(
+            test_app.url_path_for(RouteName.USERS_LOGIN),
+            json={"email": TEST_USER_EMAIL.upper(), "password": TEST_USER_PASSWORD_WRONG},
+        )
+
+        assert response.status_code == status.HTTP_429_TOO_MANY_REQUESTS
+        assert response.json()["code"] == ExceptionCode.TOO_MANY_REQUESTS
+        assert int(response.headers["Retry-After"]) >= 1
+
+        # 다른 이메일은 영향을 받지 않음
+        assert login(test_app, client, TEST_OTHER_EMAIL) == status.HTTP_401_UNAUTHORIZED
+
+    def test_rejected_before_user_lookup(
+        self, test_app: FastAPI, client: TestClient, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """제한에 걸린 요청은 사용자 조회와 비밀번호 검증 전에 거부되어야 함"""
+        for _ in range(LOGIN_PER_EMAIL.capacity):
+            login(test_app, client, TEST_USER_EMAIL)
+
+        async def fail_lookup(*args: object, **kwargs: object) -> None:
+            raise AssertionError("제한된 요청에서 사용자를 조회하면 안 됨")
+
+        monkeypatch.setattr(SQLUserRepository, "get_by_email", fail_lookup)
+
+        assert login(test_app, client, TEST_USER_EMAIL) == status.HTTP_429_TOO_MANY_REQUESTS
+
+    def test_login_rejected_per_ip(self, test_app: FastAPI, client: TestClient) -> None:
+        """이메일을 바꿔가며 시도해도 IP 기준 제한을 넘으면 거부되어야 함"""
+        for index in range(LOGIN_PER_IP.capacity):
+            assert login(test_app, client, f"user{index}@example.com") == status.HTTP_401_UNAUTHORIZED
+
+        assert login(test_app, client, TEST_OTHER_EMAIL) == status.HTTP_429_TOO_MANY_REQUESTS
+
+    def test_rate_limit_stats(self, test_app: FastAPI, client: TestClient) -> None:
+        """규칙별 허용/거부 횟수를 관리자 통계로 조회할 수 있어야 함"""
+        for _ in range(LOGIN_PER_EMAIL.capacity + 1):
+            login(test_app, client, TEST_USER_EMAIL)
+        test_app.dependency_overrides[get_current_admin] = get_admin
+
+        response = client.get(test_app.url_path_for(RouteName.DEBUG_RATE_LIMITS))
+
+        assert response.status_code == status.HTTP_200_OK
+        stats = {
+            item.rule: item for item in BaseResponse[list[RateLimitStatsRead]].model_validate(response.json()).result
+        }
+        assert stats[LOGIN_PER_EMAIL.name].allowed == LOGIN_PER_EMAIL.capacity
+        assert stats[LOGIN_PER_EMAIL.name].rejected == 1
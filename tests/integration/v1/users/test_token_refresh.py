@@ -0,0 +1,123 @@
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from starlette import status
+
+from app.application.dto.product_dto import ProductRead
+from app.application.dto.response import BaseResponse
+from app.application.dto.token import Token
+from app.core.exceptions import ExceptionCode
+from app.core.rate_limit import TOKEN_PER_IP
+from app.core.route_names import RouteName
+from app.core.security import decode_access_token
+from app.domain.model.user import User, UserRole
+from app.infrastructure.persistence.user_repository import SQLUserRepository
+from tests.integration.v1.users.helpers import TEST_USER_EMAIL, TEST_USER_PASSWORD, create_test_user
+
+TEST_UNKNOWN_REFRESH_TOKEN = "unknown-refresh-token"
+
+
+def login(test_app: FastAPI, client: TestClient) -> Token:
+    response = client.post(
+        test_app.url_path_for(RouteName.USERS_LOGIN),
+        json={"email": TEST_USER_EMAIL, "password": TEST_USER_PASSWORD},
+    )
+    return BaseResponse[Token].model_validate(response.json()).result
+
+
+def refresh(test_app: FastAPI, client: TestClient, refresh_token: str) -> BaseResponse[Token | None]:
+    response = client.post(
+        test_app.url_path_for(RouteName.USERS_REFRESH_TOKEN),
+        json={"refreshToken": refresh_token},
+    )
+    return BaseResponse[Token | None].model_validate(response.json())
+
+
+class TestTokenRefresh:
+    """리프레시 토큰 재발급/폐기 테스트"""
+
+    def test_refresh_rotates_token(self, test_app: FastAPI, client: TestClient) -> None:
+        """재발급 시 새 리프레시 토큰이 발급되고, 액세스 토큰에 사용자 클레임이 포함되어야 함"""
+        user = create_test_user(test_app, client)
+        login_token = login(test_app, client)
+
+        refreshed = refresh(test_app, client, login_token.refresh_token).result
+
+        assert refreshed is not None
+        assert refreshed.refresh_token != login_token.refresh_token
+        claims = decode_access_token(refreshed.access_token)
+        assert claims.uid == user.id
+        assert claims.role == UserRole.BUYER
+
+        response = client.get(
+            test_app.url_path_for(RouteName.USERS_GET_CURRENT_USER),
+            headers={"Authorization": f"Bearer {refreshed.access_token}"},
+        )
+        assert response.status_code == status.HTTP_200_OK
+
+    def test_reused_refresh_token_revokes_family(self, test_app: FastAPI, client: TestClient) -> None:
+        """이미 회전된 리프레시 토큰을 재사용하면 같은 로그인의 토큰이 모두 폐기되어야 함"""
+        create_test_user(test_app, client)
+        login_token = login(test_app, client)
+        refreshed = refresh(test_app, client, login_token.refresh_token).result
+        assert refreshed is not None
+
+        reused = refresh(test_app, client, login_token.refresh_token)
+        assert reused.code == ExceptionCode.INVALID_REFRESH_TOKEN
+
+        assert refresh(test_app, client, refreshed.refresh_token).code == ExceptionCode.INVALID_REFRESH_TOKEN
+
+    def test_revoke_refresh_token(self, test_app: FastAPI, client: TestClient) -> None:
+        """로그아웃으로 폐기한 리프레시 토큰은 재발급에 사용할 수 없어야 함"""
+        create_test_user(test_app, client)
+        login_token = login(test_app, client)
+
+        response = client.post(
+            test_app.url_path_for(RouteName.USERS_REVOKE_TOKEN),
+            json={"refreshToken": login_token.refresh_token},
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert refresh(test_app, client, login_token.refresh_token).code == ExceptionCode.INVALID_REFRESH_TOKEN
+
+    def test_token_endpoints_rejected_per_ip(self, test_app: FastAPI, client: TestClient) -> None:
+        """재발급/폐기 요청은 IP별 제한을 공유하며, 제한을 넘으면 토큰 조회 없이 429를 반환해야 함"""
+        for _ in range(TOKEN_PER_IP.capacity):
+            assert refresh(test_app, client, TEST_UNKNOWN_REFRESH_TOKEN).code == ExceptionCode.INVALID_REFRESH_TOKEN
+
+        response = client.post(
+            test_app.url_path_for(RouteName.USERS_REVOKE_TOKEN),
+            json={"refreshToken": TEST_UNKNOWN_REFRESH_TOKEN},
+        )
+
+        assert response.status_code == status.HTTP_429_TOO_MANY_REQUESTS
+        assert response.json()["code"] == ExceptionCode.TOO_MANY_REQUESTS
+
+    def test_seller_claims_authorize_without_user_lookup(
+        self, test_app: FastAPI, client: TestClient, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """판매자 클레임이 있는 액세스 토큰은 사용자 조회 없이 판매자 API를 사용할 수 있어야 함"""
+        create_test_user(test_app, client)
+        login_token = login(test_app, client)
+        client.post(
+            test_app.url_path_for(RouteName.USERS_REGISTER_SELLER),
+            headers={"Authorization": f"Bearer {login_token.access_token}"},
+            json={"storeName": "Claims Store"},
+        )
+        # 판매자 등록 후 재발급한 토큰에는 seller_id 클레임이 포함됨
+        refreshed = refresh(test_app, client, login_token.refresh_token).result
+        assert refreshed is not None
+        assert decode_access_token(refreshed.access_token).seller_id is not None
+
+        async def fail_get_by_email(self: SQLUserRepository, email: str) -> User | None:
+            raise AssertionError("판매자 클레임이 있으면 사용자를 조회하지 않아야 함")
+
+        monkeypatch.setattr(SQLUserRepository, "get_by_email", fail_get_by_email)
+        response = client.post(
+            test_app.url_path_for(RouteName.PRODUCTS_CREATE),
+            headers={"Authorization": f"Bearer {refreshed.access_token}"},
+            json={"name": "클레임 상품", "price": 1000, "stock": 1},
+        )
+
+        assert response.status_code == status.HTTP_201_CREATED
+        assert BaseResponse[ProductRead].model_validate(response.json()).result.name == "클레임 상품"
@@ -1,11 +1,20 @@
+from collections.abc import AsyncIterator
+from typing import Any
+
 import pytest
 
-from app.application.dto.product_dto import ProductCreate
+from app.application.dto.product_dto import ProductCreate, ProductInventoryUpdate, ProductInventoryUpdateItem
 from app.application.use_cases.product_use_case import ProductUseCase
-from app.core.exceptions import ProductNotFoundException
+from app.core.exceptions import ExceptionCode, ProductNotFoundException
 from tests.fakes.fake_unit_of_work import FakeUnitOfWork
 from tests.fakes.repositories.fake_product_repository import FakeProductRepository
 
+TEST_IMPORT_TOTAL_ROWS = 4
+TEST_IMPORT_VALID_ROWS = 2
+TEST_INVENTORY_STOCK = 10
+TEST_INVENTORY_STOCK_UPDATED = 7
+TEST_INVENTORY_PRICE_UPDATED = 1500.0
+
 
 @pytest.mark.asyncio
 class TestProductUseCase:
@@ -58,3 +67,71 @@ class TestProductUseCase:
         # When & Then
         with pytest.raises(ProductNotFoundException):
             await use_case.get_product_by_id(999)
+
+    async def test_import_products_reports_each_row(self) -> None:
+        # Given
+        product_repo = FakeProductRepository()
+        uow = FakeUnitOfWork()
+        use_case = ProductUseCase(product_repository=product_repo, uow=uow)
+
+        async def rows() -> AsyncIterator[Any]:
+            yield {"name": "Valid 1", "price": 1000, "stock": 1}
+            yield {"name": "Invalid Price", "price": -1, "stock": 1}
+            yield ValueError("파싱 실패")
+            yield {"name": "Valid 2", "price": 2000, "stock": 2}
+
+        # When
+        report = await use_case.import_products(seller_id=1, rows=rows())
+
+        # Then
+        assert report.total == TEST_IMPORT_TOTAL_ROWS
+        assert report.succeeded == TEST_IMPORT_VALID_ROWS
+        assert report.failed == TEST_IMPORT_TOTAL_ROWS - TEST_IMPORT_VALID_ROWS
+        assert [result.row for result in report.results] == [1, 2, 3, 4]
+        assert [result.success for result in report.results] == [True, False, False, True]
+        assert report.results[1].error is not None and "price" in report.results[1].error
+        assert report.results[2].error == "파싱 실패"
+
+        created = await product_repo.get_by_id(report.results[3].product_id)  # type: ignore[arg-type]
+        assert created is not None
+        assert created.name == "Valid 2"
+        assert created.seller_id == 1
+
+    async def test_bulk_update_inventory_reports_conflicts_per_item(self) -> None:
+        # Given
+        product_repo = FakeProductRepository()
+        uow = FakeUnitOfWork()
+        use_case = ProductUseCase(product_repository=product_repo, uow=uow)
+
+        mine = await use_case.create_product(1, ProductCreate(name="Mine", price=1000, stock=TEST_INVENTORY_STOCK))
+        others = await use_case.create_product(2, ProductCreate(name="Others", price=1000, stock=TEST_INVENTORY_STOCK))
+        low = await use_case.create_product(1, ProductCreate(name="Low", price=1000, stock=1))
+
+        inventory_update = ProductInventoryUpdate(
+            items=[
+                ProductInventoryUpdateItem(id=mine.id, stock=TEST_INVENTORY_STOCK_UPDATED),
+                ProductInventoryUpdateItem(id=others.id, stock=1),
+                ProductInventoryUpdateItem(id=low.id, stock_delta=-2),
+                ProductInventoryUpdateItem(id=999, price=1000),
+                ProductInventoryUpdateItem(id=mine.id, price=TEST_INVENTORY_PRICE_UPDATED),
+            ]
+        )
+
+        # When
+        report = await use_case.bulk_update_inventory(seller_id=1, inventory_update=inventory_update)
+
+        # Then
+        assert report.succeeded == 1
+        assert [result.code for result in report.results] == [
+            "OK",
+            ExceptionCode.FORBIDDEN,
+            ExceptionCode.INSUFFICIENT_STOCK,
+            ExceptionCode.PRODUCT_NOT_FOUND,
+            ExceptionCode.BAD_REQUEST,
+        ]
+        assert report.results[0].product is not None
+        assert report.results[0].product.stock == TEST_INVENTORY_STOCK_UPDATED
+
+        untouched = await product_repo.get_by_id(others.id)
+        assert untouched is not None
+        assert untouched.stock == TEST_INVENTORY_STOCK
@@ -2,13 +2,16 @@ import pytest
 
 from app.application.dto.user_dto import UserCreate
 from app.application.use_cases.user_use_case import UserUseCase
+from app.core import security
 from app.core.exceptions import (
     EmailAlreadyExistsException,
     InvalidCredentialsException,
+    InvalidRefreshTokenException,
     UserInactiveException,
 )
 from app.domain.model.user import User
 from tests.fakes.fake_unit_of_work import FakeUnitOfWork
+from tests.fakes.repositories.fake_refresh_token_repository import FakeRefreshTokenRepository
 from tests.fakes.repositories.fake_user_repository import FakeUserRepository
 
 
@@ -18,7 +21,9 @@ class TestUserUseCase:
         # Given
         user_repo = FakeUserRepository()
         uow = FakeUnitOfWork()
-        use_case = UserUseCase(user_repository=user_repo, uow=uow)
+        use_case = UserUseCase(
+            user_repository=user_repo, refresh_token_repository=FakeRefreshTokenRepository(), uow=uow
+        )
 
         user_create = UserCreate(email="test@example.com", password="password123", full_name="Test User")
 
@@ -39,7 +44,9 @@ class TestUserUseCase:
         # Given
         user_repo = FakeUserRepository()
         uow = FakeUnitOfWork()
-        use_case = UserUseCase(user_repository=user_repo, uow=uow)
+        use_case = UserUseCase(
+            user_repository=user_repo, refresh_token_repository=FakeRefreshTokenRepository(), uow=uow
+        )
 
         # Pre-populate user
         existing_user = User(
@@ -57,7 +64,9 @@ class TestUserUseCase:
         # Given
         user_repo = FakeUserRepository()
         uow = FakeUnitOfWork()
-        use_case = UserUseCase(user_repository=user_repo, uow=uow)
+        use_case = UserUseCase(
+            user_repository=user_repo, refresh_token_repository=FakeRefreshTokenRepository(), uow=uow
+        )
 
         # Create user via UseCase to ensure password hashing works correctly
         user_create = UserCreate(email="login@example.com", password="correct_password", full_name="Login User")
@@ -67,14 +76,16 @@ class TestUserUseCase:
         token = await use_case.login_user("login@example.com", "correct_password")
 
         # Then
-        assert isinstance(token, str)
-        assert len(token) > 0
+        assert len(token.access_token) > 0
+        assert len(token.refresh_token) > 0
 
     async def test_login_user_invalid_credentials(self) -> None:
         # Given
         user_repo = FakeUserRepository()
         uow = FakeUnitOfWork()
-        use_case = UserUseCase(user_repository=user_repo, uow=uow)
+        use_case = UserUseCase(
+            user_repository=user_repo, refresh_token_repository=FakeRefreshTokenRepository(), uow=uow
+        )
 
         user_create = UserCreate(email="login@example.com", password="correct_password", full_name="Login User")
         await use_case.create_user(user_create)
@@ -87,7 +98,9 @@ class TestUserUseCase:
         # Given
         user_repo = FakeUserRepository()
         uow = FakeUnitOfWork()
-        use_case = UserUseCase(user_repository=user_repo, uow=uow)
+        use_case = UserUseCase(
+            user_repository=user_repo, refresh_token_repository=FakeRefreshTokenRepository(), uow=uow
+        )
 
         # When & Then
         with pytest.raises(InvalidCredentialsException):
@@ -97,7 +110,9 @@ class TestUserUseCase:
         # Given
         user_repo = FakeUserRepository()
         uow = FakeUnitOfWork()
-        use_case = UserUseCase(user_repository=user_repo, uow=uow)
+        use_case = UserUseCase(
+            user_repository=user_repo, refresh_token_repository=FakeRefreshTokenRepository(), uow=uow
+        )
 
         inactive_user = User(
             email="inactive@example.com",
@@ -111,3 +126,55 @@ class TestUserUseCase:
         # When & Then
         with pytest.raises(UserInactiveException):
             await use_case.login_user("inactive@example.com", "password123")
+
+    async def test_refresh_access_token_rotates(self) -> None:
+        # Given
+        use_case = UserUseCase(
+            user_repository=FakeUserRepository(),
+            refresh_token_repository=FakeRefreshTokenRepository(),
+            uow=FakeUnitOfWork(),
+        )
+        await use_case.create_user(
+            UserCreate(email="refresh@example.com", password="password123", full_name="Refresh User")
+        )
+        login_token = await use_case.login_user("refresh@example.com", "password123")
+
+        # When
+        refreshed = await use_case.refresh_access_token(login_token.refresh_token)
+
+        # Then
+        assert refreshed.refresh_token != login_token.refresh_token
+        assert security.decode_access_token(refreshed.access_token).uid is not None
+        # 회전된 토큰으로 다시 재발급할 수 있어야 함
+        await use_case.refresh_access_token(refreshed.refresh_token)
+
+    async def test_refresh_token_reuse_revokes_family(self) -> None:
+        # Given
+        use_case = UserUseCase(
+            user_repository=FakeUserRepository(),
+            refresh_token_repository=FakeRefreshTokenRepository(),
+            uow=FakeUnitOfWork(),
+        )
+        await use_case.create_user(
+            UserCreate(email="reuse@example.com", password="password123", full_name="Refresh User")
+        )
+        login_token = await use_case.login_user("reuse@example.com", "password123")
+        refreshed = await use_case.refresh_access_token(login_token.refresh_token)
+
+        # When: 이미 회전된 토큰을 다시 사용
+        with pytest.raises(InvalidRefreshTokenException):
+            await use_case.refresh_access_token(login_token.refresh_token)
+
+        # Then: 같은 묶음의 최신 토큰도 폐기되어야 함
+        with pytest.raises(InvalidRefreshTokenException):
+            await use_case.refresh_access_token(refreshed.refresh_token)
+
+    async def test_refresh_unknown_token(self) -> None:
+        use_case = UserUseCase(
+            user_repository=FakeUserRepository(),
+            refresh_token_repository=FakeRefreshTokenRepository(),
+            uow=FakeUnitOfWork(),
+        )
+
+        with pytest.raises(InvalidRefreshTokenException):
+            await use_case.refresh_access_token("unknown-token")
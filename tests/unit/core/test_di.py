@@ -0,0 +1,41 @@
+from unittest.mock import MagicMock
+
+from app.containers import Container
+from app.core.db import bind_request_session
+from app.core.di import request_instance_scope
+
+
+def test_request_scope_reuses_instances() -> None:
+    """요청 스코프 안에서는 같은 요청의 유즈케이스/리포지토리/UoW를 한 번만 생성해야 함"""
+    container = Container()
+    session = MagicMock()
+
+    with bind_request_session(session), request_instance_scope():
+        order_use_case = container.order_use_case()
+        assert container.order_use_case() is order_use_case
+        assert order_use_case.product_repository is container.product_repository()
+        assert order_use_case.uow is container.uow()
+        assert order_use_case.uow.session is session
+
+    with bind_request_session(session), request_instance_scope():
+        assert container.order_use_case() is not order_use_case
+
+
+def test_outside_request_scope_builds_new_instances() -> None:
+    """요청 인스턴스 스코프 밖에서는 기존 Factory처럼 호출마다 새로 생성해야 함"""
+    container = Container()
+
+    with bind_request_session(MagicMock()):
+        assert container.order_use_case() is not container.order_use_case()
+
+
+def test_override_is_respected_in_request_scope() -> None:
+    """하위 provider를 오버라이드하면 미리 펼친 생성 함수에서도 오버라이드된 값을 사용해야 함"""
+    container = Container()
+    fake_repository = MagicMock()
+    with bind_request_session(MagicMock()), request_instance_scope():
+        container.product_use_case()
+
+    with container.product_repository.override(fake_repository):
+        with bind_request_session(MagicMock()), request_instance_scope():
+            assert container.product_use_case().product_repository is fake_repository
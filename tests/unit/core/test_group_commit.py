@@ -0,0 +1,130 @@
+import asyncio
+
+import pytest
+
+from app.core.group_commit import GroupCommitter
+
+TEST_KEY = 1
+TEST_REQUEST_COUNT = 5
+TEST_MAX_BATCH = 2
+TEST_WINDOW = 0.05
+
+
+class Recorder:
+    """커밋 호출마다 받은 요청 목록을 기록하고, 요청값의 두 배를 결과로 돌려줍니다."""
+
+    def __init__(self, failing: frozenset[int] = frozenset()) -> None:
+        self.batches: list[list[int]] = []
+        self.failing = failing
+
+    async def commit(self, requests: list[int]) -> list[int | Exception]:
+        self.batches.append(requests)
+        await asyncio.sleep(0)
+        return [ValueError(request) if request in self.failing else request * 2 for request in requests]
+
+
+@pytest.mark.asyncio
+async def test_concurrent_requests_share_one_commit() -> None:
+    """window 안에 들어온 같은 키의 요청은 한 번의 커밋으로 처리되고 요청별 결과를 받아야 함"""
+    committer: GroupCommitter[int, int, int] = GroupCommitter("test")
+    recorder = Recorder()
+
+    results = await asyncio.gather(
+        *(
+            committer.submit(TEST_KEY, request, recorder.commit, window=TEST_WINDOW, max_batch=100)
+            for request in range(TEST_REQUEST_COUNT)
+        )
+    )
+
+    assert results == [request * 2 for request in range(TEST_REQUEST_COUNT)]
+    assert recorder.batches == [list(range(TEST_REQUEST_COUNT))]
+    assert len(committer) == 0
+
+
+@pytest.mark.asyncio
+async def test_different_keys_commit_separately() -> None:
+    """키가 다르면 서로 다른 배치로 처리되어야 함"""
+    committer: GroupCommitter[int, int, int] = GroupCommitter("test")
+    recorder = Recorder()
+
+    await asyncio.gather(
+        *(committer.submit(request % 2, request, recorder.commit, window=0, max_batch=100) for request in range(4))
+    )
+
+    assert sorted(recorder.batches) == [[0, 2], [1, 3]]
+
+
+@pytest.mark.asyncio
+async def test_max_batch_splits_and_hands_off_leadership() -> None:
+    """max_batch를 넘는 요청은 다음 배치로 넘어가고, 남은 요청 중 하나가 이어서 처리해야 함"""
+    committer: GroupCommitter[int, int, int] = GroupCommitter("test")
+    recorder = Recorder()
+
+    results = await asyncio.gather(
+        *(
+            committer.submit(TEST_KEY, request, recorder.commit, window=TEST_WINDOW, max_batch=TEST_MAX_BATCH)
+            for request in range(TEST_REQUEST_COUNT)
+        )
+    )
+
+    assert results == [request * 2 for request in range(TEST_REQUEST_COUNT)]
+    assert recorder.batches == [[0, 1], [2, 3], [4]]
+    assert len(committer) == 0
+
+
+@pytest.mark.asyncio
+async def test_request_error_fails_only_that_request() -> None:
+    """커밋이 요청별 예외를 돌려주면 해당 요청만 실패해야 함"""
+    committer: GroupCommitter[int, int, int] = GroupCommitter("test")
+    recorder = Recorder(failing=frozenset({0, 2}))
+
+    results = await asyncio.gather(
+        *(
+            committer.submit(TEST_KEY, request, recorder.commit, window=TEST_WINDOW, max_batch=100)
+            for request in range(TEST_REQUEST_COUNT)
+        ),
+        return_exceptions=True,
+    )
+
+    assert [type(result) for result in results] == [ValueError, int, ValueError, int, int]
+    assert len(recorder.batches) == 1
+
+
+@pytest.mark.asyncio
+async def test_commit_error_fails_whole_batch() -> None:
+    """커밋 자체가 실패하면 배치의 모든 요청이 같은 예외로 실패하고, 이후 요청은 새 배치로 처리되어야 함"""
+    committer: GroupCommitter[int, int, int] = GroupCommitter("test")
+    error = RuntimeError("conflict")
+
+    async def failing_commit(requests: list[int]) -> list[int | Exception]:
+        raise error
+
+    results = await asyncio.gather(
+        *(
+            committer.submit(TEST_KEY, request, failing_commit, window=TEST_WINDOW, max_batch=100)
+            for request in range(TEST_REQUEST_COUNT)
+        ),
+        return_exceptions=True,
+    )
+
+    assert results == [error] * TEST_REQUEST_COUNT
+    assert len(committer) == 0
+    assert await committer.submit(TEST_KEY, 1, Recorder().commit, window=0, max_batch=100) == 2  # noqa: PLR2004
+
+
+@pytest.mark.asyncio
+async def test_cancelled_follower_is_skipped() -> None:
+    """대기 중에 취소된 요청은 배치에서 제외되어야 함"""
+    committer: GroupCommitter[int, int, int] = GroupCommitter("test")
+    recorder = Recorder()
+
+    leader = asyncio.create_task(committer.submit(TEST_KEY, 0, recorder.commit, window=TEST_WINDOW, max_batch=100))
+    await asyncio.sleep(0)
+    follower = asyncio.create_task(committer.submit(TEST_KEY, 1, recorder.commit, window=TEST_WINDOW, max_batch=100))
+    await asyncio.sleep(0)
+    follower.cancel()
+
+    assert await leader == 0
+    assert follower.cancelled()
+    assert recorder.batches == [[0]]
+    assert len(committer) == 0
@@ -0,0 +1,65 @@
+import asyncio
+
+import pytest
+
+from app.core.idempotency import KeyedLock, request_fingerprint
+
+
+def test_fingerprint_ignores_key_order() -> None:
+    """요청 본문의 키 순서가 달라도 같은 지문이어야 함"""
+    assert request_fingerprint("op", {"a": 1, "b": [1, 2]}) == request_fingerprint("op", {"b": [1, 2], "a": 1})
+
+
+def test_fingerprint_differs_by_operation_and_payload() -> None:
+    """작업이나 본문이 다르면 다른 지문이어야 함"""
+    fingerprint = request_fingerprint("op", {"a": 1})
+    assert request_fingerprint("other", {"a": 1}) != fingerprint
+    assert request_fingerprint("op", {"a": 2}) != fingerprint
+
+
+@pytest.mark.asyncio
+async def test_keyed_lock_serializes_same_key() -> None:
+    """같은 키는 먼저 잡은 쪽이 끝날 때까지 대기하고, 다른 키와 None은 대기하지 않아야 함"""
+    locks = KeyedLock()
+    events: list[str] = []
+    first_entered = asyncio.Event()
+    release_first = asyncio.Event()
+
+    async def first() -> None:
+        async with locks.hold("key"):
+            events.append("first:start")
+            first_entered.set()
+            await release_first.wait()
+            events.append("first:end")
+
+    async def second() -> None:
+        async with locks.hold("key"):
+            events.append("second")
+
+    async def other(key: str | None) -> None:
+        async with locks.hold(key):
+            events.append(f"other:{key}")
+
+    first_task = asyncio.create_task(first())
+    await first_entered.wait()
+    second_task = asyncio.create_task(second())
+    await asyncio.gather(other("another"), other(None))
+    await asyncio.sleep(0)
+    assert "second" not in events
+
+    release_first.set()
+    await asyncio.gather(first_task, second_task)
+    assert events[-2:] == ["first:end", "second"]
+
+
+@pytest.mark.asyncio
+async def test_keyed_lock_removes_unused_locks() -> None:
+    """대기자가 없어진 키의 락은 제거되어야 함"""
+    locks = KeyedLock()
+
+    async def hold(key: str) -> None:
+        async with locks.hold(key):
+            await asyncio.sleep(0)
+
+    await asyncio.gather(hold("a"), hold("a"), hold("b"))
+    assert len(locks) == 0
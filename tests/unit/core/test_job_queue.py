@@ -0,0 +1,160 @@
+import asyncio
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from app.core.job_queue import JobQueue, SQLiteJobStore, job_queue_jobs_total
+
+TEST_JOB = "test.record"
+TEST_JOB_COUNT = 6
+TEST_CONCURRENCY = 2
+TEST_MAX_ATTEMPTS = 3
+TEST_RETRY_SECONDS = 0.01
+
+
+class Recorder:
+    """받은 payload를 기록하고, 앞의 `failures`번은 실패하는 핸들러"""
+
+    def __init__(self, failures: int = 0, delay: float = 0) -> None:
+        self.payloads: list[dict[str, Any]] = []
+        self.failures = failures
+        self.delay = delay
+        self.running = 0
+        self.max_running = 0
+
+    async def handle(self, payload: dict[str, Any]) -> None:
+        self.running += 1
+        self.max_running = max(self.max_running, self.running)
+        try:
+            await asyncio.sleep(self.delay)
+            if self.failures > 0:
+                self.failures -= 1
+                raise RuntimeError("일시적 실패")
+            self.payloads.append(payload)
+        finally:
+            self.running -= 1
+
+
+def _queue(recorder: Recorder, concurrency: int = 1, store: SQLiteJobStore | None = None) -> JobQueue:
+    queue = JobQueue(
+        store,
+        concurrency=concurrency,
+        max_attempts=TEST_MAX_ATTEMPTS,
+        retry_base_seconds=TEST_RETRY_SECONDS,
+        retry_max_seconds=TEST_RETRY_SECONDS,
+    )
+    queue.register(TEST_JOB, recorder.handle)
+    return queue
+
+
+@pytest.mark.asyncio
+async def test_jobs_run_in_priority_order() -> None:
+    """우선순위 값이 작은 작업부터, 같으면 넣은 순서대로 실행되어야 함"""
+    recorder = Recorder()
+    queue = _queue(recorder)
+    for index, priority in enumerate([1, 0, 1, 0]):
+        await queue.enqueue(TEST_JOB, {"index": index}, priority=priority)
+
+    await queue.start()
+    await queue.join()
+    await queue.stop()
+
+    assert [payload["index"] for payload in recorder.payloads] == [1, 3, 0, 2]
+
+
+@pytest.mark.asyncio
+async def test_concurrency_is_bounded() -> None:
+    """동시에 실행되는 작업 수는 워커 수를 넘지 않아야 함"""
+    recorder = Recorder(delay=0.01)
+    queue = _queue(recorder, concurrency=TEST_CONCURRENCY)
+    await queue.start()
+
+    for index in range(TEST_JOB_COUNT):
+        await queue.enqueue(TEST_JOB, {"index": index})
+    await queue.join()
+    await queue.stop()
+
+    assert len(recorder.payloads) == TEST_JOB_COUNT
+    assert recorder.max_running == TEST_CONCURRENCY
+
+
+@pytest.mark.asyncio
+async def test_failed_job_is_retried() -> None:
+    """실패한 작업은 재시도 간격 뒤에 다시 실행되어야 함"""
+    recorder = Recorder(failures=TEST_MAX_ATTEMPTS - 1)
+    queue = _queue(recorder)
+    retried_before = job_queue_jobs_total.value(TEST_JOB, "retried")
+    await queue.start()
+
+    await queue.enqueue(TEST_JOB, {"index": 0})
+    await queue.join()
+    await queue.stop()
+
+    assert recorder.payloads == [{"index": 0}]
+    assert job_queue_jobs_total.value(TEST_JOB, "retried") - retried_before == TEST_MAX_ATTEMPTS - 1
+    assert await queue.dead_letters() == []
+
+
+@pytest.mark.asyncio
+async def test_job_is_dead_lettered_after_max_attempts() -> None:
+    """최대 시도 횟수만큼 실패한 작업은 더 실행하지 않고 dead letter로 보관해야 함"""
+    recorder = Recorder(failures=TEST_MAX_ATTEMPTS)
+    queue = _queue(recorder)
+    await queue.start()
+
+    await queue.enqueue(TEST_JOB, {"index": 0})
+    await queue.join()
+    await queue.stop()
+
+    dead = await queue.dead_letters()
+    assert recorder.payloads == []
+    assert [(job.payload, job.attempts) for job in dead] == [({"index": 0}, TEST_MAX_ATTEMPTS)]
+    assert dead[0].last_error is not None
+
+
+@pytest.mark.asyncio
+async def test_same_key_is_coalesced_until_started() -> None:
+    """실행 전인 같은 키의 작업은 한 번만 실행되어야 함"""
+    recorder = Recorder()
+    queue = _queue(recorder)
+
+    first = await queue.enqueue(TEST_JOB, {"index": 0}, key="wake")
+    second = await queue.enqueue(TEST_JOB, {"index": 1}, key="wake")
+    await queue.start()
+    await queue.join()
+    await queue.enqueue(TEST_JOB, {"index": 2}, key="wake")
+    await queue.join()
+    await queue.stop()
+
+    assert second is first
+    assert [payload["index"] for payload in recorder.payloads] == [0, 2]
+
+
+@pytest.mark.asyncio
+async def test_unknown_job_is_rejected() -> None:
+    """등록되지 않은 작업은 큐에 넣을 수 없어야 함"""
+    queue = _queue(Recorder())
+
+    with pytest.raises(ValueError):
+        await queue.enqueue("test.unknown")
+
+
+@pytest.mark.asyncio
+async def test_sqlite_store_survives_restart(tmp_path: Path) -> None:
+    """SQLite 저장소를 사용하면 종료 전에 실행하지 못한 작업을 다음 시작 시 실행해야 함"""
+    path = tmp_path / "jobs.sqlite3"
+    stopped = _queue(Recorder(), store=SQLiteJobStore(path))
+    await stopped.enqueue(TEST_JOB, {"index": 0})
+    await stopped.store.close()
+
+    recorder = Recorder()
+    restarted = _queue(recorder, store=SQLiteJobStore(path))
+    await restarted.start()
+    await restarted.join()
+    await restarted.stop()
+
+    store = SQLiteJobStore(path)
+    assert recorder.payloads == [{"index": 0}]
+    assert await store.load_pending() == []
+    await store.close()
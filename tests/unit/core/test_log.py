@@ -0,0 +1,73 @@
+import json
+import logging
+import queue
+import sys
+
+from app.core.log import BackgroundQueueHandler, JsonFormatter, LogSampler, request_id_scope
+
+TEST_REQUEST_ID = "test-request-id"
+TEST_QUEUE_SIZE = 1
+TEST_SAMPLE_RATE = 0.5
+TEST_STATUS_CODE = 404
+
+
+def make_record(msg: str = "hello %s", args: tuple[object, ...] = ("world",), **extra: object) -> logging.LogRecord:
+    record = logging.LogRecord("test", logging.INFO, __file__, 1, msg, args, None)
+    record.__dict__.update(extra)
+    return record
+
+
+def test_json_formatter_includes_extra_fields_and_traceback() -> None:
+    """구조화 필드와 트레이스백을 JSON으로 출력해야 함"""
+    try:
+        raise ValueError("boom")
+    except ValueError:
+        exc_info = sys.exc_info()
+    record = make_record(status_code=TEST_STATUS_CODE)
+    record.exc_info = exc_info
+
+    entry = json.loads(JsonFormatter().format(record))
+
+    assert entry["message"] == "hello world"
+    assert entry["level"] == "INFO"
+    assert entry["status_code"] == TEST_STATUS_CODE
+    assert "ValueError: boom" in entry["exception"]
+
+
+def test_queue_handler_defers_formatting_to_listener() -> None:
+    """큐에 넣을 때는 트레이스백을 포맷팅하지 않고 요청 ID만 기록해야 함"""
+    log_queue: queue.Queue[logging.LogRecord] = queue.Queue()
+    handler = BackgroundQueueHandler(log_queue)
+    try:
+        raise ValueError("boom")
+    except ValueError:
+        record = make_record()
+        record.exc_info = sys.exc_info()
+
+    with request_id_scope(TEST_REQUEST_ID):
+        handler.emit(record)
+
+    queued = log_queue.get_nowait()
+    assert queued.msg == "hello world"
+    assert queued.args is None
+    assert queued.exc_info is not None
+    assert queued.exc_text is None
+    assert queued.__dict__["request_id"] == TEST_REQUEST_ID
+
+
+def test_queue_handler_drops_records_when_full() -> None:
+    """큐가 가득 차면 기다리지 않고 버린 수를 집계해야 함"""
+    handler = BackgroundQueueHandler(queue.Queue(TEST_QUEUE_SIZE))
+
+    handler.emit(make_record())
+    handler.emit(make_record())
+
+    assert handler.dropped == 1
+
+
+def test_sampler_rate() -> None:
+    """샘플링 비율에 따라 로그를 남길지 결정해야 함"""
+    assert LogSampler(1.0, random_func=lambda: 0.99).should_log()
+    assert not LogSampler(0.0, random_func=lambda: 0.0).should_log()
+    assert LogSampler(TEST_SAMPLE_RATE, random_func=lambda: 0.1).should_log()
+    assert not LogSampler(TEST_SAMPLE_RATE, random_func=lambda: 0.9).should_log()
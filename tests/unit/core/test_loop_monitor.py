@@ -0,0 +1,77 @@
+import asyncio
+import time
+
+import pytest
+from fastapi import FastAPI
+from starlette.types import Message, Scope
+
+from app.core.loop_monitor import LoopMonitor, event_loop_lag_seconds
+
+TEST_INTERVAL = 0.01
+TEST_THRESHOLD = 0.05
+TEST_BLOCK_SECONDS = 0.2
+
+
+def _scope() -> Scope:
+    return {"type": "http", "method": "GET", "path": "/test", "headers": [], "query_string": b""}
+
+
+async def _send(message: Message) -> None:
+    pass
+
+
+async def _receive() -> Message:
+    return {"type": "http.request"}
+
+
+@pytest.mark.asyncio
+async def test_monitor_records_blocking_call_with_route() -> None:
+    """임계값 이상 루프를 막은 호출은 라우트 이름, 호출 스택과 함께 기록되어야 함"""
+    app = FastAPI()
+
+    @app.get("/test", name="blocking")
+    async def blocking() -> None:
+        time.sleep(TEST_BLOCK_SECONDS)
+
+    monitor = LoopMonitor(TEST_INTERVAL, TEST_THRESHOLD)
+    monitor.start()
+    try:
+        await asyncio.sleep(TEST_INTERVAL * 3)
+        await app(_scope(), _receive, _send)
+        await asyncio.sleep(TEST_INTERVAL * 3)
+    finally:
+        monitor.stop()
+
+    [block] = monitor.blocks
+    assert block.route == "blocking"
+    assert block.duration >= TEST_THRESHOLD
+    assert any("blocking" in location for location in block.stack)
+
+
+@pytest.mark.asyncio
+async def test_monitor_measures_lag_without_blocking() -> None:
+    """루프를 막는 호출이 없으면 지연만 측정하고 차단은 기록하지 않아야 함"""
+    lag = event_loop_lag_seconds.get()
+    count_before = lag.count if lag is not None else 0
+    monitor = LoopMonitor(TEST_INTERVAL, TEST_THRESHOLD)
+    monitor.start()
+    try:
+        await asyncio.sleep(TEST_INTERVAL * 10)
+    finally:
+        monitor.stop()
+
+    lag = event_loop_lag_seconds.get()
+    assert lag is not None
+    assert lag.count > count_before
+    assert not monitor.blocks
+
+
+@pytest.mark.asyncio
+async def test_disabled_monitor_does_not_start() -> None:
+    """비활성화된 감시는 시작하지 않아야 함"""
+    monitor = LoopMonitor(TEST_INTERVAL, TEST_THRESHOLD, enabled=False)
+    monitor.start()
+    time.sleep(TEST_BLOCK_SECONDS)
+    monitor.stop()
+
+    assert not monitor.blocks
@@ -0,0 +1,88 @@
+import pytest
+
+from app.core.metrics import Counter, Histogram, MetricsRegistry, instrumented, use_case_duration_seconds
+
+TEST_BUCKETS = (0.1, 1.0)
+TEST_AMOUNT = 2
+
+
+@instrumented("use_case")
+class SampleUseCase:
+    async def succeed(self) -> str:
+        return "ok"
+
+    async def fail(self) -> None:
+        raise ValueError("boom")
+
+    async def _private(self) -> None:
+        pass
+
+
+def test_counter_renders_labels() -> None:
+    """라벨 조합별 값을 Prometheus 텍스트 형식으로 출력해야 함"""
+    registry = MetricsRegistry()
+    counter = registry.counter("requests_total", "요청 수", ("route",))
+    counter.labels("a").inc()
+    counter.labels("a").inc(TEST_AMOUNT)
+    counter.labels('b"').inc()
+
+    rendered = registry.render()
+
+    assert "# TYPE requests_total counter" in rendered
+    assert 'requests_total{route="a"} 3' in rendered
+    assert 'requests_total{route="b\\""} 1' in rendered
+
+
+def test_histogram_renders_cumulative_buckets() -> None:
+    """히스토그램은 누적 구간 값과 합계, 개수를 출력해야 함"""
+    histogram = Histogram("latency_seconds", "지연 시간", buckets=TEST_BUCKETS)
+    histogram.observe(0.05)
+    histogram.observe(0.5)
+    histogram.observe(5)
+
+    lines = list(histogram.samples())
+
+    assert lines == [
+        'latency_seconds_bucket{le="0.1"} 1',
+        'latency_seconds_bucket{le="1"} 2',
+        'latency_seconds_bucket{le="+Inf"} 3',
+        "latency_seconds_sum 5.55",
+        "latency_seconds_count 3",
+    ]
+
+
+def test_reset_keeps_bound_children() -> None:
+    """초기화 후에도 미리 찾아둔 하위 메트릭으로 계속 기록할 수 있어야 함"""
+    counter = Counter("conflicts_total", "충돌 수", ("function",))
+    child = counter.labels("f")
+    child.inc()
+
+    counter.reset()
+    child.inc()
+
+    assert counter.value("f") == 1
+
+
+def test_duplicate_metric_name_rejected() -> None:
+    """같은 이름의 메트릭을 두 번 등록할 수 없어야 함"""
+    registry = MetricsRegistry()
+    registry.counter("requests_total", "요청 수")
+
+    with pytest.raises(ValueError):
+        registry.counter("requests_total", "요청 수")
+
+
+@pytest.mark.asyncio
+async def test_instrumented_records_outcome() -> None:
+    """공개 async 메서드의 실행 시간을 성공/실패별로 기록해야 함"""
+    use_case = SampleUseCase()
+
+    assert await use_case.succeed() == "ok"
+    with pytest.raises(ValueError):
+        await use_case.fail()
+
+    succeeded = use_case_duration_seconds.get("SampleUseCase", "succeed", "success")
+    failed = use_case_duration_seconds.get("SampleUseCase", "fail", "error")
+    assert succeeded is not None and succeeded.count == 1
+    assert failed is not None and failed.count == 1
+    assert use_case_duration_seconds.get("SampleUseCase", "_private", "success") is None
@@ -0,0 +1,111 @@
+import asyncio
+import threading
+import time
+
+import pytest
+from fastapi import FastAPI
+from starlette.types import Message, Scope
+
+from app.core.exceptions import ProfilerBusyException
+from app.core.profiler import Profile, SamplingProfiler, dump_tasks, profile_event_loop
+
+TEST_INTERVAL = 0.001
+TEST_SPIN_SECONDS = 0.2
+TEST_SAMPLES = 3
+TEST_INTERVAL_MS = 10.0
+
+
+def _spin(seconds: float) -> None:
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        pass
+
+
+def _scope() -> Scope:
+    return {"type": "http", "method": "GET", "path": "/test", "headers": [], "query_string": b""}
+
+
+async def _send(message: Message) -> None:
+    pass
+
+
+async def _receive() -> Message:
+    return {"type": "http.request"}
+
+
+@pytest.mark.asyncio
+async def test_profiler_groups_stacks_by_route_name() -> None:
+    """요청 처리 중인 스택은 라우트 이름으로 집계되어야 함"""
+
+    app = FastAPI()
+
+    @app.get("/test", name="busy")
+    async def busy() -> None:
+        _spin(TEST_SPIN_SECONDS)
+
+    profiler = SamplingProfiler(threading.get_ident(), TEST_INTERVAL)
+    profiler.start()
+    await app(_scope(), _receive, _send)
+    profile = profiler.stop()
+
+    busy_stacks = [stack for (route, stack), _ in profile.samples.items() if route == "busy"]
+    assert busy_stacks
+    assert any(frame[0] == "_spin" for stack in busy_stacks for frame in stack)
+    assert any(line.startswith("busy;") for line in profile.to_collapsed().splitlines())
+
+
+def test_speedscope_document_shares_frames_between_routes() -> None:
+    """speedscope 문서는 프레임을 공유하고 라우트마다 샘플 수에 비례한 가중치를 가져야 함"""
+    outer = ("handler", "app/main.py", 1)
+    inner = ("query", "app/db.py", 10)
+    profile = Profile(interval=TEST_INTERVAL_MS / 1000)
+    profile.samples[("a", (outer, inner))] = TEST_SAMPLES
+    profile.samples[("b", (outer,))] = 1
+
+    document = profile.to_speedscope()
+
+    frames = document["shared"]["frames"]
+    assert [frame["name"] for frame in frames] == ["handler", "query"]
+    first, second = document["profiles"]
+    assert first["name"] == "a"
+    assert first["samples"] == [[0, 1]]
+    assert first["weights"] == [TEST_SAMPLES * TEST_INTERVAL_MS]
+    assert second["samples"] == [[0]]
+
+
+@pytest.mark.asyncio
+async def test_dump_tasks_reports_route_and_awaited_future() -> None:
+    """대기 중인 요청 태스크의 라우트와 await 중인 대상을 보여줘야 함"""
+    released = asyncio.Event()
+
+    app = FastAPI()
+
+    @app.get("/test", name="blocked")
+    async def blocked() -> None:
+        await released.wait()
+
+    task = asyncio.create_task(app(_scope(), _receive, _send), name="request")
+    await asyncio.sleep(0)
+
+    tasks = {info.name: info for info in dump_tasks()}
+    released.set()
+    await task
+
+    info = tasks["request"]
+    assert info.route == "blocked"
+    assert info.awaiting is not None
+    assert "Future" in info.awaiting
+    assert any("blocked" in location for location in info.stack)
+
+
+@pytest.mark.asyncio
+async def test_profile_event_loop_allows_one_profile_at_a_time() -> None:
+    """프로파일링 중에 다시 요청하면 ProfilerBusyException이 발생해야 함"""
+    running = asyncio.create_task(profile_event_loop(TEST_SPIN_SECONDS, TEST_INTERVAL))
+    await asyncio.sleep(0)
+
+    with pytest.raises(ProfilerBusyException):
+        await profile_event_loop(TEST_SPIN_SECONDS, TEST_INTERVAL)
+
+    profile = await running
+    assert profile.duration >= TEST_SPIN_SECONDS
@@ -0,0 +1,86 @@
+import pytest
+
+from app.core.exceptions import TooManyRequestsException
+from app.core.rate_limit import InMemoryRateLimitBackend, RateLimiter, RateLimitRule
+
+TEST_NOW = 1_000.0
+TEST_CAPACITY = 2
+TEST_REFILL_PER_SECOND = 0.5
+TEST_MAX_KEYS = 2
+TEST_RULE = RateLimitRule(name="test", capacity=TEST_CAPACITY, refill_per_second=TEST_REFILL_PER_SECOND)
+
+
+class FakeClock:
+    def __init__(self, now: float = TEST_NOW):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.mark.asyncio
+async def test_bucket_rejects_after_capacity_and_refills() -> None:
+    """용량만큼 허용한 뒤 거부하고, 토큰이 다시 채워지면 허용해야 함"""
+    clock = FakeClock()
+    backend = InMemoryRateLimitBackend(clock=clock)
+
+    for _ in range(TEST_CAPACITY):
+        assert (await backend.consume("key", TEST_RULE)).allowed
+
+    rejected = await backend.consume("key", TEST_RULE)
+    assert not rejected.allowed
+    assert rejected.retry_after == pytest.approx(1 / TEST_REFILL_PER_SECOND)
+
+    clock.now += rejected.retry_after
+    assert (await backend.consume("key", TEST_RULE)).allowed
+
+
+@pytest.mark.asyncio
+async def test_buckets_are_separated_by_key() -> None:
+    """키마다 별도의 버킷을 사용해야 함"""
+    backend = InMemoryRateLimitBackend(clock=FakeClock())
+    for _ in range(TEST_CAPACITY):
+        await backend.consume("first", TEST_RULE)
+
+    assert not (await backend.consume("first", TEST_RULE)).allowed
+    assert (await backend.consume("second", TEST_RULE)).allowed
+
+
+@pytest.mark.asyncio
+async def test_backend_keeps_only_recent_keys() -> None:
+    """최대 키 수를 넘으면 가장 오래 사용하지 않은 버킷부터 제거해야 함"""
+    backend = InMemoryRateLimitBackend(max_keys=TEST_MAX_KEYS, clock=FakeClock())
+    for _ in range(TEST_CAPACITY):
+        await backend.consume("oldest", TEST_RULE)
+
+    await backend.consume("second", TEST_RULE)
+    await backend.consume("third", TEST_RULE)
+
+    # 제거된 키는 가득 찬 새 버킷으로 다시 시작
+    assert (await backend.consume("oldest", TEST_RULE)).allowed
+
+
+@pytest.mark.asyncio
+async def test_limiter_raises_and_counts_rejections() -> None:
+    """거부 시 Retry-After 헤더가 포함된 예외를 발생시키고 허용/거부 횟수를 집계해야 함"""
+    limiter = RateLimiter(InMemoryRateLimitBackend(clock=FakeClock()))
+    for _ in range(TEST_CAPACITY):
+        await limiter.check(TEST_RULE, "key")
+
+    with pytest.raises(TooManyRequestsException) as exc_info:
+        await limiter.check(TEST_RULE, "key")
+
+    assert exc_info.value.headers == {"Retry-After": str(int(1 / TEST_REFILL_PER_SECOND))}
+    stats = limiter.snapshot()[TEST_RULE.name]
+    assert (stats.allowed, stats.rejected) == (TEST_CAPACITY, 1)
+
+
+@pytest.mark.asyncio
+async def test_disabled_limiter_allows_everything() -> None:
+    """비활성화된 경우 제한하지 않아야 함"""
+    limiter = RateLimiter(InMemoryRateLimitBackend(clock=FakeClock()), enabled=False)
+
+    for _ in range(TEST_CAPACITY + 1):
+        await limiter.check(TEST_RULE, "key")
+
+    assert limiter.snapshot() == {}
@@ -0,0 +1,23 @@
+from app.core.db import normalize_statement, parameter_shape
+
+TEST_ROWS = 3
+
+
+def test_normalize_statement_collapses_literals_and_in_lists() -> None:
+    """리터럴, 드라이버별 파라미터 표기, IN 목록 길이가 달라도 같은 문장으로 정규화되어야 함"""
+    first = normalize_statement("SELECT *\n  FROM products\n WHERE products.id IN (?, ?, ?) AND name = 'a'")
+    second = normalize_statement("SELECT * FROM products WHERE products.id IN ($1, $2) AND name = 'b''c'")
+
+    assert first == second == "SELECT * FROM products WHERE products.id IN (?...) AND name = ?"
+
+
+def test_normalize_statement_keeps_identifiers_with_digits() -> None:
+    """식별자에 포함된 숫자는 리터럴로 바꾸지 않아야 함"""
+    assert normalize_statement("SELECT anon_1.id FROM t LIMIT 10") == "SELECT anon_1.id FROM t LIMIT ?"
+
+
+def test_parameter_shape_hides_values() -> None:
+    """바인드 파라미터는 값 대신 타입(연속된 같은 타입은 개수)으로 표시되어야 함"""
+    assert parameter_shape((1, 2, 3, "secret", None)) == "(int*3, str, NoneType)"
+    assert parameter_shape({"seller_id": 1}) == "{seller_id: int}"
+    assert parameter_shape([(1, "a")] * TEST_ROWS, executemany=True) == f"{TEST_ROWS} x (int, str)"
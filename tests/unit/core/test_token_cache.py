@@ -0,0 +1,123 @@
+from datetime import timedelta
+from typing import Any
+
+import jwt
+import pytest
+from fastapi import HTTPException
+
+from app.application.dto.token import TokenPayload
+from app.core import security
+from app.core.config import Settings
+from app.core.token_cache import VerifiedTokenCache
+
+TEST_NOW = 1_000.0
+TEST_TTL_SECONDS = 60.0
+TEST_CACHE_SIZE = 2
+TEST_SUBJECT = "test@example.com"
+
+
+class FakeClock:
+    def __init__(self, now: float = TEST_NOW):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_cache_returns_payload_until_expiry() -> None:
+    """만료 시각 전까지는 캐시된 페이로드를 반환하고, 만료되면 제거해야 함"""
+    clock = FakeClock()
+    cache = VerifiedTokenCache(TEST_CACHE_SIZE, clock=clock)
+    cache.put("token", "payload", TEST_NOW + TEST_TTL_SECONDS)
+
+    assert cache.get("token") == "payload"
+
+    clock.now += TEST_TTL_SECONDS
+    assert cache.get("token") is None
+    assert len(cache) == 0
+
+
+def test_cache_evicts_least_recently_used() -> None:
+    """최대 크기를 넘으면 가장 오래 사용하지 않은 토큰부터 제거해야 함"""
+    cache = VerifiedTokenCache(TEST_CACHE_SIZE, clock=FakeClock())
+    expires_at = TEST_NOW + TEST_TTL_SECONDS
+    cache.put("first", 1, expires_at)
+    cache.put("second", 2, expires_at)
+    cache.get("first")
+
+    cache.put("third", 3, expires_at)
+
+    assert cache.get("second") is None
+    assert cache.get("first") == 1
+    assert cache.get("third") == 3  # noqa: PLR2004
+
+
+def test_cache_disabled_or_already_expired() -> None:
+    """크기가 0이거나 이미 만료된 토큰은 캐시하지 않아야 함"""
+    disabled = VerifiedTokenCache(0, clock=FakeClock())
+    disabled.put("token", "payload", TEST_NOW + TEST_TTL_SECONDS)
+    assert len(disabled) == 0
+
+    cache = VerifiedTokenCache(TEST_CACHE_SIZE, clock=FakeClock())
+    cache.put("token", "payload", TEST_NOW)
+    assert len(cache) == 0
+
+
+def test_decode_access_token_verifies_once(monkeypatch: pytest.MonkeyPatch) -> None:
+    """같은 토큰은 서명 검증을 한 번만 수행해야 함"""
+    security.token_cache.clear()
+    token = security.create_access_token(TokenPayload(sub=TEST_SUBJECT))
+    calls: list[str] = []
+    original_decode = jwt.decode
+
+    def counting_decode(*args: Any, **kwargs: Any) -> Any:
+        calls.append(args[0])
+        return original_decode(*args, **kwargs)
+
+    monkeypatch.setattr(jwt, "decode", counting_decode)
+
+    assert security.decode_access_token(token).sub == TEST_SUBJECT
+    assert security.decode_access_token(token).sub == TEST_SUBJECT
+    assert len(calls) == 1
+
+
+def test_decode_expired_token_is_not_cached() -> None:
+    """만료된 토큰은 캐시를 거치지 않고 401이 발생해야 함"""
+    token = security.create_access_token(TokenPayload(sub=TEST_SUBJECT), expires_delta=timedelta(seconds=-1))
+
+    with pytest.raises(HTTPException):
+        security.decode_access_token(token)
+    assert security.token_cache.get(token) is None
+
+
+def test_asymmetric_algorithm_requires_keys() -> None:
+    """비대칭 알고리즘은 키가 없으면 시작 시점에 실패해야 함"""
+    with pytest.raises(ValueError):
+        security.load_jwt_keys(Settings(jwt_algorithm="ES256"))
+
+
+@pytest.mark.parametrize("algorithm", ["ES256", "EdDSA"])
+def test_asymmetric_keys_round_trip(algorithm: str) -> None:
+    """ES256/EdDSA 키를 미리 로드하여 서명/검증할 수 있어야 함"""
+    serialization = pytest.importorskip("cryptography.hazmat.primitives.serialization")
+    ec = pytest.importorskip("cryptography.hazmat.primitives.asymmetric.ec")
+    ed25519 = pytest.importorskip("cryptography.hazmat.primitives.asymmetric.ed25519")
+
+    private_key = (
+        ec.generate_private_key(ec.SECP256R1()) if algorithm == "ES256" else ed25519.Ed25519PrivateKey.generate()
+    )
+    private_pem = private_key.private_bytes(
+        serialization.Encoding.PEM, serialization.PrivateFormat.PKCS8, serialization.NoEncryption()
+    ).decode()
+    public_pem = (
+        private_key.public_key()
+        .public_bytes(serialization.Encoding.PEM, serialization.PublicFormat.SubjectPublicKeyInfo)
+        .decode()
+    )
+
+    keys = security.load_jwt_keys(
+        Settings(jwt_algorithm=algorithm, jwt_private_key=private_pem, jwt_public_key=public_pem)
+    )
+    token = jwt.encode({"sub": TEST_SUBJECT}, keys.signing_key, algorithm=keys.algorithm)
+
+    assert jwt.decode(token, keys.verification_key, algorithms=[keys.algorithm])["sub"] == TEST_SUBJECT
@@ -0,0 +1,100 @@
+import pytest
+
+from app.core.tracing import (
+    InMemorySpanExporter,
+    SimpleSpanProcessor,
+    SpanContext,
+    StatusCode,
+    Tracer,
+    format_trace_tree,
+    parse_traceparent,
+    to_otlp_json,
+)
+
+TEST_TRACE_ID = "0af7651916cd43dd8448eb211c80319c"
+TEST_SPAN_ID = "b7ad6b7169203331"
+TEST_TRACEPARENT = f"00-{TEST_TRACE_ID}-{TEST_SPAN_ID}-01"
+TEST_SERVICE_NAME = "test-service"
+TEST_HALF_RATIO = 0.5
+# 하위 64비트가 각각 최솟값/최댓값인 trace ID
+TEST_LOW_TRACE_ID = "f" * 16 + "0" * 16
+TEST_HIGH_TRACE_ID = "0" * 16 + "f" * 16
+
+
+@pytest.fixture
+def exporter() -> InMemorySpanExporter:
+    return InMemorySpanExporter()
+
+
+@pytest.fixture
+def tracer(exporter: InMemorySpanExporter) -> Tracer:
+    tracer = Tracer()
+    tracer.configure(SimpleSpanProcessor(exporter))
+    return tracer
+
+
+def test_parse_traceparent() -> None:
+    """W3C traceparent를 해석하고, 잘못된 값은 무시해야 함"""
+    assert parse_traceparent(TEST_TRACEPARENT) == SpanContext(TEST_TRACE_ID, TEST_SPAN_ID, sampled=True)
+    assert parse_traceparent(f"00-{TEST_TRACE_ID}-{TEST_SPAN_ID}-00") == SpanContext(
+        TEST_TRACE_ID, TEST_SPAN_ID, sampled=False
+    )
+    assert parse_traceparent("invalid") is None
+    assert parse_traceparent(f"00-{'0' * 32}-{TEST_SPAN_ID}-01") is None
+
+
+def test_sampling_uses_trace_id(tracer: Tracer) -> None:
+    """샘플링 비율은 trace ID 기준으로 결정되어야 함"""
+    tracer.sample_ratio = TEST_HALF_RATIO
+
+    assert tracer.should_sample(TEST_LOW_TRACE_ID)
+    assert not tracer.should_sample(TEST_HIGH_TRACE_ID)
+
+
+def test_child_spans_follow_parent(tracer: Tracer, exporter: InMemorySpanExporter) -> None:
+    """하위 스팬은 상위 스팬과 같은 trace에 속하고 상위 스팬 ID를 가져야 함"""
+    parent = parse_traceparent(TEST_TRACEPARENT)
+    with tracer.start_request_span("GET /", parent) as root, tracer.start_span("child"):
+        pass
+
+    child_span, root_span = exporter.spans
+    assert root is root_span
+    assert root_span.context.trace_id == TEST_TRACE_ID
+    assert root_span.parent_span_id == TEST_SPAN_ID
+    assert child_span.context.trace_id == TEST_TRACE_ID
+    assert child_span.parent_span_id == root_span.context.span_id
+
+
+def test_span_records_error(tracer: Tracer, exporter: InMemorySpanExporter) -> None:
+    """예외가 발생한 스팬은 오류 상태로 기록되어야 함"""
+    with pytest.raises(ValueError), tracer.start_request_span("GET /"), tracer.start_span("child"):
+        raise ValueError("boom")
+
+    assert all(span.status == StatusCode.ERROR for span in exporter.spans)
+
+
+def test_no_spans_outside_sampled_request(tracer: Tracer, exporter: InMemorySpanExporter) -> None:
+    """요청 밖이나 샘플링되지 않은 요청에서는 하위 스팬을 기록하지 않아야 함"""
+    with tracer.start_span("orphan") as orphan:
+        assert orphan is None
+
+    not_sampled = SpanContext(TEST_TRACE_ID, TEST_SPAN_ID, sampled=False)
+    with tracer.start_request_span("GET /", not_sampled), tracer.start_span("child") as child:
+        assert child is None
+        assert not tracer.is_recording()
+
+    assert exporter.spans == []
+
+
+def test_otlp_json_and_tree(tracer: Tracer, exporter: InMemorySpanExporter) -> None:
+    """OTLP/JSON으로 변환한 스팬을 호출 트리로 출력할 수 있어야 함"""
+    with tracer.start_request_span("GET /"), tracer.start_span("child"):
+        pass
+
+    document = to_otlp_json(exporter.spans, TEST_SERVICE_NAME)
+    spans = document["resourceSpans"][0]["scopeSpans"][0]["spans"]
+    lines = format_trace_tree(spans)
+
+    assert lines[0].startswith("trace ")
+    assert lines[1].strip().startswith("GET /")
+    assert lines[2].startswith("    child")
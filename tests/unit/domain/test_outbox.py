@@ -0,0 +1,33 @@
+from datetime import datetime, timedelta
+
+import pytest
+
+from app.domain.model.outbox import next_retry_at
+
+TEST_BASE_SECONDS = 1
+TEST_MAX_SECONDS = 300
+
+
+class TestNextRetryAt:
+    @pytest.mark.parametrize(("attempts", "expected_seconds"), [(0, 1), (1, 1), (2, 2), (3, 4), (5, 16)])
+    def test_backoff_doubles(self, attempts: int, expected_seconds: int) -> None:
+        """실패할 때마다 다음 시도까지의 간격이 두 배로 늘어납니다."""
+        # Given
+        now = datetime(2024, 1, 1)
+
+        # When
+        retry_at = next_retry_at(attempts, now, TEST_BASE_SECONDS, TEST_MAX_SECONDS)
+
+        # Then
+        assert retry_at == now + timedelta(seconds=expected_seconds)
+
+    def test_backoff_is_capped(self) -> None:
+        """간격은 최대값을 넘지 않습니다."""
+        # Given
+        now = datetime(2024, 1, 1)
+
+        # When
+        retry_at = next_retry_at(30, now, TEST_BASE_SECONDS, TEST_MAX_SECONDS)
+
+        # Then
+        assert retry_at == now + timedelta(seconds=TEST_MAX_SECONDS)
@@ -129,3 +129,48 @@ class TestProduct:
         # When & Then
         with pytest.raises(PermissionDeniedException):
             product.verify_owner(2)
+
+    def test_adjust_inventory_absolute_and_price(self) -> None:
+        """재고 절대값 설정과 가격 변경을 함께 적용합니다."""
+        # Given
+        new_stock = 3
+        new_price = 1500
+        product = Product(name="Test Product", price=1000, stock=10, seller_id=1)
+
+        # When
+        product.adjust_inventory(stock=new_stock, price=new_price)
+
+        # Then
+        assert product.stock == new_stock
+        assert product.price == new_price
+
+    def test_adjust_inventory_delta(self) -> None:
+        """재고 증감량을 현재 재고에 반영합니다."""
+        # Given
+        initial_stock = 10
+        delta = -4
+        product = Product(name="Test Product", price=1000, stock=initial_stock, seller_id=1)
+
+        # When
+        product.adjust_inventory(stock_delta=delta)
+
+        # Then
+        assert product.stock == initial_stock + delta
+
+    def test_adjust_inventory_delta_insufficient(self) -> None:
+        """재고보다 많이 차감하는 증감량은 InsufficientStockException이 발생합니다."""
+        # Given
+        product = Product(name="Test Product", price=1000, stock=10, seller_id=1)
+
+        # When & Then
+        with pytest.raises(InsufficientStockException):
+            product.adjust_inventory(stock_delta=-11)
+
+    def test_adjust_inventory_stock_and_delta_together(self) -> None:
+        """재고 설정값과 증감량을 동시에 지정하면 InvalidDomainException이 발생합니다."""
+        # Given
+        product = Product(name="Test Product", price=1000, stock=10, seller_id=1)
+
+        # When & Then
+        with pytest.raises(InvalidDomainException):
+            product.adjust_inventory(stock=5, stock_delta=1)